@@ -0,0 +1,140 @@
+"""
+Deterministic stand-in TTS provider for offline benchmarks.
+
+FakeTTSProvider implements TTSProvider (including convert_chunk_async for
+the chunked path) without any network or audio engine. Latency is a base
+delay plus a per-character cost, and failures happen at a configured rate
+from a seeded RNG, so runs are repeatable.
+"""
+
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+from tts.providers.base_provider import ProviderType, TTSProvider
+from tts.providers.provider_manager import TTSProviderManager
+
+FAKE_PROVIDER_NAME = "fake_tts"
+FAKE_VOICE_ID = "en-US-BenchmarkNeural"
+
+# MPEG-1 Layer III frame header (128 kbps, 44.1 kHz); output only needs to look like audio
+_FRAME_HEADER = b"\xff\xfb\x90\x64"
+_FRAME_SIZE = 417
+
+
+@dataclass
+class FakeTTSConfig:
+    """Behaviour of the fake provider."""
+    base_latency: float = 0.01
+    latency_per_kchar: float = 0.005
+    error_rate: float = 0.0
+    max_text_bytes: int = 3000
+    bytes_per_char: int = 16
+    seed: int = 1234
+
+
+class FakeTTSProvider(TTSProvider):
+    """TTSProvider that sleeps instead of synthesizing and writes placeholder audio."""
+
+    def __init__(self, config: Optional[FakeTTSConfig] = None):
+        self.config = config or FakeTTSConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    def get_provider_name(self) -> str:
+        return FAKE_PROVIDER_NAME
+
+    def get_provider_type(self) -> ProviderType:
+        return ProviderType.OFFLINE
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_voices(self, locale: Optional[str] = None) -> List[Dict]:
+        return [{
+            "id": FAKE_VOICE_ID,
+            "name": "Benchmark",
+            "language": "en-US",
+            "gender": "neutral",
+            "quality": "low",
+            "provider": FAKE_PROVIDER_NAME,
+        }]
+
+    def supports_chunking(self) -> bool:
+        return True
+
+    def get_max_text_bytes(self) -> Optional[int]:
+        return self.config.max_text_bytes
+
+    def _latency(self, text: str) -> float:
+        return self.config.base_latency + self.config.latency_per_kchar * len(text) / 1000.0
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.calls += 1
+            failed = self._rng.random() < self.config.error_rate
+            if failed:
+                self.failures += 1
+            return failed
+
+    def _write_audio(self, text: str, output_path: Path) -> None:
+        # Size scales with text; content is derived from the text so identical input gives identical output
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        frame = _FRAME_HEADER + (digest * (_FRAME_SIZE // len(digest) + 1))[:_FRAME_SIZE - len(_FRAME_HEADER)]
+        frames = max(1, len(text) * self.config.bytes_per_char // _FRAME_SIZE)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(frame * frames)
+
+    def convert_text_to_speech(
+        self,
+        text: str,
+        voice: str,
+        output_path: Path,
+        rate: Optional[float] = None,
+        pitch: Optional[float] = None,
+        volume: Optional[float] = None
+    ) -> bool:
+        time.sleep(self._latency(text))
+        if self._should_fail():
+            return False
+        self._write_audio(text, output_path)
+        return True
+
+    async def convert_chunk_async(
+        self,
+        text: str,
+        voice: str,
+        output_path: Path,
+        rate: Optional[float] = None,
+        pitch: Optional[float] = None,
+        volume: Optional[float] = None
+    ) -> bool:
+        await asyncio.sleep(self._latency(text))
+        if self._should_fail():
+            raise ConnectionError("Simulated TTS failure")
+        await asyncio.to_thread(self._write_audio, text, output_path)
+        return True
+
+
+@contextmanager
+def only_fake_provider(provider: FakeTTSProvider) -> Iterator[FakeTTSProvider]:
+    """
+    Make every TTSProviderManager created inside the block use only provider.
+
+    Keeps the real providers (and their network availability checks) out of
+    benchmark runs.
+    """
+    def _initialize_providers(manager: TTSProviderManager) -> None:
+        manager._providers = {provider.get_provider_name(): provider}
+
+    with patch.object(TTSProviderManager, "_initialize_providers", _initialize_providers):
+        yield provider
@@ -0,0 +1,221 @@
+"""
+Local HTTP server serving a synthetic novel for offline benchmarks.
+
+Pages:
+    /novel/                  Novel landing page (links to the TOC)
+    /novel/toc?page=N        Paginated table of contents
+    /novel/chapter-N         Chapter page with title and paragraphs
+
+Content is generated deterministically from a seed, so repeated runs
+scrape identical text. Per-request latency can be added to simulate a
+remote site.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_WORDS = (
+    "the sword mountain cultivator sect elder young master spirit stone qi "
+    "heaven dragon palace disciple array formation pill furnace realm breakthrough "
+    "ancient ruins jade slip talisman beast core thunder tribulation dao heart "
+    "moon valley river city merchant guild tournament rival senior junior sister "
+    "brother shadow flame frost wind blade fist palm technique secret manual"
+).split()
+
+
+@dataclass
+class SiteConfig:
+    """Shape of the synthetic novel."""
+    chapters: int = 20
+    paragraphs_per_chapter: int = 30
+    words_per_paragraph: int = 60
+    # 0 puts every chapter on one TOC page
+    chapters_per_toc_page: int = 0
+    latency: float = 0.0
+    seed: int = 1234
+
+
+class SyntheticNovel:
+    """Generates and caches the novel's pages."""
+
+    def __init__(self, config: SiteConfig):
+        self.config = config
+        self.base_url = ""
+        self._chapter_cache: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def per_page(self) -> int:
+        return self.config.chapters_per_toc_page or max(1, self.config.chapters)
+
+    @property
+    def toc_pages(self) -> int:
+        return max(1, (self.config.chapters + self.per_page - 1) // self.per_page)
+
+    def chapter_title(self, number: int) -> str:
+        rng = random.Random(self.config.seed * 100003 + number)
+        return " ".join(rng.choice(_WORDS) for _ in range(3)).title()
+
+    def chapter_text(self, number: int) -> str:
+        rng = random.Random(self.config.seed * 7919 + number)
+        paragraphs = []
+        for _ in range(self.config.paragraphs_per_chapter):
+            words = [rng.choice(_WORDS) for _ in range(self.config.words_per_paragraph)]
+            paragraphs.append(" ".join(words).capitalize() + ".")
+        return "\n\n".join(paragraphs)
+
+    def landing_page(self) -> str:
+        return (
+            "<html><head><title>Synthetic Novel</title></head><body>"
+            "<h1 class=\"novel-title\">Synthetic Novel</h1>"
+            "<div class=\"author\">Benchmark Author</div>"
+            f"<a href=\"{self.base_url}/novel/toc?page=1\">Table of Contents</a>"
+            "</body></html>"
+        )
+
+    def toc_page(self, page: int) -> Optional[str]:
+        if page < 1 or page > self.toc_pages:
+            return None
+        first = (page - 1) * self.per_page + 1
+        last = min(self.config.chapters, page * self.per_page)
+        base = self.base_url
+
+        items = "".join(
+            f"<li><a href=\"{base}/novel/chapter-{n}\">Chapter {n}: {self.chapter_title(n)}</a></li>"
+            for n in range(first, last + 1)
+        )
+        pages = "".join(
+            f"<li><a href=\"{base}/novel/toc?page={p}\">{p}</a></li>"
+            for p in range(1, self.toc_pages + 1)
+        )
+        next_link = (
+            f"<a class=\"next\" rel=\"next\" href=\"{base}/novel/toc?page={page + 1}\">Next</a>"
+            if page < self.toc_pages else ""
+        )
+        return (
+            "<html><head><title>Synthetic Novel - Chapters</title></head><body>"
+            "<h1>Synthetic Novel</h1>"
+            f"<ul class=\"chapter-list\" id=\"chapter-list\">{items}</ul>"
+            f"<ul class=\"pagination\">{pages}</ul>{next_link}"
+            "</body></html>"
+        )
+
+    def chapter_page(self, number: int) -> Optional[str]:
+        if number < 1 or number > self.config.chapters:
+            return None
+        with self._lock:
+            cached = self._chapter_cache.get(number)
+        if cached is not None:
+            return cached
+
+        paragraphs = "".join(f"<p>{p}</p>" for p in self.chapter_text(number).split("\n\n"))
+        base = self.base_url
+        prev_link = f"<a class=\"prev\" href=\"{base}/novel/chapter-{number - 1}\">Previous</a>" if number > 1 else ""
+        next_link = (
+            f"<a class=\"next\" href=\"{base}/novel/chapter-{number + 1}\">Next</a>"
+            if number < self.config.chapters else ""
+        )
+        html = (
+            f"<html><head><title>Chapter {number}</title></head><body>"
+            f"<h1 class=\"chapter-title\">Chapter {number}: {self.chapter_title(number)}</h1>"
+            f"<div id=\"chapter-content\" class=\"chapter-content\">{paragraphs}</div>"
+            f"<div class=\"nav\">{prev_link}{next_link}</div>"
+            "</body></html>"
+        )
+        with self._lock:
+            self._chapter_cache[number] = html
+        return html
+
+    def render(self, path: str, query: str) -> Tuple[int, str]:
+        """Return (status, body) for a request path."""
+        if path in ("/novel", "/novel/"):
+            return 200, self.landing_page()
+        if path == "/novel/toc":
+            try:
+                page = int(parse_qs(query).get("page", ["1"])[0])
+            except ValueError:
+                page = 0
+            body = self.toc_page(page)
+            return (200, body) if body is not None else (404, "Not found")
+        if path.startswith("/novel/chapter-"):
+            try:
+                number = int(path.rsplit("-", 1)[1])
+            except ValueError:
+                number = 0
+            body = self.chapter_page(number)
+            return (200, body) if body is not None else (404, "Not found")
+        return 404, "Not found"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    novel: SyntheticNovel
+
+    def do_GET(self):  # noqa: N802 (http.server API)
+        if self.novel.config.latency > 0:
+            time.sleep(self.novel.config.latency)
+        parsed = urlparse(self.path)
+        status, body = self.novel.render(parsed.path, parsed.query)
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # noqa: A002 (http.server API)
+        # Keep benchmark output clean
+        pass
+
+
+class LocalNovelSite:
+    """
+    Threaded HTTP server for a SyntheticNovel on localhost.
+
+    Usage:
+        with LocalNovelSite(SiteConfig(chapters=50)) as site:
+            toc_url = site.toc_url
+    """
+
+    def __init__(self, config: Optional[SiteConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.novel = SyntheticNovel(config or SiteConfig())
+        handler = type("NovelHandler", (_Handler,), {"novel": self.novel})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        # Links are absolute, like most novel sites
+        self.novel.base_url = self.base_url
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def novel_url(self) -> str:
+        return f"{self.base_url}/novel/"
+
+    @property
+    def toc_url(self) -> str:
+        return f"{self.base_url}/novel/toc?page=1"
+
+    def start(self) -> "LocalNovelSite":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-novel-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+    def __enter__(self) -> "LocalNovelSite":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
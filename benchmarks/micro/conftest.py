@@ -0,0 +1,157 @@
+"""
+Fixtures and regression thresholds for micro-benchmarks.
+
+Each benchmark's median is compared with the value stored in
+thresholds.json and the test fails if it is slower by more than the
+allowed percentage. Timings are normalized by a calibration workload
+measured at session start, so the stored values carry over between
+machines reasonably well.
+
+Run (benchmarks are disabled under xdist, so turn it off):
+    pytest benchmarks/micro -n 0 --dist no --no-cov --benchmark-only
+
+Record new reference values after an intentional change:
+    pytest benchmarks/micro -n 0 --dist no --no-cov --benchmark-only --update-thresholds
+"""
+
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+MICRO_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = MICRO_DIR.parent.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+FIXTURES_DIR = MICRO_DIR / "fixtures"
+THRESHOLDS_FILE = MICRO_DIR / "thresholds.json"
+DEFAULT_MAX_REGRESSION_PCT = 25.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("act-micro-benchmarks")
+    group.addoption("--update-thresholds", action="store_true", default=False,
+                    help="Store current benchmark medians in thresholds.json")
+    group.addoption("--max-regression", type=float, default=None,
+                    help="Override the allowed slowdown in percent")
+
+
+def _calibrate(rounds: int = 5) -> float:
+    """Best-of time of a fixed pure-Python workload (regex, string and dict work)."""
+    pattern = re.compile(r"chapter[-_](\d+)", re.I)
+    text = " ".join(f"Chapter-{i} the sword and the mountain" for i in range(2000))
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        counts: Dict[str, int] = {}
+        for word in text.split():
+            counts[word.lower()] = counts.get(word.lower(), 0) + 1
+        numbers = [int(m.group(1)) for m in pattern.finditer(text)]
+        " ".join(sorted(counts)).replace("sword", "blade")
+        sum(numbers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class ThresholdRegistry:
+    """Loads thresholds.json, checks benchmark results and records updates."""
+
+    def __init__(self, path: Path, update: bool, max_regression: Optional[float]):
+        self.path = path
+        self.update = update
+        data: Dict[str, Any] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+        self.data = data
+        self.max_regression = max_regression if max_regression is not None else data.get(
+            "max_regression_pct", DEFAULT_MAX_REGRESSION_PCT
+        )
+        self.calibration = _calibrate()
+        self.recorded: Dict[str, float] = {}
+
+    def check(self, name: str, benchmark: Any) -> None:
+        if benchmark.disabled or benchmark.stats is None:
+            return  # e.g. under xdist or --benchmark-disable: nothing measured
+
+        median = benchmark.stats.stats.median
+        normalized = median / self.calibration
+        if self.update:
+            self.recorded[name] = normalized
+            return
+
+        reference = self.data.get("benchmarks", {}).get(name)
+        if reference is None:
+            pytest.fail(f"No threshold for {name}; run with --update-thresholds to record one", pytrace=False)
+
+        entry_limit = reference.get("max_regression_pct", self.max_regression)
+        limit = reference["normalized_median"] * (1.0 + entry_limit / 100.0)
+        if normalized > limit:
+            slowdown = (normalized / reference["normalized_median"] - 1.0) * 100.0
+            pytest.fail(
+                f"{name} regressed by {slowdown:.1f}% (allowed {entry_limit:.0f}%): "
+                f"median {median * 1000:.3f} ms, normalized {normalized:.2f} vs {reference['normalized_median']:.2f}",
+                pytrace=False
+            )
+
+    def save(self) -> None:
+        if not self.update or not self.recorded:
+            return
+        benchmarks = dict(self.data.get("benchmarks", {}))
+        for name, normalized in sorted(self.recorded.items()):
+            entry = dict(benchmarks.get(name, {}))
+            entry["normalized_median"] = float(f"{normalized:.4g}")
+            benchmarks[name] = entry
+        self.data.setdefault("note", (
+            "normalized_median = benchmark median / calibration workload time. "
+            "An entry may set its own max_regression_pct."
+        ))
+        self.data.setdefault("max_regression_pct", DEFAULT_MAX_REGRESSION_PCT)
+        self.data["benchmarks"] = dict(sorted(benchmarks.items()))
+        self.path.write_text(json.dumps(self.data, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def thresholds(request):
+    registry = ThresholdRegistry(
+        THRESHOLDS_FILE,
+        update=request.config.getoption("--update-thresholds"),
+        max_regression=request.config.getoption("--max-regression")
+    )
+    yield registry
+    registry.save()
+
+
+@pytest.fixture
+def guarded_benchmark(benchmark, thresholds, request) -> Callable[..., Any]:
+    """Like benchmark(func, *args), then fails if the result is over its threshold."""
+    def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = benchmark(func, *args, **kwargs)
+        thresholds.check(request.node.name, benchmark)
+        return result
+    return run
+
+
+@pytest.fixture(scope="session")
+def chapter_html() -> str:
+    return (FIXTURES_DIR / "chapter_page.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def toc_html() -> str:
+    return (FIXTURES_DIR / "toc_page.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def chapter_text() -> str:
+    return (FIXTURES_DIR / "chapter_text.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def chapter_urls() -> List[str]:
+    return json.loads((FIXTURES_DIR / "chapter_urls.json").read_text(encoding="utf-8"))
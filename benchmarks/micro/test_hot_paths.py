@@ -0,0 +1,86 @@
+"""
+Micro-benchmarks for scraper and text hot paths.
+
+These functions run once per chapter (or per URL) and thousands of times
+per novel, so small slowdowns add up. Inputs are recorded pages and
+texts from fixtures/; each benchmark is checked against thresholds.json.
+"""
+
+import pytest
+
+from scraper.chapter_number import extract_chapter_number
+from scraper.chapter_sorting import sort_chapters_by_number
+from scraper.extractors.chapter_extractor import ChapterExtractor
+from scraper.extractors.url_extractor_session import SessionManager
+from scraper.pagination_detector import PaginationDetector
+from scraper.strategies.html_parsing_strategy import HtmlParsingStrategy
+from text_utils import clean_text, clean_text_for_tts
+from tts.audio_merger import AudioMerger
+
+pytestmark = pytest.mark.benchmark
+
+BASE_URL = "https://readnovel.example"
+CHAPTER_URL = f"{BASE_URL}/novel/heaven-defying-sword/chapter-1234"
+
+
+@pytest.fixture(scope="module")
+def chapter_soup(chapter_html):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(chapter_html, "html.parser")
+
+
+@pytest.fixture(scope="module")
+def chapter_extractor():
+    return ChapterExtractor(base_url=BASE_URL, delay=0)
+
+
+def test_extract_content(guarded_benchmark, chapter_extractor, chapter_soup):
+    content = guarded_benchmark(chapter_extractor._extract_content, chapter_soup)
+    assert content and "Translator:" not in content.split("\n\n")[0]
+
+
+def test_extract_title(guarded_benchmark, chapter_extractor, chapter_soup):
+    title = guarded_benchmark(chapter_extractor._extract_title, chapter_soup, CHAPTER_URL)
+    assert title == "The Thunder Tribulation of the Jade Valley"
+
+
+def test_clean_text(guarded_benchmark, chapter_text):
+    cleaned = guarded_benchmark(clean_text, chapter_text)
+    assert cleaned
+
+
+def test_clean_text_for_tts(guarded_benchmark, chapter_text):
+    cleaned = guarded_benchmark(clean_text_for_tts, chapter_text)
+    assert cleaned
+
+
+def test_chunk_text(guarded_benchmark, chapter_text):
+    merger = AudioMerger(provider_manager=None)  # type: ignore[arg-type]
+    chunks = guarded_benchmark(merger.chunk_text, chapter_text, 3000)
+    assert len(chunks) > 1
+    assert all(len(chunk.encode("utf-8")) <= 3000 for chunk in chunks)
+
+
+def test_extract_chapter_number(guarded_benchmark, chapter_urls):
+    def extract_all():
+        return [extract_chapter_number(url) for url in chapter_urls]
+
+    numbers = guarded_benchmark(extract_all)
+    assert sum(1 for n in numbers if n) > len(chapter_urls) * 0.9
+
+
+def test_sort_chapters_by_number(guarded_benchmark, chapter_urls):
+    ordered = guarded_benchmark(sort_chapters_by_number, chapter_urls)
+    assert len(ordered) == len(chapter_urls)
+
+
+def test_html_parsing_extract_from_html(guarded_benchmark, toc_html):
+    strategy = HtmlParsingStrategy(BASE_URL, SessionManager())
+    urls = guarded_benchmark(strategy._extract_from_html, toc_html)
+    assert len(urls) >= 600
+
+
+def test_pagination_detector_analyze(guarded_benchmark, chapter_urls):
+    detector = PaginationDetector()
+    analysis = guarded_benchmark(detector.analyze, chapter_urls, 1, 2000)
+    assert analysis is not None
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark for ACT.
+
+Runs PipelineOrchestrator.run_full_pipeline against a local synthetic novel
+site with a fake TTS provider, so results reflect our own code (scraping,
+parsing, cleaning, chunking, file handling) rather than the network or a
+real TTS service.
+
+Measures chapters per minute, p50/p95 chapter latency and peak RSS, and
+stores every result as JSON under benchmarks/results/ so runs can be
+compared across commits.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --chapters 100 --paragraphs 60 --site-latency 0.05
+    python benchmarks/run_benchmarks.py --tts-latency 0.2 --tts-error-rate 0.05 --repeat 3
+    python benchmarks/run_benchmarks.py --compare               # compare with previous result
+    python benchmarks/run_benchmarks.py --baseline results/x.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+try:
+    import psutil  # type: ignore[import-untyped]
+    HAS_PSUTIL: bool = True
+except ImportError:
+    HAS_PSUTIL = False  # type: ignore[constant-redefinition]
+    psutil = None  # type: ignore[assignment]
+
+try:
+    import resource
+    HAS_RESOURCE: bool = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False  # type: ignore[constant-redefinition]
+    resource = None  # type: ignore[assignment]
+
+from benchmarks.fake_tts import FAKE_PROVIDER_NAME, FAKE_VOICE_ID, FakeTTSConfig, FakeTTSProvider, only_fake_provider
+from benchmarks.local_site import LocalNovelSite, SiteConfig
+
+DEFAULT_RESULTS_DIR = BENCHMARKS_DIR / "results"
+
+# Metrics compared between runs; True means higher is better
+COMPARED_RESULTS = {
+    "chapters_per_minute": True,
+    "chapter_latency_p50": False,
+    "chapter_latency_p95": False,
+    "peak_rss_mb": False,
+    "wall_seconds": False,
+}
+
+# Changes smaller than this are reported as "same" (run-to-run noise)
+NOISE_PERCENT = 2.0
+
+
+class PeakRssSampler:
+    """Tracks the process's peak resident set size while running."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PeakRssSampler":
+        if HAS_PSUTIL:
+            process = psutil.Process()
+
+            def sample():
+                while not self._stop.is_set():
+                    self.peak_bytes = max(self.peak_bytes, process.memory_info().rss)
+                    self._stop.wait(self.interval)
+
+            self._thread = threading.Thread(target=sample, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        elif HAS_RESOURCE:
+            # ru_maxrss is KiB on Linux, bytes on macOS; peak over the whole process lifetime
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            self.peak_bytes = max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    @property
+    def peak_mb(self) -> Optional[float]:
+        return round(self.peak_bytes / (1024 * 1024), 1) if self.peak_bytes else None
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _round(value: Optional[float], digits: int = 4) -> Optional[float]:
+    return round(value, digits) if value is not None else None
+
+
+def git_revision() -> Dict[str, Any]:
+    """Current commit and whether the tree has local changes."""
+    def run(*args: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=10, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    commit = run("rev-parse", "--short", "HEAD")
+    status = run("status", "--porcelain", "--untracked-files=no")
+    return {"commit": commit, "dirty": bool(status) if status is not None else None}
+
+
+def configure_isolated_run(workdir: Path, scrape_delay: float) -> None:
+    """Point ACT's output/project dirs into workdir and drop the polite scrape delay."""
+    from core.config_manager import get_config
+    config = get_config()
+    config.set("paths.output_dir", str(workdir / "output"), save=False)
+    config.set("paths.projects_dir", str(workdir / "projects"), save=False)
+    config.set("scraper.delay", scrape_delay, save=False)
+    config.set("metrics.run_report", True, save=False)
+
+
+def run_once(site_config: SiteConfig, tts_config: FakeTTSConfig, scrape_delay: float, run_index: int) -> Dict[str, Any]:
+    """Run the full pipeline once and collect measurements."""
+    from processor.pipeline_orchestrator import PipelineOrchestrator, RUN_REPORT_FILENAME
+
+    with tempfile.TemporaryDirectory(prefix="act_bench_") as tmp:
+        workdir = Path(tmp)
+        configure_isolated_run(workdir, scrape_delay)
+        provider = FakeTTSProvider(tts_config)
+
+        with LocalNovelSite(site_config) as site, only_fake_provider(provider):
+            orchestrator = PipelineOrchestrator(
+                project_name=f"benchmark_{run_index}",
+                voice=FAKE_VOICE_ID,
+                provider=FAKE_PROVIDER_NAME,
+                base_output_dir=workdir / "output",
+                novel_title="Synthetic Novel"
+            )
+
+            # Time each chapter exactly (scrape + convert + save)
+            chapter_latencies: List[float] = []
+            process_chapter = orchestrator.process_chapter
+
+            def timed_process_chapter(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return process_chapter(*args, **kwargs)
+                finally:
+                    chapter_latencies.append(time.perf_counter() - start)
+
+            orchestrator.process_chapter = timed_process_chapter  # type: ignore[method-assign]
+
+            with PeakRssSampler() as rss:
+                start = time.perf_counter()
+                result = orchestrator.run_full_pipeline(
+                    toc_url=site.toc_url,
+                    novel_url=site.novel_url,
+                    novel_title="Synthetic Novel",
+                    voice=FAKE_VOICE_ID,
+                    provider=FAKE_PROVIDER_NAME
+                )
+                wall_seconds = time.perf_counter() - start
+
+            report_path = orchestrator.conversion_coordinator.file_manager.get_metadata_dir() / RUN_REPORT_FILENAME
+            stage_metrics = {}
+            if report_path.exists():
+                stage_metrics = json.loads(report_path.read_text(encoding="utf-8")).get("metrics", {})
+
+    completed = result.get("completed", 0)
+    return {
+        "success": result.get("success", False),
+        "completed": completed,
+        "failed": result.get("failed", 0),
+        "wall_seconds": round(wall_seconds, 3),
+        "chapters_per_minute": round(completed / wall_seconds * 60.0, 2) if wall_seconds > 0 else None,
+        "chapter_latency_p50": _round(percentile(chapter_latencies, 50)),
+        "chapter_latency_p95": _round(percentile(chapter_latencies, 95)),
+        "peak_rss_mb": rss.peak_mb,
+        "tts_calls": provider.calls,
+        "tts_failures": provider.failures,
+        "stage_metrics": stage_metrics,
+    }
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of each compared value across runs."""
+    summary: Dict[str, Any] = {}
+    for key in COMPARED_RESULTS:
+        values = [run[key] for run in runs if run.get(key) is not None]
+        summary[key] = statistics.median(values) if values else None
+    summary["completed"] = min(run["completed"] for run in runs)
+    summary["failed"] = max(run["failed"] for run in runs)
+    return summary
+
+
+def find_previous_result(results_dir: Path, params: Dict[str, Any], exclude: Path) -> Optional[Path]:
+    """Most recent stored result with the same parameters."""
+    candidates = sorted(results_dir.glob("*.json"), reverse=True)
+    for candidate in candidates:
+        if candidate == exclude:
+            continue
+        try:
+            data = json.loads(candidate.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if data.get("params") == params:
+            return candidate
+    return None
+
+
+def print_comparison(current: Dict[str, Any], baseline: Dict[str, Any], baseline_path: Path) -> None:
+    base_rev = baseline.get("git", {}).get("commit") or "?"
+    print(f"\nComparison with {baseline_path.name} (commit {base_rev}):")
+    for key, higher_is_better in COMPARED_RESULTS.items():
+        new = current["summary"].get(key)
+        old = baseline.get("summary", {}).get(key)
+        if new is None or old is None or old == 0:
+            print(f"  {key:22s} {old!s:>10} -> {new!s:>10}")
+            continue
+        change = (new - old) / old * 100.0
+        if abs(change) < NOISE_PERCENT:
+            marker = "same"
+        elif (change > 0) == higher_is_better:
+            marker = "better"
+        else:
+            marker = "worse"
+        print(f"  {key:22s} {old:>10.3f} -> {new:>10.3f}  ({change:+.1f}%, {marker})")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline end-to-end throughput benchmark")
+    site = parser.add_argument_group("synthetic site")
+    site.add_argument("--chapters", type=int, default=20, help="Number of chapters (default: 20)")
+    site.add_argument("--paragraphs", type=int, default=30, help="Paragraphs per chapter (default: 30)")
+    site.add_argument("--words", type=int, default=60, help="Words per paragraph (default: 60)")
+    site.add_argument("--toc-page-size", type=int, default=0,
+                      help="Chapters per TOC page, 0 for a single page (default: 0)")
+    site.add_argument("--site-latency", type=float, default=0.0, help="Seconds added to every request")
+    tts = parser.add_argument_group("fake TTS")
+    tts.add_argument("--tts-latency", type=float, default=0.01, help="Base seconds per TTS call")
+    tts.add_argument("--tts-latency-per-kchar", type=float, default=0.005, help="Extra seconds per 1000 chars")
+    tts.add_argument("--tts-error-rate", type=float, default=0.0, help="Fraction of TTS calls that fail")
+    parser.add_argument("--log-level", default="ERROR",
+                        help="ACT log level during runs; logging costs time too (default: ERROR)")
+    parser.add_argument("--scrape-delay", type=float, default=0.0, help="Scraper politeness delay (default: 0)")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for site content and TTS failures")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of runs; the summary uses medians")
+    parser.add_argument("--label", default="", help="Free-text label stored with the result")
+    parser.add_argument("--results-dir", type=Path, default=DEFAULT_RESULTS_DIR, help="Where results are stored")
+    parser.add_argument("--no-save", action="store_true", help="Do not store the result")
+    parser.add_argument("--compare", action="store_true", help="Compare with the previous result with the same parameters")
+    parser.add_argument("--baseline", type=Path, help="Compare with this result file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    from core.logger import ACTLogger
+    ACTLogger.set_level(args.log_level)
+
+    site_config = SiteConfig(
+        chapters=args.chapters,
+        paragraphs_per_chapter=args.paragraphs,
+        words_per_paragraph=args.words,
+        chapters_per_toc_page=args.toc_page_size,
+        latency=args.site_latency,
+        seed=args.seed,
+    )
+    tts_config = FakeTTSConfig(
+        base_latency=args.tts_latency,
+        latency_per_kchar=args.tts_latency_per_kchar,
+        error_rate=args.tts_error_rate,
+        seed=args.seed,
+    )
+    params = {"site": asdict(site_config), "tts": asdict(tts_config), "scrape_delay": args.scrape_delay}
+
+    runs = []
+    for index in range(max(1, args.repeat)):
+        print(f"Run {index + 1}/{max(1, args.repeat)}: {args.chapters} chapters...", flush=True)
+        run = run_once(site_config, tts_config, args.scrape_delay, index)
+        print(
+            f"  {run['completed']} completed, {run['failed']} failed in {run['wall_seconds']:.2f}s "
+            f"({run['chapters_per_minute']} chapters/min, p50 {run['chapter_latency_p50']}, "
+            f"p95 {run['chapter_latency_p95']}, peak RSS {run['peak_rss_mb']} MB)",
+            flush=True
+        )
+        runs.append(run)
+
+    git = git_revision()
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    result = {
+        "timestamp": timestamp,
+        "label": args.label,
+        "git": git,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "summary": summarize_runs(runs),
+        "runs": runs,
+    }
+
+    result_path = args.results_dir / f"{timestamp}_{git.get('commit') or 'nogit'}.json"
+    if not args.no_save:
+        args.results_dir.mkdir(parents=True, exist_ok=True)
+        result_path.write_text(json.dumps(result, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"\nResult saved to {result_path}")
+
+    baseline_path = args.baseline
+    if baseline_path is None and args.compare:
+        baseline_path = find_previous_result(args.results_dir, params, exclude=result_path)
+        if baseline_path is None:
+            print("\nNo previous result with the same parameters to compare with")
+    if baseline_path is not None:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        print_comparison(result, baseline, baseline_path)
+
+    return 0 if all(run["success"] for run in runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
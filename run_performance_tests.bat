@@ -49,6 +49,25 @@ if %ERRORLEVEL% EQU 0 (
     echo [FAIL] Performance benchmarks failed
 )
 
+echo.
+echo ========================================
+echo    Running Micro-Benchmarks
+echo ========================================
+echo.
+echo Running hot-path micro-benchmarks against stored thresholds...
+echo.
+
+pytest benchmarks/micro -n 0 --dist no --no-cov -v --benchmark-only --benchmark-json=micro_benchmark_results.json
+
+if %ERRORLEVEL% EQU 0 (
+    echo.
+    echo [PASS] Micro-benchmarks completed
+    echo Check micro_benchmark_results.json for detailed results
+) else (
+    echo.
+    echo [FAIL] Micro-benchmarks failed or regressed past their thresholds
+)
+
 echo.
 echo ========================================
 echo    Running Property-Based Tests
@@ -74,6 +93,7 @@ echo.
 echo Results saved to:
 echo - performance_report.md
 echo - benchmark_results.json
+echo - micro_benchmark_results.json
 echo.
 
 pause
@@ -53,6 +53,7 @@ class ConfigManager:
                 "version": "1.1.0",
                 "theme": "light",
                 "language": "es",
+                "verbose_chunk_logging": False,
             },
             "paths": {
                 "output_dir": str(Path.home() / "Desktop"),
@@ -66,6 +67,9 @@ class ConfigManager:
                 "volume": "+0%",
                 "output_format": "mp3",
                 "bitrate": "128k",
+                "direct_audio_write": True,
+                # 0 = CPU count, at most 4 (each worker holds a decoded batch in memory)
+                "merge_workers": 0,
             },
             "scraper": {
                 "chapters_per_file": 1,
@@ -77,6 +81,10 @@ class ConfigManager:
                 "font_size": 12,
                 "word_wrap": True,
             },
+            "metrics": {
+                "run_report": True,
+                "prometheus_file": "",
+            },
             "ui": {
                 "window_width": 1200,
                 "window_height": 800,
@@ -3,18 +3,40 @@ Robust logging system for ACT.
 
 Provides centralized logging configuration with file and console handlers,
 log rotation, and different log levels for different components.
+
+Records are handed to a queue and written by a dedicated listener thread,
+so formatting and file I/O don't run on worker threads.
 """
 
+import atexit
 import logging
 import logging.handlers
+import multiprocessing
+import queue
 import sys
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, List, Optional
 
 from .constants import MAX_LOG_FILE_SIZE_MB, ERROR_LOG_FILE_SIZE_MB, LOG_BACKUP_COUNT, ERROR_LOG_BACKUP_COUNT
 
 
-__all__ = ["ACTLogger", "get_logger"]
+__all__ = ["ACTLogger", "get_logger", "get_chunk_logger", "CHUNK_LOGGER_NAME"]
+
+# Per-chunk / per-conversion detail on TTS hot paths goes to its own logger.
+# It is logged at INFO, but the logger sits at WARNING unless verbose chunk
+# logging is enabled (see ACTLogger.set_verbose_chunk_logging), so by default
+# no record is created and the "act" DEBUG level does not let it through.
+CHUNK_LOGGER_NAME = "act.tts.chunks"
+_CHUNK_LOGGER_QUIET_LEVEL = logging.WARNING
+logging.getLogger(CHUNK_LOGGER_NAME).setLevel(_CHUNK_LOGGER_QUIET_LEVEL)
+
+
+class _ForwardingHandler(logging.Handler):
+    """Hands records from worker processes to this process's logger of the same name."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
 
 
 class ACTLogger:
@@ -59,7 +81,6 @@ class ACTLogger:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         console_handler.setFormatter(console_format)
-        root_logger.addHandler(console_handler)
 
         # File handler - DEBUG level and above (with rotation)
         file_handler = logging.handlers.RotatingFileHandler(
@@ -74,7 +95,6 @@ class ACTLogger:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_format)
-        root_logger.addHandler(file_handler)
 
         # Error file handler - ERROR level and above
         error_handler = logging.handlers.RotatingFileHandler(
@@ -85,7 +105,26 @@ class ACTLogger:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_format)
-        root_logger.addHandler(error_handler)
+
+        self.handlers: List[logging.Handler] = [console_handler, file_handler, error_handler]
+
+        # Loggers only enqueue records; the listener thread formats and writes them
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *self.handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self) -> None:
+        """Stop the listener thread after writing all queued records."""
+        listener = getattr(self, "_listener", None)
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+            for handler in self.handlers:
+                handler.flush()
 
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
@@ -121,10 +160,68 @@ class ACTLogger:
         root_logger = logging.getLogger("act")
         root_logger.setLevel(log_level)
 
-        # Update all handlers
-        for handler in root_logger.handlers:
+        # Update all handlers (including those behind the queue listener)
+        for handler in root_logger.handlers + ACTLogger().handlers:
             handler.setLevel(log_level)
 
+    @staticmethod
+    def set_verbose_chunk_logging(enabled: bool) -> None:
+        """
+        Turn per-chunk TTS detail logs on or off.
+
+        Args:
+            enabled: If True, chunk/conversion detail (logged at INFO on the
+                chunk logger) is written; otherwise the chunk logger drops it
+                before a record is created
+        """
+        level = logging.INFO if enabled else _CHUNK_LOGGER_QUIET_LEVEL
+        logging.getLogger(CHUNK_LOGGER_NAME).setLevel(level)
+
+    @staticmethod
+    @contextmanager
+    def process_log_queue() -> Iterator[Any]:
+        """
+        Collect log records from worker processes while the block runs.
+
+        Pass the yielded queue to configure_worker_process() in each worker
+        (e.g. through a process pool initializer). Records are handed to this
+        process's loggers, so they end up in the same handlers and log files.
+
+        Example:
+            >>> with ACTLogger.process_log_queue() as log_queue:
+            ...     ProcessPoolExecutor(initializer=ACTLogger.configure_worker_process,
+            ...                         initargs=(log_queue, logging.DEBUG))
+        """
+        log_queue: Any = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, _ForwardingHandler())
+        listener.start()
+        try:
+            yield log_queue
+        finally:
+            listener.stop()
+            log_queue.close()
+            log_queue.join_thread()
+
+    @staticmethod
+    def configure_worker_process(log_queue: Any, level: int) -> None:
+        """
+        Send this worker process's "act" records to the parent's queue.
+
+        A forked worker inherits the parent's queue handler but not its
+        listener thread, and a spawned one may have set up its own file
+        handlers by importing the entry module; both are replaced.
+
+        Args:
+            log_queue: Queue from process_log_queue() in the parent
+            level: Level for the "act" logger (usually the parent's)
+        """
+        if ACTLogger._instance is not None:
+            ACTLogger._instance.shutdown()
+        root_logger = logging.getLogger("act")
+        root_logger.handlers.clear()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        root_logger.setLevel(level)
+
     @staticmethod
     def get_log_file_path() -> Path:
         """
@@ -151,6 +248,19 @@ class ACTLogger:
 # Logger is initialized lazily when first requested
 
 
+def get_chunk_logger() -> logging.Logger:
+    """
+    Logger for per-chunk / per-conversion detail on hot paths.
+
+    Log at INFO; guard anything costly to build with isEnabledFor(logging.INFO).
+
+    Example:
+        >>> chunk_logger = get_chunk_logger()
+        >>> chunk_logger.info("Converted chunk %d/%d", i, total)
+    """
+    return logging.getLogger(CHUNK_LOGGER_NAME)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Convenience function to get a logger.
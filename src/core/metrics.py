@@ -0,0 +1,386 @@
+"""
+Lightweight metrics for ACT pipeline runs.
+
+Process-wide registry of counters, gauges and histograms, plus a span()
+context manager that times a block into a histogram. Metrics are cheap
+enough to record on hot paths (one lock per update) and can be exported
+as a JSON run report or a Prometheus text exposition file.
+
+Usage:
+    from core.metrics import get_metrics
+
+    metrics = get_metrics()
+    with metrics.span("scraper_fetch_seconds"):
+        response = session.get(url)
+    metrics.counter("files_bytes_written_total").inc(len(data))
+
+Only the standard library is used so this module can be imported from
+any layer (scraper, tts, processor) without pulling in dependencies.
+"""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+# Default histogram buckets, in seconds (covers sub-ms parsing to multi-minute chapters)
+DEFAULT_TIME_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0
+)
+
+# Buckets for counts (chunks per chapter, queue sizes)
+DEFAULT_COUNT_BUCKETS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter by amount (must not be negative)."""
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} cannot be decreased")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": self.kind, "value": self._value}
+
+
+class Gauge:
+    """Value that goes up and down (e.g. queue depth). Tracks its peak."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+            self._max = max(self._max, value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+            self._max = max(self._max, self._value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": self.kind, "value": self._value, "max": self._max}
+
+
+class Histogram:
+    """
+    Distribution of observed values in fixed buckets.
+
+    Keeps count, sum and cumulative-style bucket counts (as Prometheus does);
+    quantiles in reports are estimated from the buckets.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str = "", buckets: Optional[Sequence[float]] = None):
+        self.name = name
+        self.description = description
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets or DEFAULT_TIME_BUCKETS))
+        # One slot per bucket plus +Inf
+        self._bucket_counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "type": self.kind,
+                "count": self._count,
+                "sum": self._sum,
+                "buckets": list(self.buckets),
+                "bucket_counts": list(self._bucket_counts),
+            }
+
+
+def estimate_quantile(buckets: Sequence[float], bucket_counts: Sequence[int], quantile: float) -> Optional[float]:
+    """
+    Estimate a quantile from histogram buckets by linear interpolation.
+
+    Args:
+        buckets: Upper bounds of the finite buckets (sorted)
+        bucket_counts: Observations per bucket, with the +Inf bucket last
+        quantile: Quantile to estimate (0.0-1.0)
+
+    Returns:
+        Estimated value, or None if there are no observations
+    """
+    total = sum(bucket_counts)
+    if total == 0:
+        return None
+    rank = quantile * total
+    seen = 0
+    for i, count in enumerate(bucket_counts):
+        if count and seen + count >= rank:
+            if i >= len(buckets):
+                # Overflow bucket has no upper bound; report the largest finite bound
+                return buckets[-1] if buckets else None
+            lower = buckets[i - 1] if i > 0 else 0.0
+            upper = buckets[i]
+            return lower + (upper - lower) * ((rank - seen) / count)
+        seen += count
+    return buckets[-1] if buckets else None
+
+
+def diff_snapshots(after: Dict[str, Dict[str, Any]], before: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Subtract an earlier snapshot from a later one.
+
+    Counters and histograms become the activity between the two snapshots;
+    gauges keep their latest value and peak.
+    """
+    result: Dict[str, Dict[str, Any]] = {}
+    for name, data in after.items():
+        previous = before.get(name)
+        if previous is None or previous.get("type") != data.get("type"):
+            result[name] = data
+            continue
+        if data["type"] == Counter.kind:
+            result[name] = {"type": data["type"], "value": data["value"] - previous["value"]}
+        elif data["type"] == Histogram.kind and data["buckets"] == previous["buckets"]:
+            result[name] = {
+                "type": data["type"],
+                "count": data["count"] - previous["count"],
+                "sum": data["sum"] - previous["sum"],
+                "buckets": data["buckets"],
+                "bucket_counts": [a - b for a, b in zip(data["bucket_counts"], previous["bucket_counts"])],
+            }
+        else:
+            result[name] = data
+    return result
+
+
+def summarize(snapshot: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Add mean/p50/p95 to histogram entries of a snapshot for human-readable reports."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for name, data in snapshot.items():
+        entry = dict(data)
+        if data["type"] == Histogram.kind:
+            count = data["count"]
+            entry["mean"] = data["sum"] / count if count else None
+            entry["p50"] = estimate_quantile(data["buckets"], data["bucket_counts"], 0.5)
+            entry["p95"] = estimate_quantile(data["buckets"], data["bucket_counts"], 0.95)
+        summary[name] = entry
+    return summary
+
+
+def _format_prometheus_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Thread-safe registry of named metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory: Any, *args: Any) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = factory(name, *args)
+                    self._metrics[name] = metric
+        if not isinstance(metric, factory):
+            raise TypeError(f"Metric {name} is a {metric.kind}, not a {factory.kind}")
+        return metric
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(name, Counter, description)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(name, Gauge, description)
+
+    def histogram(self, name: str, description: str = "", buckets: Optional[Sequence[float]] = None) -> Histogram:
+        """Get or create a histogram (buckets only apply on creation)."""
+        return self._get_or_create(name, Histogram, description, buckets)
+
+    @contextmanager
+    def span(self, name: str, description: str = "") -> Iterator[None]:
+        """
+        Time a block into the histogram called name (seconds).
+
+        The duration is recorded even if the block raises.
+        """
+        histogram = self.histogram(name, description)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a point-in-time copy of all metric values."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def reset(self) -> None:
+        """Drop all metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def write_json_report(
+        self,
+        path: Path,
+        since: Optional[Dict[str, Dict[str, Any]]] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Write a JSON run report.
+
+        Args:
+            path: Report file path (parent directories are created)
+            since: Optional earlier snapshot; if given, the report covers only
+                activity after it
+            extra: Optional run information stored under "run"
+
+        Returns:
+            Path to the written report
+        """
+        snapshot = self.snapshot()
+        if since is not None:
+            snapshot = diff_snapshots(snapshot, since)
+        report = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "run": extra or {},
+            "metrics": summarize(snapshot),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        return path
+
+    def to_prometheus_text(self, prefix: str = "act_") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+
+        lines = []
+        for metric in metrics:
+            name = prefix + metric.name
+            if metric.description:
+                lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            data = metric.snapshot()
+            if metric.kind == Histogram.kind:
+                cumulative = 0
+                for bound, count in zip(data["buckets"] + [math.inf], data["bucket_counts"]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{le="{_format_prometheus_value(bound)}"}} {cumulative}')
+                lines.append(f"{name}_sum {_format_prometheus_value(data['sum'])}")
+                lines.append(f"{name}_count {data['count']}")
+            else:
+                lines.append(f"{name} {_format_prometheus_value(data['value'])}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path, prefix: str = "act_") -> Path:
+        """
+        Write metrics to a Prometheus text file (e.g. for node_exporter's textfile collector).
+
+        Written to a temp file and renamed so scrapers never see a partial file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(self.to_prometheus_text(prefix), encoding="utf-8")
+        temp_path.replace(path)
+        return path
+
+
+# Global registry instance
+_metrics: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Get the global metrics registry.
+
+    Returns:
+        MetricsRegistry instance
+    """
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = MetricsRegistry()
+    return _metrics
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics",
+    "diff_snapshots",
+    "summarize",
+    "estimate_quantile",
+    "DEFAULT_TIME_BUCKETS",
+    "DEFAULT_COUNT_BUCKETS",
+]
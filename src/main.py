@@ -5,6 +5,7 @@ This module initializes the application, sets up logging and configuration,
 and launches the GUI.
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from core.constants import LOG_SEPARATOR_WIDTH, get_version
 _ = ACTLogger()
 logger = get_logger("main")
 config = get_config()
+ACTLogger.set_verbose_chunk_logging(bool(config.get("app.verbose_chunk_logging", False)))
 
 
 def main() -> int:
@@ -75,4 +77,5 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # audio batch merging uses worker processes
     sys.exit(main())
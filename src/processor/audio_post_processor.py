@@ -5,15 +5,43 @@ This module contains the AudioPostProcessor class that handles all
 audio file merging operations including single file and batched merging.
 """
 
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from core.logger import get_logger
+from core.config_manager import get_config
+from core.logger import ACTLogger, get_logger
+from core.metrics import get_metrics
 
 from .context import ProcessingContext
 
 logger = get_logger("processor.audio_post_processor")
 
+BATCH_SECONDS_METRIC = "audio_post_merge_batch_seconds"
+DEFAULT_MAX_MERGE_WORKERS = 4  # Default pool size cap; each worker may hold a whole decoded batch in memory
+
+
+def _merge_batch(batch_files: List[Path], output_path: Path, config: Any = None) -> Tuple[bool, float]:
+    """
+    Merge one batch of chapter files in a worker process.
+
+    Builds its own AudioMerger (merging needs no TTS provider) with the
+    parent merger's config. Metrics recorded in a worker stay in that
+    process, so the elapsed time is returned for the parent to record.
+
+    Returns:
+        Tuple of (success, seconds taken)
+    """
+    from tts.audio_merger import AudioMerger
+
+    start = time.perf_counter()
+    merger = AudioMerger(provider_manager=None, config=config)  # type: ignore[arg-type]
+    merged = merger.merge_audio_chunks(batch_files, output_path)
+    return merged, time.perf_counter() - start
+
 
 class AudioPostProcessor:
     """Handles audio file merging operations."""
@@ -65,40 +93,119 @@ class AudioPostProcessor:
 
     def _merge_in_batches(self, audio_merger, audio_files: List[Path],
                          output_format: Dict[str, Any]) -> bool:
-        """Merge audio files in batches."""
+        """
+        Merge audio files in batches.
+
+        Batches are independent, so they are merged concurrently in a process
+        pool (tts.merge_workers, 0 = one per CPU core). A failed batch does
+        not stop the others. With a single batch or a single worker the
+        given audio_merger is used in this process.
+        """
         batch_size = output_format.get('batch_size', 50)
         logger.info(f"Merging {len(audio_files)} audio files in batches of {batch_size}...")
 
-        success_count = 0
-        total_batches = (len(audio_files) + batch_size - 1) // batch_size
-
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min(start_idx + batch_size, len(audio_files))
-            batch_files = audio_files[start_idx:end_idx]
+        project_name = self.context.novel_title or self.context.project_name
+        safe_name = self.file_manager._sanitize_filename(project_name)
+        audio_dir = self.file_manager.get_audio_dir()
 
-            # Create output path for this batch
-            project_name = self.context.novel_title or self.context.project_name
-            safe_name = self.file_manager._sanitize_filename(project_name)
+        batches: List[Tuple[List[Path], Path]] = []
+        for start_idx in range(0, len(audio_files), batch_size):
+            batch_files = audio_files[start_idx:start_idx + batch_size]
             first_chapter = self._extract_chapter_num(batch_files[0])
             last_chapter = self._extract_chapter_num(batch_files[-1])
             batch_filename = f"{safe_name}_chapters_{first_chapter:04d}-{last_chapter:04d}.mp3"
-            batch_path = self.file_manager.get_audio_dir() / batch_filename
+            batches.append((batch_files, audio_dir / batch_filename))
 
-            logger.info(f"Merging batch {batch_num + 1}/{total_batches} ({len(batch_files)} files)...")
-            if audio_merger.merge_audio_chunks(batch_files, batch_path):
-                logger.info(f"✓ Successfully merged batch {batch_num + 1} into: {batch_path}")
-                success_count += 1
-            else:
-                logger.error(f"Failed to merge batch {batch_num + 1}")
+        total_batches = len(batches)
+        workers = min(total_batches, self._get_merge_workers())
+
+        if workers > 1:
+            results = self._merge_batches_parallel(batches, workers, getattr(audio_merger, "config", None))
+        else:
+            results = self._merge_batches_serial(audio_merger, batches)
 
+        success_count = sum(1 for merged in results.values() if merged)
         if success_count == total_batches:
             logger.info(f"✓ Successfully merged all {total_batches} batches")
             return True
         else:
-            logger.error(f"Failed to merge {total_batches - success_count} out of {total_batches} batches")
+            failed = sorted(batch_num + 1 for batch_num, merged in results.items() if not merged)
+            logger.error(f"Failed to merge {total_batches - success_count} out of {total_batches} batches "
+                         f"(batches {', '.join(map(str, failed))})")
             return False
 
+    def _merge_batches_serial(self, audio_merger,
+                              batches: List[Tuple[List[Path], Path]]) -> Dict[int, bool]:
+        """Merge batches one after another in this process."""
+        results: Dict[int, bool] = {}
+        for batch_num, (batch_files, batch_path) in enumerate(batches):
+            logger.info(f"Merging batch {batch_num + 1}/{len(batches)} ({len(batch_files)} files)...")
+            try:
+                with get_metrics().span(BATCH_SECONDS_METRIC, "Time to merge one batch of chapters"):
+                    merged = audio_merger.merge_audio_chunks(batch_files, batch_path)
+            except Exception as e:
+                logger.error(f"Error merging batch {batch_num + 1}: {e}")
+                merged = False
+            results[batch_num] = bool(merged)
+            self._report_batch_done(batch_num, batch_path, results, len(batches))
+        return results
+
+    def _merge_batches_parallel(self, batches: List[Tuple[List[Path], Path]],
+                                workers: int, config: Any = None) -> Dict[int, bool]:
+        """
+        Merge batches concurrently in a process pool.
+
+        Workers send their log records back through a queue, so merge errors
+        inside a worker still reach this process's log files.
+        """
+        logger.info(f"Merging {len(batches)} batches with {workers} worker processes...")
+        histogram = get_metrics().histogram(BATCH_SECONDS_METRIC, "Time to merge one batch of chapters")
+        results: Dict[int, bool] = {}
+
+        with ACTLogger.process_log_queue() as log_queue, \
+                ProcessPoolExecutor(max_workers=workers,
+                                    initializer=ACTLogger.configure_worker_process,
+                                    initargs=(log_queue, logging.getLogger("act").getEffectiveLevel())) as executor:
+            futures = {
+                executor.submit(_merge_batch, batch_files, batch_path, config): batch_num
+                for batch_num, (batch_files, batch_path) in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                batch_num = futures[future]
+                try:
+                    merged, seconds = future.result()
+                    histogram.observe(seconds)
+                except Exception as e:
+                    # Includes a worker dying (BrokenProcessPool); the other results still count
+                    logger.error(f"Error merging batch {batch_num + 1}: {e}")
+                    merged = False
+                results[batch_num] = bool(merged)
+                self._report_batch_done(batch_num, batches[batch_num][1], results, len(batches))
+        return results
+
+    def _report_batch_done(self, batch_num: int, batch_path: Path,
+                           results: Dict[int, bool], total_batches: int) -> None:
+        """Log a finished batch and report merge progress."""
+        if results[batch_num]:
+            logger.info(f"✓ Successfully merged batch {batch_num + 1} into: {batch_path}")
+        else:
+            logger.error(f"Failed to merge batch {batch_num + 1}")
+
+        if self.context.on_status_change:
+            self.context.on_status_change(
+                f"Merged {len(results)}/{total_batches} audio batches"
+            )
+
+    def _get_merge_workers(self) -> int:
+        """Number of merge worker processes (tts.merge_workers, 0 = CPU count up to DEFAULT_MAX_MERGE_WORKERS)."""
+        try:
+            workers = int(get_config().get("tts.merge_workers", 0) or 0)
+        except (TypeError, ValueError):
+            workers = 0
+        if workers <= 0:
+            workers = min(os.cpu_count() or 1, DEFAULT_MAX_MERGE_WORKERS)
+        return workers
+
     def _merge_single_file(self, audio_merger, audio_files: List[Path]) -> bool:
         """Merge all audio files into a single file."""
         logger.info(f"Merging {len(audio_files)} audio files into single file...")
@@ -109,7 +216,8 @@ class AudioPostProcessor:
         merged_filename = f"{safe_name}_complete.mp3"
         merged_path = self.file_manager.get_audio_dir() / merged_filename
 
-        success = audio_merger.merge_audio_chunks(audio_files, merged_path)
+        with get_metrics().span("audio_post_merge_seconds", "Time to merge all chapters into one file"):
+            success = audio_merger.merge_audio_chunks(audio_files, merged_path)
 
         if success:
             logger.info(f"✓ Successfully merged audio files into: {merged_path}")
@@ -5,8 +5,7 @@ Manages chapter data structures, sequencing, and metadata
 throughout the processing workflow.
 """
 
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Callable, Tuple
 from enum import Enum
 
 from core.logger import get_logger
@@ -24,28 +23,85 @@ class ChapterStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
 class Chapter:
     """
     Represents a single chapter in a novel.
     
     Contains all metadata and state information for a chapter
     throughout the processing pipeline.
+    
+    Uses __slots__ to keep per-chapter overhead small for large catalogs.
+    Status changes are reported to the owning ChapterManager so its
+    status buckets stay current.
     """
-    number: int
-    url: str
-    title: Optional[str] = None
-    content: Optional[str] = None
-    status: ChapterStatus = ChapterStatus.PENDING
-    error_message: Optional[str] = None
     
-    # File paths
-    text_file_path: Optional[str] = None
-    audio_file_path: Optional[str] = None
+    __slots__ = (
+        "number", "url", "title", "content", "_status", "error_message",
+        "text_file_path", "audio_file_path", "scraped_at", "converted_at",
+        "_on_status_change",
+    )
+    
+    def __init__(
+        self,
+        number: int,
+        url: str,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        status: ChapterStatus = ChapterStatus.PENDING,
+        error_message: Optional[str] = None,
+        text_file_path: Optional[str] = None,
+        audio_file_path: Optional[str] = None,
+        scraped_at: Optional[str] = None,
+        converted_at: Optional[str] = None
+    ):
+        self.number = number
+        self.url = url
+        self.title = title
+        # Scraped text, only held until it is saved to text_file_path
+        self.content = content
+        self._status = status
+        self.error_message = error_message
+        
+        # File paths
+        self.text_file_path = text_file_path
+        self.audio_file_path = audio_file_path
+        
+        # Processing metadata
+        self.scraped_at = scraped_at
+        self.converted_at = converted_at
+        
+        self._on_status_change: Optional[Callable[["Chapter", ChapterStatus], None]] = None
+    
+    @property
+    def status(self) -> ChapterStatus:
+        """Current processing status."""
+        return self._status
+    
+    @status.setter
+    def status(self, value: ChapterStatus) -> None:
+        previous = self._status
+        self._status = value
+        if previous is not value and self._on_status_change is not None:
+            self._on_status_change(self, previous)
+    
+    def _fields(self) -> Tuple[Any, ...]:
+        return (
+            self.number, self.url, self.title, self.content, self._status, self.error_message,
+            self.text_file_path, self.audio_file_path, self.scraped_at, self.converted_at
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore[attr-defined]
     
-    # Processing metadata
-    scraped_at: Optional[str] = None
-    converted_at: Optional[str] = None
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        return (
+            f"Chapter(number={self.number!r}, url={self.url!r}, title={self.title!r}, "
+            f"status={self._status!r})"
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert chapter to dictionary for serialization."""
@@ -84,6 +140,9 @@ class ChapterManager:
     Manages chapters for a novel project.
     
     Handles chapter organization, sequencing, and status tracking.
+    
+    Chapters are bucketed by status as their status changes, so status
+    queries and summaries don't scan the whole chapter list.
     """
     
     def __init__(self, chapters: Optional[List[Chapter]] = None):
@@ -96,14 +155,31 @@ class ChapterManager:
         self.chapters: List[Chapter] = chapters or []
         self._index_by_number: Dict[int, Chapter] = {}
         self._index_by_url: Dict[str, Chapter] = {}
+        # Status -> {id(chapter): chapter}
+        self._by_status: Dict[ChapterStatus, Dict[int, Chapter]] = {}
         
         # Build indices
         self._rebuild_indices()
     
     def _rebuild_indices(self) -> None:
         """Rebuild internal indices for fast lookup."""
-        self._index_by_number = {ch.number: ch for ch in self.chapters}
-        self._index_by_url = {ch.url: ch for ch in self.chapters}
+        self._index_by_number = {}
+        self._index_by_url = {}
+        self._by_status = {status: {} for status in ChapterStatus}
+        for chapter in self.chapters:
+            self._index_chapter(chapter)
+    
+    def _index_chapter(self, chapter: Chapter) -> None:
+        """Add a chapter to the lookup indices and its status bucket."""
+        self._index_by_number[chapter.number] = chapter
+        self._index_by_url[chapter.url] = chapter
+        self._by_status[chapter.status][id(chapter)] = chapter
+        chapter._on_status_change = self._on_status_change
+    
+    def _on_status_change(self, chapter: Chapter, previous: ChapterStatus) -> None:
+        """Move a chapter between status buckets."""
+        self._by_status[previous].pop(id(chapter), None)
+        self._by_status[chapter.status][id(chapter)] = chapter
     
     def add_chapter(
         self,
@@ -126,7 +202,11 @@ class ChapterManager:
         if number in self._index_by_number:
             logger.warning(f"Chapter {number} already exists, updating")
             chapter = self._index_by_number[number]
-            chapter.url = url
+            if chapter.url != url:
+                if self._index_by_url.get(chapter.url) is chapter:
+                    del self._index_by_url[chapter.url]
+                chapter.url = url
+                self._index_by_url[url] = chapter
             if title:
                 chapter.title = title
             return chapter
@@ -134,7 +214,7 @@ class ChapterManager:
         # Create new chapter
         chapter = Chapter(number=number, url=url, title=title)
         self.chapters.append(chapter)
-        self._rebuild_indices()
+        self._index_chapter(chapter)
         
         logger.debug(f"Added chapter {number}: {url}")
         return chapter
@@ -220,9 +300,21 @@ class ChapterManager:
             status: Status to filter by
             
         Returns:
-            List of chapters with the specified status
+            List of chapters with the specified status, sorted by number
+        """
+        return sorted(self._by_status.get(status, {}).values(), key=lambda ch: ch.number)
+    
+    def count_by_status(self, status: ChapterStatus) -> int:
+        """
+        Count chapters with a specific status.
+        
+        Args:
+            status: Status to count
+            
+        Returns:
+            Number of chapters with the specified status
         """
-        return [ch for ch in self.chapters if ch.status == status]
+        return len(self._by_status.get(status, {}))
     
     def get_pending_chapters(self) -> List[Chapter]:
         """Get all pending chapters."""
@@ -319,6 +411,8 @@ class ChapterManager:
         
         if text_file_path:
             chapter.text_file_path = text_file_path
+            # Content is persisted now, don't keep it in memory
+            chapter.content = None
         if audio_file_path:
             chapter.audio_file_path = audio_file_path
             chapter.status = ChapterStatus.CONVERTED
@@ -337,10 +431,7 @@ class ChapterManager:
         Returns:
             Dictionary mapping status names to counts
         """
-        summary = {}
-        for status in ChapterStatus:
-            summary[status.value] = len(self.get_chapters_by_status(status))
-        return summary
+        return {status.value: len(bucket) for status, bucket in self._by_status.items()}
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert chapter manager to dictionary for serialization."""
@@ -353,11 +444,3 @@ class ChapterManager:
         """Create chapter manager from dictionary."""
         chapters = [Chapter.from_dict(ch_data) for ch_data in data.get("chapters", [])]
         return cls(chapters=chapters)
-
-
-
-
-
-
-
-
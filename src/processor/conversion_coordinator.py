@@ -5,10 +5,12 @@ This module contains the ConversionCoordinator class that handles all
 TTS conversion operations and file management tasks.
 """
 
+from enum import Enum
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Tuple
 
 from core.logger import get_logger
+from core.metrics import get_metrics
 from tts import TTSEngine
 
 from .project_manager import ProjectManager
@@ -19,6 +21,13 @@ from .context import ProcessingContext
 logger = get_logger("processor.conversion_coordinator")
 
 
+class ChapterPlan(Enum):
+    """What still needs to be done for a chapter."""
+    DONE = "done"            # Audio file already exists
+    TEXT_ONLY = "text_only"  # Saved text exists, audio missing
+    MISSING = "missing"      # Needs scraping and conversion
+
+
 class ConversionCoordinator:
     """Handles TTS conversion and file management."""
 
@@ -36,13 +45,20 @@ class ConversionCoordinator:
         content: str,
         title: Optional[str],
         skip_if_exists: bool = True,
-        on_failure: Optional[Callable[[int, Exception], None]] = None
+        on_failure: Optional[Callable[[int, Exception], None]] = None,
+        text_file_path: Optional[Path] = None
     ) -> bool:
-        """Convert a single chapter to audio."""
+        """
+        Convert a single chapter to audio.
+
+        If text_file_path is given, content was loaded from that saved text
+        file and it is not written again.
+        """
         if self.context.check_should_stop():
             return False
 
         chapter_num = chapter.number
+        temp_audio_path: Optional[Path] = None
 
         # Check if already completed
         if skip_if_exists and self.file_manager.audio_file_exists(chapter_num):
@@ -55,12 +71,13 @@ class ConversionCoordinator:
             if self.context.check_should_stop():
                 return False
 
-            # Step 1: Save text file
-            text_file_path = self.file_manager.save_text_file(
-                chapter_num,
-                content,
-                title
-            )
+            # Step 1: Save text file (unless reusing an already saved one)
+            if text_file_path is None:
+                text_file_path = self.file_manager.save_text_file(
+                    chapter_num,
+                    content,
+                    title
+                )
             chapter.text_file_path = str(text_file_path)
 
             # Check for pause/stop before TTS conversion
@@ -76,19 +93,19 @@ class ConversionCoordinator:
             chapter_title = f"Chapter {chapter_num}"
             formatted_text = format_chapter_intro(chapter_title, content)
 
-            # Create temporary audio file path
-            import tempfile
-            temp_dir = Path(tempfile.gettempdir())
-            temp_audio_path = temp_dir / f"chapter_{chapter_num}_temp.mp3"
+            # Unique temp path per chapter and attempt (next to the final file by default)
+            temp_audio_path = self.file_manager.new_audio_temp_path(chapter_num)
 
             # Convert to speech
             voice = self.context.voice if self.context.voice else None
-            success = self.tts_engine.convert_text_to_speech(
-                text=formatted_text,
-                output_path=temp_audio_path,
-                voice=voice,
-                provider=self.context.provider
-            )
+            metrics = get_metrics()
+            with metrics.span("tts_chapter_seconds", "Chapter text-to-speech time"):
+                success = self.tts_engine.convert_text_to_speech(
+                    text=formatted_text,
+                    output_path=temp_audio_path,
+                    voice=voice,
+                    provider=self.context.provider
+                )
 
             # Check stop flag after TTS conversion
             if self.context.check_should_stop():
@@ -98,13 +115,15 @@ class ConversionCoordinator:
             if not success:
                 error_msg = "Failed to convert to audio"
                 logger.error(f"Error converting chapter {chapter_num}: {error_msg}")
+                metrics.counter("tts_chapter_failures_total", "Chapters that failed to convert").inc()
                 return False
 
             # Step 3: Save audio file
             audio_file_path = self.file_manager.save_audio_file(
                 chapter_num,
                 temp_audio_path,
-                title
+                title,
+                move=True
             )
 
             # Verify audio file was saved correctly
@@ -116,10 +135,6 @@ class ConversionCoordinator:
             logger.debug(f"Audio file saved: {audio_file_path} ({audio_file_path.stat().st_size} bytes)")
             chapter.audio_file_path = str(audio_file_path)
 
-            # Clean up temp file
-            if temp_audio_path.exists():
-                temp_audio_path.unlink()
-
             # Update chapter status in project manager
             chapter_manager = self.project_manager.get_chapter_manager()
             if chapter_manager:
@@ -147,6 +162,55 @@ class ConversionCoordinator:
 
             return False
 
+        finally:
+            # Temp audio is renamed into place on success; remove it on any other exit
+            if temp_audio_path is not None and temp_audio_path.exists():
+                try:
+                    temp_audio_path.unlink()
+                except OSError as cleanup_error:
+                    logger.warning(f"Could not remove temp audio for chapter {chapter_num}: {cleanup_error}")
+
+    def plan_chapter(self, chapter_num: int) -> ChapterPlan:
+        """Classify a chapter by the files already saved for it."""
+        if self.file_manager.audio_file_exists(chapter_num):
+            return ChapterPlan.DONE
+        if self.file_manager.find_text_file(chapter_num) is not None:
+            return ChapterPlan.TEXT_ONLY
+        return ChapterPlan.MISSING
+
+    def plan_chapters(self, chapters: List) -> Dict[int, ChapterPlan]:
+        """Classify chapters up front so only the needed work is dispatched."""
+        return {chapter.number: self.plan_chapter(chapter.number) for chapter in chapters}
+
+    def load_saved_text(self, chapter_num: int) -> Optional[Tuple[str, Optional[str], Path]]:
+        """
+        Load a previously saved chapter text file.
+
+        Returns:
+            Tuple of (content, title, text_file_path), or None if no usable text is saved.
+            The "Chapter N" header added by save_text_file is stripped from content and
+            the title is recovered from the filename.
+        """
+        text_file_path = self.file_manager.find_text_file(chapter_num)
+        if text_file_path is None:
+            return None
+
+        try:
+            content = text_file_path.read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read saved text for chapter {chapter_num}: {e}")
+            return None
+
+        header = f"Chapter {chapter_num}"
+        if content.startswith(header) and content[len(header):len(header) + 2] == "\n\n":
+            content = content[len(header):].strip()
+        if not content:
+            return None
+
+        prefix = f"chapter_{chapter_num:04d}_"
+        title = text_file_path.stem[len(prefix):] if text_file_path.stem.startswith(prefix) else None
+        return content, title or None, text_file_path
+
     def get_first_missing_chapter(self, chapters: list) -> Optional[int]:
         """Find the first chapter that doesn't have an audio file."""
         for chapter in chapters:
@@ -155,4 +219,4 @@ class ConversionCoordinator:
         return None
 
 
-__all__ = ["ConversionCoordinator"]
\ No newline at end of file
+__all__ = ["ConversionCoordinator", "ChapterPlan"]
\ No newline at end of file
@@ -8,10 +8,17 @@ organizing files by project and chapter.
 
 from pathlib import Path
 from typing import Optional, List
+import errno
+import os
 import shutil
+import tempfile
+import uuid
 
 from core.logger import get_logger
 from core.config_manager import get_config
+from core.metrics import get_metrics
+
+from .project_file_index import ProjectFileIndex
 
 logger = get_logger("processor.file_manager")
 
@@ -43,15 +50,24 @@ class FileManager:
             base_output_dir = Path(output_dir_str)
         
         self.base_output_dir = base_output_dir
+        
+        # Synthesize audio next to its final location and commit with os.replace
+        self.direct_audio_write = bool(self.config.get("tts.direct_audio_write", True))
         self.project_dir = base_output_dir / self.project_name
         
         # Subdirectories with title prefix: "novel_title_scraps" and "novel_title_audio"
         self.text_dir = self.project_dir / f"{self.novel_title}_scraps"
         self.audio_dir = self.project_dir / f"{self.novel_title}_audio"
+        # Synthesis temp files: same filesystem as audio_dir (saving is a rename), but writes
+        # there leave audio_dir's mtime alone so the file index is not rescanned per chapter
+        self.audio_temp_dir = self.audio_dir / ".tmp"
         self.metadata_dir = self.project_dir / "metadata"
         
         # Create directories
         self._create_directories()
+        
+        # Chapter → file snapshot of text/audio dirs (existence checks are dict lookups)
+        self.file_index = ProjectFileIndex(self.text_dir, self.audio_dir)
     
     def _sanitize_filename(self, name: str) -> str:
         """
@@ -159,7 +175,11 @@ class FileManager:
         
         # Save content
         try:
-            file_path.write_text(content_to_save, encoding="utf-8")
+            with self.file_index.text.tracking_write(file_path):
+                file_path.write_text(content_to_save, encoding="utf-8")
+            get_metrics().counter("files_text_bytes_written_total", "Bytes of chapter text written").inc(
+                file_path.stat().st_size
+            )
             logger.debug(f"Saved text file: {file_path}")
             return file_path
         except Exception as e:
@@ -170,7 +190,8 @@ class FileManager:
         self,
         chapter_num: int,
         audio_path: Path,
-        title: Optional[str] = None
+        title: Optional[str] = None,
+        move: bool = False
     ) -> Path:
         """
         Move or copy audio file to project audio directory.
@@ -179,6 +200,8 @@ class FileManager:
             chapter_num: Chapter number (1-indexed)
             audio_path: Path to existing audio file
             title: Optional chapter title (used in filename)
+            move: If True, commit audio_path with an atomic rename instead of
+                copying it (falls back to copy + rename across filesystems)
             
         Returns:
             Path to saved audio file in project directory
@@ -195,7 +218,14 @@ class FileManager:
         # Copy or move file
         try:
             if audio_path.exists():
-                shutil.copy2(audio_path, dest_path)
+                with self.file_index.audio.tracking_write(dest_path):
+                    if move:
+                        self._move_into_place(chapter_num, audio_path, dest_path)
+                    else:
+                        shutil.copy2(audio_path, dest_path)
+                get_metrics().counter("files_audio_bytes_written_total", "Bytes of chapter audio saved").inc(
+                    dest_path.stat().st_size
+                )
                 logger.debug(f"Saved audio file: {dest_path}")
                 return dest_path
             else:
@@ -205,6 +235,71 @@ class FileManager:
             logger.error(f"Error saving audio file {dest_path}: {e}")
             raise
     
+    def _move_into_place(self, chapter_num: int, source: Path, dest_path: Path) -> None:
+        """
+        Atomically move source to dest_path.
+        
+        Uses os.replace when both are on the same filesystem. Otherwise copies
+        to a temp file next to dest_path first, so the final rename is still atomic.
+        """
+        try:
+            os.replace(source, dest_path)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        
+        staging_path = self._ensure_audio_temp_dir() / self._audio_temp_name(chapter_num)
+        try:
+            shutil.copy2(source, staging_path)
+            os.replace(staging_path, dest_path)
+        finally:
+            if staging_path.exists():
+                staging_path.unlink()
+        source.unlink()
+    
+    def _audio_temp_name(self, chapter_num: int) -> str:
+        # Hidden, unique per chapter and attempt; keeps .mp3 so ffmpeg can infer the format
+        return f".chapter_{chapter_num:04d}.{uuid.uuid4().hex}.tmp.mp3"
+    
+    def _ensure_audio_temp_dir(self) -> Path:
+        self.audio_temp_dir.mkdir(parents=True, exist_ok=True)
+        return self.audio_temp_dir
+    
+    def new_audio_temp_path(self, chapter_num: int) -> Path:
+        """
+        Get a unique temporary path to synthesize a chapter's audio into.
+        
+        With direct_audio_write (default) the path is in a hidden subdirectory of
+        the audio directory, so save_audio_file(..., move=True) is a rename rather
+        than a copy, and synthesis does not invalidate the project file index.
+        
+        Args:
+            chapter_num: Chapter number (1-indexed)
+            
+        Returns:
+            Path for the temporary audio file (not created)
+        """
+        temp_dir = self._ensure_audio_temp_dir() if self.direct_audio_write else Path(tempfile.gettempdir())
+        return temp_dir / self._audio_temp_name(chapter_num)
+    
+    def discard_audio_temp_files(self, chapter_num: int) -> None:
+        """
+        Remove leftover temporary audio files for a chapter.
+        
+        Args:
+            chapter_num: Chapter number (1-indexed)
+        """
+        pattern = f".chapter_{chapter_num:04d}.*.tmp.mp3"
+        # audio_dir itself still holds temp files left by earlier versions
+        for temp_dir in {self.audio_temp_dir, self.audio_dir, Path(tempfile.gettempdir())}:
+            for temp_file in temp_dir.glob(pattern):
+                try:
+                    temp_file.unlink()
+                    logger.debug(f"Removed temp audio file: {temp_file}")
+                except OSError as e:
+                    logger.warning(f"Could not remove temp audio file {temp_file}: {e}")
+    
     def get_text_file_path(self, chapter_num: int) -> Path:
         """
         Get expected path for a chapter text file.
@@ -229,17 +324,51 @@ class FileManager:
         """
         return self.audio_dir / f"chapter_{chapter_num:04d}.mp3"
     
+    def find_text_file(self, chapter_num: int) -> Optional[Path]:
+        """
+        Find the saved text file for a chapter.
+        
+        Served from the project file index. Prefers the standard name,
+        then files with a title (e.g., chapter_0001_title.txt).
+        
+        Args:
+            chapter_num: Chapter number (1-indexed)
+            
+        Returns:
+            Path to the text file, or None if no text file exists
+        """
+        indexed = self.file_index.find_text(chapter_num)
+        return indexed.path if indexed else None
+    
+    def find_audio_file(self, chapter_num: int) -> Optional[Path]:
+        """
+        Find the saved audio file for a chapter.
+        
+        Served from the project file index. Prefers the standard name,
+        then files with a title (e.g., chapter_0001_title.mp3).
+        
+        Args:
+            chapter_num: Chapter number (1-indexed)
+            
+        Returns:
+            Path to the audio file, or None if no audio file exists
+        """
+        indexed = self.file_index.find_audio(chapter_num)
+        return indexed.path if indexed else None
+    
     def text_file_exists(self, chapter_num: int) -> bool:
         """
         Check if text file exists for a chapter.
         
+        Includes files with titles (e.g., chapter_0001_title.txt).
+        
         Args:
             chapter_num: Chapter number (1-indexed)
             
         Returns:
             True if text file exists
         """
-        return self.get_text_file_path(chapter_num).exists()
+        return self.find_text_file(chapter_num) is not None
     
     def audio_file_exists(self, chapter_num: int) -> bool:
         """
@@ -254,19 +383,7 @@ class FileManager:
         Returns:
             True if audio file exists
         """
-        # First check the standard path (without title)
-        standard_path = self.get_audio_file_path(chapter_num)
-        if standard_path.exists():
-            return True
-        
-        # Also check for files with title pattern (chapter_XXXX_*.mp3)
-        if self.audio_dir.exists():
-            pattern = f"chapter_{chapter_num:04d}_*.mp3"
-            matching_files = list(self.audio_dir.glob(pattern))
-            if matching_files:
-                return True
-        
-        return False
+        return self.find_audio_file(chapter_num) is not None
     
     def list_text_files(self) -> List[Path]:
         """
@@ -275,10 +392,7 @@ class FileManager:
         Returns:
             List of paths to text files
         """
-        if not self.text_dir.exists():
-            return []
-        
-        return sorted(self.text_dir.glob("chapter_*.txt"))
+        return self.file_index.text.list_paths()
     
     def list_audio_files(self) -> List[Path]:
         """
@@ -287,10 +401,7 @@ class FileManager:
         Returns:
             List of paths to audio files
         """
-        if not self.audio_dir.exists():
-            return []
-        
-        return sorted(self.audio_dir.glob("chapter_*.mp3"))
+        return self.file_index.audio.list_paths()
     
     def cleanup_temp_files(self, pattern: str = "*.tmp") -> None:
         """
@@ -312,6 +423,7 @@ class FileManager:
         if self.project_dir.exists():
             try:
                 shutil.rmtree(self.project_dir)
+                self.file_index.invalidate()
                 logger.info(f"Deleted project directory: {self.project_dir}")
             except Exception as e:
                 logger.error(f"Error deleting project directory: {e}")
@@ -5,21 +5,27 @@ This module contains the PipelineOrchestrator class that coordinates
 between specialized coordinators and maintains backward compatibility.
 """
 
+import time
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
 from core.logger import get_logger
 from core.config_manager import get_config
+from core.metrics import get_metrics
 
 from .chapter_manager import Chapter
 from .progress_tracker import ProcessingStatus
 from .context import ProcessingContext
 from .scraping_coordinator import ScrapingCoordinator
-from .conversion_coordinator import ConversionCoordinator
+from .conversion_coordinator import ConversionCoordinator, ChapterPlan
 from .audio_post_processor import AudioPostProcessor
+from .progress_events import ProgressEventBus
 
 logger = get_logger("processor.pipeline_orchestrator")
 
+# Written to the project's metadata directory after each run
+RUN_REPORT_FILENAME = "run_metrics.json"
+
 
 class PipelineOrchestrator:
     """
@@ -39,13 +45,20 @@ class PipelineOrchestrator:
         base_output_dir: Optional[Path] = None,
         novel_title: Optional[str] = None
     ):
+        # Coalesce UI callbacks so workers never block on them
+        self.event_bus = ProgressEventBus(
+            on_progress=on_progress,
+            on_status_change=on_status_change,
+            on_chapter_update=on_chapter_update
+        )
+
         # Create shared context
         self.context = ProcessingContext(
             project_name=project_name,
             novel_title=novel_title or project_name,
-            on_progress=on_progress,
-            on_status_change=on_status_change,
-            on_chapter_update=on_chapter_update,
+            on_progress=self.event_bus.publish_progress if on_progress else None,
+            on_status_change=self.event_bus.publish_status if on_status_change else None,
+            on_chapter_update=self.event_bus.publish_chapter_update if on_chapter_update else None,
             voice=voice,
             provider=provider,
             base_output_dir=base_output_dir
@@ -71,6 +84,10 @@ class PipelineOrchestrator:
         self.context.should_stop = True
         logger.info("Pipeline stop requested")
 
+    def flush_events(self) -> None:
+        """Deliver all pending progress/status/chapter events now."""
+        self.event_bus.flush()
+
     def clear_project_data(self) -> None:
         """Clear project data without deleting files."""
         self.scraping_coordinator.project_manager.clear_project_data()
@@ -88,6 +105,74 @@ class PipelineOrchestrator:
         provider: Optional[str] = None
     ) -> Dict[str, Any]:
         """Run the complete pipeline from TOC URL to finished audiobook."""
+        metrics_before = get_metrics().snapshot()
+        started_at = time.time()
+        result: Dict[str, Any] = {"success": False, "error": "Pipeline did not finish"}
+        try:
+            result = self._run_full_pipeline(
+                toc_url, novel_url, novel_title, novel_author,
+                start_from, max_chapters, voice, provider
+            )
+            return result
+        finally:
+            # Final flush so callers see the end state before this returns
+            self.flush_events()
+            self.write_metrics_report(since=metrics_before, run_info={
+                "project": self.context.project_name,
+                "toc_url": toc_url,
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started_at)),
+                "duration_seconds": time.time() - started_at,
+                "result": {key: value for key, value in result.items() if key != "progress"},
+            })
+
+    def write_metrics_report(
+        self,
+        since: Optional[Dict[str, Dict[str, Any]]] = None,
+        run_info: Optional[Dict[str, Any]] = None
+    ) -> Optional[Path]:
+        """
+        Write the JSON run report to the project's metadata directory.
+
+        Also writes a Prometheus text file if metrics.prometheus_file is configured.
+
+        Args:
+            since: Metrics snapshot taken at the start of the run; the report then
+                covers only this run's activity
+            run_info: Extra run information stored in the report
+
+        Returns:
+            Path to the report, or None if disabled or writing failed
+        """
+        if not self.config.get("metrics.run_report", True):
+            return None
+
+        metrics = get_metrics()
+        report_path = self.conversion_coordinator.file_manager.get_metadata_dir() / RUN_REPORT_FILENAME
+        try:
+            metrics.write_json_report(report_path, since=since, extra=run_info)
+            logger.info(f"Run metrics written to {report_path}")
+
+            prometheus_file = self.config.get("metrics.prometheus_file")
+            if prometheus_file:
+                metrics.write_prometheus(Path(prometheus_file))
+            return report_path
+        except Exception as e:
+            # Metrics must never fail a run
+            logger.warning(f"Could not write run metrics: {e}")
+            return None
+
+    def _run_full_pipeline(
+        self,
+        toc_url: str,
+        novel_url: Optional[str],
+        novel_title: Optional[str],
+        novel_author: Optional[str],
+        start_from: int,
+        max_chapters: Optional[int],
+        voice: Optional[str],
+        provider: Optional[str]
+    ) -> Dict[str, Any]:
+        """Pipeline steps for run_full_pipeline."""
         logger.info("Starting full pipeline...")
 
         # Update voice and provider if provided
@@ -140,21 +225,25 @@ class PipelineOrchestrator:
         # Get chapters to process
         chapters_to_process = self.scraping_coordinator.get_chapters_to_process(start_from, max_chapters)
 
-        # If skip_if_exists is True, find the first missing chapter and adjust
+        # If skip_if_exists is True, classify chapters up front and drop finished ones
+        chapter_plans: Dict[int, ChapterPlan] = {}
         if skip_if_exists and chapters_to_process:
-            first_missing = self.conversion_coordinator.get_first_missing_chapter(chapters_to_process)
-
-            if first_missing is not None:
-                # Filter to only process from first missing chapter onwards
-                chapters_to_process = [
-                    ch for ch in chapters_to_process
-                    if ch.number >= first_missing
-                ]
-                logger.info(f"Resuming from chapter {first_missing} (first missing chapter)")
+            chapter_plans = self.conversion_coordinator.plan_chapters(chapters_to_process)
+            chapters_to_process = [
+                ch for ch in chapters_to_process
+                if chapter_plans[ch.number] is not ChapterPlan.DONE
+            ]
+
+            if chapters_to_process:
+                text_only = sum(1 for plan in chapter_plans.values() if plan is ChapterPlan.TEXT_ONLY)
+                done = len(chapter_plans) - len(chapters_to_process)
+                logger.info(
+                    f"Resuming from chapter {chapters_to_process[0].number} "
+                    f"({done} already done, {text_only} with saved text)"
+                )
             else:
                 # All chapters already exist
                 logger.info("All chapters already processed, nothing to do")
-                chapters_to_process = []
 
         logger.info(f"Processing {len(chapters_to_process)} chapters")
         if ignore_errors:
@@ -164,18 +253,19 @@ class PipelineOrchestrator:
         completed = 0
         failed = 0
 
+        metrics = get_metrics()
+        if chapter_plans:
+            metrics.counter("pipeline_chapters_skipped_total", "Chapters skipped because audio exists").inc(
+                len(chapter_plans) - len(chapters_to_process)
+            )
+        pending = metrics.gauge("pipeline_chapters_pending", "Chapters waiting to be processed")
+        pending.set(len(chapters_to_process))
+
         # Default failure callback for cleanup
         def default_failure_callback(chapter_num: int, exception: Exception):
             """Default cleanup callback - removes temp files on failure."""
-            import tempfile
-            temp_dir = Path(tempfile.gettempdir())
-            temp_audio_path = temp_dir / f"chapter_{chapter_num}_temp.mp3"
-            if temp_audio_path.exists():
-                try:
-                    temp_audio_path.unlink()
-                    logger.debug(f"Failure callback: Cleaned up temp file for chapter {chapter_num}")
-                except Exception as cleanup_error:
-                    logger.warning(f"Failure callback: Failed to cleanup temp file: {cleanup_error}")
+            self.conversion_coordinator.file_manager.discard_audio_temp_files(chapter_num)
+            logger.debug(f"Failure callback: Cleaned up temp files for chapter {chapter_num}")
 
         for chapter in chapters_to_process:
             if self.context.check_should_stop():
@@ -188,15 +278,20 @@ class PipelineOrchestrator:
                 logger.info("Processing stopped by user")
                 break
 
-            success = self.process_chapter(
-                chapter,
-                skip_if_exists=skip_if_exists,
-                on_failure=default_failure_callback
-            )
+            with metrics.span("pipeline_chapter_seconds", "End-to-end time per chapter"):
+                success = self.process_chapter(
+                    chapter,
+                    skip_if_exists=skip_if_exists,
+                    on_failure=default_failure_callback,
+                    plan=chapter_plans.get(chapter.number)
+                )
+            pending.dec()
             if success:
                 completed += 1
+                metrics.counter("pipeline_chapters_completed_total", "Chapters processed successfully").inc()
             else:
                 failed += 1
+                metrics.counter("pipeline_chapters_failed_total", "Chapters that failed").inc()
                 if not ignore_errors:
                     logger.warning(f"Chapter {chapter.number} failed and ignore_errors=False - stopping processing")
                     break
@@ -219,16 +314,46 @@ class PipelineOrchestrator:
             "progress": progress_percentage
         }
 
+        # Chapters not reached (stop or failure) are no longer pending
+        pending.set(0)
+
         logger.info(f"Processing complete: {completed} completed, {failed} failed")
+        self.flush_events()
         return result
 
     def process_chapter(
         self,
         chapter,
         skip_if_exists: bool = True,
-        on_failure: Optional[callable] = None
+        on_failure: Optional[callable] = None,
+        plan: Optional[ChapterPlan] = None
     ) -> bool:
-        """Process a single chapter: scrape → convert → save."""
+        """
+        Process a single chapter: scrape → convert → save.
+
+        With skip_if_exists, finished chapters return before any scraping and
+        chapters with saved text are converted from disk instead of re-scraped.
+        plan may be passed in when chapters were already classified.
+        """
+        if skip_if_exists:
+            if plan is None:
+                plan = self.conversion_coordinator.plan_chapter(chapter.number)
+
+            if plan is ChapterPlan.DONE:
+                logger.info(f"Chapter {chapter.number} already exists, skipping")
+                return True
+
+            if plan is ChapterPlan.TEXT_ONLY:
+                saved = self.conversion_coordinator.load_saved_text(chapter.number)
+                if saved:
+                    content, title, text_file_path = saved
+                    logger.info(f"Chapter {chapter.number}: using saved text {text_file_path.name}")
+                    return self.conversion_coordinator.convert_chapter_to_audio(
+                        chapter, content, title, False, on_failure,
+                        text_file_path=text_file_path
+                    )
+                # Saved text unusable, fall back to scraping
+
         # Step 1: Scrape chapter content
         content, title, error = self.scraping_coordinator.scrape_chapter_content(chapter)
 
@@ -300,4 +425,4 @@ class PipelineOrchestrator:
 ProcessingPipeline = PipelineOrchestrator
 
 
-__all__ = ["PipelineOrchestrator", "ProcessingPipeline"]
\ No newline at end of file
+__all__ = ["PipelineOrchestrator", "ProcessingPipeline", "RUN_REPORT_FILENAME"]
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+Coalescing event bus for processing progress callbacks.
+
+Workers publish progress, status and per-chapter updates without calling
+UI callbacks directly. Updates are coalesced (latest value wins, per chapter
+for chapter updates) and delivered in batches from a background thread at a
+bounded rate, so bursts of updates don't flood the UI event loop and workers
+never block on UI callbacks.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger("processor.progress_events")
+
+# Default delivery rate: at most 10 flushes per second
+DEFAULT_FLUSH_INTERVAL = 0.1
+
+# Seconds without events before the delivery thread exits (restarted on demand)
+IDLE_THREAD_TIMEOUT = 5.0
+
+
+class ProgressEventBus:
+    """
+    Coalesces progress events and delivers them at a bounded rate.
+
+    The publish_* methods have the same signatures as the ProcessingContext
+    callbacks, so they can be passed in their place.
+    """
+
+    def __init__(
+        self,
+        on_progress: Optional[Callable[[float], None]] = None,
+        on_status_change: Optional[Callable[[str], None]] = None,
+        on_chapter_update: Optional[Callable[[int, str, str], None]] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
+        """
+        Initialize event bus.
+
+        Args:
+            on_progress: Callback for overall progress (0.0-1.0)
+            on_status_change: Callback for status changes (status string)
+            on_chapter_update: Callback for chapter updates (chapter_num, status, message)
+            flush_interval: Minimum seconds between deliveries
+        """
+        self.on_progress = on_progress
+        self.on_status_change = on_status_change
+        self.on_chapter_update = on_chapter_update
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        # Serializes deliveries so batches arrive in order
+        self._flush_lock = threading.Lock()
+        self._pending_progress: Optional[float] = None
+        self._pending_status: Optional[str] = None
+        # Insertion order is kept so chapters are delivered in the order they changed
+        self._pending_chapters: Dict[int, Tuple[str, str]] = {}
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish_progress(self, progress: float) -> None:
+        """Queue an overall progress update."""
+        if self.on_progress is None:
+            return
+        with self._lock:
+            self._pending_progress = progress
+        self._schedule()
+
+    def publish_status(self, status: str) -> None:
+        """Queue an overall status change."""
+        if self.on_status_change is None:
+            return
+        with self._lock:
+            self._pending_status = status
+        self._schedule()
+
+    def publish_chapter_update(self, chapter_num: int, status: str, message: str) -> None:
+        """Queue a chapter update; replaces any undelivered update for the same chapter."""
+        if self.on_chapter_update is None:
+            return
+        with self._lock:
+            # Re-insert so the chapter moves to the end of the delivery order
+            self._pending_chapters.pop(chapter_num, None)
+            self._pending_chapters[chapter_num] = (status, message)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Make sure the delivery thread is running and wake it."""
+        if self._stop_event.is_set():
+            # Closed: deliver synchronously so nothing is lost
+            self.flush()
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="progress-event-bus",
+                    daemon=True
+                )
+                self._thread.start()
+        self._wake_event.set()
+
+    def _has_pending(self) -> bool:
+        return (
+            self._pending_status is not None
+            or self._pending_progress is not None
+            or bool(self._pending_chapters)
+        )
+
+    def _run(self) -> None:
+        """Deliver pending events, at most once per flush_interval; exit when idle."""
+        while True:
+            if not self._wake_event.wait(IDLE_THREAD_TIMEOUT):
+                with self._lock:
+                    if not self._has_pending():
+                        self._thread = None
+                        return
+            self._wake_event.clear()
+            self.flush()
+            # Bound the delivery rate; events published meanwhile are coalesced
+            if self._stop_event.wait(self.flush_interval):
+                return
+
+    def _take_pending(self) -> Tuple[Optional[str], List[Tuple[int, str, str]], Optional[float]]:
+        with self._lock:
+            status = self._pending_status
+            chapters = [(num, st, msg) for num, (st, msg) in self._pending_chapters.items()]
+            progress = self._pending_progress
+            self._pending_status = None
+            self._pending_chapters = {}
+            self._pending_progress = None
+        return status, chapters, progress
+
+    def flush(self) -> None:
+        """
+        Deliver all pending events now on the calling thread.
+
+        Order within a batch: status, chapter updates, progress.
+        """
+        with self._flush_lock:
+            status, chapters, progress = self._take_pending()
+
+            if status is not None and self.on_status_change:
+                try:
+                    self.on_status_change(status)
+                except Exception as e:
+                    logger.warning(f"Error in status change callback: {e}")
+
+            if chapters and self.on_chapter_update:
+                for chapter_num, chapter_status, message in chapters:
+                    try:
+                        self.on_chapter_update(chapter_num, chapter_status, message)
+                    except Exception as e:
+                        logger.warning(f"Error in chapter update callback: {e}")
+
+            if progress is not None and self.on_progress:
+                try:
+                    self.on_progress(progress)
+                except Exception as e:
+                    logger.warning(f"Error in progress callback: {e}")
+
+    def close(self) -> None:
+        """Stop the delivery thread and deliver anything still pending."""
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self.flush()
+
+
+__all__ = ["ProgressEventBus", "DEFAULT_FLUSH_INTERVAL"]
@@ -79,11 +79,8 @@ class ProgressTracker:
         if self.total_chapters == 0:
             return 1.0
         
-        completed = sum(
-            1 for status in self.chapter_statuses.values()
-            if status == ProcessingStatus.COMPLETED
-        )
-        return completed / self.total_chapters
+        # completed_chapters is maintained by update_chapter
+        return self.completed_chapters / self.total_chapters
     
     def get_progress_percentage(self) -> int:
         """
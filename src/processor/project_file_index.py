@@ -0,0 +1,226 @@
+"""
+Project file index for fast chapter file lookups.
+
+Builds a snapshot of a project's text and audio directories with a single
+os.scandir per directory and maps chapter numbers to saved files, so
+existence checks are dictionary lookups instead of per-chapter globbing.
+Snapshots are revalidated by directory mtime and updated incrementally
+when the FileManager saves files.
+"""
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from core.logger import get_logger
+
+logger = get_logger("processor.project_file_index")
+
+# chapter_0001.mp3 / chapter_0001_Some Title.mp3
+_CHAPTER_FILE_PATTERN = re.compile(r"^chapter_(\d+)(_.*)?$")
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """A chapter file found in a project directory."""
+    chapter_num: Optional[int]
+    path: Path
+    size: int
+
+
+def _parse_chapter_number(stem: str) -> Optional[int]:
+    """
+    Parse the chapter number from a file stem.
+
+    Only zero-padded names produced by FileManager are accepted, so
+    chapter_00012 is not mistaken for chapter 12 (mirrors the glob
+    chapter_0012_* used before).
+    """
+    match = _CHAPTER_FILE_PATTERN.match(stem)
+    if not match:
+        return None
+    digits = match.group(1)
+    chapter_num = int(digits)
+    if f"{chapter_num:04d}" != digits:
+        return None
+    return chapter_num
+
+
+class _DirectoryIndex:
+    """Index of chapter_* files with one extension in one directory."""
+
+    def __init__(self, directory: Path, extension: str):
+        self.directory = directory
+        self.extension = extension
+        self._files: Dict[str, IndexedFile] = {}
+        self._by_chapter: Dict[int, List[IndexedFile]] = {}
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.RLock()
+
+    def _directory_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _ensure_fresh(self) -> None:
+        """Rescan if the directory changed since the last snapshot."""
+        mtime = self._directory_mtime()
+        if mtime is None:
+            self._files.clear()
+            self._by_chapter.clear()
+            self._mtime_ns = None
+        elif mtime != self._mtime_ns:
+            self._scan(mtime)
+
+    def _scan(self, mtime: int) -> None:
+        files: Dict[str, IndexedFile] = {}
+        by_chapter: Dict[int, List[IndexedFile]] = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith("chapter_") or not name.endswith(self.extension):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    stem = name[:-len(self.extension)]
+                    indexed = IndexedFile(_parse_chapter_number(stem), Path(entry.path), size)
+                    files[name] = indexed
+                    if indexed.chapter_num is not None:
+                        by_chapter.setdefault(indexed.chapter_num, []).append(indexed)
+        except OSError as e:
+            logger.warning(f"Could not scan {self.directory}: {e}")
+            return
+
+        for chapter_files in by_chapter.values():
+            chapter_files.sort(key=lambda f: f.path.name)
+        self._files = files
+        self._by_chapter = by_chapter
+        self._mtime_ns = mtime
+        logger.debug(f"Indexed {len(files)} {self.extension} files in {self.directory}")
+
+    def find(self, chapter_num: int) -> Optional[IndexedFile]:
+        """
+        Find the file for a chapter.
+
+        Prefers the untitled standard name, then the first titled file by name.
+        """
+        with self._lock:
+            self._ensure_fresh()
+            chapter_files = self._by_chapter.get(chapter_num)
+            if not chapter_files:
+                return None
+            standard_name = f"chapter_{chapter_num:04d}{self.extension}"
+            for indexed in chapter_files:
+                if indexed.path.name == standard_name:
+                    return indexed
+            return chapter_files[0]
+
+    def chapter_numbers(self) -> List[int]:
+        with self._lock:
+            self._ensure_fresh()
+            return sorted(self._by_chapter)
+
+    def list_paths(self) -> List[Path]:
+        with self._lock:
+            self._ensure_fresh()
+            return sorted(indexed.path for indexed in self._files.values())
+
+    @contextmanager
+    def tracking_write(self, path: Path) -> Iterator[None]:
+        """
+        Wrap a write of path into this directory.
+
+        The snapshot is brought up to date before the write and the new file is
+        added in place afterwards, so the directory mtime change caused by our
+        own write does not trigger a full rescan.
+        """
+        with self._lock:
+            self._ensure_fresh()
+            snapshot_mtime = self._mtime_ns
+
+        yield
+
+        with self._lock:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                self._mtime_ns = None
+                return
+
+            stem = path.name[:-len(self.extension)]
+            indexed = IndexedFile(_parse_chapter_number(stem), path, size)
+            self._files[path.name] = indexed
+            if indexed.chapter_num is not None:
+                chapter_files = [
+                    f for f in self._by_chapter.get(indexed.chapter_num, [])
+                    if f.path.name != path.name
+                ]
+                chapter_files.append(indexed)
+                chapter_files.sort(key=lambda f: f.path.name)
+                self._by_chapter[indexed.chapter_num] = chapter_files
+
+            # Only adopt the new mtime if nobody else changed the snapshot meanwhile
+            if snapshot_mtime is not None and snapshot_mtime == self._mtime_ns:
+                self._mtime_ns = self._directory_mtime()
+            else:
+                self._mtime_ns = None
+
+    def invalidate(self) -> None:
+        """Force a rescan on next lookup."""
+        with self._lock:
+            self._mtime_ns = None
+
+
+class ProjectFileIndex:
+    """
+    Chapter → file index for a project's text and audio directories.
+
+    Each directory is scanned once with os.scandir and rescanned only when
+    its mtime changes. FileManager reports its own writes so saving a file
+    does not trigger a full rescan.
+    """
+
+    def __init__(self, text_dir: Path, audio_dir: Path):
+        """
+        Initialize the index.
+
+        Args:
+            text_dir: Directory holding chapter_XXXX*.txt files
+            audio_dir: Directory holding chapter_XXXX*.mp3 files
+        """
+        self.text = _DirectoryIndex(text_dir, ".txt")
+        self.audio = _DirectoryIndex(audio_dir, ".mp3")
+
+    def find_text(self, chapter_num: int) -> Optional[IndexedFile]:
+        """Get the indexed text file for a chapter, or None."""
+        return self.text.find(chapter_num)
+
+    def find_audio(self, chapter_num: int) -> Optional[IndexedFile]:
+        """Get the indexed audio file for a chapter, or None."""
+        return self.audio.find(chapter_num)
+
+    def text_chapters(self) -> List[int]:
+        """Chapter numbers with a saved text file, sorted."""
+        return self.text.chapter_numbers()
+
+    def audio_chapters(self) -> List[int]:
+        """Chapter numbers with a saved audio file, sorted."""
+        return self.audio.chapter_numbers()
+
+    def invalidate(self) -> None:
+        """Force a rescan of both directories on next lookup."""
+        self.text.invalidate()
+        self.audio.invalidate()
+
+
+__all__ = ["ProjectFileIndex", "IndexedFile"]
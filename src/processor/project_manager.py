@@ -13,7 +13,7 @@ from datetime import datetime
 from core.logger import get_logger
 from core.config_manager import get_config
 
-from .chapter_manager import ChapterManager
+from .chapter_manager import ChapterManager, ChapterStatus
 
 logger = get_logger("processor.project_manager")
 
@@ -165,8 +165,8 @@ class ProjectManager:
             # Update metadata
             self.metadata["updated_at"] = datetime.now().isoformat()
             self.metadata["total_chapters"] = self.chapter_manager.get_total_count()
-            self.metadata["completed_chapters"] = len(
-                self.chapter_manager.get_completed_chapters()
+            self.metadata["completed_chapters"] = self.chapter_manager.count_by_status(
+                ChapterStatus.CONVERTED
             )
             
             # Prepare data
@@ -246,8 +246,8 @@ class ProjectManager:
         if not self.chapter_manager:
             return False
         
-        pending = len(self.chapter_manager.get_pending_chapters())
-        failed = len(self.chapter_manager.get_failed_chapters())
+        pending = self.chapter_manager.count_by_status(ChapterStatus.PENDING)
+        failed = self.chapter_manager.count_by_status(ChapterStatus.FAILED)
         return pending > 0 or failed > 0
     
     def clear_project_data(self) -> None:
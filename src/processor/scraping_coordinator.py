@@ -9,6 +9,7 @@ from typing import Optional, List, Tuple
 from urllib.parse import urlparse
 
 from core.logger import get_logger
+from core.metrics import get_metrics
 from scraper import GenericScraper
 
 from .project_manager import ProjectManager
@@ -72,7 +73,8 @@ class ScrapingCoordinator:
             self.scraper = GenericScraper(base_url=base_url)
 
             # Fetch chapter URLs
-            chapter_urls = self.scraper.get_chapter_urls(toc_url)
+            with get_metrics().span("scrape_toc_seconds", "Chapter URL discovery time"):
+                chapter_urls = self.scraper.get_chapter_urls(toc_url)
 
             if not chapter_urls:
                 logger.error("No chapter URLs found")
@@ -125,7 +127,9 @@ class ScrapingCoordinator:
         if not self.scraper:
             return None, None, "Scraper not initialized"
 
-        content, title, error = self.scraper.scrape_chapter(chapter.url)
+        metrics = get_metrics()
+        with metrics.span("scrape_chapter_seconds", "Chapter scrape time (fetch, parse and clean)"):
+            content, title, error = self.scraper.scrape_chapter(chapter.url)
 
         if content:
             logger.info(f"✓ Chapter {chapter_num} scraped successfully ({len(content)} characters)")
@@ -142,6 +146,7 @@ class ScrapingCoordinator:
                 logger.error(f"   This could indicate the novel was deleted or chapters were renumbered")
 
             logger.error(f"Error scraping chapter {chapter_num}: {error_msg}")
+            metrics.counter("scrape_chapter_failures_total", "Chapters that failed to scrape").inc()
             return None, None, error_msg
 
         # Update progress
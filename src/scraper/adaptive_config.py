@@ -5,15 +5,30 @@ Manages site-specific configurations that learn and adapt based on scraping succ
 Handles persistence, optimization, and intelligent strategy selection.
 """
 
+import atexit
 import json
 import os
+import sqlite3
+import threading
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from contextlib import closing
+from typing import Dict, List, Optional, Any, Set
+from dataclasses import asdict, dataclass, field, fields
 from urllib.parse import urlparse
 
 from core.logger import get_logger
 
+from .config import (
+    ADAPTIVE_PROFILE_FLUSH_DELAY,
+    ADAPTIVE_PROFILE_STORE,
+    CHAPTER_SELECTOR_MIN_HITS,
+    SETTLE_MAX_TIMEOUT_MS,
+    SETTLE_MAX_WAIT_MS,
+    SETTLE_QUIET_MS,
+    SETTLE_TIMEOUT_FACTOR,
+    SETTLE_TIMEOUT_MS,
+)
+
 logger = get_logger("scraper.adaptive_config")
 
 
@@ -32,6 +47,8 @@ class SiteProfile:
     custom_selectors: List[Dict[str, Any]] = field(default_factory=list)
     pagination_patterns: List[str] = field(default_factory=list)
     api_endpoints: List[str] = field(default_factory=list)
+    settle_time_ms: Optional[float] = None  # Moving average of the slowest link arrival after a scroll
+    extraction_selectors: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # 'content'/'title' -> {selector, hits}
 
     def update_success_rate(self, strategy: str, success: bool, response_time: float):
         """Update success rate and response time for a strategy."""
@@ -129,45 +146,155 @@ class SiteProfile:
             self.pagination_patterns = self.pagination_patterns[-10:]
 
     def add_api_endpoint(self, endpoint: str):
-        """Add a discovered API endpoint."""
-        if endpoint not in self.api_endpoints:
-            self.api_endpoints.append(endpoint)
-            # Keep only recent endpoints
-            self.api_endpoints = self.api_endpoints[-20:]
+        """Add a discovered API endpoint (most recently successful last)."""
+        if endpoint in self.api_endpoints:
+            self.api_endpoints.remove(endpoint)
+        self.api_endpoints.append(endpoint)
+        # Keep only recent endpoints
+        self.api_endpoints = self.api_endpoints[-20:]
+
+    def get_extraction_selector(self, kind: str) -> Optional[str]:
+        """Get the learned chapter selector for kind ('content' or 'title'), once it is confirmed."""
+        entry = self.extraction_selectors.get(kind)
+        if entry and entry.get('hits', 0) >= CHAPTER_SELECTOR_MIN_HITS:
+            return entry['selector']
+        return None
+
+    def record_extraction_selector(self, kind: str, selector: str) -> bool:
+        """
+        Record the selector that extracted a chapter's content or title.
+
+        Returns:
+            True if the profile changed
+        """
+        entry = self.extraction_selectors.get(kind)
+        if entry and entry.get('selector') == selector:
+            if entry.get('hits', 0) >= CHAPTER_SELECTOR_MIN_HITS:
+                return False
+            entry['hits'] = entry.get('hits', 0) + 1
+        else:
+            self.extraction_selectors[kind] = {'selector': selector, 'hits': 1}
+        self.last_updated = time.time()
+        return True
+
+    def forget_extraction_selector(self, kind: str, selector: str) -> bool:
+        """
+        Drop a learned selector that no longer matches.
+
+        Returns:
+            True if the profile changed
+        """
+        entry = self.extraction_selectors.get(kind)
+        if not entry or entry.get('selector') != selector:
+            return False
+        del self.extraction_selectors[kind]
+        self.last_updated = time.time()
+        return True
+
+    def record_settle_times(self, first_change_ms: List[float]):
+        """Learn how long new chapter links take to appear after a scroll or click."""
+        samples = [float(ms) for ms in first_change_ms if ms is not None and ms >= 0]
+        if not samples:
+            return
+        slowest = max(samples)
+        if self.settle_time_ms is None:
+            self.settle_time_ms = slowest
+        else:
+            self.settle_time_ms = self.settle_time_ms * 0.7 + slowest * 0.3
+        self.last_updated = time.time()
 
+    def get_settle_options(self) -> Dict[str, float]:
+        """Settle timings for dom_settle.js (configureSettle options), in milliseconds."""
+        if self.settle_time_ms is None:
+            return {
+                'quietMs': SETTLE_QUIET_MS,
+                'timeoutMs': SETTLE_TIMEOUT_MS,
+                'maxWaitMs': SETTLE_MAX_WAIT_MS,
+            }
+        # Only rounds that produced links are observed, so a shorter timeout could
+        # never be corrected; slow sites get longer waits, fast ones keep the default
+        timeout = min(max(self.settle_time_ms * SETTLE_TIMEOUT_FACTOR, SETTLE_TIMEOUT_MS), SETTLE_MAX_TIMEOUT_MS)
+        quiet = min(max(self.settle_time_ms / 2, 150), 1000)
+        return {
+            'quietMs': round(quiet),
+            'timeoutMs': round(timeout),
+            'maxWaitMs': max(SETTLE_MAX_WAIT_MS, round(timeout)),
+        }
 
-class AdaptiveConfigManager:
-    """Manages adaptive configurations for all sites."""
 
-    def __init__(self, config_dir: str = None):
+class AdaptiveConfigManager:
+    """
+    Manages adaptive configurations for all sites.
+
+    Profiles are loaded lazily per domain and kept in a single SQLite store.
+    Updates only mark a profile dirty; dirty profiles are written in one
+    transaction by a background flush at most every flush_delay seconds
+    (and at interpreter exit), so profile bookkeeping adds no disk I/O to
+    detection attempts. Profiles are read and updated under the manager's
+    lock, so a flush never serializes a profile mid-update.
+    Legacy per-domain JSON files are migrated into the store on first access.
+    """
+
+    def __init__(self, config_dir: str = None, flush_delay: float = ADAPTIVE_PROFILE_FLUSH_DELAY):
         self.config_dir = config_dir or os.path.join(os.path.dirname(__file__), 'adaptive_configs')
+        self.store_path = os.path.join(self.config_dir, ADAPTIVE_PROFILE_STORE)
+        self.flush_delay = flush_delay
         self.site_profiles: Dict[str, SiteProfile] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
         self._ensure_config_dir()
-        self._load_all_profiles()
+        self._ensure_store()
+        atexit.register(self.flush)
 
     def _ensure_config_dir(self):
         """Ensure the configuration directory exists."""
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir)
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the profile store."""
+        return sqlite3.connect(self.store_path, timeout=5.0)
+
+    def _ensure_store(self):
+        """Create the profile store table if needed."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS profiles ("
+                    "domain TEXT PRIMARY KEY, "
+                    "last_updated REAL NOT NULL, "
+                    "data TEXT NOT NULL)"
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to initialize profile store {self.store_path}: {e}")
+
     def _get_profile_path(self, domain: str) -> str:
-        """Get the file path for a domain's profile."""
+        """Get the legacy JSON file path for a domain's profile."""
         # Sanitize domain for filename
         safe_domain = domain.replace('.', '_').replace('/', '_')
         return os.path.join(self.config_dir, f"{safe_domain}.json")
 
-    def _load_all_profiles(self):
-        """Load all saved site profiles."""
-        if not os.path.exists(self.config_dir):
-            return
-
-        for filename in os.listdir(self.config_dir):
-            if filename.endswith('.json'):
-                domain = filename[:-5].replace('_', '.')  # Remove .json and restore dots
-                self._load_profile(domain)
+    @staticmethod
+    def _profile_from_dict(data: Dict[str, Any]) -> SiteProfile:
+        """Build a SiteProfile from stored data, ignoring unknown keys."""
+        known = {f.name for f in fields(SiteProfile)}
+        return SiteProfile(**{k: v for k, v in data.items() if k in known})
 
     def _load_profile(self, domain: str) -> Optional[SiteProfile]:
-        """Load a site profile from disk."""
+        """Load a site profile from the store, migrating a legacy JSON file if present."""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT data FROM profiles WHERE domain = ?", (domain,)
+                ).fetchone()
+            if row:
+                profile = self._profile_from_dict(json.loads(row[0]))
+                self.site_profiles[domain] = profile
+                return profile
+        except (sqlite3.Error, json.JSONDecodeError, TypeError) as e:
+            logger.debug(f"Failed to load profile for {domain}: {e}")
+
         profile_path = self._get_profile_path(domain)
         if not os.path.exists(profile_path):
             return None
@@ -176,104 +303,167 @@ class AdaptiveConfigManager:
             with open(profile_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            # Convert dict back to SiteProfile
-            profile = SiteProfile(**data)
+            profile = self._profile_from_dict(data)
             self.site_profiles[domain] = profile
+            # Move the legacy profile into the store on the next flush
+            self._mark_dirty(domain)
             return profile
 
-        except (json.JSONDecodeError, IOError) as e:
+        except (json.JSONDecodeError, IOError, TypeError) as e:
             logger.debug(f"Failed to load profile for {domain}: {e}")
             return None
 
+    def _mark_dirty(self, domain: str):
+        """
+        Mark a profile as modified and schedule a flush.
+
+        The timer is not restarted by later writes, so while updates keep
+        arriving (one per chapter during a scrape) profiles are still
+        written every flush_delay seconds instead of only at exit.
+        """
+        with self._lock:
+            self._dirty.add(domain)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
     def _save_profile(self, domain: str):
-        """Save a site profile to disk."""
+        """Schedule a site profile to be persisted with the next flush."""
         if domain not in self.site_profiles:
             return
+        self._mark_dirty(domain)
+
+    def flush(self):
+        """Write all dirty profiles to the store in a single transaction."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            domains = [d for d in self._dirty if d in self.site_profiles]
+            rows = [
+                (domain, self.site_profiles[domain].last_updated,
+                 json.dumps(asdict(self.site_profiles[domain]), ensure_ascii=False))
+                for domain in domains
+            ]
+            self._dirty.clear()
+
+        if not rows:
+            return
 
-        profile_path = self._get_profile_path(domain)
         try:
-            profile = self.site_profiles[domain]
-
-            # Convert to dict for JSON serialization
-            data = {
-                'domain': profile.domain,
-                'strategy_success_rates': profile.strategy_success_rates,
-                'optimal_strategy_order': profile.optimal_strategy_order,
-                'known_patterns': profile.known_patterns,
-                'last_successful_strategy': profile.last_successful_strategy,
-                'average_response_times': profile.average_response_times,
-                'total_attempts': profile.total_attempts,
-                'successful_attempts': profile.successful_attempts,
-                'last_updated': profile.last_updated,
-                'custom_selectors': profile.custom_selectors,
-                'pagination_patterns': profile.pagination_patterns,
-                'api_endpoints': profile.api_endpoints,
-            }
-
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-        except IOError as e:
-            logger.debug(f"Failed to save profile for {domain}: {e}")
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO profiles (domain, last_updated, data) VALUES (?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to save {len(rows)} site profiles: {e}")
+            with self._lock:
+                self._dirty.update(domains)
 
     def get_site_profile(self, url: str) -> SiteProfile:
         """Get or create a site profile for a URL."""
         domain = self._extract_domain(url)
 
-        if domain not in self.site_profiles:
-            self.site_profiles[domain] = SiteProfile(domain=domain)
+        with self._lock:
+            if domain not in self.site_profiles and self._load_profile(domain) is None:
+                self.site_profiles[domain] = SiteProfile(domain=domain)
 
-        return self.site_profiles[domain]
+            return self.site_profiles[domain]
 
     def update_profile(self, url: str, strategy: str, success: bool, response_time: float):
         """Update a site profile with new results."""
-        profile = self.get_site_profile(url)
-        profile.update_success_rate(strategy, success, response_time)
-        self._save_profile(profile.domain)
+        with self._lock:
+            profile = self.get_site_profile(url)
+            profile.update_success_rate(strategy, success, response_time)
+            self._save_profile(profile.domain)
 
     def get_optimal_strategy_order(self, url: str) -> List[str]:
         """Get optimal strategy order for a URL."""
-        profile = self.get_site_profile(url)
-        return profile.get_optimal_strategy_order()
+        with self._lock:
+            return self.get_site_profile(url).get_optimal_strategy_order()
 
     def add_successful_selector(self, url: str, selector: str, success_rate: float = 0.8):
         """Add a successful CSS selector for a site."""
-        profile = self.get_site_profile(url)
-        profile.add_custom_selector(selector, success_rate)
-        self._save_profile(profile.domain)
+        with self._lock:
+            profile = self.get_site_profile(url)
+            profile.add_custom_selector(selector, success_rate)
+            self._save_profile(profile.domain)
 
     def get_custom_selectors(self, url: str) -> List[str]:
         """Get custom selectors for a site."""
-        profile = self.get_site_profile(url)
-        return profile.get_custom_selectors()
+        with self._lock:
+            return self.get_site_profile(url).get_custom_selectors()
 
     def add_pagination_pattern(self, url: str, pattern: str):
         """Add a pagination pattern for a site."""
-        profile = self.get_site_profile(url)
-        profile.add_pagination_pattern(pattern)
-        self._save_profile(profile.domain)
+        with self._lock:
+            profile = self.get_site_profile(url)
+            profile.add_pagination_pattern(pattern)
+            self._save_profile(profile.domain)
 
     def add_api_endpoint(self, url: str, endpoint: str):
         """Add an API endpoint for a site."""
-        profile = self.get_site_profile(url)
-        profile.add_api_endpoint(endpoint)
-        self._save_profile(profile.domain)
+        with self._lock:
+            profile = self.get_site_profile(url)
+            profile.add_api_endpoint(endpoint)
+            self._save_profile(profile.domain)
+
+    def get_api_endpoints(self, url: str) -> List[str]:
+        """Get a site's API endpoints that returned chapters, most recent last."""
+        with self._lock:
+            return list(self.get_site_profile(url).api_endpoints)
+
+    def get_settle_options(self, url: str) -> Dict[str, float]:
+        """Get DOM settle timings for a site."""
+        with self._lock:
+            return self.get_site_profile(url).get_settle_options()
+
+    def record_settle_times(self, url: str, first_change_ms: List[float]):
+        """Record observed link arrival times for a site."""
+        if not first_change_ms:
+            return
+        with self._lock:
+            profile = self.get_site_profile(url)
+            profile.record_settle_times(first_change_ms)
+            self._save_profile(profile.domain)
+
+    def get_extraction_selector(self, url: str, kind: str) -> Optional[str]:
+        """Get a site's learned chapter content or title selector."""
+        with self._lock:
+            return self.get_site_profile(url).get_extraction_selector(kind)
+
+    def record_extraction_selector(self, url: str, kind: str, selector: str):
+        """Record the selector that extracted a chapter's content or title."""
+        with self._lock:
+            profile = self.get_site_profile(url)
+            if profile.record_extraction_selector(kind, selector):
+                self._save_profile(profile.domain)
+
+    def forget_extraction_selector(self, url: str, kind: str, selector: str):
+        """Drop a learned selector that stopped matching the site's pages."""
+        with self._lock:
+            profile = self.get_site_profile(url)
+            if profile.forget_extraction_selector(kind, selector):
+                self._save_profile(profile.domain)
 
     def get_statistics(self, url: str) -> Dict[str, Any]:
         """Get statistics for a site."""
-        profile = self.get_site_profile(url)
+        with self._lock:
+            profile = self.get_site_profile(url)
 
-        return {
-            'domain': profile.domain,
-            'total_attempts': profile.total_attempts,
-            'successful_attempts': profile.successful_attempts,
-            'success_rate': profile.successful_attempts / max(profile.total_attempts, 1),
-            'last_successful_strategy': profile.last_successful_strategy,
-            'strategy_count': len(profile.strategy_success_rates),
-            'custom_selectors_count': len(profile.custom_selectors),
-            'api_endpoints_count': len(profile.api_endpoints),
-            'last_updated': profile.last_updated,
-        }
+            return {
+                'domain': profile.domain,
+                'total_attempts': profile.total_attempts,
+                'successful_attempts': profile.successful_attempts,
+                'success_rate': profile.successful_attempts / max(profile.total_attempts, 1),
+                'last_successful_strategy': profile.last_successful_strategy,
+                'strategy_count': len(profile.strategy_success_rates),
+                'custom_selectors_count': len(profile.custom_selectors),
+                'api_endpoints_count': len(profile.api_endpoints),
+                'last_updated': profile.last_updated,
+            }
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -292,19 +482,34 @@ class AdaptiveConfigManager:
     def cleanup_old_profiles(self, max_age_days: int = 90):
         """Remove profiles that haven't been updated recently."""
         cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
-        domains_to_remove = []
+        self.flush()
 
-        for domain, profile in self.site_profiles.items():
-            if profile.last_updated < cutoff_time:
-                domains_to_remove.append(domain)
-
-        for domain in domains_to_remove:
-            del self.site_profiles[domain]
-            profile_path = self._get_profile_path(domain)
+        with self._lock:
+            domains_to_remove = {
+                domain for domain, profile in self.site_profiles.items()
+                if profile.last_updated < cutoff_time
+            }
             try:
-                os.remove(profile_path)
-            except OSError:
-                pass
+                with closing(self._connect()) as conn, conn:
+                    rows = conn.execute(
+                        "SELECT domain FROM profiles WHERE last_updated < ?", (cutoff_time,)
+                    ).fetchall()
+                    domains_to_remove.update(row[0] for row in rows)
+                    conn.executemany(
+                        "DELETE FROM profiles WHERE domain = ?",
+                        [(domain,) for domain in domains_to_remove]
+                    )
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to clean up site profiles: {e}")
+
+            for domain in domains_to_remove:
+                self.site_profiles.pop(domain, None)
+                self._dirty.discard(domain)
+                profile_path = self._get_profile_path(domain)
+                try:
+                    os.remove(profile_path)
+                except OSError:
+                    pass
 
         if domains_to_remove:
             logger.info(f"Cleaned up {len(domains_to_remove)} old site profiles")
@@ -18,6 +18,17 @@ RATE_LIMIT_BUFFER = 1.0  # Increased from 0.5 for more conservative rate limitin
 PLAYWRIGHT_TIMEOUT = 30000
 PLAYWRIGHT_HEADLESS = True
 PLAYWRIGHT_MAX_SCROLLS = 2000
+PLAYWRIGHT_MAX_PAGINATION_PAGES = 200  # TOC pages visited per novel
+PLAYWRIGHT_PAGINATION_TABS = 4  # Tabs used to crawl TOC pages concurrently (1 = one page at a time)
+PLAYWRIGHT_MINIFY_SCRIPTS = True  # Strip comments/indentation from the playwright_scripts bundle
+
+# DOM settle waits after scrolling / "Load More" (playwright_scripts/dom_settle.js), in milliseconds
+SETTLE_QUIET_MS = 300  # Link count must stay unchanged this long after new links appear
+SETTLE_TIMEOUT_MS = 3000  # Wait for new links to start appearing; learned timeouts only ever extend it
+SETTLE_MAX_TIMEOUT_MS = 15000
+SETTLE_MAX_WAIT_MS = 15000  # Hard cap per settle, even while links keep arriving
+SETTLE_TIMEOUT_FACTOR = 3.0  # Learned timeout = factor x the site's slowest observed link arrival
+SCROLL_MAX_UNCHANGED_SETTLES = 2  # Stop scrolling after this many settles in a row bring no new links
 
 # Content selectors (common patterns across webnovel sites)
 TITLE_SELECTORS = [
@@ -68,6 +79,13 @@ CONTENT_SELECTORS = [
     "div#chap-content",
 ]
 
+# Per-site content/title selector learning (ChapterExtractor + AdaptiveConfigManager)
+CHAPTER_SELECTOR_MIN_HITS = 2  # Chapters a selector must win in a row before it is tried first
+
+# Streaming chapter fetch (extractors/chapter_stream.py)
+CHAPTER_STREAMING = True  # With learned selectors, stop downloading a chapter once its content and title have closed
+CHAPTER_STREAM_CHUNK_SIZE = 16384  # Bytes read per chunk while streaming a chapter page
+
 # Chapter URL patterns
 CHAPTER_URL_PATTERN = r"chapter[_-]?(\d+)"
 NOVEL_ID_PATTERNS = [
@@ -83,3 +101,25 @@ PAGINATION_SUSPICIOUS_COUNTS = [20, 25, 30, 40, 50, 55, 100, 200]  # Common pagi
 PAGINATION_CRITICAL_COUNT = 55  # Always suspect pagination at this count
 PAGINATION_SMALL_COUNT_THRESHOLD = 100  # Below this is considered "small"
 PAGINATION_RANGE_COVERAGE_THRESHOLD = 0.8  # Minimum coverage required for range validation
+
+# HTTP TOC pagination (toc_pagination.py): fetch ?page=N / /page/N pages without a browser
+TOC_PAGINATION_MAX_PAGES = 200  # TOC pages fetched per novel
+TOC_PAGINATION_CONCURRENCY = 4  # Pages in flight per host (requests are still spaced by the session's rate limit)
+TOC_PAGINATION_MAX_RETRIES = 2  # Attempts per page
+
+# Strategy racing (UniversalUrlDetector.detect_urls(use_racing=True))
+DETECTION_HEDGE_DELAY = 2.0  # Seconds HTTP strategies get before browser strategies are started
+DETECTION_RACE_MIN_CONFIDENCE = 0.7  # Confidence a sufficient result needs to end the race
+
+# AJAX endpoint probing (strategies/ajax_strategy.py)
+AJAX_PROBE_CONCURRENCY = 3  # Endpoints queried at the same time
+AJAX_PROBE_TIMEOUT = 10  # Seconds per endpoint request; guessed endpoints often hang instead of failing
+AJAX_ENOUGH_URLS = 100  # Without a requested chapter range, stop probing once this many URLs were found
+
+# Regex safety settings (ReDoS protection without signals, usable from any thread)
+REGEX_MAX_INPUT_SIZE = 2_000_000  # Characters scanned per regex call; longer inputs are truncated
+REGEX_TIMEOUT = 1.0  # Seconds, enforced only when the optional `regex` module is installed
+
+# Adaptive site-profile persistence
+ADAPTIVE_PROFILE_STORE = "profiles.db"  # Single SQLite store inside the adaptive configs directory
+ADAPTIVE_PROFILE_FLUSH_DELAY = 2.0  # Seconds from the first profile write to the flush of dirty profiles
@@ -0,0 +1,159 @@
+"""
+Per-detection document cache for URL detection strategies.
+
+Several strategies start from the same TOC page. The cache downloads
+each URL once per detection run, shares the download between strategies
+that ask for it at the same time, and parses the page at most once.
+"""
+
+import asyncio
+import html as html_lib
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    from bs4 import BeautifulSoup  # type: ignore[import-untyped]
+    HAS_BS4: bool = True
+except ImportError:
+    BeautifulSoup = None  # type: ignore[assignment, misc]
+    HAS_BS4 = False  # type: ignore[constant-redefinition]
+
+from core.logger import get_logger
+from .config import REQUEST_TIMEOUT
+
+logger = get_logger("scraper.document_cache")
+
+_ANCHOR_RE = re.compile(r'<a\b[^>]*?href\s*=\s*["\']([^"\']+)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+class FetchedDocument:
+    """
+    A fetched page with lazily built views.
+
+    The decoded text is available at once; the parsed tree and the
+    anchor table are built on first use and then shared.
+    """
+
+    def __init__(self, url: str, text: str, status_code: int = 200, headers: Optional[Any] = None):
+        self.url = url
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._soup: Any = None
+        self._anchors: Optional[List[Any]] = None
+        self._links: Optional[List[Tuple[str, str]]] = None
+        self._lock = threading.Lock()  # Views may be built from worker threads
+
+    @classmethod
+    def from_response(cls, url: str, response: Any) -> "FetchedDocument":
+        """Build a document from a requests-style response."""
+        return cls(url, response.text, response.status_code, getattr(response, "headers", None))
+
+    @property
+    def soup(self) -> Any:
+        """BeautifulSoup tree of the page, or None if bs4 is not installed."""
+        if self._soup is None and HAS_BS4:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = BeautifulSoup(self.text, "html.parser")
+        return self._soup
+
+    @property
+    def anchors(self) -> List[Any]:
+        """All <a href> elements of the parsed tree, in document order (empty without bs4)."""
+        if self._anchors is None:
+            soup = self.soup
+            anchors = soup.find_all("a", href=True) if soup is not None else []
+            with self._lock:
+                if self._anchors is None:
+                    self._anchors = anchors
+        return self._anchors
+
+    @property
+    def links(self) -> List[Tuple[str, str]]:
+        """(href, text) of every link, in document order."""
+        if self._links is None:
+            if HAS_BS4:
+                links = [(str(a.get("href", "")).strip(), a.get_text().strip()) for a in self.anchors]
+            else:
+                links = [
+                    (html_lib.unescape(m.group(1)).strip(), html_lib.unescape(_TAG_RE.sub("", m.group(2))).strip())
+                    for m in _ANCHOR_RE.finditer(self.text)
+                ]
+            with self._lock:
+                if self._links is None:
+                    self._links = links
+        return self._links
+
+
+class DocumentCache:
+    """
+    Fetches documents once per detection run.
+
+    Concurrent requests for the same URL wait for the one download in
+    flight. Failed downloads are not remembered: callers waiting on the
+    failed download get None, and a later request tries again, so one
+    transient failure does not fail every strategy. Create one cache per
+    run inside the event loop that uses it.
+    """
+
+    def __init__(self, session_manager, timeout: int = REQUEST_TIMEOUT):
+        """
+        Initialize the cache.
+
+        Args:
+            session_manager: SessionManager used for downloads
+            timeout: Request timeout in seconds
+        """
+        self.session_manager = session_manager
+        self.timeout = timeout
+        self._documents: Dict[str, Optional[FetchedDocument]] = {}
+        self._in_flight: Dict[str, "asyncio.Task[Optional[FetchedDocument]]"] = {}
+        self.downloads = 0
+
+    async def get(self, url: str) -> Optional[FetchedDocument]:
+        """
+        Get a document, downloading it if no strategy has yet.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            FetchedDocument, or None if the page could not be fetched
+        """
+        if url in self._documents:
+            return self._documents[url]
+
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(self._download, url))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda done: self._store(url, done))
+
+        # shield: a cancelled caller must not cancel the download others share
+        return await asyncio.shield(task)
+
+    def _store(self, url: str, task: "asyncio.Task[Optional[FetchedDocument]]") -> None:
+        """Move a finished download from in-flight to the cache (successful downloads only)."""
+        self._in_flight.pop(url, None)
+        if not task.cancelled() and task.exception() is None and task.result() is not None:
+            self._documents[url] = task.result()
+
+    def _download(self, url: str) -> Optional[FetchedDocument]:
+        """Blocking download of one page."""
+        self.downloads += 1
+        try:
+            session = self.session_manager.get_session()
+            if not session:
+                return None
+            self.session_manager.rate_limit(urlparse(url).netloc)
+            response = session.get(url, timeout=self.timeout)
+            if response.status_code == 200:
+                return FetchedDocument.from_response(url, response)
+            logger.debug(f"Fetching {url} returned HTTP {response.status_code}")
+        except Exception as e:
+            logger.debug(f"Failed to fetch {url}: {e}")
+        return None
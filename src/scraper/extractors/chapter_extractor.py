@@ -6,7 +6,7 @@ Handles extracting chapter content and titles from individual chapter pages.
 
 import re
 import time
-from typing import Optional, Tuple, Callable, Any
+from typing import Optional, Tuple, Callable, Any, List
 
 try:
     from bs4 import BeautifulSoup  # type: ignore[import-untyped]
@@ -36,15 +36,19 @@ except ImportError:
     sync_playwright = None  # type: ignore[assignment, misc]
     HAS_PLAYWRIGHT: bool = False  # type: ignore[constant-redefinition]
 
+from ..adaptive_config import get_adaptive_config_manager
 from ..chapter_parser import extract_chapter_number
 from text_utils import clean_text
 from core.logger import get_logger
+from core.metrics import get_metrics
 from ..config import (
+    CHAPTER_STREAMING,
     REQUEST_TIMEOUT,
     REQUEST_DELAY,
     TITLE_SELECTORS,
     CONTENT_SELECTORS,
 )
+from .chapter_stream import ChapterStream, is_streamable
 
 logger = get_logger("scraper.extractors.chapter_extractor")
 
@@ -152,7 +156,14 @@ class ChapterExtractor:
             return None, None, str(e)
 
     def _scrape_with_requests(self, chapter_url: str, should_stop: Optional[Callable[[], bool]] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-        """Scrape using requests/BeautifulSoup with retry logic for 403 errors."""
+        """
+        Scrape using requests/BeautifulSoup with retry logic for 403 errors.
+        
+        Once the site's content and title selectors are learned, the page is
+        streamed and reading stops after both elements have closed. If that
+        prefix does not yield content and a title, the rest of the page is
+        read and extracted as usual.
+        """
         if not HAS_BS4 or BeautifulSoup is None:
             return None, None, "BeautifulSoup4 not available"
         
@@ -167,6 +178,9 @@ class ChapterExtractor:
         if should_stop and should_stop():
             return None, None, "Stopped by user"
         
+        metrics = get_metrics()
+        stream_selectors = self._stream_selectors(chapter_url)
+        
         # Retry logic for 403 errors with exponential backoff
         max_retries = 3
         base_delay = 2.0
@@ -175,7 +189,11 @@ class ChapterExtractor:
         for attempt in range(max_retries):
             try:
                 # Make request
-                response = session.get(chapter_url, timeout=self.timeout, allow_redirects=True)  # type: ignore[attr-defined]
+                if attempt > 0:
+                    metrics.counter("scraper_fetch_retries_total", "Chapter fetch retries").inc()
+                with metrics.span("scraper_fetch_seconds", "Chapter page fetch latency"):
+                    response = session.get(chapter_url, timeout=self.timeout, allow_redirects=True,  # type: ignore[attr-defined]
+                                           stream=stream_selectors is not None)
                 
                 if response.status_code == 200:  # type: ignore[attr-defined]
                     break  # Success, exit retry loop
@@ -194,8 +212,10 @@ class ChapterExtractor:
                     else:
                         return None, None, f"HTTP {response.status_code}"
                 elif response.status_code == 404:  # type: ignore[attr-defined]
+                    response.close()  # type: ignore[attr-defined]
                     return None, None, f"HTTP {response.status_code} - Chapter not found (may have been removed)"
                 else:
+                    response.close()  # type: ignore[attr-defined]
                     return None, None, f"HTTP {response.status_code}"
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -211,46 +231,112 @@ class ChapterExtractor:
             status_code = response.status_code if response else "Unknown"  # type: ignore[attr-defined]
             return None, None, f"HTTP {status_code}"
         
-        # Parse HTML
-        # response.content is bytes, BeautifulSoup accepts bytes
-        html_content: bytes = response.content  # type: ignore[attr-defined]
-        soup = BeautifulSoup(html_content, "html.parser")  # type: ignore[arg-type, assignment]
+        if stream_selectors is not None:
+            stream = ChapterStream(response, *stream_selectors)
+            try:
+                with metrics.span("scraper_stream_seconds", "Chapter page streaming time up to the chapter body"):
+                    prefix = stream.read_until_complete()
+                if prefix is not None:
+                    streamed = self._extract_streamed(prefix, stream_selectors, should_stop)
+                    if streamed:
+                        metrics.counter("scraper_stream_cutoffs_total", "Chapter downloads stopped after the chapter body").inc()
+                        content, title = streamed
+                        with metrics.span("scraper_clean_seconds", "Scraped text cleaning time"):
+                            cleaned_content = clean_text(content)
+                        return cleaned_content, title, None
+                    if should_stop and should_stop():
+                        return None, None, "Stopped by user"
+                    logger.debug(f"Streamed extraction failed for {chapter_url}, reading the full page")
+                html_content: bytes = stream.read_all()
+            finally:
+                stream.close()
+        else:
+            # response.content is bytes, BeautifulSoup accepts bytes
+            html_content = response.content  # type: ignore[attr-defined]
         
-        # Extract content and title
-        content = self._extract_content(soup, should_stop)
-        title = self._extract_title(soup, chapter_url)
+        # Parse HTML
+        with metrics.span("scraper_parse_seconds", "HTML parse and content extraction time"):
+            soup = BeautifulSoup(html_content, "html.parser")  # type: ignore[arg-type, assignment]
+            
+            # Extract content and title
+            content = self._extract_content(soup, should_stop, chapter_url)
+            title = self._extract_title(soup, chapter_url)
         
         if not content:
             return None, None, "No content found"
         
         # Clean content
-        cleaned_content = clean_text(content)
+        with metrics.span("scraper_clean_seconds", "Scraped text cleaning time"):
+            cleaned_content = clean_text(content)
         
         return cleaned_content, title, None
 
-    def _extract_title(self, soup: Any, chapter_url: str) -> str:
+    def _stream_selectors(self, chapter_url: str) -> Optional[Tuple[str, str]]:
+        """The site's learned (content, title) selectors, if the page can be streamed with them."""
+        if not CHAPTER_STREAMING:
+            return None
+        adaptive_config = get_adaptive_config_manager()
+        content_selector = adaptive_config.get_extraction_selector(chapter_url, "content")
+        title_selector = adaptive_config.get_extraction_selector(chapter_url, "title")
+        if is_streamable(content_selector) and is_streamable(title_selector):
+            return content_selector, title_selector  # type: ignore[return-value]
+        return None
+
+    def _extract_streamed(self, html: str, selectors: Tuple[str, str],
+                          should_stop: Optional[Callable[[], bool]] = None) -> Optional[Tuple[str, str]]:
+        """
+        Extract content and title from a streamed page prefix.
+        
+        Only the learned selectors are used: the prefix ends after their
+        elements, so the full search would see a truncated page.
+        
+        Returns:
+            (content, title), or None if either is missing
+        """
+        content_selector, title_selector = selectors
+        with get_metrics().span("scraper_parse_seconds", "HTML parse and content extraction time"):
+            soup = BeautifulSoup(html, "html.parser")  # type: ignore[arg-type, assignment]
+            content_elem = soup.select_one(content_selector)  # type: ignore[attr-defined]
+            content = self._content_from_element(content_elem, should_stop) if content_elem else None
+            title = self._title_from_selector(soup, title_selector)
+        if not content or not title:
+            return None
+        return content, title
+
+    def _extract_title(self, soup: Any, chapter_url: str,
+                       deferred_updates: Optional[List[Tuple[str, str, str]]] = None) -> str:
         """
         Extract chapter title from soup, trying all selectors.
         
+        The site's learned title selector is tried first; if it no longer
+        yields a title, it is forgotten and all selectors are tried.
+        
         Args:
             soup: BeautifulSoup object
-            chapter_url: URL of the chapter (for fallback)
+            chapter_url: URL of the chapter (for fallback and per-site learning)
+            deferred_updates: If given, selector learning is collected here for
+                _apply_selector_updates() instead of being applied at once
             
         Returns:
             Chapter title
         """
+        adaptive_config = get_adaptive_config_manager()
+        learned = adaptive_config.get_extraction_selector(chapter_url, "title")
+        if learned:
+            title_text = self._title_from_selector(soup, learned)
+            if title_text:
+                return title_text
+            logger.debug(f"Learned title selector '{learned}' no longer matches, trying all selectors")
+            self._update_selector(chapter_url, ("forget", "title", learned), deferred_updates)
+        
         # Try selectors from config
         for selector in TITLE_SELECTORS:
-            title_elem = soup.select_one(selector)  # type: ignore[attr-defined]
-            if title_elem:
-                title_text_raw = title_elem.get_text(strip=True)  # type: ignore[attr-defined]
-                title_text: str = str(title_text_raw) if title_text_raw is not None else ""
-                # Clean title
-                title_text = re.sub(r"^(Chapter\s+\d+[:\s]*)?", "", title_text, flags=re.I)
-                title_text = re.sub(r"\s*-\s*.*novel.*$", "", title_text, flags=re.I)
-                title_text = title_text.strip()
-                if title_text and 3 < len(title_text) < 200:
-                    return title_text
+            if selector == learned:
+                continue
+            title_text = self._title_from_selector(soup, selector)
+            if title_text:
+                self._update_selector(chapter_url, ("record", "title", selector), deferred_updates)
+                return title_text
         
         # Fallback: extract from URL
         chapter_num = extract_chapter_number(chapter_url)
@@ -259,23 +345,61 @@ class ChapterExtractor:
         
         return "Chapter 1"
 
-    def _extract_content(self, soup: Any, should_stop: Optional[Callable[[], bool]] = None) -> Optional[str]:
+    def _title_from_selector(self, soup: Any, selector: str) -> Optional[str]:
+        """Cleaned title from the first element matching selector, or None if it is unusable."""
+        title_elem = soup.select_one(selector)  # type: ignore[attr-defined]
+        if not title_elem:
+            return None
+        title_text_raw = title_elem.get_text(strip=True)  # type: ignore[attr-defined]
+        title_text: str = str(title_text_raw) if title_text_raw is not None else ""
+        # Clean title
+        title_text = re.sub(r"^(Chapter\s+\d+[:\s]*)?", "", title_text, flags=re.I)
+        title_text = re.sub(r"\s*-\s*.*novel.*$", "", title_text, flags=re.I)
+        title_text = title_text.strip()
+        if title_text and 3 < len(title_text) < 200:
+            return title_text
+        return None
+
+    def _extract_content(self, soup: Any, should_stop: Optional[Callable[[], bool]] = None,
+                         chapter_url: Optional[str] = None,
+                         deferred_updates: Optional[List[Tuple[str, str, str]]] = None) -> Optional[str]:
         """
         Extract chapter content from soup, trying all selectors.
         
+        With chapter_url, the site's learned content selector is tried
+        first; if it no longer yields content, it is forgotten and the full
+        search runs. The selector that wins the full search is recorded.
+        
         Args:
             soup: BeautifulSoup object
             should_stop: Optional callback that returns True if scraping should stop
+            chapter_url: URL of the chapter (for per-site selector learning)
+            deferred_updates: If given, selector learning is collected here for
+                _apply_selector_updates() instead of being applied at once
             
         Returns:
             Extracted content text, or None if not found
         """
+        adaptive_config = get_adaptive_config_manager() if chapter_url else None
+        learned = adaptive_config.get_extraction_selector(chapter_url, "content") if adaptive_config else None
+        if learned:
+            learned_elem = soup.select_one(learned)  # type: ignore[attr-defined]
+            content = self._content_from_element(learned_elem, should_stop) if learned_elem else None
+            if content or (should_stop and should_stop()):
+                return content
+            logger.debug(f"Learned content selector '{learned}' no longer matches, trying all selectors")
+            self._update_selector(chapter_url, ("forget", "content", learned), deferred_updates)  # type: ignore[arg-type]
+        
         # Try content selectors
         content_elem: Any = None
+        matched_selector: Optional[str] = None
         for selector in CONTENT_SELECTORS:
+            if selector == learned:
+                continue
             content_elem = soup.select_one(selector)  # type: ignore[attr-defined]
             if content_elem:
                 logger.debug(f"Found content element with selector: {selector}")
+                matched_selector = selector
                 break
         
         if not content_elem:
@@ -296,6 +420,39 @@ class ChapterExtractor:
             logger.debug(f"No content element found for chapter {chapter_url}")
             return None
         
+        content = self._content_from_element(content_elem, should_stop)
+        if content and matched_selector and adaptive_config:
+            self._update_selector(chapter_url, ("record", "content", matched_selector), deferred_updates)  # type: ignore[arg-type]
+        return content
+
+    def _update_selector(self, chapter_url: str, update: Tuple[str, str, str],
+                         deferred_updates: Optional[List[Tuple[str, str, str]]]) -> None:
+        """Apply a ("record" | "forget", kind, selector) update now, or queue it if deferred."""
+        if deferred_updates is not None:
+            deferred_updates.append(update)
+        else:
+            self._apply_selector_updates(chapter_url, [update])
+
+    def _apply_selector_updates(self, chapter_url: str, updates: List[Tuple[str, str, str]]) -> None:
+        """Apply selector learning collected by _extract_content() / _extract_title()."""
+        adaptive_config = get_adaptive_config_manager()
+        for action, kind, selector in updates:
+            if action == "forget":
+                adaptive_config.forget_extraction_selector(chapter_url, kind, selector)
+            else:
+                adaptive_config.record_extraction_selector(chapter_url, kind, selector)
+
+    def _content_from_element(self, content_elem: Any, should_stop: Optional[Callable[[], bool]] = None) -> Optional[str]:
+        """
+        Extract chapter text from a content element.
+        
+        Args:
+            content_elem: Element holding the chapter text
+            should_stop: Optional callback that returns True if scraping should stop
+            
+        Returns:
+            Extracted content text, or None if the element holds no usable text
+        """
         # Extract paragraphs - prefer p tags, avoid nested duplication
         # Strategy: Extract all p tags first (they're usually the actual content)
         # Then extract div tags only if they don't contain p tags (to avoid duplication)
@@ -516,6 +673,8 @@ class ChapterExtractor:
         
         try:
             logger.debug(f"Using Playwright to scrape {chapter_url}")
+            metrics = get_metrics()
+            fetch_start = time.perf_counter()
             with sync_playwright() as p:  # type: ignore[attr-defined]
                 # Launch browser with optimized settings for stealth
                 browser = p.chromium.launch(
@@ -592,8 +751,12 @@ class ChapterExtractor:
                 
                 # Close browser
                 browser.close()
+            metrics.histogram("scraper_browser_fetch_seconds", "Chapter page fetch latency with Playwright").observe(
+                time.perf_counter() - fetch_start
+            )
             
             # Parse HTML with BeautifulSoup
+            parse_start = time.perf_counter()
             soup = BeautifulSoup(html_content, "html.parser")  # type: ignore[arg-type, assignment]
             
             # Check if page indicates novel was removed
@@ -601,9 +764,14 @@ class ChapterExtractor:
             if any(keyword in page_text for keyword in ['not found', '404', 'removed', 'deleted', 'does not exist', 'page not found']):
                 return None, None, "Page indicates novel/chapter was removed"
             
-            # Extract content and title first
-            content = self._extract_content(soup, should_stop)
-            title = self._extract_title(soup, chapter_url)
+            # Extract content and title first; selector learning waits until the
+            # page is known not to be a challenge page
+            selector_updates: List[Tuple[str, str, str]] = []
+            content = self._extract_content(soup, should_stop, chapter_url, selector_updates)
+            title = self._extract_title(soup, chapter_url, selector_updates)
+            metrics.histogram("scraper_parse_seconds", "HTML parse and content extraction time").observe(
+                time.perf_counter() - parse_start
+            )
             
             # Check if we got Cloudflare challenge page content instead of actual content
             challenge_keywords = [
@@ -644,8 +812,11 @@ class ChapterExtractor:
                 if content_challenge_indicators:
                     return None, None, f"Content too short ({len(content)} chars) and contains challenge keywords - likely challenge page (found: {', '.join(content_challenge_indicators[:2])})"
             
+            self._apply_selector_updates(chapter_url, selector_updates)
+            
             # Clean content
-            cleaned_content = clean_text(content)
+            with metrics.span("scraper_clean_seconds", "Scraped text cleaning time"):
+                cleaned_content = clean_text(content)
             
             return cleaned_content, title, None
             
@@ -0,0 +1,211 @@
+"""
+Streaming chapter page reader.
+
+Reads a chapter page in chunks and stops once the elements matching the
+site's learned content and title selectors have both closed. Comment
+sections, related-novel widgets and scripts after the chapter body are
+then never downloaded or parsed. Only simple selectors (tag, .class, #id
+and combinations) can be watched while streaming.
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from core.logger import get_logger
+
+from ..config import CHAPTER_STREAM_CHUNK_SIZE
+
+logger = get_logger("scraper.extractors.chapter_stream")
+
+_SIMPLE_SELECTOR_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9]*)?((?:[.#][\w-]+)*)$")
+_CHARSET_HEADER_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_CHARSET_META_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+
+
+class SimpleSelector:
+    """A CSS selector of the form tag, tag.class, tag#id, .class.other, ..."""
+
+    def __init__(self, tag: Optional[str], element_id: Optional[str], classes: Sequence[str]):
+        self.tag = tag
+        self.element_id = element_id
+        self.classes = set(classes)
+
+    @classmethod
+    def parse(cls, selector: str) -> Optional["SimpleSelector"]:
+        """Parse a selector, or return None if it is not a simple selector."""
+        match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+        if not match or not selector.strip():
+            return None
+        tag, qualifiers = match.groups()
+        parts = re.findall(r"([.#])([\w-]+)", qualifiers or "")
+        ids = [name for kind, name in parts if kind == "#"]
+        if len(ids) > 1:
+            return None
+        classes = [name for kind, name in parts if kind == "."]
+        return cls(tag.lower() if tag else None, ids[0] if ids else None, classes)
+
+    def matches(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> bool:
+        """Whether a start tag matches the selector."""
+        if self.tag and tag != self.tag:
+            return False
+        attributes = dict(attrs)
+        if self.element_id and attributes.get("id") != self.element_id:
+            return False
+        if self.classes and not self.classes <= set((attributes.get("class") or "").split()):
+            return False
+        return True
+
+
+class _ElementWatcher:
+    """Follows the first element matching a selector until its end tag."""
+
+    def __init__(self, selector: SimpleSelector):
+        self.selector = selector
+        self.tag: Optional[str] = None
+        self.depth = 0
+        self.closed = False
+
+    def start(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self.closed:
+            return
+        if self.tag is None:
+            if self.selector.matches(tag, attrs):
+                self.tag = tag
+                self.depth = 1
+        elif tag == self.tag:
+            self.depth += 1
+
+    def end(self, tag: str) -> None:
+        if self.closed or self.tag is None or tag != self.tag:
+            return
+        self.depth -= 1
+        if self.depth == 0:
+            self.closed = True
+
+
+class _CutoffParser(HTMLParser):
+    """Incremental parser that reports when all watched elements have closed."""
+
+    def __init__(self, watchers: List[_ElementWatcher]):
+        super().__init__(convert_charrefs=False)
+        self.watchers = watchers
+
+    @property
+    def done(self) -> bool:
+        return all(watcher.closed for watcher in self.watchers)
+
+    def handle_starttag(self, tag, attrs):
+        for watcher in self.watchers:
+            watcher.start(tag, attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        for watcher in self.watchers:
+            watcher.end(tag)
+
+
+def is_streamable(selector: Optional[str]) -> bool:
+    """Whether a selector can be watched while streaming."""
+    return bool(selector) and SimpleSelector.parse(selector) is not None  # type: ignore[arg-type]
+
+
+def _stream_encoding(response: Any, head: bytes) -> Optional[str]:
+    """Page encoding from the Content-Type header or a <meta charset>, or None if undeclared."""
+    candidates = []
+    header_match = _CHARSET_HEADER_RE.search(str(getattr(response, "headers", {}).get("content-type", "")))
+    if header_match:
+        candidates.append(header_match.group(1))
+    meta_match = _CHARSET_META_RE.search(head)
+    if meta_match:
+        candidates.append(meta_match.group(1).decode("ascii", "ignore"))
+    for candidate in candidates:
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+    return None
+
+
+class ChapterStream:
+    """
+    Reads a streamed response (requests with stream=True) up to the chapter body.
+
+    read_until_complete() stops once the content and title elements have
+    closed. If the caller cannot use the prefix, read_all() reads the rest
+    of the same response, so falling back costs no second request.
+    """
+
+    def __init__(self, response: Any, content_selector: str, title_selector: str,
+                 chunk_size: int = CHAPTER_STREAM_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            response: Response opened with stream=True
+            content_selector: Learned content selector (must be simple)
+            title_selector: Learned title selector (must be simple)
+            chunk_size: Bytes read per chunk
+        """
+        selectors = [SimpleSelector.parse(content_selector), SimpleSelector.parse(title_selector)]
+        if None in selectors:
+            raise ValueError(f"Cannot stream with selectors {content_selector!r}, {title_selector!r}")
+        self.response = response
+        self._chunks: Iterator[bytes] = iter(response.iter_content(chunk_size=chunk_size))
+        self._parser = _CutoffParser([_ElementWatcher(s) for s in selectors])  # type: ignore[arg-type]
+        self._raw: List[bytes] = []
+        self._text: List[str] = []
+        self._decoder: Any = None
+        self.exhausted = False
+
+    @property
+    def bytes_read(self) -> int:
+        return sum(len(chunk) for chunk in self._raw)
+
+    def read_until_complete(self) -> Optional[str]:
+        """
+        Read until the watched elements have closed.
+
+        Returns:
+            The page text read so far, or None if the whole page had to be
+            read first (use read_all() for it)
+        """
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self._raw.append(chunk)
+            if self._decoder is None:
+                declared = _stream_encoding(self.response, chunk)
+                # Undeclared pages are read as strict UTF-8; BeautifulSoup detects anything else
+                self._decoder = codecs.getincrementaldecoder(declared or "utf-8")(
+                    errors="replace" if declared else "strict")
+            try:
+                text = self._decoder.decode(chunk)
+            except UnicodeDecodeError:
+                logger.debug("Undeclared page encoding is not UTF-8, reading the full page")
+                break
+            self._text.append(text)
+            self._parser.feed(text)
+            if self._parser.done:
+                logger.debug(f"Chapter body complete after {self.bytes_read} bytes, skipping the rest of the page")
+                return "".join(self._text)
+        self.read_all()
+        return None
+
+    def read_all(self) -> bytes:
+        """Read the rest of the response and return the whole body."""
+        if not self.exhausted:
+            self._raw.extend(chunk for chunk in self._chunks if chunk)
+            self.exhausted = True
+        return b"".join(self._raw)
+
+    def close(self) -> None:
+        """Release the connection, dropping any unread part of the body."""
+        try:
+            self.response.close()
+        except Exception as e:
+            logger.debug(f"Failed to close streamed response: {e}")
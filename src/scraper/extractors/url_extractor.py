@@ -16,8 +16,10 @@ from ..chapter_parser import extract_chapter_number, sort_chapters_by_number
 from ..config import (
     REQUEST_DELAY, REQUEST_TIMEOUT,
     PAGINATION_SUSPICIOUS_COUNTS, PAGINATION_CRITICAL_COUNT,
-    PAGINATION_SMALL_COUNT_THRESHOLD, PAGINATION_RANGE_COVERAGE_THRESHOLD
+    PAGINATION_SMALL_COUNT_THRESHOLD, PAGINATION_RANGE_COVERAGE_THRESHOLD,
+    REGEX_TIMEOUT
 )
+from ..safe_regex import safe_findall, safe_search
 from .url_extractor_extractors import ChapterUrlExtractors
 from .url_extractor_session import SessionManager
 from ..universal_url_detector import UniversalUrlDetector
@@ -126,68 +128,39 @@ class UrlExtractor:
         logger.warning("Could not fetch chapter URLs to determine count")
         return None
 
-    def _safe_regex_search(self, pattern: str, text: str, flags: int = 0, timeout_seconds: float = 1.0) -> Optional[re.Match[str]]:
+    def _safe_regex_search(self, pattern: str, text: str, flags: int = 0, timeout_seconds: float = REGEX_TIMEOUT) -> Optional[re.Match[str]]:
         """
-        Perform regex search with timeout protection to prevent ReDoS attacks.
+        Perform regex search with ReDoS protection.
+
+        Thread-safe (no signals), so it can run from worker threads and executors.
 
         Args:
             pattern: Regex pattern
             text: Text to search
             flags: Regex flags
-            timeout_seconds: Timeout in seconds
+            timeout_seconds: Timeout in seconds for unvetted patterns
 
         Returns:
             Match object or None if timeout or no match
         """
-        import signal
-        import functools
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError("Regex operation timed out")
-
-        # Set up the timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(timeout_seconds))
-
-        try:
-            return re.search(pattern, text, flags)
-        except TimeoutError:
-            logger.debug(f"Regex timeout for pattern: {pattern[:50]}...")
-            return None
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+        return safe_search(pattern, text, flags, timeout=timeout_seconds)
 
-    def _safe_regex_findall(self, pattern: str, text: str, flags: int = 0, timeout_seconds: float = 1.0) -> List[str]:
+    def _safe_regex_findall(self, pattern: str, text: str, flags: int = 0, timeout_seconds: float = REGEX_TIMEOUT) -> List[str]:
         """
-        Perform regex findall with timeout protection to prevent ReDoS attacks.
+        Perform regex findall with ReDoS protection.
+
+        Thread-safe (no signals), so it can run from worker threads and executors.
 
         Args:
             pattern: Regex pattern
             text: Text to search
             flags: Regex flags
-            timeout_seconds: Timeout in seconds
+            timeout_seconds: Timeout in seconds for unvetted patterns
 
         Returns:
             List of matches or empty list if timeout
         """
-        import signal
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError("Regex operation timed out")
-
-        # Set up the timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(timeout_seconds))
-
-        try:
-            return re.findall(pattern, text, flags)
-        except TimeoutError:
-            logger.debug(f"Regex timeout for pattern: {pattern[:50]}...")
-            return []
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+        return safe_findall(pattern, text, flags, timeout=timeout_seconds)
 
     def _extract_chapter_count_from_metadata(self, toc_url: str) -> Optional[int]:
         """
@@ -214,7 +187,6 @@ class UrlExtractor:
             
             # Pattern 1: Look for explicit total counts (avoid matching "Chapter 1")
             # These patterns require context like "total", "共", or number before "chapter"
-            import re
             # Safer regex patterns with limited repetition to prevent ReDoS
             patterns = [
                 r'total[:\s]{0,10}(\d{1,6})\s{0,10}chapters?',  # "Total: 423 chapters"
@@ -335,7 +307,8 @@ class UrlExtractor:
                         should_stop=should_stop,
                         min_chapter=min_chapter_number,
                         max_chapter=max_chapter_number,
-                        use_parallel=True
+                        use_parallel=True,
+                        use_racing=True
                     )
                 )
         except RuntimeError:
@@ -346,7 +319,8 @@ class UrlExtractor:
                     should_stop=should_stop,
                     min_chapter=min_chapter_number,
                     max_chapter=max_chapter_number,
-                    use_parallel=True
+                    use_parallel=True,
+                    use_racing=True
                 )
             )
 
@@ -377,7 +351,8 @@ class UrlExtractor:
                 should_stop=should_stop,
                 min_chapter=min_chapter_number,
                 max_chapter=max_chapter_number,
-                use_parallel=True
+                use_parallel=True,
+                use_racing=True
             )
         )
 
@@ -7,8 +7,9 @@ using Playwright with scrolling and pagination support.
 
 import re
 import time
-from pathlib import Path
-from typing import Any, Callable, List, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 try:
     from playwright.sync_api import \
@@ -20,11 +21,18 @@ except ImportError:
 
 from core.logger import get_logger
 
+from ..adaptive_config import get_adaptive_config_manager
 from ..chapter_parser import extract_chapter_number, normalize_url
+from ..config import PLAYWRIGHT_MAX_PAGINATION_PAGES, PLAYWRIGHT_PAGINATION_TABS
+from .url_extractor_scripts import evaluate_script, evaluate_script_async, install_script_bundle
 from .url_extractor_validators import is_chapter_url
 
 logger = get_logger("scraper.extractors.url_extractor_playwright")
 
+PAGE_MAX_RETRIES = 3
+PAGE_RETRY_BASE_DELAY = 1.0
+CLOUDFLARE_PAGE_WAIT = 10.0  # Seconds a pagination page may sit on a challenge before it is read anyway
+
 
 def retry_with_backoff(func: Callable[..., Any], max_retries: int = 3, base_delay: float = 1.0, should_stop: Optional[Callable[[], bool]] = None):
     """
@@ -65,54 +73,89 @@ def retry_with_backoff(func: Callable[..., Any], max_retries: int = 3, base_dela
         raise last_exception
 
 
-def _load_playwright_scroll_script() -> str:
+def _is_challenge_title(title: str) -> bool:
+    """Whether a page title belongs to a Cloudflare challenge page."""
+    title = title.lower()
+    return "just a moment" in title or "checking your browser" in title
+
+
+@dataclass
+class _PageJob:
+    """A pagination page waiting for, or loading in, a crawl tab."""
+    index: int
+    url: str
+    attempt: int = 0
+    not_before: float = 0.0
+    challenge_deadline: Optional[float] = None
+
+
+async def settle_chapter_links_async(page: Any, options: Optional[Dict[str, Any]] = None,
+                                     wait_for_change: bool = True) -> Optional[Dict[str, Any]]:
     """
-    Load and bundle all Playwright scroll script modules.
+    Wait until the page's chapter-link count stops changing (async API).
     
-    Modules are loaded in dependency order:
-    1. chapter_detector.js - Chapter link detection
-    2. link_counter.js - Link counting utilities
-    3. load_more_handler.js - Load More button handling
-    4. container_finder.js - Container finding utilities
-    5. scroll_operations.js - Scroll operation helpers
-    6. scroll_loop.js - Main scroll loop logic
-    7. main.js - Entry point
+    Args:
+        page: Playwright async Page
+        options: Settle timings (e.g. AdaptiveConfigManager.get_settle_options())
+        wait_for_change: Wait for new links to appear (after a scroll or click);
+            False waits only for the current count to hold still
     
     Returns:
-        JavaScript code as string, wrapped in async function call
+        {count, startCount, changed, timedOut, firstChangeMs, elapsedMs}, or None if the page could not be evaluated
     """
-    script_dir = Path(__file__).parent.parent / "playwright_scripts"
-    
-    # Define modules in dependency order
-    modules = [
-        ("chapter_detector", "chapter_detector.js"),
-        ("link_counter", "link_counter.js"),
-        ("load_more_handler", "load_more_handler.js"),
-        ("container_finder", "container_finder.js"),
-        ("scroll_operations", "scroll_operations.js"),
-        ("scroll_loop", "scroll_loop.js"),
-        ("main", "main.js"),
+    settle_options = dict(options or {})
+    settle_options["waitForChange"] = wait_for_change
+    try:
+        result = await evaluate_script_async(page, "settle", settle_options)
+    except Exception as e:
+        logger.debug(f"DOM settle wait failed: {e}")
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _harvest_options(selector: str, chapter_only: bool) -> Dict[str, Any]:
+    return {"selector": selector, "chapterOnly": chapter_only}
+
+
+def _to_link_pairs(result: Any) -> List[Tuple[str, str]]:
+    """Convert the JSON array returned by harvestLinks() to (href, text) tuples."""
+    if not isinstance(result, list):
+        return []
+    return [
+        (str(item[0]), str(item[1] or ""))
+        for item in result
+        if isinstance(item, (list, tuple)) and len(item) == 2 and item[0]
     ]
+
+
+def harvest_links(page: Any, selector: str = "a[href]", chapter_only: bool = False) -> List[Tuple[str, str]]:
+    """
+    Collect (href, text) pairs for all links matching selector in one round trip.
     
-    bundled_parts = []
-    for module_name, filename in modules:
-        module_path = script_dir / filename
-        try:
-            with open(module_path, "r", encoding="utf-8") as f:
-                module_content = f.read()
-            bundled_parts.append(f"// === {module_name} ===\n{module_content}")
-        except FileNotFoundError:
-            logger.error(f"Playwright module '{module_name}' not found at {module_path}")
-            raise
-        except Exception as e:
-            logger.error(f"Error loading Playwright module '{module_name}': {e}")
-            raise
-    
-    # Combine all modules
-    bundled_script = "\n\n".join(bundled_parts)
+    Args:
+        page: Playwright sync Page
+        selector: CSS selector for link elements
+        chapter_only: Pre-filter in the page with chapter_detector.js isChapterLink()
     
-    # Wrap in async function call for page.evaluate()
-    return f"async () => {{ {bundled_script} return await scrollAndCountChapters(); }}"
+    Returns:
+        (raw href, stripped text) pairs in document order; empty if the page cannot be evaluated
+    """
+    try:
+        result = evaluate_script(page, "harvestLinks", _harvest_options(selector, chapter_only))
+    except Exception as e:
+        logger.debug(f"Link harvesting failed: {e}")
+        return []
+    return _to_link_pairs(result)
+
+
+async def harvest_links_async(page: Any, selector: str = "a[href]", chapter_only: bool = False) -> List[Tuple[str, str]]:
+    """Async-API version of harvest_links()."""
+    try:
+        result = await evaluate_script_async(page, "harvestLinks", _harvest_options(selector, chapter_only))
+    except Exception as e:
+        logger.debug(f"Link harvesting failed: {e}")
+        return []
+    return _to_link_pairs(result)
 
 
 class PlaywrightExtractor:
@@ -124,33 +167,27 @@ class PlaywrightExtractor:
         session_manager: Any,  # SessionManager from url_extractor_session
         timeout: int,
         delay: float,
+        max_tabs: int = PLAYWRIGHT_PAGINATION_TABS,
 ):
       
         self.base_url = base_url
         self.session_manager = session_manager
         self.timeout = timeout
         self.delay = delay
+        self.max_tabs = max(1, max_tabs)
 
     def _collect_links(self, page: Any) -> List[tuple[str, str]]:
         """Collect (href, text) pairs from the current DOM."""
-        links: List[tuple[str, str]] = []
-        try:
-            dom_links = page.query_selector_all("a[href]")  # type: ignore[attr-defined]
-        except Exception as e:
-            return links
+        return harvest_links(page)
 
-        for link in dom_links:
-            try:
-                href_raw: Any = link.get_attribute("href")  # type: ignore[attr-defined]
-                href: str = str(href_raw) if href_raw else ""
-                if not href:
-                    continue
-                text_raw: Any = link.inner_text()  # type: ignore[attr-defined]
-                text: str = (str(text_raw) if text_raw else "").strip()
-                links.append((href, text))
-            except Exception as e:
-                continue
-        return links
+    def _collect_chapter_urls(self, page: Any) -> List[str]:
+        """Collect chapter URLs from the current DOM, in document order."""
+        chapter_urls: List[str] = []
+        for href, text in self._collect_links(page):
+            full_url: str = normalize_url(href, self.base_url)
+            if is_chapter_url(full_url, text):
+                chapter_urls.append(full_url)
+        return chapter_urls
     
     def extract(
         self,
@@ -175,7 +212,10 @@ class PlaywrightExtractor:
             with sync_playwright() as p:  # type: ignore[attr-defined]
                 browser = p.chromium.launch(headless=True)
                 try:
-                    page = browser.new_page()
+                    # Tabs opened for pagination share this context and its init script
+                    context = browser.new_context()
+                    install_script_bundle(context)
+                    page = context.new_page()
                     logger.debug(f"Navigating to {toc_url}...")
                     page.goto(toc_url, wait_until="networkidle", timeout=60000)  # type: ignore[attr-defined]
                     
@@ -516,82 +556,243 @@ class PlaywrightExtractor:
         page_urls: List[str],
         should_stop: Optional[Callable[[], bool]] = None
     ) -> List[str]:
-        """Extract chapters by visiting pagination pages."""
+        """
+        Extract chapters by visiting pagination pages.
+
+        With max_tabs > 1 the pages are crawled concurrently in several tabs;
+        results are merged in page order either way.
+        """
         all_chapter_urls: List[str] = []
         
         # Extract from page 1 (already loaded)
         logger.debug("Collecting chapters from page 1...")
-        for href, text in self._collect_links(page):
-            full_url: str = normalize_url(href, self.base_url)
-            if is_chapter_url(full_url, text):
-                all_chapter_urls.append(full_url)
+        all_chapter_urls.extend(self._collect_chapter_urls(page))
         
         # Visit additional pages
-        max_pages_to_visit = min(len(page_urls), 200)
+        page_urls = page_urls[:PLAYWRIGHT_MAX_PAGINATION_PAGES]
         if page_urls:
-            logger.info(f"Visiting {max_pages_to_visit} additional pages to collect all chapters...")
+            logger.info(f"Visiting {len(page_urls)} additional pages to collect all chapters...")
         
-        total_pages: int = len(page_urls[:max_pages_to_visit])
-        for idx, page_url in enumerate(page_urls[:max_pages_to_visit], 1):
+        tab_count: int = min(self.max_tabs, len(page_urls))
+        if tab_count > 1:
+            page_results = self._crawl_pages_concurrently(page, page_urls, tab_count, should_stop)
+        else:
+            page_results = self._crawl_pages_sequentially(page, page_urls, should_stop)
+        
+        for idx in sorted(page_results):
+            all_chapter_urls.extend(page_results[idx])
+        
+        # Remove duplicates
+        seen: set[str] = set()
+        unique_urls: List[str] = []
+        for url in all_chapter_urls:
+            if url not in seen:
+                seen.add(url)
+                unique_urls.append(url)
+        
+        logger.info(f"✓ Playwright found {len(unique_urls)} unique chapter URLs from {len(page_urls) + 1} pages")
+        page.close()  # type: ignore[attr-defined]
+        return unique_urls
+    
+    def _crawl_pages_sequentially(
+        self,
+        page: Any,
+        page_urls: List[str],
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Dict[int, List[str]]:
+        """Visit pagination pages one at a time on a single page."""
+        page_results: Dict[int, List[str]] = {}
+        total_pages: int = len(page_urls)
+        found_so_far: int = 0
+        for idx, page_url in enumerate(page_urls, 1):
             if should_stop and should_stop():
                 break
             
             progress_pct: float = (idx / total_pages * 100) if total_pages > 0 else 0
             logger.info(f"Loading page {idx}/{total_pages} ({progress_pct:.1f}%): {page_url}")
             
-            self.session_manager.rate_limit()
+            self.session_manager.rate_limit(urlparse(page_url).netloc)
             
             def load_page():
                 page.goto(page_url, wait_until="domcontentloaded", timeout=30000)  # type: ignore[attr-defined]
-                try:
-                    page.wait_for_load_state("networkidle", timeout=10000)  # type: ignore[attr-defined]
-                except Exception as e:
-                    try:
-                        page.wait_for_load_state("domcontentloaded", timeout=5000)  # type: ignore[attr-defined]
-                    except Exception as e:
-                        pass
+                self._wait_for_network_idle(page)
                 
-                page_title: str = page.title()  # type: ignore[attr-defined]
-                if "just a moment" in page_title.lower() or "checking your browser" in page_title.lower():
-                    max_wait: int = 10
+                if _is_challenge_title(page.title()):  # type: ignore[attr-defined]
+                    max_wait: int = int(CLOUDFLARE_PAGE_WAIT)
                     waited: int = 0
                     while waited < max_wait:
                         time.sleep(1)
                         waited += 1
                         try:
-                            current_title: str = page.title()  # type: ignore[attr-defined]
-                            if not ("just a moment" in current_title.lower() or "checking your browser" in current_title.lower()):
+                            if not _is_challenge_title(page.title()):  # type: ignore[attr-defined]
                                 break
                         except Exception as e:
                             pass
                 return True
             
             try:
-                retry_with_backoff(load_page, max_retries=3, base_delay=1.0, should_stop=should_stop)
+                retry_with_backoff(load_page, max_retries=PAGE_MAX_RETRIES, base_delay=PAGE_RETRY_BASE_DELAY,
+                                   should_stop=should_stop)
                 
-                page_chapters: List[str] = []
-                for href, text in self._collect_links(page):
-                    full_url: str = normalize_url(href, self.base_url)
-                    if is_chapter_url(full_url, text):
-                        page_chapters.append(full_url)
-                
-                all_chapter_urls.extend(page_chapters)
-                logger.info(f"Page {idx}/{total_pages}: Found {len(page_chapters)} chapters (total so far: {len(all_chapter_urls)})")
+                page_chapters: List[str] = self._collect_chapter_urls(page)
+                page_results[idx] = page_chapters
+                found_so_far += len(page_chapters)
+                logger.info(f"Page {idx}/{total_pages}: Found {len(page_chapters)} chapters (total so far: {found_so_far})")
             except Exception as e:
                 logger.warning(f"Error loading page {idx} ({page_url}) after retries: {e}")
                 continue
         
-        # Remove duplicates
-        seen: set[str] = set()
-        unique_urls: List[str] = []
-        for url in all_chapter_urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
+        return page_results
+    
+    def _crawl_pages_concurrently(
+        self,
+        page: Any,
+        page_urls: List[str],
+        tab_count: int,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Dict[int, List[str]]:
+        """
+        Visit pagination pages in several tabs of the page's browser context.
         
-        logger.info(f"✓ Playwright found {len(unique_urls)} unique chapter URLs from {len(page_urls[:max_pages_to_visit]) + 1} pages")
-        page.close()  # type: ignore[attr-defined]
-        return unique_urls
+        A navigation is started on every idle tab before waiting on any of
+        them, so page loads overlap in the browser. Each start goes through
+        the per-host rate limit. Retries and Cloudflare waits are tracked
+        per tab, so a slow or failing page does not hold up the others.
+        
+        Returns:
+            Chapter URLs per page, keyed by the page's 1-based position in page_urls
+        """
+        context: Any = page.context  # type: ignore[attr-defined]
+        tabs: List[Any] = [page]
+        try:
+            for _ in range(tab_count - 1):
+                tabs.append(context.new_page())  # type: ignore[attr-defined]
+        except Exception as e:
+            logger.debug(f"Could not open more tabs ({len(tabs)} open): {e}")
+        
+        total_pages: int = len(page_urls)
+        pending: List[_PageJob] = [_PageJob(idx, url) for idx, url in enumerate(page_urls, 1)]
+        active: Dict[int, _PageJob] = {}  # tab slot -> job loading in it
+        page_results: Dict[int, List[str]] = {}
+        logger.info(f"Crawling {total_pages} pages with {len(tabs)} tabs...")
+        
+        try:
+            while pending or active:
+                if should_stop and should_stop():
+                    break
+                
+                progressed = False
+                for slot in range(len(tabs)):
+                    if slot in active:
+                        continue
+                    job = self._next_ready_job(pending)
+                    if job is None:
+                        break
+                    self.session_manager.rate_limit(urlparse(job.url).netloc)
+                    logger.debug(f"Tab {slot + 1}: loading page {job.index}/{total_pages}: {job.url}")
+                    try:
+                        tabs[slot].goto(job.url, wait_until="commit", timeout=30000)  # type: ignore[attr-defined]
+                        active[slot] = job
+                    except Exception as e:
+                        self._requeue_or_drop(job, e, pending)
+                        tabs[slot] = self._replace_closed_tab(tabs[slot], context)
+                    progressed = True
+                
+                for slot in sorted(active):
+                    job = active[slot]
+                    try:
+                        if not self._advance_tab(tabs[slot], job):
+                            continue
+                        page_chapters: List[str] = self._collect_chapter_urls(tabs[slot])
+                    except Exception as e:
+                        del active[slot]
+                        self._requeue_or_drop(job, e, pending)
+                        tabs[slot] = self._replace_closed_tab(tabs[slot], context)
+                        progressed = True
+                        continue
+                    
+                    del active[slot]
+                    page_results[job.index] = page_chapters
+                    progressed = True
+                    logger.info(f"Page {job.index}/{total_pages}: Found {len(page_chapters)} chapters "
+                                f"({len(page_results)}/{total_pages} pages done)")
+                
+                if not progressed:
+                    # Only challenge waits or retry backoffs left
+                    time.sleep(0.5)
+        finally:
+            # The caller closes page; a tab that replaced it in slot 0 is ours
+            for tab in tabs:
+                if tab is page:
+                    continue
+                try:
+                    tab.close()  # type: ignore[attr-defined]
+                except Exception as e:
+                    pass
+        
+        return page_results
+    
+    def _next_ready_job(self, pending: List[_PageJob]) -> Optional[_PageJob]:
+        """Take the first pending job that is not waiting out a retry backoff."""
+        now = time.time()
+        for position, job in enumerate(pending):
+            if job.not_before <= now:
+                return pending.pop(position)
+        return None
+    
+    def _advance_tab(self, tab: Any, job: _PageJob) -> bool:
+        """
+        Move a loading tab forward; True once its page can be read.
+        
+        A page showing a Cloudflare challenge is re-checked on later passes
+        until CLOUDFLARE_PAGE_WAIT runs out, then read as it is.
+        """
+        if job.challenge_deadline is None:
+            tab.wait_for_load_state("domcontentloaded", timeout=30000)  # type: ignore[attr-defined]
+            self._wait_for_network_idle(tab)
+            if not _is_challenge_title(tab.title()):  # type: ignore[attr-defined]
+                return True
+            logger.debug(f"Page {job.index}: Cloudflare challenge, waiting up to {CLOUDFLARE_PAGE_WAIT:.0f}s")
+            job.challenge_deadline = time.time() + CLOUDFLARE_PAGE_WAIT
+            return False
+        
+        if time.time() >= job.challenge_deadline:
+            return True
+        try:
+            return not _is_challenge_title(tab.title())  # type: ignore[attr-defined]
+        except Exception as e:
+            return False  # Still navigating past the challenge
+    
+    def _requeue_or_drop(self, job: _PageJob, error: Exception, pending: List[_PageJob]) -> None:
+        """Put a failed page back with exponential backoff, or give up after PAGE_MAX_RETRIES."""
+        job.attempt += 1
+        job.challenge_deadline = None
+        if job.attempt < PAGE_MAX_RETRIES:
+            wait_time = PAGE_RETRY_BASE_DELAY * (2 ** (job.attempt - 1))
+            logger.debug(f"Retry {job.attempt}/{PAGE_MAX_RETRIES} for page {job.index} after {wait_time:.1f}s: {str(error)[:100]}")
+            job.not_before = time.time() + wait_time
+            pending.insert(0, job)
+        else:
+            logger.warning(f"Error loading page {job.index} ({job.url}) after retries: {error}")
+    
+    def _replace_closed_tab(self, tab: Any, context: Any) -> Any:
+        """Open a new tab in place of one that crashed or was closed."""
+        try:
+            if tab.is_closed():  # type: ignore[attr-defined]
+                return context.new_page()  # type: ignore[attr-defined]
+        except Exception as e:
+            logger.debug(f"Could not replace closed tab: {e}")
+        return tab
+    
+    def _wait_for_network_idle(self, page: Any) -> None:
+        """Wait for network idle, settling for DOM content loaded."""
+        try:
+            page.wait_for_load_state("networkidle", timeout=10000)  # type: ignore[attr-defined]
+        except Exception as e:
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=5000)  # type: ignore[attr-defined]
+            except Exception as e:
+                pass
     
     def _try_fallback_pagination_detection(
         self,
@@ -659,8 +860,14 @@ class PlaywrightExtractor:
         logger.debug("No pagination detected or pagination extraction failed, using scrolling method...")
         logger.debug("Starting scroll to load chapters...")
         
-        scroll_script = _load_playwright_scroll_script()
-        scroll_result = page.evaluate(scroll_script)  # type: ignore[attr-defined]
+        adaptive_config = get_adaptive_config_manager()
+        scroll_result = evaluate_script(page, "scrollAndCountChapters", adaptive_config.get_settle_options(toc_url))
+        if isinstance(scroll_result, dict):
+            settle_stats: Dict[str, Any] = scroll_result.get("settle") or {}
+            adaptive_config.record_settle_times(toc_url, settle_stats.get("firstChangeMs") or [])
+            logger.debug(f"Settle waits: {settle_stats.get('rounds', 0)} rounds, "
+                         f"{settle_stats.get('changedRounds', 0)} with new links, {settle_stats.get('timeouts', 0)} timed out")
+            scroll_result = scroll_result.get("count")
         logger.info(f"Scrolling complete. Found {scroll_result} chapter links in DOM.")
         
         try:
@@ -690,7 +897,7 @@ class PlaywrightExtractor:
         if unique_urls:
             logger.info(f"✓ Playwright found {len(unique_urls)} unique chapter URLs")
         else:
-            logger.warning(f"⚠ Playwright found {len(unique_links)} links but extracted 0 chapter URLs")
+            logger.warning(f"⚠ Playwright found {scroll_result} links but extracted 0 chapter URLs")
         
         return unique_urls
 
@@ -0,0 +1,270 @@
+"""
+Playwright script bundle for URL extraction.
+
+All playwright_scripts/*.js modules are joined once per process into a
+single bundle that installs a `window.__actPlaywright` namespace. The
+bundle is registered on browser contexts with add_init_script, so every
+page has it before its own scripts run; page.evaluate then only sends a
+short call to an entry point. Pages created without the init script get
+the bundle injected on first use.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from core.logger import get_logger
+
+from ..config import PLAYWRIGHT_MINIFY_SCRIPTS
+
+logger = get_logger("scraper.extractors.url_extractor_scripts")
+
+SCRIPT_DIR = Path(__file__).parent.parent / "playwright_scripts"
+SCRIPT_NAMESPACE = "__actPlaywright"
+BUNDLE_MISSING = "__actPlaywrightMissing__"
+
+# Dependency order
+SCRIPT_MODULES: List[Tuple[str, str]] = [
+    ("chapter_detector", "chapter_detector.js"),
+    ("link_counter", "link_counter.js"),
+    ("link_harvester", "link_harvester.js"),
+    ("load_more_handler", "load_more_handler.js"),
+    ("container_finder", "container_finder.js"),
+    ("scroll_operations", "scroll_operations.js"),
+    ("dom_settle", "dom_settle.js"),
+    ("scroll_loop", "scroll_loop.js"),
+    ("main", "main.js"),
+]
+
+# Entry points exposed on the namespace; each starts from fresh settle state
+_ENTRY_POINTS = """
+scrollAndCountChapters: async function(settleOptions) {
+    resetSettle();
+    var count = await scrollAndCountChapters(settleOptions);
+    return {count: count, settle: getSettleStats()};
+},
+settle: function(options) {
+    resetSettle();
+    configureSettle(options);
+    return waitForChapterLinksSettled(function() { return countChapterLinks(isChapterLink); }, options);
+},
+harvestLinks: function(options) {
+    return harvestLinks(options);
+}
+"""
+
+# Characters after which a "/" starts a regex literal rather than a division
+_REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = ("return", "typeof", "case", "in", "of", "delete", "void", "throw")
+_WORD_RE = re.compile(r"[A-Za-z0-9_$]+")
+
+
+@dataclass(frozen=True)
+class ScriptBundle:
+    """A built bundle and its identity."""
+    source: str  # Expression that installs the namespace (init script or evaluate payload)
+    version: str  # Content hash; a page holding another version gets the bundle re-installed
+    minified: bool
+
+
+def _load_playwright_modules(modules: List[Tuple[str, str]]) -> str:
+    """Read Playwright script modules and join them in the given order."""
+    bundled_parts = []
+    for module_name, filename in modules:
+        module_path = SCRIPT_DIR / filename
+        try:
+            with open(module_path, "r", encoding="utf-8") as f:
+                module_content = f.read()
+            bundled_parts.append(f"// === {module_name} ===\n{module_content}")
+        except FileNotFoundError:
+            logger.error(f"Playwright module '{module_name}' not found at {module_path}")
+            raise
+        except Exception as e:
+            logger.error(f"Error loading Playwright module '{module_name}': {e}")
+            raise
+
+    return "\n\n".join(bundled_parts)
+
+
+def _read_string(source: str, start: int) -> int:
+    """Index just past the string literal starting at start."""
+    quote = source[start]
+    i = start + 1
+    while i < len(source):
+        if source[i] == "\\":
+            i += 2
+            continue
+        if source[i] == quote:
+            return i + 1
+        i += 1
+    return i
+
+
+def _read_regex(source: str, start: int) -> int:
+    """Index just past the regex literal (including flags) starting at start."""
+    i = start + 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            i += 1
+            while i < len(source) and (source[i].isalnum() or source[i] == "_"):
+                i += 1
+            return i
+        elif char == "\n":
+            break
+        i += 1
+    return i
+
+
+def _minify_js(source: str) -> str:
+    """
+    Conservatively minify JavaScript.
+
+    Removes comments and collapses whitespace outside string and regex
+    literals. Line breaks are kept (one per line) so automatic semicolon
+    insertion behaves exactly as in the original source.
+    """
+    out: List[str] = []
+    i = 0
+    n = len(source)
+    last = ""  # Last significant character written
+    last_word = ""  # Identifier, keyword or number just written ("" after any other token)
+
+    while i < n:
+        char = source[i]
+        nxt = source[i + 1] if i + 1 < n else ""
+
+        if char in "\"'`":
+            end = _read_string(source, i)
+            out.append(source[i:end])
+            last, last_word = char, ""
+            i = end
+        elif char == "/" and nxt == "/":
+            while i < n and source[i] != "\n":
+                i += 1
+        elif char == "/" and nxt == "*":
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            out.append("\n" if "\n" in source[i:end] else " ")
+            i = end
+        elif char == "/" and (last == "" or last in _REGEX_PRECEDERS or last_word in _REGEX_KEYWORDS):
+            end = _read_regex(source, i)
+            out.append(source[i:end])
+            last, last_word = "/", ""
+            i = end
+        elif char.isspace():
+            end = i
+            while end < n and source[end].isspace():
+                end += 1
+            out.append("\n" if "\n" in source[i:end] else " ")
+            i = end
+        elif _WORD_RE.match(char):
+            word = _WORD_RE.match(source, i).group(0)  # type: ignore[union-attr]
+            out.append(word)
+            # A property name (obj.case) is not a keyword
+            last, last_word = word[-1], ("" if last == "." else word)
+            i += len(word)
+        else:
+            out.append(char)
+            last, last_word = char, ""
+            i += 1
+
+    lines = (line.strip() for line in "".join(out).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+@lru_cache(maxsize=2)
+def get_script_bundle(minified: bool = PLAYWRIGHT_MINIFY_SCRIPTS) -> ScriptBundle:
+    """
+    Build the script bundle (once per process and variant).
+
+    Args:
+        minified: Strip comments and indentation to cut payload and parse time
+
+    Returns:
+        ScriptBundle
+    """
+    library = _load_playwright_modules(SCRIPT_MODULES)
+    version = hashlib.sha256(f"{int(minified)}:{library}".encode("utf-8")).hexdigest()[:16]
+    namespace = f"window.{SCRIPT_NAMESPACE}"
+    source = (
+        f"(function() {{\n"
+        f"if ({namespace} && {namespace}.version === '{version}') return;\n"
+        f"{library}\n"
+        f"{namespace} = {{\nversion: '{version}',{_ENTRY_POINTS}}};\n"
+        f"}})()"
+    )
+    if minified:
+        source = _minify_js(source)
+    logger.debug(f"Built Playwright script bundle {version} ({len(source)} chars, minified={minified})")
+    return ScriptBundle(source=source, version=version, minified=minified)
+
+
+@lru_cache(maxsize=None)
+def _entry_point_call(function: str, minified: bool) -> str:
+    """page.evaluate payload calling an entry point, or returning BUNDLE_MISSING without the bundle."""
+    version = get_script_bundle(minified).version
+    namespace = f"window.{SCRIPT_NAMESPACE}"
+    return (
+        f"(args) => ({namespace} && {namespace}.version === '{version}') "
+        f"? {namespace}.{function}(args) : '{BUNDLE_MISSING}'"
+    )
+
+
+def evaluate_script(page: Any, function: str, args: Any = None) -> Any:
+    """
+    Call a bundle entry point on a page (sync API).
+
+    Args:
+        page: Playwright sync Page
+        function: Entry point name (scrollAndCountChapters, settle, harvestLinks)
+        args: JSON-serializable argument
+
+    Returns:
+        The entry point's result
+    """
+    bundle = get_script_bundle()
+    call = _entry_point_call(function, bundle.minified)
+    result = page.evaluate(call, args)  # type: ignore[attr-defined]
+    if isinstance(result, str) and result == BUNDLE_MISSING:
+        page.evaluate(bundle.source)  # type: ignore[attr-defined]
+        result = page.evaluate(call, args)  # type: ignore[attr-defined]
+    return result
+
+
+async def evaluate_script_async(page: Any, function: str, args: Any = None) -> Any:
+    """Async-API version of evaluate_script()."""
+    bundle = get_script_bundle()
+    call = _entry_point_call(function, bundle.minified)
+    result = await page.evaluate(call, args)  # type: ignore[attr-defined]
+    if isinstance(result, str) and result == BUNDLE_MISSING:
+        await page.evaluate(bundle.source)  # type: ignore[attr-defined]
+        result = await page.evaluate(call, args)  # type: ignore[attr-defined]
+    return result
+
+
+def install_script_bundle(context: Any) -> None:
+    """Register the bundle as an init script on a browser context (sync API)."""
+    try:
+        context.add_init_script(script=get_script_bundle().source)  # type: ignore[attr-defined]
+    except Exception as e:
+        logger.debug(f"Could not register Playwright script bundle: {e}")
+
+
+async def install_script_bundle_async(context: Any) -> None:
+    """Async-API version of install_script_bundle()."""
+    try:
+        await context.add_init_script(script=get_script_bundle().source)  # type: ignore[attr-defined]
+    except Exception as e:
+        logger.debug(f"Could not register Playwright script bundle: {e}")
@@ -4,8 +4,9 @@ Session management and rate limiting for URL extractor.
 Handles HTTP session creation and rate limiting between requests.
 """
 
+import threading
 import time
-from typing import Optional, Any
+from typing import Dict, Optional, Any
 
 try:
     import requests  # type: ignore[import-untyped]
@@ -42,8 +43,9 @@ class SessionManager:
             min_request_delay: Minimum delay between requests in seconds
         """
         self._session: Optional[Any] = None
-        self._last_request_time: float = 0.0
+        self._last_request_times: Dict[str, float] = {}
         self._min_request_delay: float = min_request_delay
+        self._rate_lock = threading.Lock()
 
     def get_session(self):  # type: ignore[return-type]
         """
@@ -68,20 +70,27 @@ class SessionManager:
                 return None
         return self._session
     
-    def rate_limit(self) -> None:
+    def rate_limit(self, host: Optional[str] = None) -> None:
         """
         Enforce rate limiting between requests.
         
         Ensures minimum delay between requests to avoid being blocked.
-        Sleeps if necessary to maintain the minimum delay.
+        Sleeps if necessary to maintain the minimum delay. Requests are
+        tracked per host; calls without a host share one limit. Safe to
+        call from several threads: each caller reserves the next free
+        slot, so concurrent requests to one host stay spaced out.
+        
+        Args:
+            host: Host (netloc) the next request goes to
         """
-        current_time = time.time()
-        elapsed = current_time - self._last_request_time
+        key = (host or "").lower()
+        with self._rate_lock:
+            current_time = time.time()
+            last_time = self._last_request_times.get(key)
+            slot = current_time if last_time is None else max(current_time, last_time + self._min_request_delay)
+            self._last_request_times[key] = slot
         
-        if elapsed < self._min_request_delay:
-            sleep_time = self._min_request_delay - elapsed
-            logger.debug(f"Rate limiting: waiting {sleep_time:.2f}s")
+        sleep_time = slot - current_time
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting{f' {key}' if key else ''}: waiting {sleep_time:.2f}s")
             time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
-
@@ -0,0 +1,179 @@
+/**
+ * DOM settle module.
+ *
+ * Event-driven replacement for fixed sleeps after scrolling or clicking
+ * "Load More". A MutationObserver re-counts chapter links as the DOM
+ * changes, and the wait resolves as soon as the count has stopped
+ * changing, instead of always paying the worst-case delay.
+ * No dependencies; the count function is passed in.
+ */
+
+/**
+ * Settle timings, overridden per site by configureSettle().
+ */
+var SETTLE_CONFIG = {
+    quietMs: 300,        // Count must stay unchanged this long after a change
+    timeoutMs: 3000,     // Longest wait for new links to start appearing
+    maxWaitMs: 15000,    // Hard cap for a single settle, even while links keep arriving
+    recountDelayMs: 50   // Mutations are batched into one recount per interval
+};
+
+/**
+ * Statistics of waitForChange settles in the current script run, returned
+ * to Python to tune the site's timeouts.
+ */
+var SETTLE_STATS = {
+    rounds: 0,
+    changedRounds: 0,
+    timeouts: 0,
+    firstChangeMs: []
+};
+
+/**
+ * Restores default timings and clears the statistics.
+ *
+ * The script bundle stays installed for the page's lifetime, so each
+ * entry point starts from a clean state, as a fresh evaluate would.
+ */
+function resetSettle() {
+    SETTLE_CONFIG = { quietMs: 300, timeoutMs: 3000, maxWaitMs: 15000, recountDelayMs: 50 };
+    SETTLE_STATS = { rounds: 0, changedRounds: 0, timeouts: 0, firstChangeMs: [] };
+}
+
+/**
+ * Overrides SETTLE_CONFIG values (e.g. from the site profile).
+ *
+ * @param {Object} options - quietMs, timeoutMs, maxWaitMs (all optional)
+ */
+function configureSettle(options) {
+    if (!options) return;
+    ['quietMs', 'timeoutMs', 'maxWaitMs', 'recountDelayMs'].forEach(function(key) {
+        if (typeof options[key] === 'number' && options[key] >= 0) {
+            SETTLE_CONFIG[key] = options[key];
+        }
+    });
+}
+
+/**
+ * Waits until the chapter-link count settles.
+ *
+ * With waitForChange (default) the wait lasts until new links have appeared
+ * and then stayed unchanged for quietMs, or until timeoutMs passes without
+ * any change. Without it, the wait ends once the count has been stable for
+ * quietMs (used right after page load). Network activity seen through
+ * resource timing entries keeps the quiet period open.
+ *
+ * @param {Function} countFn - Returns the current number of chapter links
+ * @param {Object} options - waitForChange plus any SETTLE_CONFIG override
+ * @returns {Promise<Object>} {count, startCount, changed, timedOut, firstChangeMs, elapsedMs}
+ */
+function waitForChapterLinksSettled(countFn, options) {
+    var opts = options || {};
+    var quietMs = typeof opts.quietMs === 'number' ? opts.quietMs : SETTLE_CONFIG.quietMs;
+    var timeoutMs = typeof opts.timeoutMs === 'number' ? opts.timeoutMs : SETTLE_CONFIG.timeoutMs;
+    var maxWaitMs = typeof opts.maxWaitMs === 'number' ? opts.maxWaitMs : SETTLE_CONFIG.maxWaitMs;
+    var waitForChange = opts.waitForChange !== false;
+
+    return new Promise(function(resolve) {
+        var start = Date.now();
+        var startCount = countFn();
+        var lastCount = startCount;
+        var firstChangeAt = null;
+        var quietTimer = null;
+        var patienceTimer = null;
+        var capTimer = null;
+        var recountTimer = null;
+        var observer = null;
+        var resourceObserver = null;
+        var done = false;
+
+        function finish(timedOut) {
+            if (done) return;
+            done = true;
+            clearTimeout(quietTimer);
+            clearTimeout(patienceTimer);
+            clearTimeout(capTimer);
+            clearTimeout(recountTimer);
+            if (observer) observer.disconnect();
+            if (resourceObserver) resourceObserver.disconnect();
+
+            var changed = lastCount !== startCount;
+            var firstChangeMs = firstChangeAt === null ? null : firstChangeAt - start;
+            if (waitForChange) {
+                SETTLE_STATS.rounds++;
+                if (changed) {
+                    SETTLE_STATS.changedRounds++;
+                    SETTLE_STATS.firstChangeMs.push(firstChangeMs);
+                }
+                if (timedOut) SETTLE_STATS.timeouts++;
+            }
+
+            resolve({
+                count: lastCount,
+                startCount: startCount,
+                changed: changed,
+                timedOut: timedOut,
+                firstChangeMs: firstChangeMs,
+                elapsedMs: Date.now() - start
+            });
+        }
+
+        function armQuiet() {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(function() { finish(false); }, quietMs);
+        }
+
+        function recount() {
+            recountTimer = null;
+            var count = countFn();
+            if (count !== lastCount) {
+                lastCount = count;
+                if (firstChangeAt === null) {
+                    firstChangeAt = Date.now();
+                    clearTimeout(patienceTimer);
+                }
+                armQuiet();
+            }
+        }
+
+        observer = new MutationObserver(function() {
+            if (recountTimer === null && !done) {
+                recountTimer = setTimeout(recount, SETTLE_CONFIG.recountDelayMs);
+            }
+        });
+        observer.observe(document.body || document.documentElement, { childList: true, subtree: true });
+
+        if (typeof PerformanceObserver !== 'undefined') {
+            try {
+                resourceObserver = new PerformanceObserver(function() {
+                    // A request just finished; give its content time to render
+                    if (firstChangeAt !== null || !waitForChange) armQuiet();
+                });
+                resourceObserver.observe({ type: 'resource', buffered: false });
+            } catch (e) {
+                resourceObserver = null;
+            }
+        }
+
+        capTimer = setTimeout(function() { finish(true); }, Math.max(maxWaitMs, timeoutMs));
+        if (waitForChange) {
+            patienceTimer = setTimeout(function() { finish(true); }, timeoutMs);
+        } else {
+            armQuiet();
+        }
+    });
+}
+
+/**
+ * Returns a copy of this run's settle statistics.
+ *
+ * @returns {Object} {rounds, changedRounds, timeouts, firstChangeMs}
+ */
+function getSettleStats() {
+    return {
+        rounds: SETTLE_STATS.rounds,
+        changedRounds: SETTLE_STATS.changedRounds,
+        timeouts: SETTLE_STATS.timeouts,
+        firstChangeMs: SETTLE_STATS.firstChangeMs.slice()
+    };
+}
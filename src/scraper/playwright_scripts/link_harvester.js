@@ -0,0 +1,37 @@
+/**
+ * Link harvesting module.
+ * 
+ * Collects links as plain [href, text] pairs in a single page.evaluate()
+ * call, so Python does not need a browser round trip per element.
+ * Depends on chapter_detector.js when chapterOnly is set.
+ */
+
+/**
+ * Gets href and text of every matching link element.
+ * 
+ * @param {Object} options - Optional settings
+ * @param {string} options.selector - CSS selector for link elements (default 'a[href]')
+ * @param {boolean} options.chapterOnly - Keep only links accepted by isChapterLink()
+ * @returns {Array<Array<string>>} [href, text] pairs in document order; href is the raw attribute value
+ */
+function harvestLinks(options) {
+    var opts = options || {};
+    var nodes = document.querySelectorAll(opts.selector || 'a[href]');
+    var pairs = [];
+    
+    for (var i = 0; i < nodes.length; i++) {
+        var link = nodes[i];
+        var href = link.getAttribute('href');
+        if (!href) continue;
+        if (opts.chapterOnly && !isChapterLink(link)) continue;
+        
+        // innerText matches Playwright's inner_text(); textContent covers elements without layout
+        var text = link.innerText;
+        if (text === undefined || text === null) {
+            text = link.textContent || '';
+        }
+        pairs.push([href, text.trim()]);
+    }
+    
+    return pairs;
+}
@@ -16,11 +16,18 @@
  * - Clicks "Load More" buttons
  * - Counts total chapters available
  * 
+ * @param {Object} settleOptions - Optional per-site settle timings for configureSettle()
  * @returns {Promise<number>} The final count of chapter links found
  */
-async function scrollAndCountChapters() {
+async function scrollAndCountChapters(settleOptions) {
     // Note: In browser context, all module functions are available in the global scope
     // after being bundled together by the Python loader
+    configureSettle(settleOptions);
+    
+    // Let the initial render finish before the first scroll
+    await waitForChapterLinksSettled(function() {
+        return countChapterLinks(isChapterLink);
+    }, { waitForChange: false });
     
     // Create dependencies object for scroll loop
     var dependencies = {
@@ -3,6 +3,8 @@
  * 
  * Contains the main scrolling loop logic that orchestrates scrolling,
  * load more button clicking, and chapter counting.
+ * Waits use waitForChapterLinksSettled() from dom_settle.js, so each step
+ * ends as soon as new chapter links have finished loading.
  */
 
 /**
@@ -10,13 +12,11 @@
  */
 var SCROLL_CONFIG = {
     maxScrolls: 1000,
-    maxNoChange: 30,
-    scrollDelay: 1000,
+    maxNoChange: 3,  // Consecutive settles that time out without new links
     loadMoreCheckInterval: 2,  // Check every N scrolls
-    loadMoreWaitAfterClick: 2000,
     finalAggressiveScrolls: 10,
     finalAggressiveLoadMoreAttempts: 3,
-    finalAggressiveWait: 1000,
+    finalLoadMoreAttempts: 5,
     progressLogInterval: 10
 };
 
@@ -58,33 +58,25 @@ async function performScrollLoop(dependencies) {
     
     // Main scroll loop
     while (scrollAttempts < SCROLL_CONFIG.maxScrolls) {
-        // Scroll container
+        // Scroll container, then the last chapter into view and past it to trigger lazy loading
         scrollContainer(chapterContainer);
-        await new Promise(resolve => setTimeout(resolve, SCROLL_CONFIG.scrollDelay));
+        var chapterLinks = getChapterLinks();
+        await scrollToLastChapter(chapterLinks, 0);
+        await scrollPastLastChapter(chapterLinks, 2, 0);
+        
+        var settled = await waitForChapterLinksSettled(countChapterLinks);
+        currentCount = settled.count;
         
-        // Try clicking Load More buttons periodically
-        if (scrollAttempts % SCROLL_CONFIG.loadMoreCheckInterval === 0) {
+        // Try clicking Load More buttons periodically, and whenever scrolling brought nothing
+        if (!settled.changed || scrollAttempts % SCROLL_CONFIG.loadMoreCheckInterval === 0) {
             if (await tryClickLoadMore()) {
-                await new Promise(resolve => setTimeout(resolve, SCROLL_CONFIG.loadMoreWaitAfterClick));
-                currentCount = countChapterLinks();
+                currentCount = (await waitForChapterLinksSettled(countChapterLinks)).count;
                 if (currentCount > lastCount) {
                     console.log('Load More clicked! Found ' + currentCount + ' chapters (was ' + lastCount + ')');
-                    lastCount = currentCount;
-                    noChangeCount = 0;
                 }
             }
         }
         
-        // Scroll to last chapter to trigger lazy loading
-        var chapterLinks = getChapterLinks();
-        await scrollToLastChapter(chapterLinks);
-        
-        // Also try scrolling past the last link to trigger infinite scroll
-        await scrollPastLastChapter(chapterLinks);
-        
-        // Recount chapter links
-        currentCount = countChapterLinks();
-        
         // Check if we're making progress
         if (currentCount === lastCount) {
             noChangeCount++;
@@ -142,16 +134,15 @@ async function performFinalLoadMoreAttempts(tryClickLoadMore, countChapterLinks)
     console.log('No change detected, trying final aggressive Load More attempt...');
     var lastCount = countChapterLinks();
     
-    for (var attempt = 0; attempt < 5; attempt++) {
-        if (await tryClickLoadMore()) {
-            await new Promise(resolve => setTimeout(resolve, 3000));
-            var currentCount = countChapterLinks();
-            if (currentCount > lastCount) {
-                console.log('Final Load More successful! Found ' + currentCount + ' chapters');
-                return true;
-            }
+    for (var attempt = 0; attempt < SCROLL_CONFIG.finalLoadMoreAttempts; attempt++) {
+        if (!(await tryClickLoadMore())) {
+            break;  // No button left to click
+        }
+        var settled = await waitForChapterLinksSettled(countChapterLinks);
+        if (settled.count > lastCount) {
+            console.log('Final Load More successful! Found ' + settled.count + ' chapters');
+            return true;
         }
-        await new Promise(resolve => setTimeout(resolve, 500));
     }
     
     return false;
@@ -160,6 +151,8 @@ async function performFinalLoadMoreAttempts(tryClickLoadMore, countChapterLinks)
 /**
  * Performs final aggressive scrolling phase to ensure everything is loaded.
  * 
+ * Stops at the first round that loads no new chapters.
+ * 
  * @param {HTMLElement} chapterContainer - The container element
  * @param {Object} dependencies - Object containing required functions
  * @param {number} currentCount - Current chapter count
@@ -175,33 +168,29 @@ async function performFinalAggressiveScroll(chapterContainer, dependencies, curr
     console.log('Starting final aggressive scroll phase...');
     
     for (var i = 0; i < SCROLL_CONFIG.finalAggressiveScrolls; i++) {
+        var roundStartCount = currentCount;
         scrollContainerToBottom(chapterContainer);
         
+        // Scroll past the last chapter to trigger infinite scroll
+        await scrollPastLastChapter(getChapterLinks(), 3, 0);
+        currentCount = Math.max(currentCount, (await waitForChapterLinksSettled(countChapterLinks)).count);
+        
         // Try clicking load more multiple times
         for (var j = 0; j < SCROLL_CONFIG.finalAggressiveLoadMoreAttempts; j++) {
-            if (await tryClickLoadMore()) {
-                await new Promise(resolve => setTimeout(resolve, 2000));
-                var newCount = countChapterLinks();
-                if (newCount > currentCount) {
-                    console.log('Final scroll found more chapters: ' + newCount);
-                    currentCount = newCount;
-                }
+            if (!(await tryClickLoadMore())) {
+                break;
+            }
+            var newCount = (await waitForChapterLinksSettled(countChapterLinks)).count;
+            if (newCount > currentCount) {
+                console.log('Final scroll found more chapters: ' + newCount);
+                currentCount = newCount;
             }
         }
         
-        await new Promise(resolve => setTimeout(resolve, SCROLL_CONFIG.finalAggressiveWait));
-        
-        // Scroll past the last chapter to trigger infinite scroll
-        var chapterLinks = getChapterLinks();
-        await scrollPastLastChapter(chapterLinks, 3, 1500);
+        if (currentCount === roundStartCount) {
+            break;
+        }
     }
     
     return currentCount;
 }
-
-
-
-
-
-
-
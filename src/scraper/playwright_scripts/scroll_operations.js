@@ -46,17 +46,19 @@ function scrollContainerToBottom(container) {
  * Scrolls the last chapter link into view to trigger lazy loading.
  * 
  * @param {Array<HTMLElement>} chapterLinks - Array of chapter link elements
- * @param {number} waitTime - Time to wait after scrolling in milliseconds (default: 800)
+ * @param {number} waitTime - Time to wait after scrolling in milliseconds (default: 800, 0 = no wait)
  * @returns {Promise<void>}
  */
 async function scrollToLastChapter(chapterLinks, waitTime) {
-    waitTime = waitTime || 800;
+    waitTime = typeof waitTime === 'number' ? waitTime : 800;
     
     if (chapterLinks.length > 0) {
         var lastLink = chapterLinks[chapterLinks.length - 1];
         try {
             lastLink.scrollIntoView({ behavior: 'auto', block: 'end', inline: 'nearest' });
-            await new Promise(resolve => setTimeout(resolve, waitTime));
+            if (waitTime > 0) {
+                await new Promise(resolve => setTimeout(resolve, waitTime));
+            }
         } catch(e) {
             // Ignore errors
         }
@@ -68,18 +70,20 @@ async function scrollToLastChapter(chapterLinks, waitTime) {
  * 
  * @param {Array<HTMLElement>} chapterLinks - Array of chapter link elements
  * @param {number} multiplier - Multiplier for scroll distance (default: 2)
- * @param {number} waitTime - Time to wait after scrolling in milliseconds (default: 500)
+ * @param {number} waitTime - Time to wait after scrolling in milliseconds (default: 500, 0 = no wait)
  * @returns {Promise<void>}
  */
 async function scrollPastLastChapter(chapterLinks, multiplier, waitTime) {
     multiplier = multiplier || 2;
-    waitTime = waitTime || 500;
+    waitTime = typeof waitTime === 'number' ? waitTime : 500;
     
     if (chapterLinks.length > 0) {
         try {
             var lastLinkRect = chapterLinks[chapterLinks.length - 1].getBoundingClientRect();
             window.scrollBy(0, lastLinkRect.height * multiplier);
-            await new Promise(resolve => setTimeout(resolve, waitTime));
+            if (waitTime > 0) {
+                await new Promise(resolve => setTimeout(resolve, waitTime));
+            }
         } catch(e) {
             // Ignore errors
         }
@@ -0,0 +1,219 @@
+"""
+Thread-safe regex helpers with ReDoS protection.
+
+Replaces the old SIGALRM-based timeouts, which only worked on the main thread,
+so regex scans can run inside worker threads and asyncio executors:
+- Input size is capped (REGEX_MAX_INPUT_SIZE) so a single call is bounded
+- Patterns are compiled once and cached
+- Patterns are vetted for nested unbounded quantifiers (e.g. ``(a+)+``), the
+  classic catastrophic-backtracking shape
+- Unvetted patterns run through the optional ``regex`` module with a timeout,
+  or are refused when it is not installed
+"""
+
+import functools
+import re
+from typing import Any, List, Optional, Pattern
+
+try:
+    import regex as _regex  # type: ignore[import-untyped]
+    HAS_REGEX_MODULE: bool = True
+except ImportError:
+    _regex = None  # type: ignore[assignment]
+    HAS_REGEX_MODULE = False  # type: ignore[constant-redefinition]
+
+from core.logger import get_logger
+
+from .config import REGEX_MAX_INPUT_SIZE, REGEX_TIMEOUT
+
+logger = get_logger("scraper.safe_regex")
+
+
+__all__ = [
+    "HAS_REGEX_MODULE",
+    "compile_pattern",
+    "is_linear_pattern",
+    "safe_search",
+    "safe_findall",
+]
+
+
+def _read_quantifier(pattern: str, pos: int) -> Optional[int]:
+    """
+    Read a quantifier starting at ``pos``.
+
+    Returns:
+        End index of the quantifier if it is unbounded (``*``, ``+``, ``{n,}``),
+        otherwise None
+    """
+    if pos >= len(pattern):
+        return None
+    char = pattern[pos]
+    if char in "*+":
+        return pos + 1
+    if char == "{":
+        end = pattern.find("}", pos)
+        if end == -1:
+            return None
+        body = pattern[pos + 1:end]
+        if re.fullmatch(r"\d*,", body):
+            return end + 1
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def is_linear_pattern(pattern: str) -> bool:
+    """
+    Check a pattern for nested unbounded quantifiers.
+
+    This is a conservative structural check: a group that contains an
+    unbounded quantifier and is itself repeated without bound (``(a+)+``,
+    ``(?:\\s*x)*``, ``(.{2,})+``) is rejected. Bounded repetition such as
+    ``\\s{0,10}`` is always accepted.
+
+    Args:
+        pattern: Regex pattern source
+
+    Returns:
+        True if the pattern has no nested unbounded quantifiers
+    """
+    # Each entry records whether the open group contains an unbounded quantifier
+    group_stack: List[bool] = []
+    in_class = False
+    i = 0
+    length = len(pattern)
+
+    while i < length:
+        char = pattern[i]
+
+        if char == "\\":
+            i += 2
+            quantifier_end = _read_quantifier(pattern, i)
+            if quantifier_end is not None and group_stack:
+                group_stack[-1] = True
+            continue
+
+        if in_class:
+            if char == "]":
+                in_class = False
+                quantifier_end = _read_quantifier(pattern, i + 1)
+                if quantifier_end is not None and group_stack:
+                    group_stack[-1] = True
+            i += 1
+            continue
+
+        if char == "[":
+            in_class = True
+            # A leading "]" (or "^]") is a literal inside the class
+            if pattern[i + 1:i + 2] == "]":
+                i += 1
+            elif pattern[i + 1:i + 3] == "^]":
+                i += 2
+            i += 1
+            continue
+
+        if char == "(":
+            group_stack.append(False)
+            i += 1
+            continue
+
+        if char == ")":
+            inner_unbounded = group_stack.pop() if group_stack else False
+            quantifier_end = _read_quantifier(pattern, i + 1)
+            if quantifier_end is not None:
+                if inner_unbounded:
+                    return False
+                inner_unbounded = True
+            if group_stack and inner_unbounded:
+                group_stack[-1] = True
+            i += 1
+            continue
+
+        if _read_quantifier(pattern, i) is not None and group_stack:
+            group_stack[-1] = True
+        i += 1
+
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern[str]:
+    """
+    Compile and cache a pattern with the standard ``re`` module.
+
+    Args:
+        pattern: Regex pattern source
+        flags: Regex flags
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+def _cap_input(pattern: str, text: str) -> str:
+    """Truncate text to the configured maximum regex input size."""
+    if len(text) > REGEX_MAX_INPUT_SIZE:
+        logger.debug(
+            f"Regex input truncated from {len(text)} to {REGEX_MAX_INPUT_SIZE} chars for pattern: {pattern[:50]}..."
+        )
+        return text[:REGEX_MAX_INPUT_SIZE]
+    return text
+
+
+def safe_search(pattern: str, text: str, flags: int = 0, timeout: float = REGEX_TIMEOUT) -> Optional[Any]:
+    """
+    Perform a regex search protected against ReDoS. Safe to call from any thread.
+
+    Args:
+        pattern: Regex pattern
+        text: Text to search
+        flags: Regex flags (``re`` flag values)
+        timeout: Timeout in seconds for unvetted patterns (requires ``regex`` module)
+
+    Returns:
+        Match object, or None on no match, timeout or refused pattern
+    """
+    text = _cap_input(pattern, text)
+
+    if is_linear_pattern(pattern):
+        return compile_pattern(pattern, flags).search(text)
+
+    if HAS_REGEX_MODULE:
+        try:
+            return _regex.search(pattern, text, flags, timeout=timeout)
+        except TimeoutError:
+            logger.debug(f"Regex timeout for pattern: {pattern[:50]}...")
+            return None
+
+    logger.debug(f"Refusing potentially catastrophic regex pattern: {pattern[:50]}...")
+    return None
+
+
+def safe_findall(pattern: str, text: str, flags: int = 0, timeout: float = REGEX_TIMEOUT) -> List[Any]:
+    """
+    Perform a regex findall protected against ReDoS. Safe to call from any thread.
+
+    Args:
+        pattern: Regex pattern
+        text: Text to search
+        flags: Regex flags (``re`` flag values)
+        timeout: Timeout in seconds for unvetted patterns (requires ``regex`` module)
+
+    Returns:
+        List of matches, or empty list on timeout or refused pattern
+    """
+    text = _cap_input(pattern, text)
+
+    if is_linear_pattern(pattern):
+        return compile_pattern(pattern, flags).findall(text)
+
+    if HAS_REGEX_MODULE:
+        try:
+            return _regex.findall(pattern, text, flags, timeout=timeout)
+        except TimeoutError:
+            logger.debug(f"Regex timeout for pattern: {pattern[:50]}...")
+            return []
+
+    logger.debug(f"Refusing potentially catastrophic regex pattern: {pattern[:50]}...")
+    return []
@@ -5,14 +5,17 @@ Discovers and queries AJAX endpoints that provide chapter lists.
 Handles lazy-loading and paginated content via API calls.
 """
 
+import asyncio
 import json
 import re
 import time
-from typing import List, Optional, Callable, Any, Dict, Tuple
+from typing import List, Optional, Callable, Any, Dict, Set, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs
 
 from core.logger import get_logger
-from ..universal_url_detector import BaseDetectionStrategy, DetectionResult
+from ..adaptive_config import get_adaptive_config_manager
+from ..config import AJAX_PROBE_CONCURRENCY, AJAX_PROBE_TIMEOUT, AJAX_ENOUGH_URLS
+from ..universal_url_detector import BaseDetectionStrategy, DetectionResult, covers_chapter_range
 
 logger = get_logger("scraper.strategies.ajax")
 
@@ -29,11 +32,11 @@ class AjaxStrategy(BaseDetectionStrategy):
 
         try:
             # First, fetch the TOC page to discover endpoints
-            response = self._fetch_with_retry(toc_url)
-            if not response:
+            document = await self._get_document(toc_url)
+            if not document:
                 return self._create_result([], confidence=0.0, error="Failed to fetch page", response_time=time.time() - start_time)
 
-            html = response.text
+            html = document.text
 
             # Extract novel ID if available
             novel_id = self._extract_novel_id(html)
@@ -44,26 +47,17 @@ class AjaxStrategy(BaseDetectionStrategy):
             if not endpoints:
                 return self._create_result([], confidence=0.0, error="No AJAX endpoints found", response_time=time.time() - start_time)
 
-            # Try each endpoint
-            all_urls = []
-            successful_endpoints = 0
-
-            for endpoint in endpoints:
-                if should_stop and should_stop():
-                    break
-
-                urls = self._try_endpoint(endpoint, novel_id)
-                if urls:
-                    all_urls.extend(urls)
-                    successful_endpoints += 1
-
-                # If we have enough URLs, we can stop
-                if len(all_urls) >= 100:  # Reasonable threshold
-                    break
+            # Known-good endpoints first, then probe concurrently
+            endpoints = self._rank_endpoints(endpoints)
+            all_urls, successful_endpoints = await self._probe_endpoints(endpoints, novel_id, should_stop)
 
             if not all_urls:
                 return self._create_result([], confidence=0.0, error="No URLs from AJAX endpoints", response_time=time.time() - start_time)
 
+            # Remember endpoints that returned chapters for the next detection
+            for endpoint in successful_endpoints:
+                get_adaptive_config_manager().add_api_endpoint(self.base_url, endpoint)
+
             # Remove duplicates and validate
             all_urls = self._normalize_urls(all_urls)
             urls, validation_score = self._validate_urls(all_urls)
@@ -71,7 +65,7 @@ class AjaxStrategy(BaseDetectionStrategy):
             # Analyze coverage
             coverage_range = self._analyze_coverage(urls)
 
-            confidence = min(0.7 + (validation_score * 0.2) + (successful_endpoints * 0.1), 1.0)
+            confidence = min(0.7 + (validation_score * 0.2) + (len(successful_endpoints) * 0.1), 1.0)
 
             return self._create_result(
                 urls=urls,
@@ -82,7 +76,7 @@ class AjaxStrategy(BaseDetectionStrategy):
                 metadata={
                     "extraction_method": "ajax_endpoints",
                     "endpoints_tried": len(endpoints),
-                    "successful_endpoints": successful_endpoints
+                    "successful_endpoints": len(successful_endpoints)
                 }
             )
 
@@ -90,6 +84,93 @@ class AjaxStrategy(BaseDetectionStrategy):
             logger.debug(f"AJAX strategy failed: {e}")
             return self._create_result([], confidence=0.0, error=str(e), response_time=time.time() - start_time)
 
+    async def _probe_endpoints(
+        self,
+        endpoints: List[str],
+        novel_id: Optional[str],
+        should_stop: Optional[Callable[[], bool]]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Query endpoints concurrently until the results are sufficient.
+
+        At most AJAX_PROBE_CONCURRENCY requests are in flight. Probing stops
+        once the collected URLs cover the requested chapter range (or reach
+        AJAX_ENOUGH_URLS when no range was requested); endpoints still
+        waiting for a slot are then cancelled.
+
+        Returns:
+            (URLs in endpoint rank order, absolute URLs of endpoints that returned chapters)
+        """
+        semaphore = asyncio.Semaphore(AJAX_PROBE_CONCURRENCY)
+        enough = asyncio.Event()
+        results: Dict[int, List[str]] = {}
+
+        async def probe(rank: int, endpoint: str) -> None:
+            async with semaphore:
+                if enough.is_set() or (should_stop and should_stop()):
+                    return
+                urls = await asyncio.to_thread(self._try_endpoint, endpoint, novel_id)
+                if urls:
+                    results[rank] = urls
+                    if self._probe_results_sufficient(results):
+                        enough.set()
+
+        probes = asyncio.ensure_future(asyncio.gather(*(probe(rank, endpoint) for rank, endpoint in enumerate(endpoints))))
+        enough_waiter = asyncio.ensure_future(enough.wait())
+        waiters: Set["asyncio.Future[Any]"] = {probes, enough_waiter}
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            if enough.is_set():
+                logger.debug(f"AJAX probing stopped early after {len(results)} successful endpoints")
+        finally:
+            # Requests already running finish in their threads; their results are dropped
+            probes.cancel()
+            enough_waiter.cancel()
+
+        all_urls: List[str] = []
+        successful_endpoints: List[str] = []
+        for rank in sorted(results):
+            all_urls.extend(results[rank])
+            successful_endpoints.append(urljoin(self.base_url, endpoints[rank]))
+        return all_urls, successful_endpoints
+
+    def _probe_results_sufficient(self, results: Dict[int, List[str]]) -> bool:
+        """Check if the URLs collected so far make further probing unnecessary."""
+        urls = self._normalize_urls([url for rank in sorted(results) for url in results[rank]])
+        min_chapter, max_chapter = self.chapter_range
+        if min_chapter:
+            return covers_chapter_range(urls, min_chapter, max_chapter)
+        return len(urls) >= AJAX_ENOUGH_URLS
+
+    def _rank_endpoints(self, endpoints: List[str]) -> List[str]:
+        """
+        Order endpoints by the site's endpoint history.
+
+        Endpoints shaped like one that returned chapters before (same path
+        with any numbers, e.g. novel IDs, ignored) go first, most recently
+        successful first; the rest keep their discovery order.
+        """
+        history = get_adaptive_config_manager().get_api_endpoints(self.base_url)
+        if not history:
+            return endpoints
+
+        def shape(endpoint: str) -> str:
+            return re.sub(r'\d+', '#', urlparse(urljoin(self.base_url, endpoint)).path.rstrip('/').lower())
+
+        exact = {urljoin(self.base_url, known): idx for idx, known in enumerate(history)}
+        shapes = {shape(known): idx for idx, known in enumerate(history)}
+
+        def rank(item: Tuple[int, str]) -> Tuple[int, int, int]:
+            position, endpoint = item
+            absolute = urljoin(self.base_url, endpoint)
+            if absolute in exact:
+                return (0, -exact[absolute], position)
+            if shape(endpoint) in shapes:
+                return (1, -shapes[shape(endpoint)], position)
+            return (2, 0, position)
+
+        return [endpoint for _, endpoint in sorted(enumerate(endpoints), key=rank)]
+
     def _extract_novel_id(self, html: str) -> Optional[str]:
         """Extract novel ID from HTML content."""
         # Try data attributes
@@ -226,7 +307,7 @@ class AjaxStrategy(BaseDetectionStrategy):
             if not endpoint.startswith(('http://', 'https://')):
                 endpoint = urljoin(self.base_url, endpoint)
 
-            response = self._fetch_with_retry(endpoint)
+            response = self._fetch_with_retry(endpoint, timeout=AJAX_PROBE_TIMEOUT)
             if not response:
                 return []
 
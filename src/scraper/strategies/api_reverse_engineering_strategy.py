@@ -20,6 +20,8 @@ logger = get_logger("scraper.strategies.api_reverse")
 class ApiReverseEngineeringStrategy(BaseDetectionStrategy):
     """Strategy that reverse-engineers API endpoints for modern web applications."""
 
+    uses_browser = True
+
     def __init__(self, base_url: str, session_manager):
         super().__init__("api_reverse", base_url, session_manager)
         self._playwright_available = self._check_playwright_available()
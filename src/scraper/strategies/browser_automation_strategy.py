@@ -10,6 +10,10 @@ import time
 from typing import List, Optional, Callable, Any, Tuple
 
 from core.logger import get_logger
+from ..adaptive_config import get_adaptive_config_manager
+from ..config import SCROLL_MAX_UNCHANGED_SETTLES
+from ..extractors.url_extractor_playwright import harvest_links_async, settle_chapter_links_async
+from ..extractors.url_extractor_scripts import install_script_bundle_async
 from ..universal_url_detector import BaseDetectionStrategy, DetectionResult
 
 logger = get_logger("scraper.strategies.browser")
@@ -18,6 +22,8 @@ logger = get_logger("scraper.strategies.browser")
 class BrowserAutomationStrategy(BaseDetectionStrategy):
     """Strategy that uses browser automation for comprehensive URL detection."""
 
+    uses_browser = True
+
     def __init__(self, base_url: str, session_manager):
         super().__init__("browser_automation", base_url, session_manager)
         self._playwright_available = self._check_playwright_available()
@@ -105,6 +111,7 @@ class BrowserAutomationStrategy(BaseDetectionStrategy):
                     viewport={'width': 1280, 'height': 720},
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                 )
+                await install_script_bundle_async(context)
 
                 page = await context.new_page()
 
@@ -120,11 +127,14 @@ class BrowserAutomationStrategy(BaseDetectionStrategy):
                     # Navigate to the page
                     await page.goto(toc_url, wait_until='networkidle')
 
-                    # Wait for dynamic content to load
-                    await page.wait_for_timeout(2000)
+                    # Wait for dynamic content to finish rendering
+                    adaptive_config = get_adaptive_config_manager()
+                    settle_options = adaptive_config.get_settle_options(toc_url)
+                    await settle_chapter_links_async(page, settle_options, wait_for_change=False)
 
                     # Try to trigger lazy loading by scrolling
-                    await self._scroll_and_wait(page, should_stop)
+                    arrival_times = await self._scroll_and_wait(page, should_stop, settle_options)
+                    adaptive_config.record_settle_times(toc_url, arrival_times)
 
                     # Extract URLs using multiple methods
                     urls = []
@@ -163,62 +173,70 @@ class BrowserAutomationStrategy(BaseDetectionStrategy):
             logger.debug(f"Browser automation failed: {e}")
             return []
 
-    async def _scroll_and_wait(self, page, should_stop: Optional[Callable[[], bool]]):
-        """Scroll the page to trigger lazy loading."""
+    async def _scroll_and_wait(self, page, should_stop: Optional[Callable[[], bool]],
+                               settle_options: Optional[dict] = None) -> List[float]:
+        """
+        Scroll the page to trigger lazy loading.
+
+        After each scroll step, waits only until new chapter links stop
+        arriving (or the site's settle timeout passes without any). Once a
+        step brings no new links the next one jumps to the bottom, and after
+        SCROLL_MAX_UNCHANGED_SETTLES such steps in a row scrolling stops, so a
+        static page costs a couple of settle timeouts rather than one per step.
+
+        Returns:
+            Milliseconds until new links appeared, for each step that loaded some
+        """
+        arrival_times: List[float] = []
         try:
             # Scroll down in increments to trigger lazy loading
             scroll_increment = 500
             max_scrolls = 20  # Limit to prevent infinite scrolling
+            unchanged_settles = 0
 
             for i in range(max_scrolls):
                 if should_stop and should_stop():
                     break
 
-                # Scroll down
-                await page.evaluate(f"window.scrollBy(0, {scroll_increment})")
+                # Scroll down; after a step without new links go straight to the bottom
+                if unchanged_settles:
+                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                else:
+                    await page.evaluate(f"window.scrollBy(0, {scroll_increment})")
 
                 # Wait for content to load
-                await page.wait_for_timeout(500)
+                settled = await settle_chapter_links_async(page, settle_options)
+                changed = bool(settled and settled.get("changed"))
+                if changed and settled.get("firstChangeMs") is not None:  # type: ignore[union-attr]
+                    arrival_times.append(settled["firstChangeMs"])  # type: ignore[index]
+
+                unchanged_settles = 0 if changed else unchanged_settles + 1
+                if unchanged_settles >= SCROLL_MAX_UNCHANGED_SETTLES:
+                    break
 
                 # Check if we reached the bottom
                 at_bottom = await page.evaluate("""
                     window.innerHeight + window.scrollY >= document.body.offsetHeight - 100
                 """)
 
-                if at_bottom:
+                if at_bottom and not changed:
                     break
 
             # Scroll back to top for extraction
             await page.evaluate("window.scrollTo(0, 0)")
-            await page.wait_for_timeout(500)
 
         except Exception as e:
             logger.debug(f"Scrolling failed: {e}")
 
+        return arrival_times
+
     async def _extract_from_page_content(self, page) -> List[str]:
         """Extract chapter URLs from the rendered page content."""
-        try:
-            # Get all links that might be chapters
-            links = await page.query_selector_all('a')
-
-            urls = []
-            for link in links:
-                try:
-                    href = await link.get_attribute('href')
-                    text = await link.inner_text()
-
-                    if href and self._is_chapter_link(href, text.strip()):
-                        full_url = self._normalize_url(href)
-                        urls.append(full_url)
-
-                except Exception:
-                    continue
-
-            return urls
-
-        except Exception as e:
-            logger.debug(f"Content extraction failed: {e}")
-            return []
+        urls = []
+        for href, text in await harvest_links_async(page):
+            if self._is_chapter_link(href, text):
+                urls.append(self._normalize_url(href))
+        return urls
 
     async def _extract_with_selectors(self, page) -> List[str]:
         """Extract URLs using common CSS selectors."""
@@ -236,25 +254,9 @@ class BrowserAutomationStrategy(BaseDetectionStrategy):
             '.chapter-title a',
         ]
 
-        urls = []
-
-        for selector in selectors:
-            try:
-                elements = await page.query_selector_all(selector)
-
-                for element in elements:
-                    try:
-                        href = await element.get_attribute('href')
-                        if href:
-                            full_url = self._normalize_url(href)
-                            urls.append(full_url)
-                    except Exception:
-                        continue
-
-            except Exception:
-                continue
-
-        return urls
+        # One selector list, so all matches come back in a single evaluate call
+        links = await harvest_links_async(page, selector=", ".join(selectors))
+        return [self._normalize_url(href) for href, _ in links]
 
     async def _try_api_endpoints(self, page, api_urls: List[str]) -> List[str]:
         """Try to extract chapter URLs from discovered API endpoints."""
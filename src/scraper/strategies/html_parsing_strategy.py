@@ -7,10 +7,11 @@ and pattern recognition.
 
 import re
 import time
-from typing import List, Optional, Callable, Any, Tuple, Set
+from typing import Dict, List, Optional, Callable, Any, Tuple, Set
 from collections import defaultdict
 
 from core.logger import get_logger
+from ..document_cache import FetchedDocument
 from ..universal_url_detector import BaseDetectionStrategy, DetectionResult
 
 logger = get_logger("scraper.strategies.html_parsing")
@@ -28,14 +29,14 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
         start_time = time.time()
 
         try:
-            response = self._fetch_with_retry(toc_url)
-            if not response:
+            document = await self._get_document(toc_url)
+            if not document:
                 return self._create_result([], confidence=0.0, error="Failed to fetch page", response_time=time.time() - start_time)
 
-            html = response.text
+            html = document.text
 
             # Extract URLs using multiple HTML parsing methods
-            urls = self._extract_from_html(html)
+            urls = self._extract_from_html(html, document)
 
             if not urls:
                 return self._create_result([], confidence=0.0, error="No chapter links found", response_time=time.time() - start_time)
@@ -48,7 +49,7 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
 
             # Learn from successful patterns
             if urls:
-                self._learn_patterns(html, urls)
+                self._learn_patterns(html, urls, document)
 
             confidence = min(0.6 + (validation_score * 0.3), 1.0)
 
@@ -68,15 +69,15 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
             logger.debug(f"HTML parsing strategy failed: {e}")
             return self._create_result([], confidence=0.0, error=str(e), response_time=time.time() - start_time)
 
-    def _extract_from_html(self, html: str) -> List[str]:
-        """Extract chapter URLs from HTML using various methods."""
+    def _extract_from_html(self, html: str, document: Optional[FetchedDocument] = None) -> List[str]:
+        """Extract chapter URLs from HTML using various methods (reusing the document's parsed tree if given)."""
         urls = []
 
         # Method 1: Use adaptive CSS selectors
-        urls.extend(self._extract_with_selectors(html))
+        urls.extend(self._extract_with_selectors(html, document))
 
         # Method 2: Use regex patterns for common link structures
-        urls.extend(self._extract_with_patterns(html))
+        urls.extend(self._extract_with_patterns(html, document))
 
         # Method 3: Look for structured data (JSON-LD, etc.)
         urls.extend(self._extract_structured_data(html))
@@ -91,13 +92,15 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
 
         return unique_urls
 
-    def _extract_with_selectors(self, html: str) -> List[str]:
+    def _extract_with_selectors(self, html: str, document: Optional[FetchedDocument] = None) -> List[str]:
         """Extract URLs using CSS selectors."""
         urls = []
 
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = document.soup if document is not None else None
+            if soup is None:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(html, 'html.parser')
 
             # Try adaptive selectors based on site learning
             for selector_info in self._adaptive_selectors:
@@ -140,7 +143,7 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
 
         except ImportError:
             # Fallback without BeautifulSoup
-            urls.extend(self._extract_with_patterns(html))
+            urls.extend(self._extract_with_patterns(html, document))
 
         return urls
 
@@ -161,8 +164,16 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
 
         return None
 
-    def _extract_with_patterns(self, html: str) -> List[str]:
-        """Extract URLs using regex patterns."""
+    def _extract_with_patterns(self, html: str, document: Optional[FetchedDocument] = None) -> List[str]:
+        """
+        Extract URLs using regex patterns.
+
+        With a document, its shared link table is checked instead of scanning
+        the HTML once per pattern; every link the patterns could match is in it.
+        """
+        if document is not None:
+            return [href for href, text in document.links if self._is_chapter_link(href, text)]
+
         urls = []
 
         # Pattern 1: Standard anchor tags with chapter URLs
@@ -292,18 +303,26 @@ class HtmlParsingStrategy(BaseDetectionStrategy):
 
         return default_selectors
 
-    def _learn_patterns(self, html: str, successful_urls: List[str]):
+    def _learn_patterns(self, html: str, successful_urls: List[str], document: Optional[FetchedDocument] = None):
         """Learn successful patterns for future use."""
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
+            if document is not None and document.soup is not None:
+                anchors = document.anchors
+            else:
+                from bs4 import BeautifulSoup
+                anchors = BeautifulSoup(html, 'html.parser').find_all('a', href=True)
+
+            # First link element per href, instead of searching the tree per URL
+            elements_by_href: Dict[Any, Any] = {}
+            for anchor in anchors:
+                elements_by_href.setdefault(anchor.get('href'), anchor)
 
             # Find common patterns in successful URLs
             successful_patterns = []
 
             for url in successful_urls[:10]:  # Sample first 10
                 # Find the element containing this URL
-                element = soup.find('a', href=url)
+                element = elements_by_href.get(url)
                 if element:
                     # Generate CSS selector for this element
                     selector = self._generate_selector(element)
@@ -28,11 +28,11 @@ class JavaScriptStrategy(BaseDetectionStrategy):
 
         try:
             # Fetch the page
-            response = self._fetch_with_retry(toc_url)
-            if not response:
+            document = await self._get_document(toc_url)
+            if not document:
                 return self._create_result([], confidence=0.0, error="Failed to fetch page", response_time=time.time() - start_time)
 
-            html = response.text
+            html = document.text
 
             # Extract URLs using multiple JavaScript patterns
             urls = self._extract_from_javascript(html)
@@ -0,0 +1,277 @@
+"""
+HTTP pagination engine for table-of-contents pages.
+
+Most sites paginate their chapter list with predictable URLs
+(``?page=N``, ``/page/N``). Instead of walking those pages in a browser,
+the engine infers the page URL template and page count from the links on
+page 1, fetches the remaining pages concurrently through the HTTP session
+and returns the union of their chapter links.
+"""
+
+import asyncio
+import html as html_lib
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from core.logger import get_logger
+from .url_processing import normalize_url
+from .config import (
+    REQUEST_TIMEOUT, TOC_PAGINATION_MAX_PAGES,
+    TOC_PAGINATION_CONCURRENCY, TOC_PAGINATION_MAX_RETRIES
+)
+
+logger = get_logger("scraper.toc_pagination")
+
+PAGE_PLACEHOLDER = "{page}"
+
+_HREF_RE = re.compile(r'href\s*=\s*["\']([^"\'#]+)', re.IGNORECASE)
+_QUERY_PAGE_RE = re.compile(r'(?:^|&)(?:page|p|pg|paged|pagenum)=(\d+)(?=&|$)', re.IGNORECASE)
+_PATH_PAGE_RE = re.compile(r'^(?P<prefix>.*?)/(?P<key>page|p)(?P<sep>[/-])(?P<num>\d+)(?P<suffix>/?)$', re.IGNORECASE)
+
+
+@dataclass
+class PageTemplate:
+    """Page URL pattern of a paginated TOC."""
+    pattern: str  # URL with PAGE_PLACEHOLDER in place of the page number
+    first_page: int
+    last_page: int
+    current_page: int  # Page the TOC URL itself points at
+
+    def url_for(self, page: int) -> str:
+        """Build the URL of a page."""
+        return self.pattern.replace(PAGE_PLACEHOLDER, str(page))
+
+
+@dataclass
+class TocPaginationResult:
+    """Chapter links collected from all pages of a paginated TOC."""
+    template: PageTemplate
+    urls: List[str] = field(default_factory=list)
+    pages_fetched: int = 0
+    pages_failed: int = 0
+    script_rendered: bool = False  # Pages loaded over HTTP but held no chapter links
+
+
+def _split_page_number(url: str) -> Optional[Tuple[str, str, int]]:
+    """
+    Split a URL into (list path, pattern, page number).
+
+    The list path is the URL path with any page segment removed, used to
+    check that a page link belongs to the same list as the TOC.
+    """
+    parsed = urlparse(url)
+    match = _QUERY_PAGE_RE.search(parsed.query)
+    if match:
+        start, end = match.span(1)
+        query = parsed.query[:start] + PAGE_PLACEHOLDER + parsed.query[end:]
+        pattern = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{query}"
+        return parsed.path.rstrip("/"), pattern, int(match.group(1))
+
+    match = _PATH_PAGE_RE.match(parsed.path)
+    if match:
+        path = (f"{match.group('prefix')}/{match.group('key')}{match.group('sep')}"
+                f"{PAGE_PLACEHOLDER}{match.group('suffix')}")
+        pattern = f"{parsed.scheme}://{parsed.netloc}{path}"
+        if parsed.query:
+            pattern += f"?{parsed.query}"
+        return match.group("prefix").rstrip("/"), pattern, int(match.group("num"))
+
+    return None
+
+
+def _list_path(url: str) -> str:
+    """URL path of the list a TOC URL belongs to, without its page segment."""
+    split = _split_page_number(url)
+    if split:
+        return split[0]
+    return urlparse(url).path.rstrip("/")
+
+
+def _page_links(html: str, page_url: str) -> Dict[str, Set[int]]:
+    """Page numbers linked from a page, grouped by URL pattern (same host and list only)."""
+    host = urlparse(page_url).netloc.lower()
+    list_path = _list_path(page_url)
+    patterns: Dict[str, Set[int]] = {}
+
+    for match in _HREF_RE.finditer(html):
+        url = normalize_url(html_lib.unescape(match.group(1).strip()), page_url)
+        if urlparse(url).netloc.lower() != host:
+            continue
+        split = _split_page_number(url)
+        if not split or split[0] != list_path:
+            continue
+        patterns.setdefault(split[1], set()).add(split[2])
+
+    return patterns
+
+
+def infer_page_template(toc_url: str, html: str, max_pages: int = TOC_PAGINATION_MAX_PAGES) -> Optional[PageTemplate]:
+    """
+    Infer the page URL template and page count from the TOC's first page.
+
+    Args:
+        toc_url: URL the HTML was fetched from
+        html: HTML of the TOC page
+        max_pages: Upper bound on the number of pages
+
+    Returns:
+        PageTemplate, or None if the page links to no other pages of its list
+    """
+    split = _split_page_number(toc_url)
+    current_page = split[2] if split else 1
+
+    candidates = _page_links(html, toc_url)
+    if split:
+        candidates = {pattern: pages for pattern, pages in candidates.items() if pattern == split[1]}
+    candidates = {pattern: pages - {current_page} for pattern, pages in candidates.items()}
+    candidates = {pattern: pages for pattern, pages in candidates.items() if pages}
+    if not candidates:
+        return None
+
+    # Several patterns (e.g. ?page=N and ?p=N) - take the one with most pages
+    pattern, pages = max(candidates.items(), key=lambda item: len(item[1]))
+    first_page = min(min(pages), current_page)
+    last_page = min(max(pages), first_page + max_pages - 1)
+    return PageTemplate(pattern=pattern, first_page=first_page, last_page=last_page, current_page=current_page)
+
+
+class TocPaginationEngine:
+    """
+    Fetches every page of a paginated TOC over HTTP.
+
+    Pages are fetched concurrently, at most `concurrency` at a time per
+    host, and each request goes through the session manager's per-host
+    rate limit. Pagination lists that only show nearby pages
+    ("1 2 3 ... Next") are followed as later pages reveal higher numbers.
+    """
+
+    def __init__(
+        self,
+        session_manager,
+        max_pages: int = TOC_PAGINATION_MAX_PAGES,
+        concurrency: int = TOC_PAGINATION_CONCURRENCY,
+        timeout: int = REQUEST_TIMEOUT
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            session_manager: SessionManager used for the requests
+            max_pages: Maximum number of TOC pages per novel
+            concurrency: Maximum pages in flight per host
+            timeout: Request timeout in seconds
+        """
+        self.session_manager = session_manager
+        self.max_pages = max(1, max_pages)
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+
+    async def collect(
+        self,
+        toc_url: str,
+        html: str,
+        extract_links: Callable[[str], List[str]],
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Optional[TocPaginationResult]:
+        """
+        Collect chapter links from all pages of a paginated TOC.
+
+        Args:
+            toc_url: URL of the TOC page that was already fetched
+            html: HTML of that page
+            extract_links: Returns chapter hrefs (may be relative) found in a page's HTML
+            should_stop: Optional callback to check if fetching should stop
+
+        Returns:
+            TocPaginationResult with links in page order, or None if the TOC
+            has no page URL template
+        """
+        template = infer_page_template(toc_url, html, self.max_pages)
+        if template is None:
+            return None
+
+        result = TocPaginationResult(template=template)
+        page_urls: Dict[int, List[str]] = {template.current_page: self._chapter_urls(html, toc_url, extract_links)}
+        requested: Set[int] = {template.current_page}
+        last_page = template.last_page
+        page_limit = template.first_page + self.max_pages - 1
+        # Created per call: asyncio primitives are bound to the running loop
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        logger.info(f"TOC is paginated ({template.pattern}), fetching pages {template.first_page}-{last_page} over HTTP")
+        while not (should_stop and should_stop()):
+            batch = [page for page in range(template.first_page, last_page + 1) if page not in requested]
+            if not batch:
+                break
+            requested.update(batch)
+
+            pages = await asyncio.gather(*(
+                self._fetch_page(semaphore, template.url_for(page), should_stop) for page in batch
+            ))
+            for page, page_html in zip(batch, pages):
+                if page_html is None:
+                    result.pages_failed += 1
+                    continue
+                result.pages_fetched += 1
+                page_url = template.url_for(page)
+                page_urls[page] = self._chapter_urls(page_html, page_url, extract_links)
+                linked_pages = _page_links(page_html, page_url).get(template.pattern, set())
+                if linked_pages:
+                    last_page = max(last_page, min(max(linked_pages), page_limit))
+
+        seen: Set[str] = set()
+        for page in sorted(page_urls):
+            for url in page_urls[page]:
+                if url not in seen:
+                    seen.add(url)
+                    result.urls.append(url)
+
+        result.script_rendered = result.pages_fetched > 0 and not any(
+            page_urls[page] for page in page_urls if page != template.current_page
+        )
+        logger.info(
+            f"Fetched {result.pages_fetched} TOC pages over HTTP ({result.pages_failed} failed), "
+            f"{len(result.urls)} chapter links"
+        )
+        return result
+
+    def _chapter_urls(self, html: str, page_url: str, extract_links: Callable[[str], List[str]]) -> List[str]:
+        """Absolute chapter URLs of one page."""
+        try:
+            return [normalize_url(href, page_url) for href in extract_links(html) if href]
+        except Exception as e:
+            logger.debug(f"Failed to extract chapter links from {page_url}: {e}")
+            return []
+
+    async def _fetch_page(
+        self,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        should_stop: Optional[Callable[[], bool]]
+    ) -> Optional[str]:
+        """Fetch one page once a slot is free."""
+        async with semaphore:
+            if should_stop and should_stop():
+                return None
+            return await asyncio.to_thread(self._fetch_page_sync, url)
+
+    def _fetch_page_sync(self, url: str) -> Optional[str]:
+        """Blocking page fetch with retries; returns the HTML or None."""
+        host = urlparse(url).netloc
+        for attempt in range(1, TOC_PAGINATION_MAX_RETRIES + 1):
+            try:
+                session = self.session_manager.get_session()
+                if not session:
+                    return None
+                self.session_manager.rate_limit(host)
+                response = session.get(url, timeout=self.timeout)
+                if response.status_code == 200:
+                    return response.text
+                if response.status_code == 404:
+                    return None  # Past the last page
+                logger.debug(f"TOC page {url} returned HTTP {response.status_code} (attempt {attempt})")
+            except Exception as e:
+                logger.debug(f"Failed to fetch TOC page {url} (attempt {attempt}): {e}")
+        return None
@@ -22,9 +22,11 @@ from .chapter_parser import extract_chapter_number, normalize_url
 from .config import (
     REQUEST_TIMEOUT, REQUEST_DELAY,
     PAGINATION_SUSPICIOUS_COUNTS, PAGINATION_CRITICAL_COUNT,
-    PAGINATION_SMALL_COUNT_THRESHOLD, PAGINATION_RANGE_COVERAGE_THRESHOLD
+    PAGINATION_SMALL_COUNT_THRESHOLD, PAGINATION_RANGE_COVERAGE_THRESHOLD,
+    DETECTION_HEDGE_DELAY, DETECTION_RACE_MIN_CONFIDENCE
 )
 from .adaptive_config import get_adaptive_config_manager
+from .document_cache import DocumentCache, FetchedDocument
 
 logger = get_logger("scraper.universal_detector")
 
@@ -73,14 +75,48 @@ class SiteConfig:
     average_response_times: Dict[str, float] = field(default_factory=dict)
 
 
+def covers_chapter_range(urls: List[str], min_chapter: Optional[int], max_chapter: Optional[int]) -> bool:
+    """Check if the URLs' chapter numbers cover the requested range."""
+    if not min_chapter or not urls:
+        return True
+
+    # Extract chapter numbers from URLs
+    chapter_nums = []
+    for url in urls:
+        num = extract_chapter_number(url)
+        if num:
+            chapter_nums.append(num)
+
+    if not chapter_nums:
+        return False
+
+    max_found = max(chapter_nums)
+    min_found = min(chapter_nums)
+
+    # Check if we have the required range
+    if max_chapter and max_found < max_chapter:
+        return False
+
+    if min_found > min_chapter:
+        return False
+
+    return True
+
+
 class BaseDetectionStrategy(ABC):
     """Base class for all URL detection strategies."""
 
+    uses_browser: bool = False  # Launches a browser (started late in racing mode)
+
     def __init__(self, name: str, base_url: str, session_manager: SessionManager):
         self.name = name
         self.base_url = base_url
         self.session_manager = session_manager
         self.domain = urlparse(base_url).netloc.lower()
+        # Chapter range of the current detection (min, max), set by the detector
+        self.chapter_range: Tuple[Optional[int], Optional[int]] = (None, None)
+        # Documents shared by the strategies of the current detection, set by the detector
+        self.documents: Optional[DocumentCache] = None
 
     @abstractmethod
     async def detect(self, toc_url: str, should_stop: Optional[Callable[[], bool]] = None) -> DetectionResult:
@@ -95,6 +131,13 @@ class BaseDetectionStrategy(ABC):
             **kwargs
         )
 
+    async def _get_document(self, url: str) -> Optional[FetchedDocument]:
+        """Get a page through the detection's document cache (or fetch it directly without one)."""
+        if self.documents is not None:
+            return await self.documents.get(url)
+        response = await asyncio.to_thread(self._fetch_with_retry, url)
+        return FetchedDocument.from_response(url, response) if response else None
+
     def _fetch_with_retry(self, url: str, timeout: int = REQUEST_TIMEOUT) -> Optional[Any]:
         """Fetch URL with session management and retry logic."""
         try:
@@ -102,7 +145,7 @@ class BaseDetectionStrategy(ABC):
             if not session:
                 return None
 
-            self.session_manager.rate_limit()
+            self.session_manager.rate_limit(urlparse(url).netloc)
             response = session.get(url, timeout=timeout)
             if response.status_code == 200:
                 return response
@@ -181,6 +224,8 @@ class UniversalUrlDetector:
         # Learning components
         self.adaptive_config = get_adaptive_config_manager()
         self.pagination_detector = PaginationDetector()
+        self.pagination_engine = TocPaginationEngine(self.session_manager)
+        self.documents: Optional[DocumentCache] = None  # Created per detect_urls() run
 
     def _create_strategies(self) -> List[BaseDetectionStrategy]:
         """Create all detection strategies."""
@@ -198,7 +243,8 @@ class UniversalUrlDetector:
         should_stop: Optional[Callable[[], bool]] = None,
         min_chapter: Optional[int] = None,
         max_chapter: Optional[int] = None,
-        use_parallel: bool = True
+        use_parallel: bool = True,
+        use_racing: bool = False
     ) -> DetectionResult:
         """
         Detect chapter URLs using optimal strategy combination.
@@ -209,6 +255,8 @@ class UniversalUrlDetector:
             min_chapter: Minimum chapter number needed
             max_chapter: Maximum chapter number needed
             use_parallel: Whether to run strategies in parallel
+            use_racing: Race the strategies and take the first sufficient
+                result (overrides use_parallel)
 
         Returns:
             Best detection result
@@ -217,8 +265,14 @@ class UniversalUrlDetector:
 
         # Get optimal strategy order for this site
         strategy_order = self._get_optimal_strategy_order()
-
-        if use_parallel:
+        self.documents = DocumentCache(self.session_manager)
+        for strategy in self.strategies:
+            strategy.chapter_range = (min_chapter, max_chapter)
+            strategy.documents = self.documents
+
+        if use_racing:
+            result = await self._detect_racing(toc_url, strategy_order, should_stop, min_chapter, max_chapter)
+        elif use_parallel:
             result = await self._detect_parallel(toc_url, strategy_order, should_stop, min_chapter, max_chapter)
         else:
             result = await self._detect_sequential(toc_url, strategy_order, should_stop, min_chapter, max_chapter)
@@ -235,9 +289,102 @@ class UniversalUrlDetector:
 
         if pagination_analysis.is_paginated:
             result.metadata["pagination_suggestion"] = pagination_analysis.suggested_action
+            if not (should_stop and should_stop()):
+                await self._resolve_pagination(toc_url, result, should_stop, min_chapter, max_chapter)
 
         return result
 
+    async def _resolve_pagination(
+        self,
+        toc_url: str,
+        result: DetectionResult,
+        should_stop: Optional[Callable[[], bool]],
+        min_chapter: Optional[int],
+        max_chapter: Optional[int]
+    ) -> None:
+        """
+        Complete a paginated result with the chapters from the other TOC pages.
+
+        Pages are fetched over HTTP by the pagination engine; a browser is
+        only used when those pages turn out to be script-rendered. The
+        result is updated in place.
+        """
+        html_strategy = next((s for s in self.strategies if isinstance(s, HtmlParsingStrategy)), None)
+        if html_strategy is None:
+            return
+
+        document = await html_strategy._get_document(toc_url)
+        if not document:
+            return
+
+        paginated = await self.pagination_engine.collect(
+            toc_url, document.text, html_strategy._extract_from_html, should_stop
+        )
+        if paginated is None:
+            return
+
+        extra_urls = paginated.urls
+        method = "http"
+        if paginated.script_rendered:
+            logger.info("TOC pages have no chapter links without JavaScript, using the browser")
+            extra_urls = await self._paginate_with_browser(toc_url, should_stop, min_chapter, max_chapter)
+            method = "browser"
+        elif extra_urls:
+            self.adaptive_config.add_pagination_pattern(self.base_url, paginated.template.pattern)
+        if not extra_urls:
+            return
+
+        merged = self._normalize_urls(result.urls + extra_urls)
+        result.urls, result.validation_score = self._validate_urls(merged)
+        result.coverage_range = self._coverage_range(result.urls)
+
+        pagination_analysis = self.pagination_detector.analyze(result.urls, min_chapter, max_chapter)
+        result.pagination_detected = pagination_analysis.is_paginated
+        result.metadata["pagination_method"] = method
+        result.metadata["pagination_pages"] = paginated.pages_fetched + 1
+        if pagination_analysis.is_paginated:
+            result.metadata["pagination_suggestion"] = pagination_analysis.suggested_action
+        else:
+            result.metadata.pop("pagination_suggestion", None)
+
+    async def _paginate_with_browser(
+        self,
+        toc_url: str,
+        should_stop: Optional[Callable[[], bool]],
+        min_chapter: Optional[int],
+        max_chapter: Optional[int]
+    ) -> List[str]:
+        """Walk the TOC pages in a browser (sync Playwright, run off the event loop)."""
+        from .extractors.url_extractor_playwright import PlaywrightExtractor, HAS_PLAYWRIGHT
+        if not HAS_PLAYWRIGHT:
+            return []
+
+        extractor = PlaywrightExtractor(
+            base_url=self.base_url,
+            session_manager=self.session_manager,
+            timeout=REQUEST_TIMEOUT,
+            delay=REQUEST_DELAY
+        )
+        return await asyncio.to_thread(extractor.extract, toc_url, should_stop, min_chapter, max_chapter)
+
+    def _normalize_urls(self, urls: List[str]) -> List[str]:
+        """Deduplicate URLs, keeping the first occurrence."""
+        seen: Set[str] = set()
+        unique = []
+        for url in urls:
+            full_url = normalize_url(url, self.base_url)
+            if full_url not in seen:
+                seen.add(full_url)
+                unique.append(full_url)
+        return unique
+
+    def _coverage_range(self, urls: List[str]) -> Optional[Tuple[int, int]]:
+        """Lowest and highest chapter number among the URLs."""
+        chapter_nums = [num for num in (extract_chapter_number(url) for url in urls) if num]
+        if not chapter_nums:
+            return None
+        return (min(chapter_nums), max(chapter_nums))
+
     async def _detect_parallel(
         self,
         toc_url: str,
@@ -272,6 +419,90 @@ class UniversalUrlDetector:
         # Return best result based on confidence and completeness
         return self._select_best_result(valid_results, min_chapter, max_chapter)
 
+    async def _detect_racing(
+        self,
+        toc_url: str,
+        strategy_order: List[str],
+        should_stop: Optional[Callable[[], bool]],
+        min_chapter: Optional[int],
+        max_chapter: Optional[int]
+    ) -> DetectionResult:
+        """
+        Race strategies and return the first sufficient result.
+
+        HTTP-only strategies start at once. Browser strategies start after
+        DETECTION_HEDGE_DELAY seconds, or earlier if every HTTP strategy has
+        finished, and only if no sufficient result has arrived by then. The
+        first sufficient result (see _is_race_winner) wins; the remaining
+        strategies are cancelled (closing their browsers). Without a
+        winner, the best result is selected as in parallel mode.
+        """
+        strategy_map = {s.name: s for s in self.strategies}
+        ordered = [strategy_map[name] for name in strategy_order if name in strategy_map]
+        cheap = [s for s in ordered if not s.uses_browser]
+        expensive = [s for s in ordered if s.uses_browser]
+
+        loop = asyncio.get_running_loop()
+        hedge_at = loop.time() + DETECTION_HEDGE_DELAY
+        pending: Set[asyncio.Task] = {asyncio.create_task(s.detect(toc_url, should_stop)) for s in cheap}
+        valid_results: List[DetectionResult] = []
+
+        try:
+            while pending or expensive:
+                if should_stop and should_stop():
+                    break
+
+                if expensive and (not pending or loop.time() >= hedge_at):
+                    logger.debug(f"No sufficient result yet, starting {[s.name for s in expensive]}")
+                    pending.update(asyncio.create_task(s.detect(toc_url, should_stop)) for s in expensive)
+                    expensive = []
+
+                timeout = max(0.0, hedge_at - loop.time()) if expensive else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    result = task.result() if not task.exception() else None
+                    if not isinstance(result, DetectionResult) or result.error:
+                        continue
+                    valid_results.append(result)
+                    if self._is_race_winner(result, min_chapter, max_chapter):
+                        logger.debug(f"Strategy {result.method} won the race")
+                        return result
+        finally:
+            # Cancel the losers and wait so their browsers are closed
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if not valid_results:
+            return DetectionResult(error="All strategies failed")
+
+        return self._select_best_result(valid_results, min_chapter, max_chapter)
+
+    def _is_race_winner(
+        self,
+        result: DetectionResult,
+        min_chapter: Optional[int],
+        max_chapter: Optional[int]
+    ) -> bool:
+        """
+        Check if a result is good enough to end a race.
+
+        Without a chapter range (whole-novel downloads) there is nothing to
+        check coverage against, so the result must also look complete: not
+        paginated, and not short of the total the strategy reported.
+        """
+        if not result.urls or result.confidence < DETECTION_RACE_MIN_CONFIDENCE:
+            return False
+        if not self._result_meets_requirements(result, min_chapter, max_chapter):
+            return False
+        if min_chapter is None:
+            if result.estimated_total and len(result.urls) < result.estimated_total:
+                return False
+            return not self.pagination_detector.analyze(result.urls).is_paginated
+        return True
+
     async def _detect_sequential(
         self,
         toc_url: str,
@@ -349,30 +580,7 @@ class UniversalUrlDetector:
         max_chapter: Optional[int]
     ) -> bool:
         """Check if result meets the chapter requirements."""
-        if not min_chapter or not result.urls:
-            return True
-
-        # Extract chapter numbers from URLs
-        chapter_nums = []
-        for url in result.urls:
-            num = extract_chapter_number(url)
-            if num:
-                chapter_nums.append(num)
-
-        if not chapter_nums:
-            return False
-
-        max_found = max(chapter_nums)
-        min_found = min(chapter_nums)
-
-        # Check if we have the required range
-        if max_chapter and max_found < max_chapter:
-            return False
-
-        if min_found > min_chapter:
-            return False
-
-        return True
+        return covers_chapter_range(result.urls, min_chapter, max_chapter)
 
     def _get_optimal_strategy_order(self) -> List[str]:
         """Get optimal strategy order based on site learning."""
@@ -445,4 +653,5 @@ from .strategies.ajax_strategy import AjaxStrategy
 from .strategies.html_parsing_strategy import HtmlParsingStrategy
 from .strategies.browser_automation_strategy import BrowserAutomationStrategy
 from .strategies.api_reverse_engineering_strategy import ApiReverseEngineeringStrategy
-from .pagination_detector import PaginationDetector
\ No newline at end of file
+from .pagination_detector import PaginationDetector
+from .toc_pagination import TocPaginationEngine
\ No newline at end of file
@@ -15,14 +15,16 @@ import time
 from pathlib import Path
 from typing import Callable, List, Optional
 
-from core.logger import get_logger
+from core.logger import get_logger, get_chunk_logger
 from core.constants import FFMPEG_TIMEOUT_SECONDS
+from core.metrics import get_metrics
 from utils.validation import validate_file_path
 
 from .providers.base_provider import TTSProvider
 from .providers.provider_manager import TTSProviderManager
 
 logger = get_logger("tts.audio_merger")
+chunk_logger = get_chunk_logger()
 
 
 def _validate_subprocess_args(args: List[str]) -> List[str]:
@@ -280,6 +282,9 @@ class AudioMerger:
         if not temp_dir.exists():
             raise ValueError(f"Temporary directory does not exist: {temp_dir}")
 
+        # Chunks submitted but not yet finished (all in flight with gather)
+        get_metrics().gauge("tts_chunks_pending", "Chunks waiting for synthesis").inc(len(chunks))
+
         # Convert all chunks concurrently with error handling
         tasks = [
             self._convert_single_chunk_async(chunk, index, voice, temp_dir, output_stem, provider, rate, pitch, volume)
@@ -341,8 +346,35 @@ class AudioMerger:
         """
         chunk_path = temp_dir / f"{output_stem}_chunk_{index}.mp3"
         retry_delay = self.config.DEFAULT_CHUNK_RETRY_DELAY
+        metrics = get_metrics()
+        try:
+            return await self._convert_chunk_with_retries(
+                chunk, index, voice, chunk_path, provider, rate, pitch, volume, retry_delay
+            )
+        except Exception:
+            metrics.counter("tts_chunk_failures_total", "Chunks that failed after all retries").inc()
+            raise
+        finally:
+            metrics.gauge("tts_chunks_pending", "Chunks waiting for synthesis").dec()
 
+    async def _convert_chunk_with_retries(
+        self,
+        chunk: str,
+        index: int,
+        voice: str,
+        chunk_path: Path,
+        provider: TTSProvider,
+        rate: Optional[float],
+        pitch: Optional[float],
+        volume: Optional[float],
+        retry_delay: float
+    ) -> Path:
+        """Retry loop for _convert_single_chunk_async."""
+        metrics = get_metrics()
         for attempt in range(self.config.DEFAULT_CHUNK_RETRIES):
+            if attempt > 0:
+                metrics.counter("tts_chunk_retries_total", "Chunk synthesis retries").inc()
+            attempt_start = time.perf_counter()
             try:
                 # Add timeout to prevent hanging
                 success = await asyncio.wait_for(
@@ -356,18 +388,21 @@ class AudioMerger:
                     ),
                     timeout=self.config.CONVERSION_TIMEOUT
                 )
+                metrics.histogram("tts_chunk_synth_seconds", "Per-chunk synthesis latency").observe(
+                    time.perf_counter() - attempt_start
+                )
 
                 # Verify output file exists and has content
                 if success and await self._verify_audio_file_async(chunk_path):
-                    logger.debug(f"✓ Chunk {index+1} converted successfully")
+                    chunk_logger.info("✓ Chunk %d converted successfully", index + 1)
                     return chunk_path
                 else:
-                    logger.warning(f"Chunk {index+1} attempt {attempt+1} produced invalid file")
+                    logger.warning("Chunk %d attempt %d produced invalid file", index + 1, attempt + 1)
 
             except asyncio.TimeoutError:
-                logger.warning(f"Chunk {index+1} attempt {attempt+1} timed out")
+                logger.warning("Chunk %d attempt %d timed out", index + 1, attempt + 1)
             except Exception as e:
-                logger.debug(f"Chunk {index+1} attempt {attempt+1} failed: {e}")
+                logger.debug("Chunk %d attempt %d failed: %s", index + 1, attempt + 1, e)
 
             # Don't retry on last attempt
             if attempt < self.config.DEFAULT_CHUNK_RETRIES - 1:
@@ -429,13 +464,14 @@ class AudioMerger:
             self._merge_fallback_copy
         ]
 
-        for strategy in strategies:
-            try:
-                if strategy(chunk_files, output_path):
-                    return True
-            except Exception as e:
-                logger.debug(f"Merge strategy {strategy.__name__} failed: {e}")
-                continue
+        with get_metrics().span("tts_merge_seconds", "Chunk merge time"):
+            for strategy in strategies:
+                try:
+                    if strategy(chunk_files, output_path):
+                        return True
+                except Exception as e:
+                    logger.debug(f"Merge strategy {strategy.__name__} failed: {e}")
+                    continue
 
         logger.error("All audio merging strategies failed")
         return False
@@ -6,13 +6,15 @@ Strategy pattern implementation for different TTS conversion approaches:
 - Chunked conversion for large text that needs to be split
 """
 
+import logging
 import tempfile
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, TYPE_CHECKING
 
-from core.logger import get_logger
+from core.logger import get_logger, get_chunk_logger
+from core.metrics import get_metrics, DEFAULT_COUNT_BUCKETS
 
 from .providers.base_provider import TTSProvider
 from .providers.provider_manager import TTSProviderManager
@@ -24,6 +26,7 @@ if TYPE_CHECKING:
     from .text_processing_pipeline import ProcessedText
 
 logger = get_logger("tts.conversion_strategies")
+chunk_logger = get_chunk_logger()
 
 
 class ConversionStrategy(ABC):
@@ -57,17 +60,21 @@ class ConversionStrategy(ABC):
         volume: Optional[float]
     ) -> None:
         """Log the start of conversion with relevant parameters."""
-        text_bytes_size = len(text.encode('utf-8'))
+        logger.info("Converting text to speech: %s", output_path.name)
+        if not chunk_logger.isEnabledFor(logging.INFO):
+            return
 
-        logger.info(f"Converting text to speech: {output_path.name}")
-        logger.info(f"Voice: {voice_id}, Provider: {provider_name or 'auto'}, Rate: {rate}%, Pitch: {pitch}%, Volume: {volume}%")
-        logger.info(f"Text size: {text_bytes_size} bytes")
+        chunk_logger.info(
+            "Voice: %s, Provider: %s, Rate: %s%%, Pitch: %s%%, Volume: %s%%",
+            voice_id, provider_name or 'auto', rate, pitch, volume
+        )
+        chunk_logger.info("Text size: %d bytes", len(text.encode('utf-8')))
 
         # Debug: Check text content
         if len(text) < 200:
-            logger.info(f"Text preview: '{text}'")
+            chunk_logger.info("Text preview: '%s'", text)
         else:
-            logger.info(f"Text preview: '{text[:200]}...'")
+            chunk_logger.info("Text preview: '%s...'", text[:200])
 
 
 class DirectConversionStrategy(ConversionStrategy):
@@ -97,7 +104,7 @@ class DirectConversionStrategy(ConversionStrategy):
         )
 
         # Convert directly using the resolved provider
-        logger.info("Using direct conversion strategy")
+        chunk_logger.info("Using direct conversion strategy")
 
         try:
             success = voice_resolution.provider.convert_text_to_speech(
@@ -110,7 +117,7 @@ class DirectConversionStrategy(ConversionStrategy):
             )
 
             if success:
-                logger.info("Direct conversion successful")
+                chunk_logger.info("Direct conversion successful")
                 return True
             else:
                 logger.error(f"Direct conversion failed for voice '{voice_resolution.voice_id}'")
@@ -154,11 +161,14 @@ class ChunkedConversionStrategy(ConversionStrategy):
                 voice_resolution.provider.get_provider_name(), rate, pitch, volume
             )
 
-            logger.info("Using chunked conversion strategy")
+            chunk_logger.info("Using chunked conversion strategy")
 
             # Chunk the text
             chunks = self.audio_merger.chunk_text(final_text, max_bytes=3000)
-            logger.info(f"Split text into {len(chunks)} chunks")
+            chunk_logger.info("Split text into %d chunks", len(chunks))
+            get_metrics().histogram(
+                "tts_chunks_per_conversion", "Text chunks per chunked conversion", DEFAULT_COUNT_BUCKETS
+            ).observe(len(chunks))
 
             if len(chunks) <= 1:
                 # If only one chunk, use direct conversion
@@ -228,30 +238,36 @@ class ChunkedConversionStrategy(ConversionStrategy):
         # For now, convert sequentially to avoid async complexity
         # TODO: Implement proper parallel conversion
         chunk_files = []
+        metrics = get_metrics()
+        pending = metrics.gauge("tts_chunks_pending", "Chunks waiting for synthesis")
+        pending.inc(len(chunks))
 
         for i, chunk in enumerate(chunks):
             chunk_filename = f"{output_stem}_chunk_{i:04d}.mp3"
             chunk_path = temp_dir / chunk_filename
 
             try:
-                success = provider.convert_text_to_speech(
-                    text=chunk,
-                    voice=voice_id,
-                    output_path=chunk_path,
-                    rate=rate,
-                    pitch=pitch,
-                    volume=volume
-                )
+                with metrics.span("tts_chunk_synth_seconds", "Per-chunk synthesis latency"):
+                    success = provider.convert_text_to_speech(
+                        text=chunk,
+                        voice=voice_id,
+                        output_path=chunk_path,
+                        rate=rate,
+                        pitch=pitch,
+                        volume=volume
+                    )
 
                 if success and chunk_path.exists() and chunk_path.stat().st_size > 0:
                     chunk_files.append(chunk_path)
                     self.resource_manager.register_temp_file(chunk_path)
-                    logger.debug(f"Converted chunk {i+1}/{len(chunks)}: {chunk_path}")
+                    logger.debug("Converted chunk %d/%d: %s", i + 1, len(chunks), chunk_path)
                 else:
-                    logger.warning(f"Failed to convert chunk {i+1}/{len(chunks)}")
+                    logger.warning("Failed to convert chunk %d/%d", i + 1, len(chunks))
 
             except Exception as e:
-                logger.warning(f"Error converting chunk {i+1}/{len(chunks)}: {e}")
+                logger.warning("Error converting chunk %d/%d: %s", i + 1, len(chunks), e)
+            finally:
+                pending.dec()
 
         return chunk_files
 
@@ -305,5 +321,5 @@ class ConversionStrategySelector:
             logger.info(f"Text exceeds {max_bytes} bytes ({text_bytes_size} bytes), using chunking...")
             return ChunkedConversionStrategy(self.provider_manager, TTSResourceManager())
         else:
-            logger.debug(f"Text within limits ({text_bytes_size} bytes), using direct conversion")
+            logger.debug("Text within limits (%d bytes), using direct conversion", text_bytes_size)
             return DirectConversionStrategy(self.provider_manager, TTSResourceManager())
\ No newline at end of file
@@ -5,9 +5,11 @@ Manages multiple TTS providers and implements fallback logic.
 Tries Edge TTS first (cloud, high quality), falls back to pyttsx3 (offline).
 """
 
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -19,9 +21,17 @@ from .pyttsx3_provider import Pyttsx3Provider
 
 logger = get_logger("tts.providers.manager")
 
+# Seconds between background provider availability probes
+HEALTH_PROBE_INTERVAL = 60.0
+
 
 class ProviderSelectionStrategy(ABC):
-    """Strategy for selecting TTS providers."""
+    """
+    Strategy for selecting TTS providers.
+
+    Callers pass only providers the health checker considers healthy, so
+    strategies choose among them without checking availability again.
+    """
 
     @abstractmethod
     def select_provider(self, providers: List[TTSProvider], voice: str = None) -> Optional[TTSProvider]:
@@ -38,15 +48,13 @@ class FallbackProviderStrategy(ProviderSelectionStrategy):
     def select_provider(self, providers: List[TTSProvider], voice: str = None) -> Optional[TTSProvider]:
         """Select provider using fallback logic."""
         # Try cloud providers first (higher quality)
-        cloud_providers = [p for p in providers if p.get_provider_type() == ProviderType.CLOUD]
-        for provider in cloud_providers:
-            if provider.is_available():
+        for provider in providers:
+            if provider.get_provider_type() == ProviderType.CLOUD:
                 return provider
 
         # Fallback to offline providers
-        offline_providers = [p for p in providers if p.get_provider_type() == ProviderType.OFFLINE]
-        for provider in offline_providers:
-            if provider.is_available():
+        for provider in providers:
+            if provider.get_provider_type() == ProviderType.OFFLINE:
                 return provider
 
         return None
@@ -60,44 +68,59 @@ class QualityFirstStrategy(ProviderSelectionStrategy):
 
     def select_provider(self, providers: List[TTSProvider], voice: str = None) -> Optional[TTSProvider]:
         """Select the highest quality provider available."""
-        available_providers = [p for p in providers if p.is_available()]
-
-        if not available_providers:
+        if not providers:
             return None
 
         # For now, prefer cloud over offline (assuming cloud = higher quality)
         # In the future, we could add quality scoring
-        cloud_providers = [p for p in available_providers if p.get_provider_type() == ProviderType.CLOUD]
+        cloud_providers = [p for p in providers if p.get_provider_type() == ProviderType.CLOUD]
         if cloud_providers:
             return cloud_providers[0]
 
-        return available_providers[0]
+        return providers[0]
 
 
 class ProviderHealthChecker:
     """
     Manages provider health checking and circuit breaker logic.
     Prevents repeatedly trying failed providers.
+
+    Availability is probed periodically on a background thread and kept as
+    plain per-provider flags, so is_provider_healthy() on the conversion path
+    is a lookup and never calls provider.is_available() itself. Providers not
+    probed yet are treated optimistically as healthy and a probe is requested;
+    failed conversions still mark them unhealthy immediately.
     """
 
-    def __init__(self, failure_threshold: int = 3, recovery_timeout: int = 300):
+    def __init__(self, failure_threshold: int = 3, recovery_timeout: int = 300, probe_interval: float = HEALTH_PROBE_INTERVAL):
         """
         Initialize health checker.
 
         Args:
             failure_threshold: Number of failures before marking provider unhealthy
             recovery_timeout: Seconds to wait before retrying unhealthy provider
+            probe_interval: Seconds between background availability probes
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.probe_interval = probe_interval
         self.failure_counts: Dict[str, int] = {}
         self.last_failure_times: Dict[str, float] = {}
         self.healthy_providers: set = set()
 
+        # Latest background probe result per provider (single dict writes are atomic)
+        self.probe_results: Dict[str, bool] = {}
+        self._probed_providers: Dict[str, TTSProvider] = {}
+        self._probe_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
     def is_provider_healthy(self, provider: TTSProvider) -> bool:
         """
         Check if a provider is healthy and can be used.
 
+        Only reads cached state; never performs a synchronous availability check.
+
         Args:
             provider: Provider to check
 
@@ -118,16 +141,79 @@ class ProviderHealthChecker:
             if time.time() - last_failure < self.recovery_timeout:
                 return False  # Still in recovery period
 
-            # Recovery period passed, reset failure count
+            # Recovery period passed, reset failure count and re-probe in the background
             self.failure_counts[provider_name] = 0
+            self.request_probe(provider)
+            return True
 
-        # Perform actual health check
-        if provider.is_available():
-            self.healthy_providers.add(provider_name)
+        probe_result = self.probe_results.get(provider_name)
+        if probe_result is None:
+            # Not probed yet: allow it and let the background probe confirm
+            self.request_probe(provider)
             return True
+        return probe_result
+
+    def probe(self, provider: TTSProvider) -> bool:
+        """
+        Synchronously probe a provider's availability and record the result.
+
+        Called from the background probe thread.
+
+        Args:
+            provider: Provider to probe
+
+        Returns:
+            True if the provider reported itself available
+        """
+        provider_name = provider.get_provider_name()
+        try:
+            available = bool(provider.is_available())
+        except Exception as e:
+            logger.warning(f"Health probe for {provider_name} raised: {e}")
+            available = False
+
+        self.probe_results[provider_name] = available
+        if available:
+            if self.failure_counts.get(provider_name, 0) < self.failure_threshold:
+                self.healthy_providers.add(provider_name)
         else:
-            self.record_failure(provider)
-            return False
+            self.healthy_providers.discard(provider_name)
+        return available
+
+    def request_probe(self, provider: TTSProvider) -> None:
+        """Ask the background thread to probe a provider as soon as possible."""
+        self._probed_providers.setdefault(provider.get_provider_name(), provider)
+        self._wake_event.set()
+
+    def start_background_probes(self, providers: Iterable[TTSProvider]) -> None:
+        """
+        Start periodic background probing of providers.
+
+        Args:
+            providers: Providers to probe every probe_interval seconds
+        """
+        for provider in providers:
+            self._probed_providers[provider.get_provider_name()] = provider
+
+        if self._probe_thread is not None and self._probe_thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._probe_thread = threading.Thread(
+            target=_run_health_probes,
+            args=(weakref.ref(self), self._stop_event, self._wake_event, self.probe_interval),
+            name="tts-health-probe",
+            daemon=True
+        )
+        self._probe_thread.start()
+
+    def stop_background_probes(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the background probe thread."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._probe_thread is not None:
+            self._probe_thread.join(timeout)
+            self._probe_thread = None
 
     def record_failure(self, provider: TTSProvider) -> None:
         """Record a provider failure."""
@@ -145,6 +231,51 @@ class ProviderHealthChecker:
         self.healthy_providers.add(provider_name)
 
 
+def _run_health_probes(
+    checker_ref: "weakref.ReferenceType[ProviderHealthChecker]",
+    stop_event: threading.Event,
+    wake_event: threading.Event,
+    interval: float
+) -> None:
+    """
+    Background probe loop.
+
+    Holds only a weak reference to the checker so the thread exits once the
+    owning provider manager is garbage collected.
+    """
+    while not stop_event.is_set():
+        checker = checker_ref()
+        if checker is None:
+            return
+        for provider in list(checker._probed_providers.values()):
+            if stop_event.is_set():
+                return
+            checker.probe(provider)
+        del checker
+
+        wake_event.wait(interval)
+        wake_event.clear()
+
+
+_shared_health_checker: Optional[ProviderHealthChecker] = None
+_shared_health_checker_lock = threading.Lock()
+
+
+def get_shared_health_checker() -> ProviderHealthChecker:
+    """
+    Get the process-wide health checker.
+
+    Provider managers are created in many places and are often short-lived;
+    sharing one checker keeps a single probe thread per process and lets
+    every manager see the same provider health.
+    """
+    global _shared_health_checker
+    with _shared_health_checker_lock:
+        if _shared_health_checker is None:
+            _shared_health_checker = ProviderHealthChecker()
+        return _shared_health_checker
+
+
 class TTSProviderManager:
     """Manages TTS providers and implements fallback logic"""
 
@@ -158,12 +289,14 @@ class TTSProviderManager:
 
         Args:
             selection_strategy: Strategy for provider selection (defaults to FallbackProviderStrategy)
-            health_checker: Health checker for provider monitoring (defaults to new instance)
+            health_checker: Health checker for provider monitoring (defaults to the process-wide checker)
         """
         self._providers: Dict[str, TTSProvider] = {}
         self.selection_strategy = selection_strategy or FallbackProviderStrategy()
-        self.health_checker = health_checker or ProviderHealthChecker()
+        self.health_checker = health_checker or get_shared_health_checker()
         self._initialize_providers()
+        # Keep availability checks off the conversion path
+        self.health_checker.start_background_probes(self._providers.values())
     
     def _initialize_providers(self) -> None:
         """Initialize all available TTS providers"""
@@ -23,6 +23,8 @@ class Pyttsx3Provider(TTSProvider):
         self._engine: Any = None
         self._available = False
         self._voices_cache: Optional[List[Dict[str, Any]]] = None
+        # Voice id/name -> pyttsx3 system voice id, built alongside _voices_cache
+        self._system_voice_ids: Dict[str, str] = {}
         self._initialize()
     
     def _initialize(self) -> None:
@@ -72,6 +74,7 @@ class Pyttsx3Provider(TTSProvider):
             return self._voices_cache
         
         voices: List[Dict[str, Any]] = []
+        system_voice_ids: Dict[str, str] = {}
         try:
             system_voices = self._engine.getProperty('voices')  # type: ignore[attr-defined]
             for idx, voice in enumerate(system_voices):  # type: ignore[arg-type]
@@ -109,10 +112,13 @@ class Pyttsx3Provider(TTSProvider):
                         'quality': 'low',
                         'provider': 'pyttsx3'
                     })
+                    system_voice_ids.setdefault(voice_id, voice_id)
+                    system_voice_ids.setdefault(voice_name, voice_id)
             
             # Sort by name
             voices.sort(key=lambda x: x.get("name", ""))
             self._voices_cache = voices
+            self._system_voice_ids = system_voice_ids
             
         except Exception as e:
             logger.error(f"Error loading pyttsx3 voices: {e}")
@@ -148,31 +154,13 @@ class Pyttsx3Provider(TTSProvider):
             return False
         
         try:
-            # Set voice
+            # Set voice (indexed lookup, falls back to first available voice)
             voices = self.get_voices()
-            voice_obj: Any = None
-            for v in voices:
-                if v['id'] == voice or v['name'] == voice:
-                    # Find the actual voice object
-                    system_voices = self._engine.getProperty('voices')  # type: ignore[attr-defined]
-                    for sys_voice in system_voices:  # type: ignore[arg-type]
-                        sys_voice_id = sys_voice.id if hasattr(sys_voice, 'id') else str(system_voices.index(sys_voice))  # type: ignore[attr-defined,arg-type]
-                        if sys_voice_id == v['id']:
-                            voice_obj = sys_voice
-                            break
-                    break
-            
-            if voice_obj:
-                self._engine.setProperty('voice', voice_obj.id if hasattr(voice_obj, 'id') else voice_obj)  # type: ignore[attr-defined,arg-type]
-            elif voices:
-                # Use first available voice as fallback
-                first_voice_id = voices[0]['id']
-                system_voices = self._engine.getProperty('voices')  # type: ignore[attr-defined]
-                for sys_voice in system_voices:  # type: ignore[arg-type]
-                    sys_voice_id = sys_voice.id if hasattr(sys_voice, 'id') else str(system_voices.index(sys_voice))  # type: ignore[attr-defined,arg-type]
-                    if sys_voice_id == first_voice_id:
-                        self._engine.setProperty('voice', sys_voice.id if hasattr(sys_voice, 'id') else sys_voice)  # type: ignore[attr-defined,arg-type]
-                        break
+            system_voice_id = self._system_voice_ids.get(voice)
+            if system_voice_id is None and voices:
+                system_voice_id = self._system_voice_ids.get(voices[0]['id'])
+            if system_voice_id is not None:
+                self._engine.setProperty('voice', system_voice_id)  # type: ignore[attr-defined]
             
             # Set rate (words per minute, pyttsx3 uses 0-200, default ~200)
             # Map our 0-200 scale to pyttsx3's expected range
@@ -5,16 +5,19 @@ Centralized text processing with a clean pipeline approach.
 Handles text cleaning, validation, SSML building, and preparation for conversion.
 """
 
+import logging
 from typing import Callable, Optional, Tuple, List
 from dataclasses import dataclass
 
-from core.logger import get_logger
+from core.logger import get_logger, get_chunk_logger
+from core.metrics import get_metrics
 
 from .providers.base_provider import TTSProvider
 from .ssml_builder import build_ssml
 from text_utils import clean_text_for_tts
 
 logger = get_logger("tts.text_processing_pipeline")
+chunk_logger = get_chunk_logger()
 
 
 @dataclass
@@ -101,14 +104,14 @@ class TextValidator:
             logger.error("Text is empty after processing - cannot convert to speech")
             return False
 
-        # Log text statistics
-        text_length = len(processed_text.enhanced)
-        text_bytes = len(processed_text.enhanced.encode('utf-8'))
-        logger.info(f"Text length after processing: {text_length} characters ({text_bytes} bytes)")
+        # Log text statistics (skipped entirely unless verbose chunk logging is on)
+        if chunk_logger.isEnabledFor(logging.INFO):
+            text_length = len(processed_text.enhanced)
+            text_bytes = len(processed_text.enhanced.encode('utf-8'))
+            chunk_logger.info("Text length after processing: %d characters (%d bytes)", text_length, text_bytes)
 
-        if text_length > 0:
             preview = processed_text.enhanced[:100].replace('\n', ' ').strip()
-            logger.info(f"Text preview (first 100 chars): {preview}...")
+            chunk_logger.info("Text preview (first 100 chars): %s...", preview)
 
         return True
 
@@ -152,8 +155,9 @@ class TextProcessingPipeline:
         """
         # Apply cleaning pipeline
         cleaned_text = text
-        for cleaner in self.cleaners:
-            cleaned_text = cleaner.clean(cleaned_text)
+        with get_metrics().span("tts_clean_seconds", "TTS text cleaning time"):
+            for cleaner in self.cleaners:
+                cleaned_text = cleaner.clean(cleaned_text)
 
         # Create processed text object
         processed = ProcessedText(
@@ -0,0 +1,193 @@
+"""
+Voice Catalog for TTS Module
+
+Indexed, immutable view over a voice list. Built once per voice listing so
+lookups by id, short name, display name, locale and name prefix are dictionary
+or binary-search operations instead of linear scans.
+"""
+
+import bisect
+from typing import Dict, List, Optional, Any, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger("tts.voice_catalog")
+
+
+class VoiceCatalog:
+    """
+    Prebuilt indexes over a list of voice dictionaries.
+
+    Indexes:
+    - by id, by ShortName and by lowercase name (exact lookups)
+    - by locale
+    - sorted lowercase names (prefix lookups for fuzzy matching)
+
+    Voice order from the source list is preserved within each index bucket,
+    so lookups return the same voice a linear scan would have found first.
+    """
+
+    def __init__(self, voices: List[Dict[str, Any]]):
+        """
+        Build catalog indexes.
+
+        Args:
+            voices: Voice dictionaries (keys: id, name, language/Locale, ShortName, provider)
+        """
+        self._voices: List[Dict[str, Any]] = list(voices)
+        # Exact indexes map a lowercase key to source positions
+        self._by_id: Dict[str, List[int]] = {}
+        self._by_short_name: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_locale: Dict[str, List[int]] = {}
+        # (lowercase name, source position) sorted for bisect prefix search
+        self._sorted_names: List[Tuple[str, int]] = []
+
+        for position, voice in enumerate(self._voices):
+            voice_id = (voice.get("id") or "").lower()
+            short_name = (voice.get("ShortName") or "").lower()
+            name = (voice.get("name") or "").lower()
+            locale = (voice.get("language") or voice.get("Locale") or "").lower()
+
+            if voice_id:
+                self._by_id.setdefault(voice_id, []).append(position)
+            if short_name:
+                self._by_short_name.setdefault(short_name, []).append(position)
+            if name:
+                self._by_name.setdefault(name, []).append(position)
+            if locale:
+                self._by_locale.setdefault(locale, []).append(position)
+            self._sorted_names.append((name, position))
+
+        self._sorted_names.sort()
+        logger.debug(f"VoiceCatalog built with {len(self._voices)} voices")
+
+    def __len__(self) -> int:
+        return len(self._voices)
+
+    @property
+    def voices(self) -> List[Dict[str, Any]]:
+        """All voices in source order."""
+        return self._voices
+
+    def _first_for_provider(self, positions: List[int], provider: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the first voice (in source order) belonging to provider, or any if provider is None."""
+        for position in sorted(positions):
+            voice = self._voices[position]
+            if provider is None or voice.get("provider") == provider:
+                return voice
+        return None
+
+    def find_exact(self, voice_name: str, provider: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a voice whose id, name or ShortName equals voice_name (case-insensitive).
+
+        Args:
+            voice_name: Voice id, name or short name
+            provider: Optional provider name to restrict the match to
+
+        Returns:
+            Voice dictionary or None if not found
+        """
+        return self._first_for_provider(self._exact_positions(voice_name), provider)
+
+    def find_all_exact(self, voice_name: str) -> List[Dict[str, Any]]:
+        """
+        Find every voice whose id, name or ShortName equals voice_name (case-insensitive).
+
+        Args:
+            voice_name: Voice id, name or short name
+
+        Returns:
+            Matching voice dictionaries in source order (empty if none)
+        """
+        return [self._voices[position] for position in self._exact_positions(voice_name)]
+
+    def _exact_positions(self, voice_name: str) -> List[int]:
+        """Source positions of exact matches, in source order and without duplicates."""
+        key = voice_name.lower().strip()
+        positions: set = set()
+        for index in (self._by_id, self._by_name, self._by_short_name):
+            positions.update(index.get(key, ()))
+        return sorted(positions)
+
+    def find_by_prefix(self, prefix: str, provider: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the first voice (in source order) whose lowercase name starts with prefix.
+
+        Args:
+            prefix: Name prefix
+            provider: Optional provider name to restrict the match to
+
+        Returns:
+            Voice dictionary or None if not found
+        """
+        return self._first_for_provider(self._prefix_positions(prefix), provider)
+
+    def _prefix_positions(self, prefix: str) -> List[int]:
+        """Source positions of voices whose lowercase name starts with prefix, in source order."""
+        prefix = prefix.lower().strip()
+        start = bisect.bisect_left(self._sorted_names, (prefix, -1))
+        positions: List[int] = []
+        for index in range(start, len(self._sorted_names)):
+            name, position = self._sorted_names[index]
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+        return sorted(positions)
+
+    def find_partial(self, fragment: str, provider: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the first voice whose lowercase name contains fragment.
+
+        Tries the prefix index first and only scans names when no prefix match exists.
+
+        Args:
+            fragment: Name fragment
+            provider: Optional provider name to restrict the match to
+
+        Returns:
+            Voice dictionary or None if not found
+        """
+        fragment = fragment.lower().strip()
+        voice = self.find_by_prefix(fragment, provider)
+        if voice:
+            return voice
+
+        for voice in self._voices:
+            if provider is not None and voice.get("provider") != provider:
+                continue
+            if fragment in (voice.get("name") or "").lower():
+                return voice
+        return None
+
+    def find_all_partial(self, fragment: str) -> List[Dict[str, Any]]:
+        """
+        Find every voice whose lowercase name contains fragment.
+
+        Args:
+            fragment: Name fragment
+
+        Returns:
+            Prefix matches, then the other matches, each in source order (empty if none)
+        """
+        fragment = fragment.lower().strip()
+        prefix_positions = self._prefix_positions(fragment)
+        matches = [self._voices[position] for position in prefix_positions]
+        seen = set(prefix_positions)
+        for position, voice in enumerate(self._voices):
+            if position not in seen and fragment in (voice.get("name") or "").lower():
+                matches.append(voice)
+        return matches
+
+    def get_by_locale(self, locale: str) -> List[Dict[str, Any]]:
+        """
+        Get voices for a locale.
+
+        Args:
+            locale: Locale code (e.g., "en-US")
+
+        Returns:
+            List of voice dictionaries (empty if none)
+        """
+        return [self._voices[position] for position in self._by_locale.get(locale.lower(), ())]
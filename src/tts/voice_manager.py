@@ -7,10 +7,11 @@ Handles loading, caching, and managing TTS voices from multiple providers.
 """
 
 import json
+import threading
 import time
 import warnings
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Set
 
 from core.config_manager import get_config
 from core.logger import get_logger
@@ -18,6 +19,12 @@ from tts.providers.provider_manager import TTSProviderManager
 
 logger = get_logger("tts.voice_manager")
 
+# Voice list shipped with the app so a cold start never waits on the network
+BUNDLED_VOICES_SNAPSHOT = Path(__file__).parent / "data" / "voices_snapshot.json"
+
+# Listener signature: (provider, locale, voices)
+VoicesListener = Callable[[str, str, List[Dict[str, Any]]], None]
+
 # Deprecation warning
 warnings.warn(
     "VoiceManager is deprecated. Use VoiceResolver instead.",
@@ -27,15 +34,33 @@ warnings.warn(
 
 
 class VoiceManager:
-    """Manages TTS voices from multiple providers with caching support."""
+    """
+    Manages TTS voices from multiple providers with caching support.
+
+    With stale_while_revalidate enabled, get_voices() never blocks on the
+    network: it serves the last snapshot (on-disk cache, else the bundled
+    snapshot) immediately and refreshes stale entries in a background
+    thread, notifying listeners registered with add_voices_listener() when
+    the list changes. A provider/locale with no snapshot yet returns an
+    empty list while its first fetch runs in the background (see
+    is_loading_voices()); listeners are notified when it completes.
+    """
 
-    def __init__(self, cache_duration_days: int = 7, provider_manager: Optional[TTSProviderManager] = None):
+    def __init__(
+        self,
+        cache_duration_days: int = 7,
+        provider_manager: Optional[TTSProviderManager] = None,
+        stale_while_revalidate: bool = False,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize voice manager.
 
         Args:
             cache_duration_days: How long to keep cached voices (default: 7 days)
             provider_manager: Optional TTSProviderManager instance. If None, creates a new one.
+            stale_while_revalidate: Serve cached voices immediately and refresh in the background
+            cache_dir: Optional cache directory (defaults to ~/.act/cache)
         """
         self.cache_duration = cache_duration_days * 24 * 3600  # Convert to seconds
         self.config = get_config()
@@ -44,13 +69,22 @@ class VoiceManager:
         self.provider_manager = provider_manager or TTSProviderManager()
         
         # Cache file location
-        cache_dir = Path.home() / ".act" / "cache"
+        cache_dir = cache_dir or Path.home() / ".act" / "cache"
         cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = cache_dir / "voices_cache.json"
+        self.snapshot_file = cache_dir / "voices_snapshot.json"
         
         self._voices: List[Dict[str, Any]] = []
         self._voices_loaded = False
 
+        # Stale-while-revalidate state
+        self.stale_while_revalidate = stale_while_revalidate
+        self._snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._snapshot_lock = threading.Lock()
+        self._refresh_threads: Dict[str, threading.Thread] = {}
+        self._first_fetches: Set[str] = set()  # Keys with no snapshot whose first fetch is running
+        self._listeners: List[VoicesListener] = []
+
     def get_voices(self, locale: Optional[str] = None, provider: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get available voices, optionally filtered by locale and provider.
@@ -67,17 +101,141 @@ class VoiceManager:
         if locale is None:
             locale = "en-US"
         
-        # If provider is specified, get voices from that provider only
-        # ProviderManager returns List[Dict] without type args, but we know it's List[Dict[str, Any]]
-        if provider:
-            voices = self.provider_manager.get_voices_by_provider(provider, locale=locale)  # type: ignore[assignment]
-        else:
+        if not provider:
             # Default to Edge TTS voices when no provider specified (avoid Windows SAPI voices)
             logger.debug("No provider specified, defaulting to Edge TTS voices")
-            voices = self.provider_manager.get_voices_by_provider("edge_tts", locale=locale)  # type: ignore[assignment]
-        
-        # Cast to proper type since ProviderManager returns List[Dict] without type args
-        return voices  # type: ignore[return-value]
+            provider = "edge_tts"
+
+        if self.stale_while_revalidate:
+            return self._get_voices_stale_while_revalidate(provider, locale)
+
+        return self._fetch_voices(provider, locale)
+
+    def _fetch_voices(self, provider: str, locale: str) -> List[Dict[str, Any]]:
+        """Fetch voices from a provider (may hit the network)."""
+        # ProviderManager returns List[Dict] without type args, but we know it's List[Dict[str, Any]]
+        return self.provider_manager.get_voices_by_provider(provider, locale=locale)  # type: ignore[return-value]
+
+    def add_voices_listener(self, listener: VoicesListener) -> None:
+        """
+        Register a callback invoked when a background refresh delivers new voices.
+
+        The callback runs on the refresh thread; UI code must marshal it to the GUI thread.
+
+        Args:
+            listener: Callable receiving (provider, locale, voices)
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_voices_listener(self, listener: VoicesListener) -> None:
+        """Unregister a voices listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _get_voices_stale_while_revalidate(self, provider: str, locale: str) -> List[Dict[str, Any]]:
+        """Serve the last known voices immediately, refreshing stale entries in the background."""
+        key = f"{provider}|{locale}"
+        with self._snapshot_lock:
+            if self._snapshot is None:
+                self._snapshot = self._load_snapshot()
+            entry = self._snapshot.get(key)
+            if entry is None:
+                self._first_fetches.add(key)
+
+        if entry is None:
+            # Nothing known yet for this provider/locale: fetch it off the caller's thread
+            self._revalidate_async(provider, locale)
+            return []
+
+        if time.time() - entry.get("timestamp", 0) >= self.cache_duration:
+            self._revalidate_async(provider, locale)
+
+        return list(entry.get("voices", []))
+
+    def is_loading_voices(self, locale: Optional[str] = None, provider: Optional[str] = None) -> bool:
+        """Whether the first background fetch for provider/locale is still running."""
+        with self._snapshot_lock:
+            return f"{provider or 'edge_tts'}|{locale or 'en-US'}" in self._first_fetches
+
+    def _revalidate_async(self, provider: str, locale: str) -> None:
+        """Start a background refresh for provider/locale unless one is already running."""
+        key = f"{provider}|{locale}"
+        with self._snapshot_lock:
+            running = self._refresh_threads.get(key)
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._revalidate,
+                args=(provider, locale),
+                name=f"voice-refresh-{key}",
+                daemon=True
+            )
+            self._refresh_threads[key] = thread
+        thread.start()
+
+    def _revalidate(self, provider: str, locale: str) -> None:
+        """Refresh one snapshot entry and notify listeners if the voices changed."""
+        key = f"{provider}|{locale}"
+        try:
+            voices = self._fetch_voices(provider, locale)
+        except Exception as e:
+            logger.warning(f"Background voice refresh failed for {key}: {e}")
+            voices = []
+
+        with self._snapshot_lock:
+            previous = (self._snapshot or {}).get(key, {}).get("voices")
+
+        if not voices:
+            # Keep serving the stale list rather than replacing it with nothing
+            logger.debug(f"Background voice refresh for {key} returned no voices")
+            if previous is None:
+                # A first fetch that found nothing still ends the wait for it
+                with self._snapshot_lock:
+                    self._first_fetches.discard(key)
+                self._notify_listeners(provider, locale, [])
+            return
+
+        self._store_snapshot_entry(key, voices)
+
+        if voices != previous:
+            logger.info(f"Voice list refreshed for {key}: {len(voices)} voices")
+            self._notify_listeners(provider, locale, voices)
+
+    def _notify_listeners(self, provider: str, locale: str, voices: List[Dict[str, Any]]) -> None:
+        """Call every voices listener, logging (not raising) listener errors."""
+        for listener in list(self._listeners):
+            try:
+                listener(provider, locale, voices)
+            except Exception as e:
+                logger.warning(f"Voices listener failed: {e}")
+
+    def _load_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Load the voice snapshot from the cache directory, falling back to the bundled snapshot."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        for path in (BUNDLED_VOICES_SNAPSHOT, self.snapshot_file):
+            try:
+                if path.exists():
+                    with open(path, "r", encoding="utf-8") as f:
+                        # Later files (user cache) override the bundled entries
+                        entries.update(json.load(f).get("entries", {}))
+            except Exception as e:
+                logger.warning(f"Error loading voice snapshot {path}: {e}")
+        return entries
+
+    def _store_snapshot_entry(self, key: str, voices: List[Dict[str, Any]]) -> None:
+        """Update one snapshot entry and persist the snapshot to the cache directory."""
+        with self._snapshot_lock:
+            if self._snapshot is None:
+                self._snapshot = self._load_snapshot()
+            self._snapshot[key] = {"timestamp": time.time(), "voices": voices}
+            self._first_fetches.discard(key)
+            data = {"entries": dict(self._snapshot)}
+        try:
+            with open(self.snapshot_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            logger.warning(f"Error saving voice snapshot: {e}")
 
     def get_voice_list(self, locale: Optional[str] = None, provider: Optional[str] = None) -> List[str]:
         """
@@ -156,6 +314,8 @@ class VoiceManager:
         """
         if locale is None:
             locale = "en-US"
+        if self.stale_while_revalidate:
+            return self._get_voices_stale_while_revalidate(provider, locale)
         # ProviderManager returns List[Dict] without type args, but we know it's List[Dict[str, Any]]
         return self.provider_manager.get_voices_by_provider(provider, locale=locale)  # type: ignore[return-value]
 
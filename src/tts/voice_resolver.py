@@ -5,8 +5,9 @@ Handles voice lookup, validation, and resolution with a clean pipeline approach.
 Simplifies the complex voice management that was spread across VoiceManager and VoiceValidator.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
+import threading
 import warnings
 
 from core.config_manager import get_config
@@ -14,6 +15,7 @@ from core.logger import get_logger
 
 from .providers.base_provider import TTSProvider
 from .providers.provider_manager import TTSProviderManager
+from .voice_catalog import VoiceCatalog
 
 # Suppress deprecation warning for VoiceManager - VoiceResolver uses it internally
 with warnings.catch_warnings():
@@ -45,6 +47,13 @@ class VoiceResolver:
     - Voice lookup and validation
     - Provider resolution
     - Fallback logic
+
+    Voice listings are indexed once into a VoiceCatalog and resolutions are
+    memoized per (voice, provider), so repeated conversions with the same
+    voice skip lookup entirely. Fuzzy matches and resolutions that had to
+    skip an unavailable provider are not memoized, so a fallback chosen
+    during an outage is not kept once the provider is back. Call
+    refresh_voices() or invalidate_cache() when the voice list changes.
     """
 
     def __init__(self, provider_manager: TTSProviderManager):
@@ -58,8 +67,35 @@ class VoiceResolver:
         self.voice_manager = VoiceManager(provider_manager=provider_manager)
         self.config = get_config()
 
+        # Catalogs keyed by provider name (None = default voice listing)
+        self._catalogs: Dict[Optional[str], VoiceCatalog] = {}
+        self._resolution_cache: Dict[Tuple[str, Optional[str]], VoiceResolutionResult] = {}
+        self._cache_lock = threading.Lock()
+
         logger.debug("VoiceResolver initialized")
 
+    def _get_catalog(self, provider: Optional[str] = None) -> VoiceCatalog:
+        """Get (building on first use) the voice catalog for a provider."""
+        catalog = self._catalogs.get(provider)
+        if catalog is None:
+            voices = self.voice_manager.get_voices(provider=provider) if provider else self.voice_manager.get_voices()
+            catalog = VoiceCatalog(voices)
+            with self._cache_lock:
+                self._catalogs[provider] = catalog
+        return catalog
+
+    def invalidate_cache(self) -> None:
+        """Drop voice catalogs and memoized resolutions so they are rebuilt on next use."""
+        with self._cache_lock:
+            self._catalogs.clear()
+            self._resolution_cache.clear()
+        logger.debug("Voice catalog and resolution cache invalidated")
+
+    def refresh_voices(self) -> None:
+        """Refresh voices from providers and rebuild the catalog on next use."""
+        self.voice_manager.refresh_voices()
+        self.invalidate_cache()
+
     def resolve_voice(
         self,
         voice_name: Optional[str] = None,
@@ -84,21 +120,59 @@ class VoiceResolver:
         # Clean voice name
         voice_name = voice_name.strip()
 
+        return self._resolve(voice_name, preferred_provider, set())
+
+    def _resolve(
+        self,
+        voice_name: str,
+        preferred_provider: Optional[str],
+        unavailable: Set[str]
+    ) -> VoiceResolutionResult:
+        """
+        Resolve a voice through the resolution cache.
+
+        Args:
+            voice_name: Cleaned voice name
+            preferred_provider: Preferred provider name or None
+            unavailable: Collects providers skipped because they were unavailable
+        """
+        cache_key = (voice_name, preferred_provider)
+        cached = self._resolution_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        skipped: Set[str] = set()
+        result = self._resolve_uncached(voice_name, preferred_provider, skipped)
+        unavailable.update(skipped)
+        if not result.fallback_used and not skipped:
+            with self._cache_lock:
+                self._resolution_cache[cache_key] = result
+        return result
+
+    def _resolve_uncached(
+        self,
+        voice_name: str,
+        preferred_provider: Optional[str] = None,
+        unavailable: Optional[Set[str]] = None
+    ) -> VoiceResolutionResult:
+        """Resolve a voice without consulting the resolution cache."""
         logger.debug(f"Resolving voice: '{voice_name}', preferred provider: {preferred_provider}")
+        if unavailable is None:
+            unavailable = set()
 
         # Try exact match first with preferred provider
         if preferred_provider:
-            result = self._try_resolve_with_provider(voice_name, preferred_provider)
+            result = self._try_resolve_with_provider(voice_name, preferred_provider, unavailable)
             if result:
                 return result
 
         # Try exact match with any provider
-        result = self._try_resolve_any_provider(voice_name)
+        result = self._try_resolve_any_provider(voice_name, unavailable)
         if result:
             return result
 
         # Try fuzzy matching
-        result = self._try_fuzzy_match(voice_name, preferred_provider)
+        result = self._try_fuzzy_match(voice_name, preferred_provider, unavailable)
         if result:
             return result
 
@@ -115,17 +189,21 @@ class VoiceResolver:
     def _try_resolve_with_provider(
         self,
         voice_name: str,
-        provider_name: str
+        provider_name: str,
+        unavailable: Optional[Set[str]] = None
     ) -> Optional[VoiceResolutionResult]:
         """Try to resolve voice with a specific provider."""
         # Check if provider is available
         provider = self.provider_manager.get_provider(provider_name)
         if not provider:
             logger.debug(f"Preferred provider '{provider_name}' is not available")
+            if unavailable is not None:
+                unavailable.add(provider_name)
             return None
 
-        # Try to find voice in this provider
-        voice_dict = self.voice_manager.get_voice_by_name(voice_name, provider=provider_name)
+        # Try to find voice in this provider (exact, then partial name match)
+        catalog = self._get_catalog(provider_name)
+        voice_dict = catalog.find_exact(voice_name) or catalog.find_partial(voice_name)
         if voice_dict:
             voice_id = self._extract_voice_id(voice_dict)
             logger.info(f"Resolved voice '{voice_name}' to '{voice_id}' using provider '{provider_name}'")
@@ -137,32 +215,34 @@ class VoiceResolver:
 
         return None
 
-    def _try_resolve_any_provider(self, voice_name: str) -> Optional[VoiceResolutionResult]:
+    def _try_resolve_any_provider(
+        self,
+        voice_name: str,
+        unavailable: Optional[Set[str]] = None
+    ) -> Optional[VoiceResolutionResult]:
         """Try to resolve voice with any available provider."""
-        # Get all voices from all providers
-        all_voices = self.voice_manager.get_voices()
-
-        for voice_dict in all_voices:
-            voice_id = self._extract_voice_id(voice_dict)
+        # A voice may be listed under several providers; use the first whose provider is available
+        for voice_dict in self._get_catalog().find_all_exact(voice_name):
             provider_name = voice_dict.get('provider')
-
-            # Check if this voice matches
-            if self._voice_matches(voice_name, voice_dict):
-                provider = self.provider_manager.get_provider(provider_name)
-                if provider:
-                    logger.info(f"Resolved voice '{voice_name}' to '{voice_id}' using provider '{provider_name}'")
-                    return VoiceResolutionResult(
-                        voice_id=voice_id,
-                        provider=provider,
-                        voice_metadata=voice_dict
-                    )
+            provider = self.provider_manager.get_provider(provider_name)
+            if provider:
+                voice_id = self._extract_voice_id(voice_dict)
+                logger.info(f"Resolved voice '{voice_name}' to '{voice_id}' using provider '{provider_name}'")
+                return VoiceResolutionResult(
+                    voice_id=voice_id,
+                    provider=provider,
+                    voice_metadata=voice_dict
+                )
+            if unavailable is not None:
+                unavailable.add(str(provider_name))
 
         return None
 
     def _try_fuzzy_match(
         self,
         voice_name: str,
-        preferred_provider: Optional[str] = None
+        preferred_provider: Optional[str] = None,
+        unavailable: Optional[Set[str]] = None
     ) -> Optional[VoiceResolutionResult]:
         """Try fuzzy matching for voice names."""
         # Handle Windows SAPI voice names that might be selected in UI
@@ -183,46 +263,27 @@ class VoiceResolver:
         for windows_name, edge_voice in windows_mappings.items():
             if windows_name in voice_name_lower:
                 logger.info(f"Mapped Windows voice '{voice_name}' to Edge TTS voice '{edge_voice}'")
-                return self.resolve_voice(edge_voice, preferred_provider)
+                return self._resolve(edge_voice, preferred_provider, unavailable if unavailable is not None else set())
 
-        # Try partial matching
-        all_voices = self.voice_manager.get_voices()
-        voice_name_lower = voice_name.lower().strip()
-
-        for voice_dict in all_voices:
+        # Try partial matching (prefix matches first, then substring); use the first
+        # match whose provider is available
+        for voice_dict in self._get_catalog().find_all_partial(voice_name):
             provider_name = voice_dict.get('provider')
-            voice_name_full = (voice_dict.get("name") or "").lower()
-
-            # Check partial matches
-            if voice_name_lower in voice_name_full or voice_name_full.startswith(voice_name_lower):
-                provider = self.provider_manager.get_provider(provider_name)
-                if provider:
-                    voice_id = self._extract_voice_id(voice_dict)
-                    logger.info(f"Fuzzy matched voice '{voice_name}' to '{voice_id}' using provider '{provider_name}'")
-                    return VoiceResolutionResult(
-                        voice_id=voice_id,
-                        provider=provider,
-                        voice_metadata=voice_dict,
-                        fallback_used=True
-                    )
+            provider = self.provider_manager.get_provider(provider_name)
+            if provider:
+                voice_id = self._extract_voice_id(voice_dict)
+                logger.info(f"Fuzzy matched voice '{voice_name}' to '{voice_id}' using provider '{provider_name}'")
+                return VoiceResolutionResult(
+                    voice_id=voice_id,
+                    provider=provider,
+                    voice_metadata=voice_dict,
+                    fallback_used=True
+                )
+            if unavailable is not None:
+                unavailable.add(str(provider_name))
 
         return None
 
-    def _voice_matches(self, requested_name: str, voice_dict: Dict[str, Any]) -> bool:
-        """Check if a voice dictionary matches the requested voice name."""
-        requested_lower = requested_name.lower()
-
-        # Check exact matches
-        voice_id = (voice_dict.get("id") or "").lower()
-        voice_name = (voice_dict.get("name") or "").lower()
-        voice_short = (voice_dict.get("ShortName") or "").lower()
-
-        return (
-            voice_id == requested_lower or
-            voice_name == requested_lower or
-            voice_short == requested_lower
-        )
-
     def _extract_voice_id(self, voice_dict: Dict[str, Any]) -> str:
         """Extract the voice ID from voice metadata."""
         return (
@@ -16,6 +16,7 @@ from core.logger import get_logger
 from tts import VoiceManager
 from ui.dialogs import ProviderSelectionDialog
 from ui.view_config import ViewConfig
+from ui.widgets import VoicesUpdatedNotifier
 
 logger = get_logger("ui.full_auto_view.add_queue_dialog")
 
@@ -27,7 +28,11 @@ class AddQueueDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Add to Queue")
         self.setMinimumWidth(ViewConfig.DIALOG_MIN_WIDTH)
-        self.voice_manager = VoiceManager()
+        # Serve cached voices immediately; refreshed lists arrive via voices_notifier
+        self.voice_manager = VoiceManager(stale_while_revalidate=True)
+        self.voices_notifier = VoicesUpdatedNotifier()
+        self.voice_manager.add_voices_listener(self.voices_notifier.notify)
+        self.voices_notifier.voices_updated.connect(self._on_voices_updated)
         self.selected_provider: Optional[str] = None
         self._providers_loaded = False
         self.setup_ui()
@@ -305,6 +310,11 @@ class AddQueueDialog(QDialog):
             voices = self.voice_manager.get_voice_list(locale="en-US", provider=provider)
 
             if not voices:
+                if self.voice_manager.is_loading_voices(locale="en-US", provider=provider):
+                    # Filled in by _on_voices_updated() when the fetch completes
+                    self.voice_combo.addItems(["Loading voices..."])
+                    self.voice_combo.setEnabled(False)
+                    return
                 logger.warning(f"No voices available for provider: {provider}")
                 self.voice_combo.addItems(["No voices available for this provider"])
                 self.voice_combo.setEnabled(False)
@@ -326,6 +336,16 @@ class AddQueueDialog(QDialog):
             self.voice_combo.addItems(["Error loading voices"])
             self.voice_combo.setEnabled(False)
     
+    def _on_voices_updated(self, provider: str):
+        """Refresh the voice list when a background voice refresh completes, keeping the selection."""
+        if provider != self.selected_provider:
+            return
+        selected_voice = self.voice_combo.currentText()
+        self._load_voices()
+        index = self.voice_combo.findText(selected_voice)
+        if index >= 0:
+            self.voice_combo.setCurrentIndex(index)
+    
     def get_data(self) -> Tuple[str, str, str, Optional[str], Dict[str, Any], Dict[str, Any], Optional[str]]:
         """Get the entered URL, title, voice, provider, chapter selection, output format, and output folder."""
         url = self.url_input.text().strip()
@@ -18,6 +18,7 @@ from PySide6.QtCore import QUrl, QTimer
 from core.constants import PREVIEW_TEXT_LENGTH, TEMP_FILE_CLEANUP_DELAY_MS
 from core.logger import get_logger
 from tts import TTSEngine, VoiceManager
+from ui.widgets import VoicesUpdatedNotifier
 from utils.validation import validate_file_path
 
 # Try to import QtMultimedia for audio playback
@@ -50,7 +51,10 @@ class TTSViewHandlers:
     def __init__(self, view: 'QWidget'):
         self.view = view
         self.tts_engine = TTSEngine()
-        self.voice_manager = VoiceManager()
+        # Serve cached voices immediately; refreshed lists arrive via voices_notifier
+        self.voice_manager = VoiceManager(stale_while_revalidate=True)
+        self.voices_notifier = VoicesUpdatedNotifier()
+        self.voice_manager.add_voices_listener(self.voices_notifier.notify)
         self.preview_player: Optional[Any] = None
         self.preview_audio_output: Optional[Any] = None
         self.preview_temp_file: Optional[str] = None
@@ -131,6 +135,11 @@ class TTSViewHandlers:
             voices = self.voice_manager.get_voice_list(locale="en-US", provider=provider)
 
             if not voices:
+                if self.voice_manager.is_loading_voices(locale="en-US", provider=provider):
+                    # Filled in by reload_voices_if_current() when the fetch completes
+                    voice_combo.addItems(["Loading voices..."])
+                    voice_combo.setEnabled(False)
+                    return
                 logger.warning(f"No voices available for provider: {provider}")
                 voice_combo.addItems(["No voices available"])
                 voice_combo.setEnabled(False)
@@ -149,6 +158,19 @@ class TTSViewHandlers:
             # Fallback to default voices
             voice_combo.addItems(["en-US-AndrewNeural", "en-US-AriaNeural", "en-US-GuyNeural"])
     
+    def reload_voices_if_current(self, provider: str, voice_combo, provider_combo):
+        """Reload the voice combo after a background refresh, keeping the current selection."""
+        current_index = provider_combo.currentIndex()
+        current_provider = provider_combo.itemData(current_index) if current_index >= 0 else "edge_tts"
+        if provider != current_provider:
+            return
+
+        selected_voice = voice_combo.currentText()
+        self.load_voices(voice_combo, provider_combo)
+        index = voice_combo.findText(selected_voice)
+        if index >= 0:
+            voice_combo.setCurrentIndex(index)
+    
     def add_files(self, file_paths, files_list):
         """Add text files via file dialog."""
         files, _ = QFileDialog.getOpenFileNames(
@@ -64,6 +64,7 @@ class TTSView(BaseView):
         
         self._load_providers()
         self._load_voices()
+        self.handlers.voices_notifier.voices_updated.connect(self._on_voices_updated)
         logger.info("TTS view initialized")
     
     def setup_ui(self) -> None:
@@ -139,6 +140,12 @@ class TTSView(BaseView):
         """Load available voices into the combo box based on selected provider."""
         self.handlers.load_voices(self.voice_settings.voice_combo, self.voice_settings.provider_combo)
     
+    def _on_voices_updated(self, provider: str) -> None:
+        """Refresh the voice list when a background voice refresh completes."""
+        self.handlers.reload_voices_if_current(
+            provider, self.voice_settings.voice_combo, self.voice_settings.provider_combo
+        )
+    
     def add_files(self) -> None:
         """Add text files via file dialog."""
         self.handlers.add_files(self.file_paths, self.input_section.files_list)
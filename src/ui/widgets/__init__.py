@@ -6,7 +6,9 @@ consistent UI components across the application.
 """
 
 from ui.widgets.base_controls_section import BaseControlsSection
+from ui.widgets.voices_updated_notifier import VoicesUpdatedNotifier
 
 __all__ = [
     'BaseControlsSection',
+    'VoicesUpdatedNotifier',
 ]
@@ -0,0 +1,20 @@
+"""
+Voices Updated Notifier - Qt bridge for background voice list refreshes.
+
+VoiceManager listeners run on its refresh threads; this object re-emits
+them as a signal so connected slots run on the GUI thread.
+"""
+
+from typing import Any
+
+from PySide6.QtCore import QObject, Signal
+
+
+class VoicesUpdatedNotifier(QObject):
+    """Bridges background voice refreshes to the GUI thread via a queued signal."""
+
+    voices_updated = Signal(str)  # Provider name
+
+    def notify(self, provider: str, locale: str, voices: Any) -> None:
+        """VoiceManager listener; may be called from a background thread."""
+        self.voices_updated.emit(provider)
@@ -21,6 +21,7 @@ def validate_modules():
         "load_more_handler.js",
         "container_finder.js",
         "scroll_operations.js",
+        "dom_settle.js",
         "scroll_loop.js",
         "main.js",
     ]
@@ -53,6 +54,7 @@ def validate_modules():
         "load_more_handler.js": ["tryClickLoadMore", "matchesLoadMoreText"],
         "container_finder.js": ["findChapterContainer"],
         "scroll_operations.js": ["scrollContainer", "scrollContainerToBottom", "scrollToLastChapter", "scrollPastLastChapter"],
+        "dom_settle.js": ["waitForChapterLinksSettled", "configureSettle", "getSettleStats"],
         "scroll_loop.js": ["performScrollLoop", "SCROLL_CONFIG"],
         "main.js": ["scrollAndCountChapters"],
     }
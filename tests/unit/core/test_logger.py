@@ -0,0 +1,143 @@
+"""
+Unit tests for the logging system.
+
+Tests the queue listener lifecycle, logging from worker processes and the
+verbose chunk logging switch.
+"""
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+# Path setup is handled by conftest.py
+from core.logger import CHUNK_LOGGER_NAME, ACTLogger, get_chunk_logger, get_logger
+
+
+class _RecordingHandler(logging.Handler):
+    """Keeps records and the thread that handled each one."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.getMessage(), threading.current_thread().name))
+
+
+def _log_in_worker(message):
+    """Runs in a worker process."""
+    get_logger("test.worker").error(message)
+    return True
+
+
+@pytest.fixture
+def fresh_logger(temp_dir):
+    """A new ACTLogger writing under temp_dir; the real one is restored afterwards."""
+    act_logger = logging.getLogger("act")
+    saved_handlers, saved_level = list(act_logger.handlers), act_logger.level
+    with patch.object(ACTLogger, "_instance", None), \
+            patch("core.logger.Path.home", return_value=temp_dir), \
+            patch("core.logger.atexit.register"):
+        instance = ACTLogger()
+        try:
+            yield instance
+        finally:
+            instance.shutdown()
+            act_logger.handlers[:] = saved_handlers
+            act_logger.setLevel(saved_level)
+
+
+@pytest.fixture
+def chunk_logging_off():
+    """Leave verbose chunk logging off after the test."""
+    yield
+    ACTLogger.set_verbose_chunk_logging(False)
+
+
+class TestQueueListener:
+    """Tests for the queue listener lifecycle."""
+
+    def test_records_are_written_by_the_listener_thread(self, fresh_logger):
+        """Worker threads only enqueue; the listener writes, and shutdown flushes the queue."""
+        recorder = _RecordingHandler()
+        fresh_logger._listener.handlers += (recorder,)
+        logger = logging.getLogger("act.test.listener")
+
+        workers = [
+            threading.Thread(target=logger.info, args=(f"message {n}",), name=f"worker-{n}")
+            for n in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        fresh_logger.shutdown()
+
+        assert sorted(message for message, _ in recorder.records) == [f"message {n}" for n in range(4)]
+        assert not any(thread.startswith("worker-") for _, thread in recorder.records)
+        assert "message 3" in fresh_logger.log_file.read_text(encoding="utf-8")
+
+    def test_shutdown_is_idempotent(self, fresh_logger):
+        """Stopping twice (explicitly and at exit) is harmless."""
+        fresh_logger.shutdown()
+        fresh_logger.shutdown()
+
+        assert fresh_logger._listener is None
+
+
+class TestWorkerProcessLogging:
+    """Tests for process_log_queue and configure_worker_process."""
+
+    def test_worker_records_reach_the_parent(self):
+        """Records logged in pool workers are handled by the parent's loggers."""
+        recorder = _RecordingHandler()
+        parent_logger = logging.getLogger("act.test.worker")
+        parent_logger.addHandler(recorder)
+        try:
+            with ACTLogger.process_log_queue() as log_queue, \
+                    ProcessPoolExecutor(max_workers=1,
+                                        initializer=ACTLogger.configure_worker_process,
+                                        initargs=(log_queue, logging.DEBUG)) as executor:
+                assert list(executor.map(_log_in_worker, ["merge failed: 1", "merge failed: 2"])) == [True, True]
+        finally:
+            parent_logger.removeHandler(recorder)
+
+        assert sorted(message for message, _ in recorder.records) == ["merge failed: 1", "merge failed: 2"]
+
+
+class TestChunkLogging:
+    """Tests for the verbose chunk logging switch."""
+
+    def test_chunk_detail_is_off_by_default(self, chunk_logging_off):
+        """With act at DEBUG, chunk detail still creates no records."""
+        ACTLogger.set_verbose_chunk_logging(False)
+        recorder = _RecordingHandler()
+        chunk_logger = get_chunk_logger()
+        chunk_logger.addHandler(recorder)
+        try:
+            with patch.object(logging.getLogger("act"), "level", logging.DEBUG):
+                chunk_logger.info("Converted chunk %d", 1)
+
+                assert chunk_logger.name == CHUNK_LOGGER_NAME
+                assert not chunk_logger.isEnabledFor(logging.INFO)
+                assert recorder.records == []
+        finally:
+            chunk_logger.removeHandler(recorder)
+
+    def test_verbose_switch_enables_chunk_detail(self, chunk_logging_off):
+        """Turning verbose chunk logging on lets chunk detail through, and off again drops it."""
+        recorder = _RecordingHandler()
+        chunk_logger = get_chunk_logger()
+        chunk_logger.addHandler(recorder)
+        try:
+            ACTLogger.set_verbose_chunk_logging(True)
+            chunk_logger.info("Converted chunk %d", 1)
+            ACTLogger.set_verbose_chunk_logging(False)
+            chunk_logger.info("Converted chunk %d", 2)
+        finally:
+            chunk_logger.removeHandler(recorder)
+
+        assert [message for message, _ in recorder.records] == ["Converted chunk 1"]
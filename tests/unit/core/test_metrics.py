@@ -0,0 +1,132 @@
+"""
+Unit tests for the metrics registry.
+
+Tests counters, gauges, histograms, spans, snapshot diffs and the
+JSON / Prometheus exports.
+"""
+
+import json
+import threading
+
+import pytest
+
+# Path setup is handled by conftest.py
+from core.metrics import MetricsRegistry, diff_snapshots, estimate_quantile, get_metrics
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry class."""
+
+    def test_counter_accumulates_across_threads(self):
+        """Concurrent increments are not lost."""
+        registry = MetricsRegistry()
+
+        def worker():
+            for _ in range(1000):
+                registry.counter("events_total").inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registry.counter("events_total").value == 8000
+
+    def test_counter_rejects_negative_increment(self):
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            registry.counter("events_total").inc(-1)
+
+    def test_name_reused_with_other_type_raises(self):
+        registry = MetricsRegistry()
+        registry.counter("things")
+        with pytest.raises(TypeError):
+            registry.histogram("things")
+
+    def test_gauge_tracks_peak(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("queue_depth")
+        gauge.set(5)
+        gauge.dec(3)
+        gauge.inc()
+
+        assert gauge.value == 3
+        assert gauge.max == 5
+
+    def test_span_records_even_on_error(self):
+        """A failing block still records its duration."""
+        registry = MetricsRegistry()
+        with registry.span("work_seconds"):
+            pass
+        with pytest.raises(RuntimeError):
+            with registry.span("work_seconds"):
+                raise RuntimeError("boom")
+
+        histogram = registry.histogram("work_seconds")
+        assert histogram.count == 2
+        assert histogram.sum >= 0
+
+    def test_histogram_buckets_and_quantiles(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", buckets=[1.0, 2.0, 4.0])
+        for value in [0.5, 0.5, 1.5, 3.0, 10.0]:
+            histogram.observe(value)
+
+        data = histogram.snapshot()
+        assert data["bucket_counts"] == [2, 1, 1, 1]
+        assert estimate_quantile(data["buckets"], data["bucket_counts"], 0.5) == pytest.approx(1.5)
+        # Overflow bucket reports the largest finite bound
+        assert estimate_quantile(data["buckets"], data["bucket_counts"], 1.0) == 4.0
+        assert estimate_quantile([1.0], [0, 0], 0.5) is None
+
+    def test_diff_snapshots_covers_only_new_activity(self):
+        registry = MetricsRegistry()
+        registry.counter("chapters_total").inc(3)
+        registry.histogram("latency_seconds").observe(0.2)
+        before = registry.snapshot()
+
+        registry.counter("chapters_total").inc(2)
+        registry.histogram("latency_seconds").observe(0.4)
+        registry.counter("new_total").inc()
+
+        diff = diff_snapshots(registry.snapshot(), before)
+        assert diff["chapters_total"]["value"] == 2
+        assert diff["latency_seconds"]["count"] == 1
+        assert diff["latency_seconds"]["sum"] == pytest.approx(0.4)
+        assert diff["new_total"]["value"] == 1
+
+    def test_write_json_report(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.counter("chapters_total").inc(4)
+        registry.histogram("latency_seconds").observe(0.3)
+
+        path = registry.write_json_report(tmp_path / "metadata" / "run.json", extra={"project": "p"})
+
+        report = json.loads(path.read_text(encoding="utf-8"))
+        assert report["run"] == {"project": "p"}
+        assert report["metrics"]["chapters_total"]["value"] == 4
+        assert report["metrics"]["latency_seconds"]["mean"] == pytest.approx(0.3)
+        assert report["metrics"]["latency_seconds"]["p95"] is not None
+
+    def test_prometheus_text_format(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.counter("chapters_total", "Chapters done").inc(2)
+        histogram = registry.histogram("latency_seconds", buckets=[1.0, 5.0])
+        histogram.observe(0.5)
+        histogram.observe(3.0)
+
+        path = registry.write_prometheus(tmp_path / "act.prom")
+        text = path.read_text(encoding="utf-8")
+
+        assert "# HELP act_chapters_total Chapters done" in text
+        assert "# TYPE act_chapters_total counter" in text
+        assert "act_chapters_total 2" in text
+        assert 'act_latency_seconds_bucket{le="1"} 1' in text
+        assert 'act_latency_seconds_bucket{le="5"} 2' in text
+        assert 'act_latency_seconds_bucket{le="+Inf"} 2' in text
+        assert "act_latency_seconds_count 2" in text
+        assert not (tmp_path / "act.prom.tmp").exists()
+
+    def test_get_metrics_is_singleton(self):
+        assert get_metrics() is get_metrics()
@@ -307,6 +307,38 @@ class TestChapterManager:
         assert summary["converted"] == 1
         assert summary["failed"] == 1
     
+    def test_status_buckets_follow_status_changes(self):
+        """Test status buckets stay current however status is changed."""
+        manager = ChapterManager()
+        for i in range(1, 6):
+            manager.add_chapter(i, f"https://example.com/{i}")
+        
+        manager.update_chapter_status(2, ChapterStatus.FAILED)
+        manager.update_chapter_files(3, audio_file_path="/path/to/audio.mp3")
+        manager.get_chapter(4).status = ChapterStatus.SKIPPED
+        
+        assert [ch.number for ch in manager.get_pending_chapters()] == [1, 5]
+        assert manager.count_by_status(ChapterStatus.FAILED) == 1
+        assert manager.count_by_status(ChapterStatus.CONVERTED) == 1
+        assert manager.get_status_summary()["skipped"] == 1
+        assert sum(manager.get_status_summary().values()) == 5
+    
+    def test_content_released_when_text_saved(self):
+        """Test chapter content is dropped once saved to a text file."""
+        manager = ChapterManager()
+        manager.add_chapter(1, "https://example.com/1")
+        manager.update_chapter_content(1, "Chapter content")
+        
+        manager.update_chapter_files(1, text_file_path="/path/to/text.txt")
+        
+        assert manager.get_chapter(1).content is None
+    
+    def test_chapter_uses_slots(self):
+        """Test Chapter records don't carry a per-instance __dict__."""
+        chapter = Chapter(number=1, url="https://example.com/1")
+        
+        assert not hasattr(chapter, "__dict__")
+    
     def test_to_dict(self):
         """Test converting manager to dictionary."""
         manager = ChapterManager()
@@ -11,7 +11,7 @@ from unittest.mock import Mock, patch, MagicMock
 
 from processor.context import ProcessingContext
 from processor.scraping_coordinator import ScrapingCoordinator
-from processor.conversion_coordinator import ConversionCoordinator
+from processor.conversion_coordinator import ConversionCoordinator, ChapterPlan
 from processor.audio_post_processor import AudioPostProcessor
 
 
@@ -327,6 +327,35 @@ class TestConversionCoordinator:
 
         assert first_missing == 2
 
+    def test_plan_chapters(self, coordinator, tmp_path):
+        """Test classifying chapters as done, text-only or missing."""
+        chapters = []
+        for num in (1, 2, 3):
+            chapter = Mock()
+            chapter.number = num
+            chapters.append(chapter)
+
+        coordinator.file_manager.audio_file_exists = Mock(side_effect=lambda num: num == 1)
+        coordinator.file_manager.find_text_file = Mock(
+            side_effect=lambda num: tmp_path / "chapter_0002.txt" if num == 2 else None
+        )
+
+        plans = coordinator.plan_chapters(chapters)
+
+        assert plans == {1: ChapterPlan.DONE, 2: ChapterPlan.TEXT_ONLY, 3: ChapterPlan.MISSING}
+
+    def test_load_saved_text(self, coordinator, tmp_path):
+        """Test reusing saved text strips the header and recovers the title."""
+        text_file = tmp_path / "chapter_0002_The Return.txt"
+        text_file.write_text("Chapter 2\n\nSaved body text.", encoding="utf-8")
+        coordinator.file_manager.find_text_file = Mock(return_value=text_file)
+
+        content, title, path = coordinator.load_saved_text(2)
+
+        assert content == "Saved body text."
+        assert title == "The Return"
+        assert path == text_file
+
 
 class TestAudioPostProcessor:
     """Tests for AudioPostProcessor class."""
@@ -423,4 +452,62 @@ class TestAudioPostProcessor:
 
         success = processor.merge_audio_files()
 
-        assert success is True  # Should return True but not merge
\ No newline at end of file
+        assert success is True  # Should return True but not merge
+
+    def test_merge_in_batches_parallel_isolates_failures(self, processor, context):
+        """A failing batch does not stop the others, progress is reported per batch and workers get the merger's config."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        statuses = []
+        context.on_status_change = statuses.append
+        processor.file_manager.get_audio_dir = Mock(return_value=Path("audio_dir"))
+        files = [Path(f"chapter_{i:03d}.mp3") for i in range(1, 6)]
+        merged_batches = []
+        audio_merger = Mock()
+
+        def fake_merge(batch_files, output_path, config):
+            assert config is audio_merger.config
+            if batch_files[0].name == "chapter_003.mp3":
+                raise RuntimeError("decode error")
+            merged_batches.append(output_path.name)
+            return True, 0.01
+
+        with patch('processor.audio_post_processor.ProcessPoolExecutor', ThreadPoolExecutor), \
+                patch('processor.audio_post_processor.ACTLogger.configure_worker_process') as configure_worker, \
+                patch('processor.audio_post_processor._merge_batch', side_effect=fake_merge), \
+                patch.object(processor, '_get_merge_workers', return_value=4):
+            success = processor._merge_in_batches(audio_merger, files, {'type': 'batched_mp3', 'batch_size': 2})
+
+        assert success is False
+        assert configure_worker.called
+        assert sorted(merged_batches) == [
+            "Test Novel_chapters_0001-0002.mp3",
+            "Test Novel_chapters_0005-0005.mp3",
+        ]
+        assert len(statuses) == 3
+        assert statuses[-1] == "Merged 3/3 audio batches"
+
+    def test_merge_in_batches_single_worker_uses_given_merger(self, processor):
+        """With one worker, batches are merged in-process and failures are isolated."""
+        processor.file_manager.get_audio_dir = Mock(return_value=Path("audio_dir"))
+        files = [Path(f"chapter_{i:03d}.mp3") for i in range(1, 4)]
+        audio_merger = MagicMock()
+        audio_merger.merge_audio_chunks.side_effect = [RuntimeError("boom"), True]
+
+        with patch('processor.audio_post_processor.ProcessPoolExecutor') as mock_pool, \
+                patch.object(processor, '_get_merge_workers', return_value=1):
+            success = processor._merge_in_batches(audio_merger, files, {'type': 'batched_mp3', 'batch_size': 2})
+
+        assert success is False
+        assert audio_merger.merge_audio_chunks.call_count == 2
+        mock_pool.assert_not_called()
+
+    def test_default_merge_workers_are_capped(self, processor):
+        """With tts.merge_workers unset, the pool stays small on many-core machines; an explicit value is honoured."""
+        config = Mock()
+        config.get.return_value = 0
+        with patch('processor.audio_post_processor.get_config', return_value=config), \
+                patch('processor.audio_post_processor.os.cpu_count', return_value=16):
+            assert processor._get_merge_workers() == 4
+            config.get.return_value = 8
+            assert processor._get_merge_workers() == 8
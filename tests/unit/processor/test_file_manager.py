@@ -156,6 +156,80 @@ class TestFileManager:
         
         assert file_manager.audio_file_exists(1)
     
+    def test_save_audio_file_move(self, file_manager):
+        """Test committing a temp file from the audio dir with a rename."""
+        temp_audio = file_manager.new_audio_temp_path(1)
+        assert temp_audio.parent == file_manager.audio_temp_dir
+        assert temp_audio.parent.parent == file_manager.audio_dir
+        temp_audio.write_bytes(b"data")
+        
+        dest = file_manager.save_audio_file(1, temp_audio, move=True)
+        
+        assert dest.read_bytes() == b"data"
+        assert not temp_audio.exists()
+        assert file_manager.list_audio_files() == [dest]
+    
+    def test_save_audio_file_move_across_filesystems(self, file_manager, temp_dir):
+        """Test move falls back to copy when rename crosses filesystems."""
+        import errno
+        import os
+        temp_audio = temp_dir / "other_fs.mp3"
+        temp_audio.write_bytes(b"data")
+        real_replace = os.replace
+        
+        def replace(src, dst):
+            if Path(src) == temp_audio:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return real_replace(src, dst)
+        
+        with patch('processor.file_manager.os.replace', side_effect=replace):
+            dest = file_manager.save_audio_file(1, temp_audio, move=True)
+        
+        assert dest.read_bytes() == b"data"
+        assert not temp_audio.exists()
+        assert list(file_manager.audio_dir.glob(".chapter_*")) == []
+    
+    def test_saves_record_bytes_written(self, file_manager):
+        """Test saved text and audio sizes are added to the metrics counters."""
+        from core.metrics import get_metrics
+        metrics = get_metrics()
+        text_before = metrics.counter("files_text_bytes_written_total").value
+        audio_before = metrics.counter("files_audio_bytes_written_total").value
+
+        text_path = file_manager.save_text_file(1, "Some content")
+        temp_audio = file_manager.new_audio_temp_path(1)
+        temp_audio.write_bytes(b"12345")
+        file_manager.save_audio_file(1, temp_audio, move=True)
+
+        assert metrics.counter("files_text_bytes_written_total").value - text_before == text_path.stat().st_size
+        assert metrics.counter("files_audio_bytes_written_total").value - audio_before == 5
+
+    def test_synthesis_temp_files_do_not_rescan_the_index(self, file_manager):
+        """Writing and removing a synthesis temp file leaves the audio index snapshot valid."""
+        temp_audio = file_manager.new_audio_temp_path(1)
+        temp_audio.write_bytes(b"data")
+        file_manager.save_audio_file(1, temp_audio, move=True)
+
+        with patch.object(file_manager.file_index.audio, '_scan') as scan:
+            temp_audio = file_manager.new_audio_temp_path(2)
+            temp_audio.write_bytes(b"partial")
+            file_manager.discard_audio_temp_files(2)
+            assert file_manager.audio_file_exists(1)
+
+        scan.assert_not_called()
+
+    def test_new_audio_temp_path_unique(self, file_manager):
+        """Test temp paths are unique per attempt and discarded by chapter."""
+        first = file_manager.new_audio_temp_path(1)
+        second = file_manager.new_audio_temp_path(1)
+        assert first != second
+        assert first.suffix == ".mp3"
+        
+        first.write_bytes(b"partial")
+        file_manager.discard_audio_temp_files(1)
+        assert not first.exists()
+        assert not file_manager.audio_file_exists(1)
+    
     def test_list_text_files(self, file_manager):
         """Test listing text files."""
         assert len(file_manager.list_text_files()) == 0
@@ -0,0 +1,90 @@
+"""
+Unit tests for ProgressEventBus.
+
+Tests coalescing of progress/chapter events, bounded-rate background
+delivery and that publishers are never blocked by slow callbacks.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+# Path setup is handled by conftest.py
+from processor.progress_events import ProgressEventBus
+
+
+class TestProgressEventBus:
+    """Tests for ProgressEventBus class."""
+
+    def test_flush_coalesces_per_chapter(self):
+        """Only the latest update per chapter is delivered."""
+        on_chapter_update = Mock()
+        on_progress = Mock()
+        bus = ProgressEventBus(on_progress=on_progress, on_chapter_update=on_chapter_update,
+                               flush_interval=60.0)
+        bus._schedule = Mock()  # Deliver only on explicit flush
+
+        bus.publish_chapter_update(1, "scraping", "")
+        bus.publish_chapter_update(2, "scraping", "")
+        bus.publish_chapter_update(1, "completed", "done")
+        for i in range(10):
+            bus.publish_progress(i / 10)
+
+        bus.flush()
+
+        assert [c.args for c in on_chapter_update.call_args_list] == [
+            (2, "scraping", ""),
+            (1, "completed", "done"),
+        ]
+        on_progress.assert_called_once_with(0.9)
+
+    def test_background_delivery(self):
+        """Events are delivered without an explicit flush."""
+        delivered = threading.Event()
+        bus = ProgressEventBus(on_status_change=lambda s: delivered.set(), flush_interval=0.01)
+
+        bus.publish_status("processing")
+
+        assert delivered.wait(timeout=5)
+        bus.close()
+
+    def test_publish_does_not_block_on_slow_callback(self):
+        """A slow UI callback doesn't stall the publishing worker."""
+        release = threading.Event()
+        bus = ProgressEventBus(on_progress=lambda p: release.wait(5), flush_interval=0.01)
+
+        start = time.monotonic()
+        for i in range(100):
+            bus.publish_progress(i / 100)
+        elapsed = time.monotonic() - start
+
+        release.set()
+        bus.close()
+        assert elapsed < 1.0
+
+    def test_close_delivers_pending(self):
+        """close() performs a final flush."""
+        on_progress = Mock()
+        bus = ProgressEventBus(on_progress=on_progress, flush_interval=60.0)
+        bus._schedule = Mock()
+        bus.publish_progress(1.0)
+
+        bus.close()
+
+        on_progress.assert_called_once_with(1.0)
+
+    def test_callback_errors_are_contained(self):
+        """A failing callback doesn't prevent other deliveries."""
+        on_progress = Mock()
+        bus = ProgressEventBus(
+            on_progress=on_progress,
+            on_status_change=Mock(side_effect=RuntimeError("boom")),
+            flush_interval=60.0
+        )
+        bus._schedule = Mock()
+        bus.publish_status("processing")
+        bus.publish_progress(0.5)
+
+        bus.flush()
+
+        on_progress.assert_called_once_with(0.5)
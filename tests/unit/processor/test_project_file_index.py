@@ -0,0 +1,110 @@
+"""
+Unit tests for ProjectFileIndex.
+
+Tests directory snapshotting, chapter lookups, incremental updates
+on FileManager writes and mtime-based revalidation.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Path setup is handled by conftest.py
+from processor.file_manager import FileManager
+from processor.project_file_index import ProjectFileIndex
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    text_dir = tmp_path / "scraps"
+    audio_dir = tmp_path / "audio"
+    text_dir.mkdir()
+    audio_dir.mkdir()
+    return text_dir, audio_dir
+
+
+def _bump_mtime(directory: Path) -> None:
+    """Move a directory's mtime forward so coarse-grained filesystems see a change."""
+    stat = os.stat(directory)
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestProjectFileIndex:
+    """Tests for ProjectFileIndex class."""
+
+    def test_finds_standard_and_titled_files(self, dirs):
+        """Standard names are preferred over titled names."""
+        text_dir, audio_dir = dirs
+        (audio_dir / "chapter_0001_Title.mp3").write_bytes(b"a")
+        (audio_dir / "chapter_0001.mp3").write_bytes(b"abc")
+        (audio_dir / "chapter_0002_Only Title.mp3").write_bytes(b"ab")
+        (text_dir / "chapter_0003.txt").write_text("text")
+
+        index = ProjectFileIndex(text_dir, audio_dir)
+
+        assert index.find_audio(1).path.name == "chapter_0001.mp3"
+        assert index.find_audio(1).size == 3
+        assert index.find_audio(2).path.name == "chapter_0002_Only Title.mp3"
+        assert index.find_audio(3) is None
+        assert index.find_text(3) is not None
+        assert index.audio_chapters() == [1, 2]
+
+    def test_ignores_non_padded_names(self, dirs):
+        """chapter_00012 is not treated as chapter 12."""
+        text_dir, audio_dir = dirs
+        (audio_dir / "chapter_00012.mp3").write_bytes(b"a")
+        (audio_dir / "chapter_12345.mp3").write_bytes(b"a")
+
+        index = ProjectFileIndex(text_dir, audio_dir)
+
+        assert index.find_audio(12) is None
+        assert index.find_audio(12345) is not None
+
+    def test_external_changes_trigger_rescan(self, dirs):
+        """A changed directory mtime revalidates the snapshot."""
+        text_dir, audio_dir = dirs
+        index = ProjectFileIndex(text_dir, audio_dir)
+        assert index.find_audio(5) is None
+
+        (audio_dir / "chapter_0005.mp3").write_bytes(b"a")
+        _bump_mtime(audio_dir)
+
+        assert index.find_audio(5) is not None
+
+    def test_unchanged_directory_is_not_rescanned(self, dirs):
+        """Lookups reuse the snapshot while the directory is unchanged."""
+        text_dir, audio_dir = dirs
+        for num in range(1, 50):
+            (audio_dir / f"chapter_{num:04d}.mp3").write_bytes(b"a")
+        index = ProjectFileIndex(text_dir, audio_dir)
+        index.find_audio(1)
+
+        with patch("processor.project_file_index.os.scandir") as mock_scandir:
+            assert all(index.find_audio(num) for num in range(1, 50))
+            mock_scandir.assert_not_called()
+
+
+class TestFileManagerIndexing:
+    """Tests that FileManager keeps its index current."""
+
+    @pytest.fixture
+    def file_manager(self, tmp_path):
+        with patch('processor.file_manager.get_config'):
+            return FileManager("test_project", base_output_dir=tmp_path)
+
+    def test_saves_update_index_without_rescan(self, file_manager, tmp_path):
+        """Files saved through FileManager are indexed in place."""
+        assert not file_manager.audio_file_exists(1)
+        assert not file_manager.text_file_exists(1)
+
+        temp_audio = tmp_path / "temp.mp3"
+        temp_audio.write_bytes(b"data")
+
+        with patch("processor.project_file_index.os.scandir") as mock_scandir:
+            file_manager.save_audio_file(1, temp_audio, "First")
+            file_manager.save_text_file(1, "content", "First")
+            assert file_manager.audio_file_exists(1)
+            assert file_manager.find_text_file(1).name == "chapter_0001_First.txt"
+            mock_scandir.assert_not_called()
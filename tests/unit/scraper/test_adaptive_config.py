@@ -0,0 +1,187 @@
+"""
+Unit tests for AdaptiveConfigManager persistence.
+
+Tests lazy per-domain loading, delayed batched flushing into the
+SQLite profile store, and migration of legacy per-domain JSON files.
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+from src.scraper.adaptive_config import AdaptiveConfigManager
+
+
+@pytest.fixture
+def manager(temp_dir):
+    """Manager with a long flush delay so flushes are explicit in tests."""
+    mgr = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=60.0)
+    yield mgr
+    mgr.flush()
+
+
+def _stored_domains(manager):
+    with sqlite3.connect(manager.store_path) as conn:
+        return {row[0] for row in conn.execute("SELECT domain FROM profiles")}
+
+
+class TestAdaptiveConfigPersistence:
+    """Tests for profile persistence behaviour."""
+
+    def test_updates_are_deferred_until_flush(self, manager):
+        """Profile updates mark dirty instead of writing immediately."""
+        manager.update_profile("https://www.example.org/novel", "ajax", True, 0.5)
+        manager.add_pagination_pattern("https://example.org/novel", "?page={n}")
+
+        assert _stored_domains(manager) == set()
+        manager.flush()
+        assert _stored_domains(manager) == {"example.org"}
+
+    def test_profiles_load_lazily(self, manager, temp_dir):
+        """A new manager loads a domain only when it is requested."""
+        manager.update_profile("https://example.org/novel", "ajax", True, 0.5)
+        manager.flush()
+
+        reloaded = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=60.0)
+        assert reloaded.site_profiles == {}
+
+        profile = reloaded.get_site_profile("https://example.org/other")
+        assert profile.total_attempts == 1
+        assert profile.last_successful_strategy == "ajax"
+
+    def test_legacy_json_profile_is_migrated(self, temp_dir):
+        """Legacy per-domain JSON files are read and moved into the store."""
+        legacy = {"domain": "legacy.com", "total_attempts": 3, "successful_attempts": 2}
+        (temp_dir / "legacy_com.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+        manager = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=60.0)
+        profile = manager.get_site_profile("https://legacy.com/toc")
+        assert profile.total_attempts == 3
+
+        manager.flush()
+        assert _stored_domains(manager) == {"legacy.com"}
+
+    def test_delayed_flush_runs_in_background(self, temp_dir):
+        """Dirty profiles are flushed by the background timer."""
+        manager = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=0.01)
+        manager.update_profile("https://example.org/novel", "javascript", True, 0.1)
+
+        timer = manager._flush_timer
+        assert timer is not None
+        timer.join(timeout=5)
+        assert _stored_domains(manager) == {"example.org"}
+
+    def test_later_writes_do_not_postpone_the_flush(self, manager):
+        """Writes arriving before the flush reuse the pending timer instead of restarting it."""
+        manager.update_profile("https://example.org/novel", "ajax", True, 0.5)
+        timer = manager._flush_timer
+
+        manager.update_profile("https://example.org/novel", "ajax", True, 0.4)
+
+        assert manager._flush_timer is timer
+
+    def test_flush_waits_for_a_profile_update_in_progress(self, manager):
+        """A flush never serializes a profile while another thread is updating it."""
+        profile = manager.get_site_profile("https://example.org/novel")
+        updating, release = threading.Event(), threading.Event()
+        original_update = profile.update_success_rate
+
+        def slow_update(*args):
+            updating.set()
+            release.wait(timeout=5)
+            original_update(*args)
+
+        profile.update_success_rate = slow_update
+        writer = threading.Thread(target=manager.update_profile,
+                                  args=("https://example.org/novel", "ajax", True, 0.5))
+        writer.start()
+        updating.wait(timeout=5)
+        flusher = threading.Thread(target=manager.flush)
+        flusher.start()
+        flusher.join(timeout=0.2)
+
+        assert flusher.is_alive()
+        release.set()
+        writer.join(timeout=5)
+        flusher.join(timeout=5)
+        with sqlite3.connect(manager.store_path) as conn:
+            data = json.loads(conn.execute("SELECT data FROM profiles").fetchone()[0])
+        assert data["total_attempts"] == 1
+
+    def test_cleanup_old_profiles(self, manager):
+        """Stale profiles are removed from memory and the store."""
+        profile = manager.get_site_profile("https://old.com/toc")
+        profile.last_updated = 0
+        manager._save_profile("old.com")
+        manager.flush()
+
+        manager.cleanup_old_profiles(max_age_days=1)
+        assert "old.com" not in manager.site_profiles
+        assert _stored_domains(manager) == set()
+
+
+class TestSettleTimings:
+    """Tests for learned DOM settle timings."""
+
+    def test_defaults_without_observations(self, manager):
+        """Unknown sites use the configured default settle timings."""
+        options = manager.get_settle_options("https://example.org/novel")
+        assert options == {"quietMs": 300, "timeoutMs": 3000, "maxWaitMs": 15000}
+
+    def test_timeout_follows_slowest_arrival(self, manager):
+        """The timeout scales with the slowest observed link arrival, within bounds."""
+        manager.record_settle_times("https://example.org/novel", [120, 1500, None])
+        assert manager.get_settle_options("https://example.org/novel")["timeoutMs"] == 4500
+
+        manager.record_settle_times("https://example.org/novel", [9000])
+        # Moving average: 1500 * 0.7 + 9000 * 0.3 = 3750, x3 capped at the maximum
+        assert manager.get_settle_options("https://example.org/novel")["timeoutMs"] == 11250
+
+        manager.record_settle_times("https://slow.example.com/toc", [20000])
+        assert manager.get_settle_options("https://slow.example.com/toc")["timeoutMs"] == 15000
+
+    def test_timeout_never_shrinks_below_default(self, manager):
+        """Fast sites keep the default timeout, so late links are not cut off for good."""
+        manager.record_settle_times("https://fast.example.com/toc", [20, 90])
+        options = manager.get_settle_options("https://fast.example.com/toc")
+
+        assert options["timeoutMs"] == 3000
+        assert options["quietMs"] == 150
+
+    def test_settle_time_is_persisted(self, manager, temp_dir):
+        """Learned settle timings survive a reload."""
+        manager.record_settle_times("https://example.org/novel", [1800])
+        manager.flush()
+
+        reloaded = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=60.0)
+        assert reloaded.get_settle_options("https://example.org/novel")["timeoutMs"] == 5400
+
+
+class TestExtractionSelectors:
+    """Tests for learned chapter content/title selectors."""
+
+    def test_selector_is_confirmed_after_repeated_wins(self, manager):
+        """A selector is only returned once it won CHAPTER_SELECTOR_MIN_HITS chapters in a row."""
+        url = "https://example.org/novel/chapter-1"
+        manager.record_extraction_selector(url, "content", "div.chapter-c")
+        assert manager.get_extraction_selector(url, "content") is None
+
+        manager.record_extraction_selector(url, "content", "div.chapter-c")
+        assert manager.get_extraction_selector(url, "content") == "div.chapter-c"
+
+        manager.record_extraction_selector(url, "content", "div#content")
+        assert manager.get_extraction_selector(url, "content") is None
+
+    def test_learned_selectors_are_persisted(self, manager, temp_dir):
+        """Learned selectors survive a reload; a forgotten selector is gone."""
+        url = "https://example.org/novel/chapter-1"
+        for _ in range(2):
+            manager.record_extraction_selector(url, "content", "div.chapter-c")
+            manager.record_extraction_selector(url, "title", "h1")
+        manager.forget_extraction_selector(url, "title", "h1")
+        manager.flush()
+
+        reloaded = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=60.0)
+        assert reloaded.get_extraction_selector(url, "content") == "div.chapter-c"
+        assert reloaded.get_extraction_selector(url, "title") is None
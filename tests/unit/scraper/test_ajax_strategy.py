@@ -0,0 +1,92 @@
+"""
+Unit tests for AJAX endpoint probing.
+
+Tests ranking of endpoints by the site's endpoint history, concurrent
+probing and stopping once the requested chapter range is covered.
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scraper.extractors.url_extractor_session import SessionManager
+from scraper.strategies.ajax_strategy import AjaxStrategy
+
+BASE = "https://novel.example.com"
+
+
+def _chapters(first, last):
+    return [f"{BASE}/novel/chapter-{n}" for n in range(first, last + 1)]
+
+
+@pytest.fixture
+def adaptive_config():
+    """Site profile stand-in so tests never touch the real profile store."""
+    config = Mock()
+    config.get_api_endpoints.return_value = []
+    with patch("scraper.strategies.ajax_strategy.get_adaptive_config_manager", return_value=config):
+        yield config
+
+
+@pytest.fixture
+def strategy(adaptive_config):
+    return AjaxStrategy(BASE, SessionManager(min_request_delay=0))
+
+
+class TestAjaxEndpointProbing:
+    """Tests for AjaxStrategy endpoint ranking and probing."""
+
+    def test_known_endpoints_are_ranked_first(self, strategy, adaptive_config):
+        """Endpoints matching the history go first, most recent first, ignoring novel IDs."""
+        adaptive_config.get_api_endpoints.return_value = [
+            f"{BASE}/api/novel/77/chapters",
+            f"{BASE}/ajax/chapter-list?novelId=12",
+        ]
+        endpoints = [
+            "/api/chapters?novel_id=12",
+            "/api/novel/12/chapters",
+            "/ajax/chapter-list?novelId=12",
+        ]
+
+        assert strategy._rank_endpoints(endpoints) == [
+            "/ajax/chapter-list?novelId=12",
+            "/api/novel/12/chapters",
+            "/api/chapters?novel_id=12",
+        ]
+
+    def test_probing_stops_once_range_is_covered(self, strategy):
+        """Endpoints waiting for a slot are skipped once the range is covered."""
+        responses = {"/first": _chapters(1, 60), "/second": _chapters(61, 120)}
+        tried = []
+
+        def try_endpoint(endpoint, novel_id):
+            tried.append(endpoint)
+            return responses.get(endpoint, [])
+
+        strategy.chapter_range = (1, 120)
+        endpoints = ["/first", "/second", "/third", "/fourth"]
+        with patch("scraper.strategies.ajax_strategy.AJAX_PROBE_CONCURRENCY", 1), \
+                patch.object(strategy, "_try_endpoint", side_effect=try_endpoint):
+            urls, successful = asyncio.run(strategy._probe_endpoints(endpoints, None, None))
+
+        assert tried == ["/first", "/second"]
+        assert urls == _chapters(1, 120)
+        assert successful == [f"{BASE}/first", f"{BASE}/second"]
+
+    def test_slow_endpoints_are_probed_concurrently(self, strategy):
+        """Hanging endpoints overlap instead of costing their timeouts in series."""
+        def try_endpoint(endpoint, novel_id):
+            time.sleep(0.3)
+            return []
+
+        endpoints = ["/a", "/b", "/c"]
+        with patch("scraper.strategies.ajax_strategy.AJAX_PROBE_CONCURRENCY", 3), \
+                patch.object(strategy, "_try_endpoint", side_effect=try_endpoint):
+            start = time.perf_counter()
+            urls, successful = asyncio.run(strategy._probe_endpoints(endpoints, None, None))
+            elapsed = time.perf_counter() - start
+
+        assert (urls, successful) == ([], [])
+        assert elapsed < 0.8
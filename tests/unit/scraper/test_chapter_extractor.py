@@ -9,9 +9,18 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch, call
 from bs4 import BeautifulSoup
 
+from src.scraper.adaptive_config import AdaptiveConfigManager
 from src.scraper.extractors.chapter_extractor import ChapterExtractor
 
 
+@pytest.fixture(autouse=True)
+def adaptive_config(temp_dir):
+    """Isolated site profiles so learned selectors never leak between tests."""
+    manager = AdaptiveConfigManager(config_dir=str(temp_dir), flush_delay=60.0)
+    with patch('src.scraper.extractors.chapter_extractor.get_adaptive_config_manager', return_value=manager):
+        yield manager
+
+
 class TestChapterExtractorInit:
     """Test ChapterExtractor initialization."""
 
@@ -386,6 +395,112 @@ class TestExtractContent:
 
 
 
+class TestSelectorLearning:
+    """Test per-site learning of content and title selectors."""
+
+    CHAPTER_HTML = (
+        '<html><body><h2 class="chapter-title">Chapter {n}: Arrival</h2>'
+        '<div class="chapter-content"><p>This is the opening paragraph of chapter {n}, long enough.</p></div>'
+        '<div class="comments"><p>First comment on this chapter, it was great!</p></div></body></html>'
+    )
+
+    def _extract(self, extractor, n, html=None):
+        soup = BeautifulSoup(html or self.CHAPTER_HTML.format(n=n), 'html.parser')
+        url = f"https://www.example.com/novel/chapter-{n}"
+        return extractor._extract_content(soup, None, url), extractor._extract_title(soup, url)
+
+    def test_selectors_are_learned_and_tried_first(self, adaptive_config):
+        """After the first chapters the winning selectors are tried before the full list."""
+        extractor = ChapterExtractor("https://example.com")
+        for n in (1, 2):
+            self._extract(extractor, n)
+
+        assert adaptive_config.get_extraction_selector("https://example.com/", "content") == "div.chapter-content"
+        assert adaptive_config.get_extraction_selector("https://example.com/", "title") == "h2.chapter-title"
+
+        with patch('src.scraper.extractors.chapter_extractor.CONTENT_SELECTORS', []), \
+             patch('src.scraper.extractors.chapter_extractor.TITLE_SELECTORS', []):
+            content, title = self._extract(extractor, 3)
+
+        assert content == "This is the opening paragraph of chapter 3, long enough."
+        assert title == "Arrival"
+
+    def test_stale_selector_falls_back_to_full_search(self, adaptive_config):
+        """A learned selector that stops matching is forgotten and the full search runs."""
+        extractor = ChapterExtractor("https://example.com")
+        for n in (1, 2):
+            self._extract(extractor, n)
+
+        redesigned = (
+            '<html><body><h1 class="chapter-title">Chapter 3: Departure</h1>'
+            '<div id="chapter-c"><p>The site moved its chapter text into a new container.</p></div></body></html>'
+        )
+        content, title = self._extract(extractor, 3, redesigned)
+
+        assert content == "The site moved its chapter text into a new container."
+        assert title == "Departure"
+        profile = adaptive_config.get_site_profile("https://example.com/")
+        assert profile.extraction_selectors["content"] == {"selector": "div#chapter-c", "hits": 1}
+        assert adaptive_config.get_extraction_selector("https://example.com/", "content") is None
+
+
+class TestStreamingFetch:
+    """Test streamed chapter downloads once the site's selectors are learned."""
+
+    URL = "https://example.com/novel/chapter-3"
+
+    def _extractor(self, adaptive_config, body):
+        for _ in range(2):
+            adaptive_config.record_extraction_selector(self.URL, "content", "div.chapter-content")
+            adaptive_config.record_extraction_selector(self.URL, "title", "h2.chapter-title")
+        response = Mock(status_code=200, headers={"content-type": "text/html; charset=utf-8"})
+        response.sent = 0
+
+        def iter_content(chunk_size=1):
+            for start in range(0, len(body), chunk_size):
+                response.sent += 1
+                yield body[start:start + chunk_size]
+
+        response.iter_content.side_effect = iter_content
+        extractor = ChapterExtractor("https://example.com", delay=0.0)
+        extractor._session = Mock()
+        extractor._session.get.return_value = response
+        return extractor, response
+
+    def test_download_stops_after_chapter_body(self, adaptive_config):
+        """The comment section after the chapter is never read."""
+        body = (
+            '<html><body><h2 class="chapter-title">Chapter 3: Storm</h2>'
+            '<div class="chapter-content"><p>Rain hammered the windows of the old house all night.</p></div>'
+            + '<div class="comment"><p>Waiting for the next chapter already!</p></div>' * 5000 + '</body></html>'
+        ).encode("utf-8")
+        extractor, response = self._extractor(adaptive_config, body)
+
+        with patch('src.scraper.extractors.chapter_extractor.clean_text', side_effect=lambda text: text):
+            result = extractor._scrape_with_requests(self.URL)
+
+        assert result == ("Rain hammered the windows of the old house all night.", "Storm", None)
+        assert extractor._session.get.call_args.kwargs["stream"] is True
+        assert response.sent == 1
+        response.close.assert_called_once()
+
+    def test_failed_validation_reads_full_page(self, adaptive_config):
+        """An empty learned container falls back to the full page and the full search."""
+        body = (
+            '<html><body><h2 class="chapter-title">Chapter 3: Storm</h2><div class="chapter-content"></div>'
+            '<div id="chapter-c"><p>The text now loads into a different container on this site.</p></div>'
+            + '<p>filler</p>' * 5000 + '</body></html>'
+        ).encode("utf-8")
+        extractor, response = self._extractor(adaptive_config, body)
+
+        with patch('src.scraper.extractors.chapter_extractor.clean_text', side_effect=lambda text: text):
+            result = extractor._scrape_with_requests(self.URL)
+
+        assert result == ("The text now loads into a different container on this site.", "Storm", None)
+        assert extractor._session.get.call_count == 1
+        assert response.sent > 1
+
+
 class TestPlaywrightScraping:
     """Test _scrape_with_playwright method."""
 
@@ -464,6 +579,34 @@ class TestPlaywrightScraping:
         assert result[2] is not None
         assert "Cloudflare challenge" in result[2]
 
+    @patch('src.scraper.extractors.chapter_extractor.HAS_PLAYWRIGHT', True)
+    @patch('src.scraper.extractors.chapter_extractor.HAS_BS4', True)
+    @patch('src.scraper.extractors.chapter_extractor.sync_playwright')
+    def test_challenge_page_leaves_learned_selectors(self, mock_sync_playwright, adaptive_config):
+        """A challenge page neither forgets the learned selectors nor records its own."""
+        extractor = ChapterExtractor("https://example.com")
+        url = "https://example.com/chapter/1"
+        adaptive_config.record_extraction_selector(url, "content", "div.chapter-content")
+        adaptive_config.record_extraction_selector(url, "title", "h2.chapter-title")
+
+        mock_page = Mock()
+        mock_page.content.return_value = (
+            '<html><body><h1>Just a moment...</h1>'
+            '<div id="content"><p>Checking your browser before accessing example.com.</p></div></body></html>'
+        )
+        mock_browser = Mock()
+        mock_browser.new_context.return_value.new_page.return_value = mock_page
+        mock_sync_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
+
+        result = extractor._scrape_with_playwright(url)
+
+        assert "Cloudflare challenge" in result[2]
+        profile = adaptive_config.get_site_profile(url)
+        assert profile.extraction_selectors == {
+            "content": {"selector": "div.chapter-content", "hits": 1},
+            "title": {"selector": "h2.chapter-title", "hits": 1},
+        }
+
     @patch('src.scraper.extractors.chapter_extractor.HAS_PLAYWRIGHT', True)
     @patch('src.scraper.extractors.chapter_extractor.HAS_BS4', True)
     @patch('src.scraper.extractors.chapter_extractor.sync_playwright')
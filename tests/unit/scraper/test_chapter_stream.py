@@ -0,0 +1,105 @@
+"""
+Unit tests for the streaming chapter page reader.
+
+Tests simple selector matching, stopping once the watched elements have
+closed, and reading the rest of the page for the full-fetch fallback
+(including pages whose undeclared encoding is not UTF-8).
+"""
+
+from src.scraper.extractors.chapter_stream import ChapterStream, SimpleSelector, is_streamable
+
+PAGE = (
+    '<html><head><meta charset="utf-8"><title>Novel</title></head><body>'
+    '<h1 class="chapter-title">Chapter 7: Night</h1>'
+    '<div class="chapter-content"><div class="ad"></div><p>Première ligne du chapitre.</p></div>'
+    '<div id="comments">' + "<p>Great chapter!</p>" * 2000 + "</div></body></html>"
+).encode("utf-8")
+
+
+class _StreamedResponse:
+    """Response stand-in for stream=True that records how far it was read."""
+
+    def __init__(self, body, headers=None):
+        self.body = body
+        self.headers = headers or {}
+        self.bytes_sent = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            chunk = self.body[start:start + chunk_size]
+            self.bytes_sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestSimpleSelector:
+    """Tests for SimpleSelector and is_streamable."""
+
+    def test_matches_tag_class_and_id(self):
+        selector = SimpleSelector.parse("div.chapter-content")
+
+        assert selector.matches("div", [("class", "text chapter-content")])
+        assert not selector.matches("section", [("class", "chapter-content")])
+        assert SimpleSelector.parse("#chapter-c").matches("article", [("id", "chapter-c")])
+        assert SimpleSelector.parse("h1").matches("h1", [])
+
+    def test_complex_selectors_are_not_streamable(self):
+        assert is_streamable("div#text.chapter")
+        assert not is_streamable("div.reader > p")
+        assert not is_streamable("a[href*=chapter]")
+        assert not is_streamable(None)
+
+
+class TestChapterStream:
+    """Tests for ChapterStream."""
+
+    def test_stops_after_content_and_title_close(self):
+        """Reading stops at the chunk holding the content's end tag; comments are never downloaded."""
+        response = _StreamedResponse(PAGE)
+        stream = ChapterStream(response, "div.chapter-content", "h1.chapter-title", chunk_size=64)
+
+        prefix = stream.read_until_complete()
+
+        assert prefix is not None
+        assert "Première ligne du chapitre.</p></div>" in prefix
+        assert response.bytes_sent < 400 < len(PAGE)
+
+    def test_read_all_continues_the_same_response(self):
+        """The full-page fallback reads the rest of the stream instead of fetching again."""
+        response = _StreamedResponse(PAGE)
+        stream = ChapterStream(response, "div.chapter-content", "h1.chapter-title", chunk_size=64)
+        stream.read_until_complete()
+
+        assert stream.read_all() == PAGE
+        stream.close()
+        assert response.closed
+
+    def test_unmatched_selector_reads_whole_page(self):
+        """If a watched element never closes the whole page is read and no prefix is returned."""
+        response = _StreamedResponse(PAGE)
+        stream = ChapterStream(response, "div.chapter-text", "h1.chapter-title", chunk_size=4096)
+
+        assert stream.read_until_complete() is None
+        assert stream.read_all() == PAGE
+
+    def test_undeclared_non_utf8_page_reads_whole_page(self):
+        """Without a declared charset, non-UTF-8 bytes hand the whole page to BeautifulSoup's detection."""
+        body = PAGE.replace(b'<meta charset="utf-8">', b"").decode("utf-8").encode("windows-1252")
+        response = _StreamedResponse(body)
+        stream = ChapterStream(response, "div.chapter-content", "h1.chapter-title", chunk_size=64)
+
+        assert stream.read_until_complete() is None
+        assert stream.read_all() == body
+
+    def test_undeclared_utf8_page_is_streamed(self):
+        """Undeclared pages that are valid UTF-8 still stop after the chapter body."""
+        response = _StreamedResponse(PAGE.replace(b'<meta charset="utf-8">', b""))
+        stream = ChapterStream(response, "div.chapter-content", "h1.chapter-title", chunk_size=64)
+
+        prefix = stream.read_until_complete()
+
+        assert prefix is not None
+        assert "Première ligne du chapitre." in prefix
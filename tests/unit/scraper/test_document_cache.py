@@ -0,0 +1,123 @@
+"""
+Unit tests for the per-detection document cache.
+
+Tests request coalescing, retrying of failed downloads, the lazily built
+document views and sharing of one download between strategies.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from scraper.document_cache import DocumentCache, FetchedDocument
+from scraper.strategies.html_parsing_strategy import HtmlParsingStrategy
+from scraper.strategies.javascript_strategy import JavaScriptStrategy
+
+BASE = "https://novel.example.com"
+TOC_URL = f"{BASE}/novel/toc"
+TOC_HTML = (
+    "<html><body><ul class=\"chapter-list\">"
+    + "".join(f'<li><a href="/novel/chapter-{n}">Chapter {n}</a></li>' for n in range(1, 6))
+    + "</ul><a href=\"/about\">About <b>us</b></a></body></html>"
+)
+
+
+class _FakeSessionManager:
+    """Serves pages after a short delay and counts requests per URL."""
+
+    def __init__(self, pages, delay=0.05):
+        self.pages = pages
+        self.delay = delay
+        self.requests = {}
+        self._lock = threading.Lock()
+
+    def get_session(self):
+        session = Mock()
+        session.get.side_effect = self._get
+        return session
+
+    def rate_limit(self, host=None):
+        pass
+
+    def _get(self, url, timeout=None):
+        with self._lock:
+            self.requests[url] = self.requests.get(url, 0) + 1
+        time.sleep(self.delay)
+        if url not in self.pages:
+            return Mock(status_code=404, text="", headers={})
+        return Mock(status_code=200, text=self.pages[url], headers={"content-type": "text/html"})
+
+
+class TestDocumentCache:
+    """Tests for DocumentCache and FetchedDocument."""
+
+    def test_concurrent_requests_share_one_download(self):
+        """Callers asking for the same URL at once wait for a single download."""
+        session_manager = _FakeSessionManager({TOC_URL: TOC_HTML})
+
+        async def run():
+            cache = DocumentCache(session_manager)
+            documents = await asyncio.gather(*(cache.get(TOC_URL) for _ in range(4)))
+            again = await cache.get(TOC_URL)
+            return documents, again
+
+        documents, again = asyncio.run(run())
+
+        assert session_manager.requests == {TOC_URL: 1}
+        assert all(document is documents[0] for document in documents + [again])
+        assert documents[0].text == TOC_HTML
+
+    def test_failed_download_is_retried_later(self):
+        """Waiters share a failed download, but a later request fetches the page again."""
+        session_manager = _FakeSessionManager({})
+
+        async def run():
+            cache = DocumentCache(session_manager)
+            concurrent = await asyncio.gather(cache.get(TOC_URL), cache.get(TOC_URL))
+            session_manager.pages[TOC_URL] = TOC_HTML  # The transient failure is over
+            return concurrent, await cache.get(TOC_URL)
+
+        concurrent, later = asyncio.run(run())
+
+        assert concurrent == [None, None]
+        assert later.text == TOC_HTML
+        assert session_manager.requests == {TOC_URL: 2}
+
+    def test_views_are_built_once(self):
+        """The parsed tree and link table are built lazily and reused."""
+        document = FetchedDocument(TOC_URL, TOC_HTML)
+
+        assert document.soup is document.soup
+        assert document.links is document.links
+        assert document.links[0] == ("/novel/chapter-1", "Chapter 1")
+        assert document.links[-1] == ("/about", "About us")
+        assert len(document.anchors) == 6
+
+    def test_pattern_extraction_uses_the_link_table(self):
+        """HTML pattern extraction reads the document's links, including anchors with nested markup."""
+        html = TOC_HTML.replace(">Chapter 5<", "><span>Chapter</span> 5<")
+        strategy = HtmlParsingStrategy(BASE, Mock())
+        document = FetchedDocument(TOC_URL, html)
+
+        urls = strategy._extract_with_patterns(html, document)
+
+        assert urls == [f"/novel/chapter-{n}" for n in range(1, 6)]
+        assert "/novel/chapter-5" not in strategy._extract_with_patterns(html)
+
+    def test_strategies_share_the_toc_download(self):
+        """Strategies of one detection run fetch the TOC once between them."""
+        session_manager = _FakeSessionManager({TOC_URL: TOC_HTML})
+        html_strategy = HtmlParsingStrategy(BASE, session_manager)
+        js_strategy = JavaScriptStrategy(BASE, session_manager)
+
+        async def run():
+            cache = DocumentCache(session_manager)
+            html_strategy.documents = cache
+            js_strategy.documents = cache
+            return await asyncio.gather(html_strategy.detect(TOC_URL), js_strategy.detect(TOC_URL))
+
+        html_result, _ = asyncio.run(run())
+
+        assert session_manager.requests == {TOC_URL: 1}
+        assert len(html_result.urls) == 5
@@ -0,0 +1,83 @@
+"""
+Unit tests for thread-safe regex helpers.
+
+Tests pattern vetting, input capping and that the helpers
+work off the main thread (no signal handlers involved).
+"""
+
+import re
+import threading
+
+import pytest
+from src.scraper import safe_regex
+from src.scraper.safe_regex import is_linear_pattern, safe_findall, safe_search
+
+
+class TestIsLinearPattern:
+    """Tests for nested-quantifier pattern vetting."""
+
+    @pytest.mark.parametrize("pattern", [
+        r'total[:\s]{0,10}(\d{1,6})\s{0,10}chapters?',
+        r'chapter[-\s]{0,5}(\d{1,6})',
+        r'href=["\'][^"\']{0,200}chapter[^"\']{0,50}(\d{1,6})',
+        r'(\d+)\s*章',
+        r'(?:ab)+',
+        r'[(+]*x',
+    ])
+    def test_linear_patterns_accepted(self, pattern):
+        """Bounded or non-nested patterns are accepted."""
+        assert is_linear_pattern(pattern) is True
+
+    @pytest.mark.parametrize("pattern", [
+        r'(a+)+$',
+        r'(?:\s*x)*',
+        r'(.{2,})+',
+        r'((ab)*c)+',
+        r'(\d+)*',
+    ])
+    def test_nested_quantifiers_rejected(self, pattern):
+        """Nested unbounded quantifiers are rejected."""
+        assert is_linear_pattern(pattern) is False
+
+
+class TestSafeRegex:
+    """Tests for safe_search and safe_findall."""
+
+    def test_search_matches_like_re(self):
+        """Vetted patterns behave like the re module."""
+        match = safe_search(r'total[:\s]{0,10}(\d{1,6})', "Total: 423 chapters", re.IGNORECASE)
+        assert match is not None
+        assert match.group(1) == "423"
+
+    def test_findall_matches_like_re(self):
+        """Vetted patterns return the same results as re.findall."""
+        html = '<a href="/chapter-12">Chapter 12</a><a href="/chapter-13">Chapter 13</a>'
+        pattern = r'/chapter[/-]{0,2}(\d{1,6})'
+        assert safe_findall(pattern, html) == re.findall(pattern, html)
+
+    def test_input_is_capped(self, monkeypatch):
+        """Text beyond the configured cap is not scanned."""
+        monkeypatch.setattr(safe_regex, "REGEX_MAX_INPUT_SIZE", 10)
+        assert safe_search(r'needle', "x" * 20 + "needle") is None
+        assert safe_findall(r'x', "x" * 20) == ["x"] * 10
+
+    def test_unvetted_pattern_refused_without_regex_module(self, monkeypatch):
+        """Catastrophic patterns are refused when no timeout engine is available."""
+        monkeypatch.setattr(safe_regex, "HAS_REGEX_MODULE", False)
+        assert safe_search(r'(a+)+$', "a" * 40 + "b") is None
+        assert safe_findall(r'(a+)+$', "a" * 40 + "b") == []
+
+    def test_works_off_main_thread(self):
+        """Helpers can be called from worker threads."""
+        results = []
+
+        def worker():
+            results.append(safe_findall(r'chapter-(\d{1,6})', "chapter-1 chapter-2"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [["1", "2"]] * 4
@@ -0,0 +1,135 @@
+"""
+Unit tests for the HTTP TOC pagination engine.
+
+Tests page URL template inference and concurrent fetching of the
+remaining TOC pages through the session manager.
+"""
+
+import asyncio
+import re
+from unittest.mock import Mock
+
+from src.scraper.toc_pagination import TocPaginationEngine, infer_page_template
+
+BASE = "https://novel.example.com"
+
+
+def _toc_page(page, pages, per_page=3, link="{base}/novel/toc?page={n}", chapters=True):
+    first = (page - 1) * per_page + 1
+    items = "".join(
+        f'<li><a href="/novel/chapter-{n}">Chapter {n}</a></li>'
+        for n in range(first, first + per_page)
+    ) if chapters else '<div id="app"></div>'
+    nav = "".join(f'<a href="{link.format(base=BASE, n=n)}">{n}</a>' for n in pages)
+    return f"<html><body><ul>{items}</ul><nav>{nav}</nav></body></html>"
+
+
+def _extract_links(html):
+    return re.findall(r'href="([^"]*chapter-\d+)"', html)
+
+
+class _FakeSessionManager:
+    """Serves pages from a dict and records the requested URLs."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+        self.rate_limited_hosts = []
+
+    def get_session(self):
+        session = Mock()
+        session.get.side_effect = self._get
+        return session
+
+    def rate_limit(self, host=None):
+        self.rate_limited_hosts.append(host)
+
+    def _get(self, url, timeout=None):
+        self.requested.append(url)
+        if url not in self.pages:
+            return Mock(status_code=404, text="")
+        return Mock(status_code=200, text=self.pages[url])
+
+
+class TestPageTemplateInference:
+    """Tests for infer_page_template."""
+
+    def test_query_parameter_template(self):
+        """?page=N links give the template and the highest page number."""
+        html = _toc_page(1, [1, 2, 3, 40])
+        template = infer_page_template(f"{BASE}/novel/toc?page=1", html)
+
+        assert template.pattern == f"{BASE}/novel/toc?page={{page}}"
+        assert (template.first_page, template.last_page, template.current_page) == (1, 40, 1)
+        assert template.url_for(7) == f"{BASE}/novel/toc?page=7"
+
+    def test_path_template_from_unpaginated_toc_url(self):
+        """/page/N links on a TOC URL without a page segment; the TOC is page 1."""
+        html = _toc_page(1, [2, 3], link="/novel/toc/page/{n}/")
+        template = infer_page_template(f"{BASE}/novel/toc", html)
+
+        assert template.url_for(3) == f"{BASE}/novel/toc/page/3/"
+        assert (template.first_page, template.last_page, template.current_page) == (1, 3, 1)
+
+    def test_ignores_other_lists_and_hosts(self):
+        """Page links of other paths or hosts are not TOC pages."""
+        html = (
+            '<a href="/latest?page=2">2</a>'
+            '<a href="https://other.example.com/novel/toc?page=3">3</a>'
+        )
+        assert infer_page_template(f"{BASE}/novel/toc?page=1", html) is None
+
+
+class TestTocPaginationEngine:
+    """Tests for TocPaginationEngine.collect."""
+
+    def test_collects_all_pages_in_order(self):
+        """Every page is fetched once and links come back in page order."""
+        pages = {f"{BASE}/novel/toc?page={n}": _toc_page(n, [1, 2, 3, 4]) for n in range(1, 5)}
+        session_manager = _FakeSessionManager(pages)
+        engine = TocPaginationEngine(session_manager, concurrency=2)
+
+        toc_url = f"{BASE}/novel/toc?page=1"
+        result = asyncio.run(engine.collect(toc_url, pages[toc_url], _extract_links))
+
+        assert result.urls == [f"{BASE}/novel/chapter-{n}" for n in range(1, 13)]
+        assert sorted(session_manager.requested) == [f"{BASE}/novel/toc?page={n}" for n in (2, 3, 4)]
+        assert session_manager.rate_limited_hosts == ["novel.example.com"] * 3
+        assert (result.pages_fetched, result.pages_failed, result.script_rendered) == (3, 0, False)
+
+    def test_follows_windowed_pagination(self):
+        """Pages beyond the first page's window are discovered from later pages."""
+        pages = {
+            f"{BASE}/novel/toc?page={n}": _toc_page(n, range(max(1, n - 2), min(6, n + 2) + 1))
+            for n in range(1, 7)
+        }
+        engine = TocPaginationEngine(_FakeSessionManager(pages))
+
+        toc_url = f"{BASE}/novel/toc?page=1"
+        result = asyncio.run(engine.collect(toc_url, pages[toc_url], _extract_links))
+
+        assert len(result.urls) == 18
+        assert result.pages_fetched == 5
+
+    def test_script_rendered_pages_are_flagged(self):
+        """Pages that load but hold no chapter links are reported as script-rendered."""
+        toc_url = f"{BASE}/novel/toc?page=1"
+        pages = {toc_url: _toc_page(1, [1, 2, 3])}
+        pages.update({f"{BASE}/novel/toc?page={n}": _toc_page(n, [1, 2, 3], chapters=False) for n in (2, 3)})
+        engine = TocPaginationEngine(_FakeSessionManager(pages))
+
+        result = asyncio.run(engine.collect(toc_url, pages[toc_url], _extract_links))
+
+        assert result.script_rendered is True
+        assert len(result.urls) == 3
+
+    def test_missing_pages_count_as_failed(self):
+        """A page that cannot be fetched does not stop the others."""
+        toc_url = f"{BASE}/novel/toc?page=1"
+        pages = {f"{BASE}/novel/toc?page={n}": _toc_page(n, [1, 2, 3]) for n in (1, 3)}
+        engine = TocPaginationEngine(_FakeSessionManager(pages))
+
+        result = asyncio.run(engine.collect(toc_url, pages[toc_url], _extract_links))
+
+        assert (result.pages_fetched, result.pages_failed) == (1, 1)
+        assert len(result.urls) == 6
@@ -17,6 +17,9 @@ import pytest
 from scraper.extractors.url_extractor import UrlExtractor
 from scraper.extractors.url_extractor_extractors import (
     ChapterUrlExtractors, retry_with_backoff)
+from scraper.extractors.url_extractor_playwright import (
+    PlaywrightExtractor, harvest_links)
+from scraper.extractors.url_extractor_session import SessionManager
 from scraper.universal_url_detector import UniversalUrlDetector, DetectionResult
 
 
@@ -278,6 +281,297 @@ class TestRetryWithBackoff:
             retry_with_backoff(mock_func, max_retries=3, base_delay=0.01, should_stop=should_stop)
 
 
+class _FakeLink:
+    def __init__(self, href: str, text: str):
+        self._href = href
+        self._text = text
+
+    def get_attribute(self, name: str):
+        return self._href if name == "href" else None
+
+    def inner_text(self) -> str:
+        return self._text
+
+
+class _FakeBrowser:
+    """Pages load in the background: goto returns at once, waits block until the load is done."""
+
+    def __init__(self, latency: float = 0.05, failures: Any = None, challenges: Any = None,
+                 crashes: Any = ()):
+        self.latency = latency
+        self.failures = dict(failures or {})  # url -> remaining failures
+        self.crashes = set(crashes)  # urls whose failures also close the tab
+        self.challenges = dict(challenges or {})  # url -> seconds the challenge lasts
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.tabs: List["_FakeTab"] = []
+
+    def new_page(self) -> "_FakeTab":
+        tab = _FakeTab(self)
+        self.tabs.append(tab)
+        return tab
+
+
+class _FakeTab:
+    def __init__(self, browser: _FakeBrowser):
+        self.browser = browser
+        self.context = browser
+        self.url = ""
+        self.ready_at = 0.0
+        self.loaded_at = 0.0
+        self.loading = False
+        self.closed = False
+
+    def goto(self, url: str, wait_until: str = "load", timeout: int = 0):
+        import time
+        if self.browser.failures.get(url, 0) > 0:
+            self.browser.failures[url] -= 1
+            self.closed = url in self.browser.crashes
+            raise TimeoutError(f"Timeout loading {url}")
+        self.url = url
+        self.ready_at = time.time() + self.browser.latency
+        self.loading = True
+        self.browser.in_flight += 1
+        self.browser.max_in_flight = max(self.browser.max_in_flight, self.browser.in_flight)
+        if wait_until != "commit":
+            self.wait_for_load_state(wait_until)
+
+    def wait_for_load_state(self, state: str = "load", timeout: int = 0):
+        import time
+        time.sleep(max(0.0, self.ready_at - time.time()))
+        if self.loading:
+            self.loading = False
+            self.loaded_at = time.time()
+            self.browser.in_flight -= 1
+
+    def title(self) -> str:
+        import time
+        lasts = self.browser.challenges.get(self.url)
+        if lasts is not None and time.time() < self.loaded_at + lasts:
+            return "Just a moment..."
+        return "Novel TOC"
+
+    def query_selector_all(self, selector: str):
+        page_num = int(self.url.rsplit("=", 1)[1]) if "=" in self.url else 1
+        if self.url in self.browser.challenges and self.title() == "Just a moment...":
+            return []
+        return [
+            _FakeLink(f"https://example.com/novel/chapter-{(page_num - 1) * 3 + i}", f"Chapter {(page_num - 1) * 3 + i}")
+            for i in range(1, 4)
+        ]
+
+    def evaluate(self, script: str, options: Any = None):
+        return [[link.get_attribute("href"), link.inner_text()] for link in self.query_selector_all("a[href]")]
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class TestPlaywrightPaginationCrawl:
+    """Test concurrent multi-tab pagination crawling in PlaywrightExtractor."""
+
+    TOC_URL = "https://example.com/novel/toc"
+
+    def _run(self, browser: _FakeBrowser, pages: int, max_tabs: int):
+        first_page = browser.new_page()
+        first_page.url = self.TOC_URL
+        page_urls = [f"{self.TOC_URL}?page={n}" for n in range(2, pages + 1)]
+        extractor = PlaywrightExtractor("https://example.com", SessionManager(min_request_delay=0.0),
+                                        timeout=30, delay=0.0, max_tabs=max_tabs)
+        return extractor._extract_via_pagination(first_page, self.TOC_URL, page_urls)
+
+    def test_tabs_load_concurrently_and_merge_in_page_order(self):
+        """Pages load in parallel tabs and results keep page order."""
+        browser = _FakeBrowser(latency=0.05)
+        urls = self._run(browser, pages=9, max_tabs=4)
+
+        assert urls == [f"https://example.com/novel/chapter-{n}" for n in range(1, 28)]
+        assert browser.max_in_flight == 4
+        assert all(tab.closed for tab in browser.tabs)
+
+    def test_single_tab_loads_one_page_at_a_time(self):
+        """max_tabs=1 keeps the sequential crawl."""
+        browser = _FakeBrowser(latency=0.01)
+        urls = self._run(browser, pages=4, max_tabs=1)
+
+        assert len(urls) == 12
+        assert browser.max_in_flight == 1
+        assert len(browser.tabs) == 1
+
+    def test_failed_page_is_retried_without_blocking_other_tabs(self):
+        """A page that fails is retried on a tab while the others keep going; hopeless pages are dropped."""
+        browser = _FakeBrowser(latency=0.01, failures={
+            f"{self.TOC_URL}?page=3": 1,
+            f"{self.TOC_URL}?page=5": 10,
+        })
+        with patch('scraper.extractors.url_extractor_playwright.PAGE_RETRY_BASE_DELAY', 0.01):
+            urls = self._run(browser, pages=6, max_tabs=3)
+
+        expected_pages = [1, 2, 3, 4, 6]
+        assert urls == [
+            f"https://example.com/novel/chapter-{(p - 1) * 3 + i}" for p in expected_pages for i in range(1, 4)
+        ]
+        assert browser.failures[f"{self.TOC_URL}?page=5"] == 7  # 3 attempts, then dropped
+
+    def test_replaced_tabs_are_closed(self):
+        """A tab that crashed is replaced, and the replacement is closed even in the caller's slot."""
+        browser = _FakeBrowser(latency=0.01, failures={f"{self.TOC_URL}?page=2": 1},
+                               crashes={f"{self.TOC_URL}?page=2"})
+        with patch('scraper.extractors.url_extractor_playwright.PAGE_RETRY_BASE_DELAY', 0.01):
+            urls = self._run(browser, pages=4, max_tabs=2)
+
+        assert len(urls) == 12
+        assert len(browser.tabs) == 3  # The caller's page, one extra tab, one replacement
+        assert all(tab.closed for tab in browser.tabs)
+
+    def test_cloudflare_wait_is_per_tab(self):
+        """A tab waiting on a challenge does not hold up the other tabs."""
+        import time
+        browser = _FakeBrowser(latency=0.01, challenges={f"{self.TOC_URL}?page=2": 0.3})
+        start = time.time()
+        with patch('scraper.extractors.url_extractor_playwright.CLOUDFLARE_PAGE_WAIT', 2.0):
+            urls = self._run(browser, pages=5, max_tabs=2)
+        elapsed = time.time() - start
+
+        assert urls[:6] == [f"https://example.com/novel/chapter-{n}" for n in range(1, 7)]
+        assert len(urls) == 15
+        assert elapsed < 1.5
+
+
+class TestLinkHarvesting:
+    """Test single-roundtrip link harvesting shared by Playwright extractors."""
+
+    def test_harvest_links_uses_one_evaluate_call(self):
+        """All (href, text) pairs come back from a single page.evaluate."""
+        page = Mock()
+        page.evaluate.return_value = [["/novel/chapter-1", "Chapter 1"], ["", "empty"], "junk", ["/about", None]]
+
+        links = harvest_links(page, selector=".toc a", chapter_only=True)
+
+        assert links == [("/novel/chapter-1", "Chapter 1"), ("/about", "")]
+        page.evaluate.assert_called_once()
+        script, options = page.evaluate.call_args.args
+        assert "__actPlaywright.harvestLinks" in script
+        assert options == {"selector": ".toc a", "chapterOnly": True}
+        page.query_selector_all.assert_not_called()
+
+    def test_harvest_links_returns_empty_on_error(self):
+        """A page that cannot be evaluated yields no links."""
+        page = Mock()
+        page.evaluate.side_effect = Exception("Execution context was destroyed")
+
+        assert harvest_links(page) == []
+
+    def test_browser_strategy_selectors_use_one_evaluate_call(self):
+        """BrowserAutomationStrategy harvests all selector matches in one call."""
+        import asyncio
+        from scraper.strategies.browser_automation_strategy import BrowserAutomationStrategy
+
+        page = Mock()
+        page.evaluate = AsyncMock(return_value=[["/novel/chapter-1", "Chapter 1"], ["https://example.com/novel/chapter-2", ""]])
+        strategy = BrowserAutomationStrategy("https://example.com", Mock())
+
+        urls = asyncio.run(strategy._extract_with_selectors(page))
+
+        assert urls == ["https://example.com/novel/chapter-1", "https://example.com/novel/chapter-2"]
+        page.evaluate.assert_awaited_once()
+        selector = page.evaluate.await_args.args[1]["selector"]
+        assert '.chapter-list a' in selector and 'a[href*="chapter"]' in selector
+
+
+class TestSettleWaits:
+    """Test event-driven settle waits in the scroll paths."""
+
+    def test_browser_scroll_waits_on_settle_not_timeouts(self):
+        """Each scroll step waits on the settle script and reports link arrival times."""
+        import asyncio
+        from scraper.strategies.browser_automation_strategy import BrowserAutomationStrategy
+
+        settles = [
+            {"changed": True, "firstChangeMs": 120},
+            {"changed": True, "firstChangeMs": 340},
+            {"changed": False, "firstChangeMs": None},
+        ]
+
+        async def evaluate(script, arg=None):
+            if isinstance(arg, dict):
+                assert arg["waitForChange"] is True and arg["timeoutMs"] == 1500
+                return settles.pop(0)
+            return "innerHeight" in script and not settles
+
+        page = Mock()
+        page.evaluate = AsyncMock(side_effect=evaluate)
+        page.wait_for_timeout = AsyncMock()
+        strategy = BrowserAutomationStrategy("https://example.com", Mock())
+
+        arrivals = asyncio.run(strategy._scroll_and_wait(page, None, {"timeoutMs": 1500}))
+
+        assert arrivals == [120, 340]
+        page.wait_for_timeout.assert_not_awaited()
+
+    def test_browser_scroll_stops_early_on_static_page(self):
+        """A step without new links jumps to the bottom; two in a row end the scroll."""
+        import asyncio
+        from scraper.strategies.browser_automation_strategy import BrowserAutomationStrategy
+
+        scrolls = []
+
+        async def evaluate(script, arg=None):
+            if isinstance(arg, dict):
+                return {"changed": False, "timedOut": True, "firstChangeMs": None}
+            if script.startswith("window.scroll"):
+                scrolls.append(script)
+            return False  # Never at the bottom
+
+        page = Mock()
+        page.evaluate = AsyncMock(side_effect=evaluate)
+        strategy = BrowserAutomationStrategy("https://example.com", Mock())
+
+        arrivals = asyncio.run(strategy._scroll_and_wait(page, None, {"timeoutMs": 3000}))
+
+        assert arrivals == []
+        assert scrolls == [
+            "window.scrollBy(0, 500)",
+            "window.scrollTo(0, document.body.scrollHeight)",
+            "window.scrollTo(0, 0)",
+        ]
+
+    def test_scrolling_uses_and_updates_site_settle_timings(self):
+        """The scroll script gets the site's settle options and its statistics are recorded."""
+        page = Mock()
+        page.evaluate.return_value = {"count": 42, "settle": {"rounds": 5, "changedRounds": 3, "firstChangeMs": [90, 250, 130]}}
+        page.query_selector_all.return_value = []
+        adaptive = Mock()
+        adaptive.get_settle_options.return_value = {"quietMs": 200, "timeoutMs": 900, "maxWaitMs": 15000}
+        extractor = PlaywrightExtractor("https://example.com", Mock(), timeout=30, delay=0.0)
+
+        with patch('scraper.extractors.url_extractor_playwright.get_adaptive_config_manager', return_value=adaptive), \
+                patch('scraper.extractors.url_extractor_playwright.harvest_links', return_value=[]):
+            extractor._extract_via_scrolling(page, "https://example.com/novel/toc")
+
+        script, options = page.evaluate.call_args.args
+        assert "__actPlaywright.scrollAndCountChapters" in script
+        assert options == {"quietMs": 200, "timeoutMs": 900, "maxWaitMs": 15000}
+        adaptive.record_settle_times.assert_called_once_with("https://example.com/novel/toc", [90, 250, 130])
+
+
+class TestSessionManagerRateLimit:
+    """Test per-host rate limiting in SessionManager."""
+
+    def test_rate_limit_is_per_host(self):
+        """Requests to different hosts do not wait on each other."""
+        manager = SessionManager(min_request_delay=10.0)
+        with patch('scraper.extractors.url_extractor_session.time.sleep') as mock_sleep:
+            manager.rate_limit("a.example.com")
+            manager.rate_limit("b.example.com")
+            mock_sleep.assert_not_called()
+            manager.rate_limit("a.example.com")
+            mock_sleep.assert_called_once()
+
+
 class TestUrlExtractorPipeline:
     """Test the overall URL extractor fetch pipeline."""
 
@@ -472,6 +766,100 @@ class TestUniversalUrlDetector:
         assert len(order) > 0
 
 
+class _FakeStrategy:
+    """Detection strategy that returns a fixed result after a delay."""
+
+    def __init__(self, name, delay, urls=(), confidence=0.9, uses_browser=False):
+        self.name = name
+        self.delay = delay
+        self.urls = list(urls)
+        self.confidence = confidence
+        self.uses_browser = uses_browser
+        self.chapter_range = (None, None)
+        self.started = False
+        self.closed = False
+
+    async def detect(self, toc_url, should_stop=None):
+        import asyncio
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.closed = True  # Where a browser strategy closes its browser
+        if not self.urls:
+            return DetectionResult(method=self.name, error="nothing found")
+        return DetectionResult(urls=self.urls, confidence=self.confidence, method=self.name)
+
+
+class TestUniversalUrlDetectorRacing:
+    """Test racing mode of the universal URL detector."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = UniversalUrlDetector("https://example.com")
+        self.chapters = [f"https://example.com/novel/chapter-{n}" for n in range(1, 11)]
+
+    def _race(self, strategies, min_chapter=None, max_chapter=None):
+        import asyncio
+        self.detector.strategies = strategies
+        order = [s.name for s in strategies]
+        with patch('scraper.universal_url_detector.DETECTION_HEDGE_DELAY', 0.1):
+            return asyncio.run(self.detector._detect_racing("https://example.com/toc", order, None, min_chapter, max_chapter))
+
+    def test_browser_strategies_wait_for_hedge_delay(self):
+        """A fast sufficient HTTP result wins before any browser is launched."""
+        html = _FakeStrategy("html_parsing", 0.01, self.chapters)
+        browser = _FakeStrategy("browser_automation", 5.0, self.chapters, uses_browser=True)
+
+        result = self._race([html, browser], 1, 10)
+
+        assert result.method == "html_parsing"
+        assert browser.started is False
+
+    def test_losers_are_cancelled_when_a_winner_arrives(self):
+        """Browser strategies started by the hedge are cancelled and cleaned up."""
+        slow_http = _FakeStrategy("ajax", 0.3, self.chapters)
+        browser = _FakeStrategy("browser_automation", 5.0, self.chapters, uses_browser=True)
+
+        result = self._race([slow_http, browser], 1, 10)
+
+        assert result.method == "ajax"
+        assert browser.started is True
+        assert browser.closed is True
+
+    def test_without_winner_best_result_is_selected(self):
+        """Insufficient results are scored like in parallel mode once all finish."""
+        partial = _FakeStrategy("html_parsing", 0.01, self.chapters[:5], confidence=0.6)
+        fuller = _FakeStrategy("browser_automation", 0.05, self.chapters[:8], confidence=0.8, uses_browser=True)
+
+        result = self._race([partial, fuller], 1, 10)
+
+        assert fuller.started is True
+        assert result.method == "browser_automation"
+
+    def test_whole_novel_first_screen_does_not_win(self):
+        """Without a chapter range, a list that looks paginated keeps the browser strategies running."""
+        first_screen = [f"https://example.com/novel/chapter-{n}" for n in range(1, 51)]
+        whole = [f"https://example.com/novel/chapter-{n}" for n in range(1, 124)]
+        html = _FakeStrategy("html_parsing", 0.01, first_screen)
+        browser = _FakeStrategy("browser_automation", 0.05, whole, uses_browser=True)
+
+        result = self._race([html, browser])
+
+        assert browser.started is True
+        assert result.method == "browser_automation"
+
+    def test_whole_novel_complete_list_wins(self):
+        """Without a chapter range, a list with no pagination signature still ends the race."""
+        html = _FakeStrategy("html_parsing", 0.01, self.chapters)
+        browser = _FakeStrategy("browser_automation", 5.0, self.chapters, uses_browser=True)
+
+        result = self._race([html, browser])
+
+        assert result.method == "html_parsing"
+        assert browser.started is False
+
+
 class TestUrlExtractorUniversalMode:
     """Test URL extractor with universal detector enabled."""
 
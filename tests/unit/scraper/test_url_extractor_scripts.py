@@ -0,0 +1,130 @@
+"""
+Unit tests for the Playwright script bundle.
+
+Tests that the bundle is built once per process, that minification keeps
+literals intact, and how pages with and without the init script are
+evaluated.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scraper.extractors import url_extractor_scripts
+from scraper.extractors.url_extractor_scripts import (
+    BUNDLE_MISSING,
+    _minify_js,
+    evaluate_script,
+    get_script_bundle,
+    install_script_bundle,
+)
+
+
+@pytest.fixture
+def fresh_bundle():
+    """Start and end each test with an empty bundle cache."""
+    get_script_bundle.cache_clear()
+    yield
+    get_script_bundle.cache_clear()
+
+
+class TestScriptBundle:
+    """Tests for get_script_bundle and _minify_js."""
+
+    def test_bundle_is_built_once(self, fresh_bundle):
+        """Script modules are read from disk once, however often the bundle is used."""
+        with patch.object(url_extractor_scripts, "_load_playwright_modules",
+                          wraps=url_extractor_scripts._load_playwright_modules) as load:
+            first = get_script_bundle(minified=True)
+            second = get_script_bundle(minified=True)
+
+        assert first is second
+        load.assert_called_once()
+        assert "window.__actPlaywright" in first.source
+        assert f"'{first.version}'" in first.source
+
+    def test_minified_variant_is_smaller(self, fresh_bundle):
+        """The minified bundle drops comments and indentation and gets its own version."""
+        full = get_script_bundle(minified=False)
+        minified = get_script_bundle(minified=True)
+
+        assert len(minified.source) < len(full.source) * 0.7
+        assert "// === chapter_detector ===" not in minified.source
+        assert minified.version != full.version
+
+    def test_minify_keeps_strings_and_regex_literals(self):
+        """Comment markers and spaces inside literals survive; line breaks are kept for ASI."""
+        source = (
+            "/**\n * Doc.\n */\n"
+            "function f(text) {\n"
+            "    var url = 'https://example.com/a  b'; // trailing\n"
+            "    if (/\\/chapter\\/|ch[_-\\s]\\d+/.test(text)) return url\n"
+            "    return text.replace(/\\/\\* not a comment/g, \"  \") / 2\n"
+            "}\n"
+        )
+
+        assert _minify_js(source) == (
+            "function f(text) {\n"
+            "var url = 'https://example.com/a  b';\n"
+            "if (/\\/chapter\\/|ch[_-\\s]\\d+/.test(text)) return url\n"
+            "return text.replace(/\\/\\* not a comment/g, \"  \") / 2\n"
+            "}"
+        )
+
+    def test_minify_detects_regex_after_keywords(self):
+        """A regex literal after return/typeof/throw is kept whole; a property named like a keyword is not one."""
+        source = (
+            "function f(s) {\n"
+            "    if (typeof /x/ === 'object') throw /y  z/\n"
+            "    return /[//]x/.test(s) || /a  b/.test(s)\n"
+            "}\n"
+            "var half = options.case / 2 // comment\n"
+        )
+
+        assert _minify_js(source) == (
+            "function f(s) {\n"
+            "if (typeof /x/ === 'object') throw /y  z/\n"
+            "return /[//]x/.test(s) || /a  b/.test(s)\n"
+            "}\n"
+            "var half = options.case / 2"
+        )
+
+    def test_minify_keeps_regex_after_return(self):
+        """Regex literals right after return are not cut at // or collapsed."""
+        assert _minify_js("return /[//]x/.test(s)") == "return /[//]x/.test(s)"
+        assert _minify_js("return /a  b/") == "return /a  b/"
+
+
+class TestScriptEvaluation:
+    """Tests for evaluate_script and install_script_bundle."""
+
+    def test_registered_bundle_is_called_without_reinjection(self):
+        """A page holding the bundle gets only the short entry-point call."""
+        page = Mock()
+        page.evaluate.return_value = [["/chapter-1", "Chapter 1"]]
+
+        result = evaluate_script(page, "harvestLinks", {"selector": "a"})
+
+        assert result == [["/chapter-1", "Chapter 1"]]
+        page.evaluate.assert_called_once()
+        call_script, args = page.evaluate.call_args.args
+        assert "__actPlaywright.harvestLinks" in call_script
+        assert len(call_script) < 300
+        assert args == {"selector": "a"}
+
+    def test_missing_bundle_is_injected_once_and_retried(self):
+        """Pages created without the init script get the bundle on first use."""
+        page = Mock()
+        page.evaluate.side_effect = [BUNDLE_MISSING, None, {"count": 3}]
+
+        assert evaluate_script(page, "scrollAndCountChapters", {}) == {"count": 3}
+        assert page.evaluate.call_args_list[1].args == (get_script_bundle().source,)
+
+    def test_install_registers_init_script(self):
+        """The bundle is registered on the context; a failing context is not fatal."""
+        context = Mock()
+        install_script_bundle(context)
+        context.add_init_script.assert_called_once_with(script=get_script_bundle().source)
+
+        context.add_init_script.side_effect = Exception("Target closed")
+        install_script_bundle(context)
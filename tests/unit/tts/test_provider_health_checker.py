@@ -0,0 +1,122 @@
+"""
+Unit tests for ProviderHealthChecker
+Tests that health checks read cached state and probing happens in the background
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.tts.providers import provider_manager
+from src.tts.providers.base_provider import ProviderType
+from src.tts.providers.provider_manager import ProviderHealthChecker, TTSProviderManager
+
+
+def _make_provider(name="edge_tts", available=True):
+    provider = MagicMock()
+    provider.get_provider_name.return_value = name
+    provider.is_available.return_value = available
+    return provider
+
+
+class TestProviderHealthChecker:
+    """Test cases for ProviderHealthChecker"""
+
+    def test_is_provider_healthy_does_not_probe_synchronously(self):
+        """Unknown providers are allowed without calling is_available()"""
+        checker = ProviderHealthChecker()
+        provider = _make_provider(available=False)
+
+        assert checker.is_provider_healthy(provider) is True
+        provider.is_available.assert_not_called()
+
+    def test_probe_result_is_used(self):
+        """A failed probe marks the provider unhealthy"""
+        checker = ProviderHealthChecker()
+        provider = _make_provider(available=False)
+
+        assert checker.probe(provider) is False
+        assert checker.is_provider_healthy(provider) is False
+
+        provider.is_available.return_value = True
+        assert checker.probe(provider) is True
+        assert checker.is_provider_healthy(provider) is True
+
+    def test_probe_exception_marks_unavailable(self):
+        """Probe errors count as unavailable"""
+        checker = ProviderHealthChecker()
+        provider = _make_provider()
+        provider.is_available.side_effect = RuntimeError("boom")
+
+        assert checker.probe(provider) is False
+        assert checker.is_provider_healthy(provider) is False
+
+    def test_circuit_breaker_opens_after_failures(self):
+        """Providers past the failure threshold are skipped during recovery"""
+        checker = ProviderHealthChecker(failure_threshold=2, recovery_timeout=300)
+        provider = _make_provider()
+        checker.record_success(provider)
+
+        checker.record_failure(provider)
+        checker.record_failure(provider)
+
+        assert checker.is_provider_healthy(provider) is False
+        # A successful probe does not close the breaker early
+        checker.probe(provider)
+        assert checker.is_provider_healthy(provider) is False
+
+    def test_background_probes_update_flags(self):
+        """The background thread probes registered providers"""
+        checker = ProviderHealthChecker(probe_interval=60.0)
+        provider = _make_provider(available=False)
+        probed = threading.Event()
+        provider.is_available.side_effect = lambda: probed.set() or False
+
+        checker.start_background_probes([provider])
+        try:
+            assert probed.wait(timeout=5)
+        finally:
+            checker.stop_background_probes()
+
+        assert checker.probe_results["edge_tts"] is False
+        assert checker.is_provider_healthy(provider) is False
+
+    def test_managers_share_one_probe_thread(self):
+        """Short-lived provider managers reuse the process-wide checker and its thread"""
+        with patch.object(provider_manager, "_shared_health_checker", None), \
+                patch.object(provider_manager, "EdgeTTSProvider", return_value=_make_provider("edge_tts")), \
+                patch.object(provider_manager, "Pyttsx3Provider", return_value=_make_provider("pyttsx3")):
+            first = TTSProviderManager()
+            probe_thread = first.health_checker._probe_thread
+            try:
+                managers = [TTSProviderManager() for _ in range(3)]
+
+                assert all(m.health_checker is first.health_checker for m in managers)
+                assert first.health_checker._probe_thread is probe_thread
+                assert set(first.health_checker._probed_providers) == {"edge_tts", "pyttsx3"}
+            finally:
+                first.health_checker.stop_background_probes()
+
+    def test_conversion_reads_only_health_flags(self):
+        """Selecting a provider for a conversion never calls is_available()"""
+        edge = _make_provider("edge_tts")
+        edge.get_provider_type.return_value = ProviderType.CLOUD
+        offline = _make_provider("pyttsx3")
+        offline.get_provider_type.return_value = ProviderType.OFFLINE
+        offline.convert_text_to_speech.return_value = True
+        checker = ProviderHealthChecker()
+        checker.probe_results["edge_tts"] = False
+
+        with patch.object(checker, "start_background_probes"), \
+                patch.object(provider_manager, "EdgeTTSProvider", return_value=edge), \
+                patch.object(provider_manager, "Pyttsx3Provider", return_value=offline):
+            manager = TTSProviderManager(health_checker=checker)
+        edge.is_available.reset_mock()
+        offline.is_available.reset_mock()
+
+        assert manager.convert_with_fallback("Hello world.", "en-US-AndrewNeural", Path("out.mp3"),
+                                              rate=0.0, pitch=0.0, volume=0.0)
+
+        edge.is_available.assert_not_called()
+        offline.is_available.assert_not_called()
+        edge.convert_text_to_speech.assert_not_called()
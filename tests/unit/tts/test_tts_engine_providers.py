@@ -47,6 +47,7 @@ if "core.logger" not in sys.modules:
     mock_get_logger = MagicMock(return_value=mock_logger)
     logger_module = types.ModuleType("core.logger")
     setattr(logger_module, "get_logger", mock_get_logger)  # type: ignore[attr-defined]
+    setattr(logger_module, "get_chunk_logger", MagicMock(return_value=mock_logger))  # type: ignore[attr-defined]
     sys.modules["core.logger"] = logger_module
 
 # Mock core.config_manager
@@ -67,6 +68,15 @@ if "core.constants" not in sys.modules:
     setattr(constants_module, "MAX_RETRIES", 3)  # type: ignore[attr-defined]
     sys.modules["core.constants"] = constants_module
 
+# Load core.metrics (standard library only, no mocking needed)
+if "core.metrics" not in sys.modules:
+    spec_metrics = importlib.util.spec_from_file_location("core.metrics", act_src / "core" / "metrics.py")
+    if spec_metrics is None or spec_metrics.loader is None:
+        raise ImportError(f"Could not load spec for core.metrics from {act_src / 'core' / 'metrics.py'}")
+    metrics_module = importlib.util.module_from_spec(spec_metrics)
+    sys.modules["core.metrics"] = metrics_module
+    spec_metrics.loader.exec_module(metrics_module)
+
 # Set up package structure
 if "tts" not in sys.modules:
     sys.modules["tts"] = types.ModuleType("tts")
@@ -196,6 +206,15 @@ text_pipeline_module = importlib.util.module_from_spec(spec_tp_new)
 sys.modules["tts.text_processing_pipeline"] = text_pipeline_module
 spec_tp_new.loader.exec_module(text_pipeline_module)
 
+# Load voice_catalog module (needed by voice_resolver)
+voice_catalog_path = act_src / "tts" / "voice_catalog.py"
+spec_vc = importlib.util.spec_from_file_location("tts.voice_catalog", voice_catalog_path)
+if spec_vc is None or spec_vc.loader is None:
+    raise ImportError(f"Could not load spec for voice_catalog from {voice_catalog_path}")
+voice_catalog_module = importlib.util.module_from_spec(spec_vc)
+sys.modules["tts.voice_catalog"] = voice_catalog_module
+spec_vc.loader.exec_module(voice_catalog_module)
+
 # Load voice_resolver module
 voice_resolver_path = act_src / "tts" / "voice_resolver.py"
 spec_vr = importlib.util.spec_from_file_location("tts.voice_resolver", voice_resolver_path)
@@ -0,0 +1,74 @@
+"""
+Unit tests for VoiceCatalog.
+
+Tests indexed exact, prefix, partial and locale lookups.
+"""
+
+import pytest
+
+from src.tts.voice_catalog import VoiceCatalog
+
+
+@pytest.fixture
+def catalog():
+    """Catalog over a small mixed-provider voice list."""
+    return VoiceCatalog([
+        {'id': 'en-US-AndrewNeural', 'name': 'Andrew', 'language': 'en-US', 'provider': 'edge_tts'},
+        {'id': 'en-GB-RyanNeural', 'name': 'Ryan', 'language': 'en-GB', 'provider': 'edge_tts'},
+        {'id': 'sapi-david', 'name': 'Microsoft David Desktop - English (United States)',
+         'language': 'en-US', 'provider': 'pyttsx3'},
+        {'ShortName': 'en-US-AriaNeural', 'name': 'Aria', 'Locale': 'en-US', 'provider': 'edge_tts'},
+    ])
+
+
+class TestVoiceCatalog:
+    """Test VoiceCatalog lookups."""
+
+    def test_find_exact_by_id_name_and_short_name(self, catalog):
+        """Exact lookups match id, name and ShortName case-insensitively."""
+        assert catalog.find_exact('EN-US-ANDREWNEURAL')['name'] == 'Andrew'
+        assert catalog.find_exact('ryan')['id'] == 'en-GB-RyanNeural'
+        assert catalog.find_exact('en-us-arianeural')['name'] == 'Aria'
+        assert catalog.find_exact('missing') is None
+
+    def test_find_exact_respects_provider(self, catalog):
+        """Provider filter excludes voices from other providers."""
+        assert catalog.find_exact('sapi-david', provider='pyttsx3') is not None
+        assert catalog.find_exact('sapi-david', provider='edge_tts') is None
+
+    def test_find_all_exact_keeps_source_order(self):
+        """All exact matches come back once each, in source order."""
+        catalog = VoiceCatalog([
+            {'id': 'shared', 'name': 'Shared', 'provider': 'pyttsx3'},
+            {'id': 'other', 'name': 'Other', 'provider': 'edge_tts'},
+            {'id': 'shared', 'name': 'shared', 'provider': 'edge_tts'},
+        ])
+
+        assert [v['provider'] for v in catalog.find_all_exact('SHARED')] == ['pyttsx3', 'edge_tts']
+        assert catalog.find_all_exact('missing') == []
+
+    def test_find_by_prefix(self, catalog):
+        """Prefix lookups use the sorted name index."""
+        assert catalog.find_by_prefix('microsoft david')['id'] == 'sapi-david'
+        assert catalog.find_by_prefix('zz') is None
+
+    def test_find_partial_falls_back_to_substring(self, catalog):
+        """Partial lookups find names containing the fragment."""
+        assert catalog.find_partial('david desktop')['id'] == 'sapi-david'
+
+    def test_find_all_partial_lists_prefix_matches_first(self):
+        """All partial matches come back, prefix matches before substring matches."""
+        catalog = VoiceCatalog([
+            {'id': 'a', 'name': 'Microsoft Jenny', 'provider': 'pyttsx3'},
+            {'id': 'b', 'name': 'Jenny', 'provider': 'edge_tts'},
+            {'id': 'c', 'name': 'Jenny Multilingual', 'provider': 'edge_tts'},
+        ])
+
+        assert [v['id'] for v in catalog.find_all_partial('jenny')] == ['b', 'c', 'a']
+        assert catalog.find_all_partial('zz') == []
+
+    def test_get_by_locale(self, catalog):
+        """Locale index groups voices from both key styles."""
+        names = [v['name'] for v in catalog.get_by_locale('en-US')]
+        assert names == ['Andrew', 'Microsoft David Desktop - English (United States)', 'Aria']
+        assert len(catalog) == 4
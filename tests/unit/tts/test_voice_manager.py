@@ -158,3 +158,86 @@ class TestVoiceManager:
 
 
 
+
+
+class TestVoiceManagerStaleWhileRevalidate:
+    """Test cases for the stale-while-revalidate voice cache"""
+
+    def _make_manager(self, temp_dir, fetched_voices):
+        from src.tts.voice_manager import VoiceManager  # type: ignore
+
+        mock_pm = MagicMock()
+        mock_pm.get_voices_by_provider.return_value = fetched_voices
+        return VoiceManager(provider_manager=mock_pm, stale_while_revalidate=True, cache_dir=temp_dir)
+
+    def test_cold_start_serves_bundled_snapshot(self, temp_dir):
+        """Bundled snapshot is served without waiting on the provider"""
+        fresh = [{"id": "en-US-NewNeural", "name": "New", "language": "en-US", "provider": "edge_tts"}]
+        manager = self._make_manager(temp_dir, fresh)
+
+        voices = manager.get_voices(provider="edge_tts")
+
+        assert any(v["id"] == "en-US-AndrewNeural" for v in voices)
+
+    def test_background_refresh_notifies_listeners(self, temp_dir):
+        """Stale entries are refreshed in the background and listeners are notified"""
+        fresh = [{"id": "en-US-NewNeural", "name": "New", "language": "en-US", "provider": "edge_tts"}]
+        manager = self._make_manager(temp_dir, fresh)
+        received = []
+        manager.add_voices_listener(lambda provider, locale, voices: received.append((provider, locale, voices)))
+
+        manager.get_voices(provider="edge_tts")
+        manager._refresh_threads["edge_tts|en-US"].join(timeout=5)
+
+        assert received == [("edge_tts", "en-US", fresh)]
+        assert manager.get_voices(provider="edge_tts") == fresh
+        assert manager.snapshot_file.exists()
+
+    def test_unknown_key_is_fetched_in_background(self, temp_dir):
+        """A provider/locale with no snapshot returns at once and its first fetch notifies listeners"""
+        fresh = [{"id": "voice1", "name": "Voice 1", "language": "en-US", "provider": "pyttsx3"}]
+        manager = self._make_manager(temp_dir, fresh)
+        received = []
+        manager.add_voices_listener(lambda provider, locale, voices: received.append((provider, voices)))
+
+        assert manager.get_voices(provider="pyttsx3") == []
+        manager._refresh_threads["pyttsx3|en-US"].join(timeout=5)
+
+        assert received == [("pyttsx3", fresh)]
+        assert not manager.is_loading_voices(provider="pyttsx3")
+        assert manager.get_voices(provider="pyttsx3") == fresh
+
+    def test_unknown_key_that_finds_nothing_ends_loading(self, temp_dir):
+        """An empty first fetch still notifies listeners so the UI stops waiting"""
+        manager = self._make_manager(temp_dir, [])
+        received = []
+        manager.add_voices_listener(lambda provider, locale, voices: received.append((provider, voices)))
+
+        manager.get_voices(provider="pyttsx3")
+        manager._refresh_threads["pyttsx3|en-US"].join(timeout=5)
+
+        assert received == [("pyttsx3", [])]
+        assert not manager.is_loading_voices(provider="pyttsx3")
+
+    def test_fresh_cache_is_not_revalidated(self, temp_dir):
+        """Entries younger than the cache duration are served without a refresh"""
+        fresh = [{"id": "voice1", "name": "Voice 1", "language": "en-US", "provider": "pyttsx3"}]
+        manager = self._make_manager(temp_dir, fresh)
+        manager.get_voices(provider="pyttsx3")
+        first_fetch = manager._refresh_threads["pyttsx3|en-US"]
+        first_fetch.join(timeout=5)
+
+        assert manager.get_voices(provider="pyttsx3") == fresh
+        assert manager.get_voices(provider="pyttsx3") == fresh
+
+        manager.provider_manager.get_voices_by_provider.assert_called_once_with("pyttsx3", locale="en-US")
+        assert manager._refresh_threads["pyttsx3|en-US"] is first_fetch
+
+    def test_failed_refresh_keeps_stale_voices(self, temp_dir):
+        """An empty refresh result does not replace the served voices"""
+        manager = self._make_manager(temp_dir, [])
+
+        stale = manager.get_voices(provider="edge_tts")
+        manager._refresh_threads["edge_tts|en-US"].join(timeout=5)
+
+        assert manager.get_voices(provider="edge_tts") == stale
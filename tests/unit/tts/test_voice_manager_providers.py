@@ -49,6 +49,7 @@ if "core.logger" not in sys.modules:
     mock_get_logger = MagicMock(return_value=mock_logger)
     logger_module = types.ModuleType("core.logger")
     setattr(logger_module, "get_logger", mock_get_logger)  # type: ignore[attr-defined]
+    setattr(logger_module, "get_chunk_logger", MagicMock(return_value=mock_logger))  # type: ignore[attr-defined]
     sys.modules["core.logger"] = logger_module
 
 # Mock core.config_manager
@@ -166,4 +166,99 @@ class TestVoiceResolver:
 
         result = self.resolver.resolve_voice(windows_name)
 
-        assert result.voice_id == expected_edge_voice
\ No newline at end of file
+        assert result.voice_id == expected_edge_voice
+
+class TestVoiceResolverCatalog:
+    """Test catalog-backed lookup and resolution memoization."""
+
+    def setup_method(self):
+        """Set up a resolver backed by a fixed voice list."""
+        self.provider_manager = MagicMock(spec=TTSProviderManager)
+        self.mock_provider = MagicMock()
+        self.provider_manager.get_provider.return_value = self.mock_provider
+        self.resolver = VoiceResolver(self.provider_manager)
+        self.resolver.voice_manager = MagicMock()
+        self.resolver.voice_manager.get_voices.return_value = [
+            {'id': 'en-US-AndrewNeural', 'name': 'Andrew', 'provider': 'edge_tts'},
+            {'id': 'en-US-AriaNeural', 'name': 'Aria', 'provider': 'edge_tts'},
+        ]
+
+    def test_exact_match_uses_catalog(self):
+        """Exact ids resolve through the catalog."""
+        result = self.resolver.resolve_voice('en-us-andrewneural')
+
+        assert result.voice_id == 'en-US-AndrewNeural'
+        assert not result.fallback_used
+
+    def test_exact_match_skips_unavailable_provider(self):
+        """A voice listed under several providers resolves with the first available one."""
+        self.resolver.voice_manager.get_voices.return_value = [
+            {'id': 'shared-voice', 'name': 'Shared', 'provider': 'offline_tts'},
+            {'id': 'shared-voice', 'name': 'Shared', 'provider': 'edge_tts'},
+        ]
+        self.provider_manager.get_provider.side_effect = (
+            lambda name: self.mock_provider if name == 'edge_tts' else None
+        )
+
+        result = self.resolver.resolve_voice('shared-voice')
+
+        assert result.provider is self.mock_provider
+        assert result.voice_metadata['provider'] == 'edge_tts'
+        assert not result.fallback_used
+
+    def test_fuzzy_match_uses_prefix_index(self):
+        """Name prefixes resolve as fuzzy matches."""
+        result = self.resolver.resolve_voice('andr')
+
+        assert result.voice_id == 'en-US-AndrewNeural'
+        assert result.fallback_used
+
+    def test_fuzzy_match_skips_unavailable_provider(self):
+        """Partial matches are tried until one has an available provider."""
+        self.resolver.voice_manager.get_voices.return_value = [
+            {'id': 'sapi-jenny', 'name': 'Jenny Desktop', 'provider': 'pyttsx3'},
+            {'id': 'en-US-JennyNeural', 'name': 'Jenny Online', 'provider': 'edge_tts'},
+        ]
+        self.provider_manager.get_provider.side_effect = (
+            lambda name: self.mock_provider if name == 'edge_tts' else None
+        )
+
+        result = self.resolver.resolve_voice('jenny')
+
+        assert result.voice_id == 'en-US-JennyNeural'
+        assert result.fallback_used
+
+    def test_outage_fallback_is_not_memoized(self):
+        """A voice resolved with another provider during an outage resolves normally afterwards."""
+        offline_provider = MagicMock()
+        self.resolver.voice_manager.get_voices.return_value = [
+            {'id': 'en-US-AriaNeural', 'name': 'Aria', 'provider': 'offline_tts'},
+            {'id': 'en-US-AriaNeural', 'name': 'Aria', 'provider': 'edge_tts'},
+        ]
+        providers = {'edge_tts': self.mock_provider}
+        self.provider_manager.get_provider.side_effect = providers.get
+
+        during = self.resolver.resolve_voice('en-US-AriaNeural', preferred_provider='offline_tts')
+        providers['offline_tts'] = offline_provider
+        after = self.resolver.resolve_voice('en-US-AriaNeural', preferred_provider='offline_tts')
+
+        assert during.provider is self.mock_provider
+        assert after.provider is offline_provider
+        assert self.resolver.resolve_voice('en-US-AriaNeural', preferred_provider='offline_tts') is after
+
+    def test_resolution_is_memoized(self):
+        """Repeated resolutions do not rebuild the catalog or re-list voices."""
+        first = self.resolver.resolve_voice('en-US-AriaNeural')
+        second = self.resolver.resolve_voice('en-US-AriaNeural')
+
+        assert first is second
+        assert self.resolver.voice_manager.get_voices.call_count == 1
+
+    def test_refresh_invalidates_cache(self):
+        """Refreshing voices rebuilds the catalog on next resolution."""
+        self.resolver.resolve_voice('en-US-AriaNeural')
+        self.resolver.refresh_voices()
+        self.resolver.resolve_voice('en-US-AriaNeural')
+
+        self.resolver.voice_manager.refresh_voices.assert_called_once()
+        assert self.resolver.voice_manager.get_voices.call_count == 2